@@ -7,6 +7,7 @@ from .models import (
     CalendarEvent,
     CalendarEventAttachment,
     CalendarEventSyncTask,
+    CalendarHubItem,
     CalendarIntegrationSetting,
     CalendarMessageCapture,
     CalendarMessageCaptureAttachment,
@@ -84,6 +85,7 @@ admin.site.register(
     [
         CalendarEventAttachment,
         CalendarEventSyncTask,
+        CalendarHubItem,
         CalendarMessageCapture,
         CalendarMessageCaptureAttachment,
         CalendarMessageCaptureCandidate,
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ClasscalendarConfig(AppConfig):
     name = 'classcalendar'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,8 +1,69 @@
+import calendar
+from datetime import datetime, time, timedelta
+from typing import NamedTuple
+
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 from .models import CalendarCollaborator, CalendarEvent, CalendarTask
 
 
+# The month page also shows the spill-over days of the grid and the next three
+# weeks of the "upcoming" agenda, so a month window reaches past the month.
+MONTH_WINDOW_LEAD_DAYS = 7
+MONTH_WINDOW_TRAIL_DAYS = 28
+MAX_WINDOW_DAYS = 400
+
+
+class CalendarWindow(NamedTuple):
+    """Local dates ``start_date``..``end_date`` (inclusive) and the matching ``[start_at, end_at)`` datetimes."""
+
+    start_date: object
+    end_date: object
+    start_at: object
+    end_at: object
+
+
+def build_calendar_window(start_date, end_date):
+    current_timezone = timezone.get_current_timezone()
+    return CalendarWindow(
+        start_date=start_date,
+        end_date=end_date,
+        start_at=timezone.make_aware(datetime.combine(start_date, time.min), current_timezone),
+        end_at=timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), current_timezone),
+    )
+
+
+def build_month_calendar_window(anchor_date):
+    month_start = anchor_date.replace(day=1)
+    month_end = anchor_date.replace(day=calendar.monthrange(anchor_date.year, anchor_date.month)[1])
+    return build_calendar_window(
+        month_start - timedelta(days=MONTH_WINDOW_LEAD_DAYS),
+        month_end + timedelta(days=MONTH_WINDOW_TRAIL_DAYS),
+    )
+
+
+def parse_calendar_window(raw_from, raw_to):
+    """
+    Window for ``from``/``to`` query values (``YYYY-MM-DD``).
+
+    Returns ``None`` when both are blank (no window) and raises ``ValueError``
+    for a malformed, reversed or overlong range.
+    """
+    raw_from = str(raw_from or "").strip()
+    raw_to = str(raw_to or "").strip()
+    if not raw_from and not raw_to:
+        return None
+    start_date = parse_date(raw_from) if raw_from else None
+    end_date = parse_date(raw_to) if raw_to else None
+    if start_date is None or end_date is None:
+        raise ValueError("from/to must both be YYYY-MM-DD dates")
+    if end_date < start_date or (end_date - start_date).days > MAX_WINDOW_DAYS:
+        raise ValueError("from/to range is reversed or too long")
+    return build_calendar_window(start_date, end_date)
+
+
 def get_calendar_access_for_user(user):
     if not getattr(user, "is_authenticated", False):
         return set(), set(), []
@@ -31,7 +92,7 @@ def get_calendar_access_for_user(user):
     return visible_owner_ids, editable_owner_ids, incoming_calendars
 
 
-def get_visible_events_queryset(user, *, active_classroom=None, visible_owner_ids=None):
+def get_visible_events_queryset(user, *, active_classroom=None, visible_owner_ids=None, window=None):
     if not getattr(user, "is_authenticated", False):
         return CalendarEvent.objects.none()
 
@@ -43,6 +104,9 @@ def get_visible_events_queryset(user, *, active_classroom=None, visible_owner_id
     if active_classroom is not None:
         query |= Q(classroom=active_classroom)
 
+    if window is not None:
+        query &= Q(start_time__lt=window.end_at, end_time__gte=window.start_at)
+
     return (
         CalendarEvent.objects.filter(query)
         .select_related("author", "classroom")
@@ -52,12 +116,17 @@ def get_visible_events_queryset(user, *, active_classroom=None, visible_owner_id
     )
 
 
-def get_visible_tasks_queryset(user):
+def get_visible_tasks_queryset(user, *, window=None):
     if not getattr(user, "is_authenticated", False):
         return CalendarTask.objects.none()
 
+    query = Q(author=user)
+    if window is not None:
+        # Undated tasks belong to every window.
+        query &= Q(due_at__isnull=True) | Q(due_at__gte=window.start_at, due_at__lt=window.end_at)
+
     return (
-        CalendarTask.objects.filter(author=user)
+        CalendarTask.objects.filter(query)
         .select_related("author", "classroom")
         .prefetch_related("message_captures__attachments")
         .order_by("due_at", "created_at", "id")
@@ -0,0 +1,295 @@
+"""
+Materialized hub items for the calendar.
+
+Collect deadlines, training sessions, consent link expiries and special-room
+reservations are copied into ``CalendarHubItem`` rows by the handlers in
+``signals.py``. The calendar then reads them with one (owner, date_key) range
+query instead of querying four apps on every request. Rows hold source facts
+only; labels that depend on today's date are worked out when items are read.
+
+``rebuild_hub_index`` backfills and repairs the table, and ``check_hub_index``
+reports rows that drifted from their sources (for example after a queryset
+``update()``, which sends no signals).
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+from urllib.parse import urlencode
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import CalendarHubItem
+
+logger = logging.getLogger(__name__)
+
+HUB_INDEX_FIELDS = (
+    "owner_id",
+    "hub_id",
+    "date_key",
+    "start_at",
+    "end_at",
+    "title",
+    "detail_text",
+    "slot_no",
+    "total_count",
+    "pending_count",
+    "is_done",
+    "source_url",
+)
+SIGNATURE_SESSION_MINUTES = 60
+
+
+def _local_datetime(value):
+    if timezone.is_naive(value):
+        return timezone.make_aware(value, timezone.get_current_timezone())
+    return timezone.localtime(value)
+
+
+def _row(*, source_id, owner_id, hub_id, start_at, end_at, title, source_url, **extra):
+    row = {
+        "source_id": str(source_id),
+        "owner_id": owner_id,
+        "hub_id": hub_id,
+        "date_key": start_at.date(),
+        "start_at": start_at,
+        "end_at": end_at,
+        "title": str(title or "")[:200],
+        "detail_text": "",
+        "slot_no": None,
+        "total_count": 0,
+        "pending_count": 0,
+        "is_done": False,
+        "source_url": source_url,
+    }
+    row.update(extra)
+    return row
+
+
+def _collect_rows(source_ids=None):
+    from collect.models import CollectionRequest
+
+    queryset = (
+        CollectionRequest.objects.filter(deadline__isnull=False)
+        .exclude(status="archived")
+        .annotate(submission_total=Count("submissions", distinct=True))
+    )
+    if source_ids is not None:
+        queryset = queryset.filter(pk__in=source_ids)
+    for request_item in queryset:
+        deadline = _local_datetime(request_item.deadline)
+        yield _row(
+            source_id=request_item.pk,
+            owner_id=request_item.creator_id,
+            hub_id=f"collect:{request_item.id}",
+            start_at=deadline,
+            end_at=deadline,
+            title=request_item.title,
+            source_url=reverse("collect:request_detail", kwargs={"request_id": request_item.id}),
+            total_count=int(request_item.submission_total or 0),
+            is_done=request_item.status == "closed",
+        )
+
+
+def _signature_rows(source_ids=None):
+    from signatures.models import TrainingSession
+
+    queryset = TrainingSession.objects.filter(created_by__isnull=False)
+    if source_ids is not None:
+        queryset = queryset.filter(pk__in=source_ids)
+    for session in queryset:
+        session_datetime = _local_datetime(session.datetime)
+        yield _row(
+            source_id=session.pk,
+            owner_id=session.created_by_id,
+            hub_id=f"signature:{session.uuid}",
+            start_at=session_datetime,
+            end_at=session_datetime + timedelta(minutes=SIGNATURE_SESSION_MINUTES),
+            title=session.title,
+            source_url=reverse("signatures:detail", kwargs={"uuid": session.uuid}),
+            detail_text=str(session.location or "")[:200],
+            is_done=not session.is_active,
+        )
+
+
+def _consent_rows(source_ids=None):
+    from consent.models import SignatureRecipient, SignatureRequest
+
+    pending_statuses = [
+        SignatureRecipient.STATUS_PENDING,
+        SignatureRecipient.STATUS_VERIFIED,
+    ]
+    queryset = SignatureRequest.objects.filter(sent_at__isnull=False).annotate(
+        recipient_count=Count("recipients", distinct=True),
+        pending_recipient_count=Count(
+            "recipients",
+            filter=Q(recipients__status__in=pending_statuses),
+            distinct=True,
+        ),
+    )
+    if source_ids is not None:
+        queryset = queryset.filter(pk__in=source_ids)
+    for request_item in queryset:
+        expires_at = _local_datetime(request_item.link_expires_at)
+        pending_count = int(request_item.pending_recipient_count or 0)
+        yield _row(
+            source_id=request_item.pk,
+            owner_id=request_item.created_by_id,
+            hub_id=f"consent:{request_item.request_id}",
+            start_at=expires_at,
+            end_at=expires_at,
+            title=request_item.title,
+            source_url=reverse("consent:detail", kwargs={"request_id": request_item.request_id}),
+            total_count=int(request_item.recipient_count or 0),
+            pending_count=pending_count,
+            is_done=request_item.status == request_item.STATUS_COMPLETED or pending_count == 0,
+        )
+
+
+def reservation_period_times(reservation):
+    """(slot label, start, end) of a reservation from its school's period slots, or a default period grid."""
+    school_config = getattr(getattr(reservation.room, "school", None), "config", None)
+    slot_time = ""
+    slot_label = f"{reservation.period}교시"
+    if school_config:
+        for slot in school_config.get_period_slots():
+            if int(slot.get("id") or 0) != int(reservation.period or 0):
+                continue
+            slot_label = slot.get("label") or slot_label
+            slot_time = slot.get("time") or ""
+            break
+    if slot_time and "-" in slot_time:
+        start_text, end_text = [segment.strip() for segment in slot_time.split("-", 1)]
+        try:
+            start_clock = datetime.strptime(start_text, "%H:%M").time()
+            end_clock = datetime.strptime(end_text, "%H:%M").time()
+        except ValueError:
+            start_clock = None
+            end_clock = None
+    else:
+        start_clock = None
+        end_clock = None
+    if not start_clock or not end_clock:
+        start_hour = min(22, 8 + max(1, int(reservation.period or 1)))
+        start_clock = time(hour=start_hour, minute=0)
+        end_clock = (datetime.combine(timezone.localdate(), start_clock) + timedelta(minutes=40)).time()
+    start_at = timezone.make_aware(
+        datetime.combine(reservation.date, start_clock),
+        timezone.get_current_timezone(),
+    )
+    end_at = timezone.make_aware(
+        datetime.combine(reservation.date, end_clock),
+        timezone.get_current_timezone(),
+    )
+    if end_at <= start_at:
+        end_at = start_at + timedelta(minutes=40)
+    return slot_label, start_at, end_at
+
+
+def _reservation_rows(source_ids=None):
+    from reservations.models import Reservation
+
+    queryset = Reservation.objects.filter(created_by__isnull=False).select_related(
+        "room",
+        "room__school",
+        "room__school__config",
+    )
+    if source_ids is not None:
+        queryset = queryset.filter(pk__in=source_ids)
+    for reservation in queryset:
+        slot_label, start_at, end_at = reservation_period_times(reservation)
+        index_url = reverse("reservations:reservation_index", kwargs={"school_slug": reservation.room.school.slug})
+        query = urlencode({"date": reservation.date.strftime("%Y-%m-%d"), "reservation": reservation.id})
+        yield _row(
+            source_id=reservation.pk,
+            owner_id=reservation.created_by_id,
+            hub_id=f"reservation:{reservation.id}",
+            start_at=start_at,
+            end_at=end_at,
+            title=reservation.room.name,
+            source_url=f"{index_url}?{query}",
+            detail_text=str(slot_label)[:200],
+            slot_no=max(0, int(reservation.period or 0)),
+        )
+
+
+HUB_INDEX_SOURCES = {
+    CalendarHubItem.Kind.COLLECT: _collect_rows,
+    CalendarHubItem.Kind.SIGNATURE: _signature_rows,
+    CalendarHubItem.Kind.CONSENT: _consent_rows,
+    CalendarHubItem.Kind.RESERVATION: _reservation_rows,
+}
+
+
+def refresh_hub_items(item_kind, source_ids):
+    """Re-copy the given source rows; sources that are gone or no longer dated lose their hub item."""
+    source_ids = {str(source_id) for source_id in source_ids if source_id is not None}
+    if not source_ids:
+        return
+    rows = {row["source_id"]: row for row in HUB_INDEX_SOURCES[item_kind](source_ids)}
+    with transaction.atomic():
+        CalendarHubItem.objects.filter(item_kind=item_kind, source_id__in=source_ids - rows.keys()).delete()
+        for source_id, row in rows.items():
+            CalendarHubItem.objects.update_or_create(
+                item_kind=item_kind,
+                source_id=source_id,
+                defaults={field_name: row[field_name] for field_name in HUB_INDEX_FIELDS},
+            )
+
+
+def _is_stale(item, row):
+    return any(getattr(item, field_name) != row[field_name] for field_name in HUB_INDEX_FIELDS)
+
+
+def _diff_hub_index(item_kind):
+    rows = {row["source_id"]: row for row in HUB_INDEX_SOURCES[item_kind]()}
+    items = {item.source_id: item for item in CalendarHubItem.objects.filter(item_kind=item_kind)}
+    missing = sorted(rows.keys() - items.keys())
+    orphaned = sorted(items.keys() - rows.keys())
+    stale = sorted(source_id for source_id in rows.keys() & items.keys() if _is_stale(items[source_id], rows[source_id]))
+    return rows, items, missing, stale, orphaned
+
+
+def check_hub_index(item_kinds=None):
+    """Per kind, the source IDs whose hub item is ``missing``, ``stale`` or ``orphaned`` (source gone)."""
+    report = {}
+    for item_kind in item_kinds or HUB_INDEX_SOURCES:
+        _rows, _items, missing, stale, orphaned = _diff_hub_index(item_kind)
+        report[item_kind] = {"missing": missing, "stale": stale, "orphaned": orphaned}
+    return report
+
+
+def rebuild_hub_index(item_kinds=None, *, batch_size=500, dry_run=False):
+    """Bring the hub items of each kind in line with their sources; returns created/updated/deleted counts."""
+    counts = {}
+    for item_kind in item_kinds or HUB_INDEX_SOURCES:
+        rows, items, missing, stale, orphaned = _diff_hub_index(item_kind)
+        counts[item_kind] = {"created": len(missing), "updated": len(stale), "deleted": len(orphaned)}
+        if dry_run:
+            continue
+        now = timezone.now()
+        updated_items = []
+        for source_id in stale:
+            item = items[source_id]
+            for field_name in HUB_INDEX_FIELDS:
+                setattr(item, field_name, rows[source_id][field_name])
+            item.updated_at = now
+            updated_items.append(item)
+        with transaction.atomic():
+            CalendarHubItem.objects.filter(item_kind=item_kind, source_id__in=orphaned).delete()
+            CalendarHubItem.objects.bulk_update(updated_items, [*HUB_INDEX_FIELDS, "updated_at"], batch_size=batch_size)
+            CalendarHubItem.objects.bulk_create(
+                [
+                    CalendarHubItem(
+                        item_kind=item_kind,
+                        source_id=source_id,
+                        **{field_name: rows[source_id][field_name] for field_name in HUB_INDEX_FIELDS},
+                    )
+                    for source_id in missing
+                ],
+                batch_size=batch_size,
+            )
+        logger.info("[ClassCalendar] hub index rebuilt kind=%s counts=%s", item_kind, counts[item_kind])
+    return counts
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from classcalendar.hub_index import rebuild_hub_index
+from classcalendar.models import CalendarHubItem
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy collect deadlines, training sessions, consent expiries and reservations into the calendar hub index. "
+        "Safe to re-run: existing rows are updated and rows whose source is gone are deleted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=CalendarHubItem.Kind.values,
+            help="Limit to one item kind (repeatable). Defaults to every kind.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per bulk insert/update.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many rows would change without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get("dry_run"))
+        counts = rebuild_hub_index(options.get("kind"), batch_size=max(1, options["batch_size"]), dry_run=dry_run)
+        mode = "would backfill" if dry_run else "backfilled"
+        for item_kind, kind_counts in counts.items():
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{mode} {item_kind}: created={kind_counts['created']} "
+                    f"updated={kind_counts['updated']} deleted={kind_counts['deleted']}"
+                )
+            )
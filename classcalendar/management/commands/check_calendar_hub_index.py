@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from classcalendar.hub_index import check_hub_index, rebuild_hub_index
+from classcalendar.models import CalendarHubItem
+
+SAMPLE_SIZE = 5
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the calendar hub index with the collect, signatures, consent and reservations tables. "
+        "Exits with an error when rows are missing, stale or orphaned unless --fix is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=CalendarHubItem.Kind.values,
+            help="Limit to one item kind (repeatable). Defaults to every kind.",
+        )
+        parser.add_argument("--fix", action="store_true", help="Rebuild the kinds that drifted.")
+
+    def handle(self, *args, **options):
+        report = check_hub_index(options.get("kind"))
+        drifted_kinds = []
+        for item_kind, problems in report.items():
+            total = sum(len(source_ids) for source_ids in problems.values())
+            if not total:
+                self.stdout.write(f"{item_kind}: ok")
+                continue
+            drifted_kinds.append(item_kind)
+            details = " ".join(
+                f"{problem}={len(source_ids)} {source_ids[:SAMPLE_SIZE]}"
+                for problem, source_ids in problems.items()
+                if source_ids
+            )
+            self.stdout.write(self.style.WARNING(f"{item_kind}: {details}"))
+
+        if not drifted_kinds:
+            self.stdout.write(self.style.SUCCESS("calendar hub index is consistent"))
+            return
+        if not options.get("fix"):
+            raise CommandError(f"calendar hub index drifted for: {', '.join(drifted_kinds)}")
+        rebuild_hub_index(drifted_kinds)
+        self.stdout.write(self.style.SUCCESS(f"rebuilt calendar hub index for: {', '.join(drifted_kinds)}"))
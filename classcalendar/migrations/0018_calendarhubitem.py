@@ -0,0 +1,60 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("classcalendar", "0017_alter_calendarmessagecapturecandidate_candidate_kind"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CalendarHubItem",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "item_kind",
+                    models.CharField(
+                        choices=[
+                            ("collect", "수합"),
+                            ("signature", "사인"),
+                            ("consent", "동의서"),
+                            ("reservation", "예약"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("source_id", models.CharField(max_length=64)),
+                ("hub_id", models.CharField(max_length=100)),
+                ("date_key", models.DateField()),
+                ("start_at", models.DateTimeField()),
+                ("end_at", models.DateTimeField()),
+                ("title", models.CharField(max_length=200)),
+                ("detail_text", models.CharField(blank=True, default="", max_length=200)),
+                ("slot_no", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("total_count", models.PositiveIntegerField(default=0)),
+                ("pending_count", models.PositiveIntegerField(default=0)),
+                ("is_done", models.BooleanField(default=False)),
+                ("source_url", models.CharField(blank=True, default="", max_length=500)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="calendar_hub_items",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date_key", "start_at", "id"],
+                "indexes": [models.Index(fields=["owner", "date_key"], name="classcalend_owner_i_c70188_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("item_kind", "source_id"), name="calendar_hub_item_unique_source")
+                ],
+            },
+        ),
+    ]
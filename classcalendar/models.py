@@ -508,3 +508,48 @@ class CalendarEventSyncTask(models.Model):
 
     def __str__(self):
         return f"{self.event_id}:{self.target_type}:{self.status}"
+
+
+class CalendarHubItem(models.Model):
+    """Read copy of a dated item from another service, kept current by ``classcalendar.signals``."""
+
+    class Kind(models.TextChoices):
+        COLLECT = "collect", "수합"
+        SIGNATURE = "signature", "사인"
+        CONSENT = "consent", "동의서"
+        RESERVATION = "reservation", "예약"
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="calendar_hub_items",
+    )
+    item_kind = models.CharField(max_length=20, choices=Kind.choices)
+    source_id = models.CharField(max_length=64)
+    hub_id = models.CharField(max_length=100)
+    date_key = models.DateField()
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField()
+    title = models.CharField(max_length=200)
+    detail_text = models.CharField(max_length=200, blank=True, default="")
+    slot_no = models.PositiveSmallIntegerField(null=True, blank=True)
+    total_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    is_done = models.BooleanField(default=False)
+    source_url = models.CharField(max_length=500, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["date_key", "start_at", "id"]
+        indexes = [
+            models.Index(fields=["owner", "date_key"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["item_kind", "source_id"],
+                name="calendar_hub_item_unique_source",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.hub_id} ({self.date_key})"
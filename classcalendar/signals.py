@@ -0,0 +1,83 @@
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .hub_index import refresh_hub_items
+from .models import CalendarHubItem
+
+logger = logging.getLogger(__name__)
+
+
+def _refresh_hub_items(item_kind, source_ids, *, raw=False):
+    if raw:
+        return
+    try:
+        refresh_hub_items(item_kind, source_ids)
+    except Exception:
+        # The source write must not fail on the calendar copy; check_calendar_hub_index repairs it.
+        logger.exception("[ClassCalendar] hub index refresh failed kind=%s source_ids=%s", item_kind, source_ids)
+
+
+def _refresh_reservations(**filters):
+    from reservations.models import Reservation
+
+    # Left lazy so a failing lookup is logged like any other refresh error.
+    _refresh_hub_items(CalendarHubItem.Kind.RESERVATION, Reservation.objects.filter(**filters).values_list("id", flat=True))
+
+
+@receiver(post_save, sender="collect.CollectionRequest")
+@receiver(post_delete, sender="collect.CollectionRequest")
+def refresh_collect_hub_item(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.COLLECT, [instance.pk], raw=raw)
+
+
+@receiver(post_save, sender="collect.Submission")
+@receiver(post_delete, sender="collect.Submission")
+def refresh_collect_hub_item_for_submission(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.COLLECT, [instance.collection_request_id], raw=raw)
+
+
+@receiver(post_save, sender="signatures.TrainingSession")
+@receiver(post_delete, sender="signatures.TrainingSession")
+def refresh_signature_hub_item(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.SIGNATURE, [instance.pk], raw=raw)
+
+
+@receiver(post_save, sender="consent.SignatureRequest")
+@receiver(post_delete, sender="consent.SignatureRequest")
+def refresh_consent_hub_item(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.CONSENT, [instance.pk], raw=raw)
+
+
+@receiver(post_save, sender="consent.SignatureRecipient")
+@receiver(post_delete, sender="consent.SignatureRecipient")
+def refresh_consent_hub_item_for_recipient(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.CONSENT, [instance.request_id], raw=raw)
+
+
+@receiver(post_save, sender="reservations.Reservation")
+@receiver(post_delete, sender="reservations.Reservation")
+def refresh_reservation_hub_item(sender, instance, raw=False, **kwargs):
+    _refresh_hub_items(CalendarHubItem.Kind.RESERVATION, [instance.pk], raw=raw)
+
+
+@receiver(post_save, sender="reservations.SpecialRoom")
+def refresh_reservation_hub_items_for_room(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    _refresh_reservations(room_id=instance.pk)
+
+
+@receiver(post_save, sender="reservations.School")
+def refresh_reservation_hub_items_for_school(sender, instance, created=False, raw=False, **kwargs):
+    if created or raw:
+        return
+    _refresh_reservations(room__school_id=instance.pk)
+
+
+@receiver(post_save, sender="reservations.SchoolConfig")
+def refresh_reservation_hub_items_for_school_config(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _refresh_reservations(room__school_id=instance.school_id)
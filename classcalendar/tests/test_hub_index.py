@@ -0,0 +1,126 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from classcalendar.hub_index import check_hub_index, rebuild_hub_index
+from classcalendar.models import CalendarHubItem
+from collect.models import CollectionRequest, Submission
+from reservations.models import Reservation, School, SpecialRoom
+
+
+User = get_user_model()
+
+
+class CalendarHubIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="hub_index_user",
+            password="pw12345",
+            email="hub_index_user@example.com",
+        )
+        self.school = School.objects.create(name="색인학교", slug="hub-index-school", owner=self.user)
+        self.room = SpecialRoom.objects.create(school=self.school, name="과학실", icon="🔬")
+
+    def _collect_item(self, request_item):
+        return CalendarHubItem.objects.filter(
+            item_kind=CalendarHubItem.Kind.COLLECT,
+            source_id=str(request_item.id),
+        ).first()
+
+    def test_collect_request_changes_are_mirrored(self):
+        deadline = timezone.now() + timedelta(days=2)
+        request_item = CollectionRequest.objects.create(creator=self.user, title="회신 수합", deadline=deadline)
+
+        item = self._collect_item(request_item)
+        self.assertEqual(item.owner_id, self.user.id)
+        self.assertEqual(item.date_key, timezone.localtime(deadline).date())
+        self.assertEqual(item.hub_id, f"collect:{request_item.id}")
+
+        Submission.objects.create(
+            collection_request=request_item,
+            contributor_name="김교사",
+            submission_type="text",
+            text_content="회신 완료",
+        )
+        self.assertEqual(self._collect_item(request_item).total_count, 1)
+
+        request_item.status = "closed"
+        request_item.save()
+        self.assertTrue(self._collect_item(request_item).is_done)
+
+        request_item.status = "archived"
+        request_item.save()
+        self.assertIsNone(self._collect_item(request_item))
+
+    def test_room_rename_refreshes_reservation_items(self):
+        reservation = Reservation.objects.create(
+            room=self.room,
+            created_by=self.user,
+            date=timezone.localdate(),
+            period=2,
+            grade=5,
+            class_no=1,
+            name="담임",
+        )
+
+        self.room.name = "음악실"
+        self.room.save()
+
+        item = CalendarHubItem.objects.get(item_kind=CalendarHubItem.Kind.RESERVATION, source_id=str(reservation.id))
+        self.assertEqual(item.title, "음악실")
+        self.assertEqual(item.slot_no, 2)
+
+        reservation.delete()
+        self.assertFalse(CalendarHubItem.objects.filter(item_kind=CalendarHubItem.Kind.RESERVATION).exists())
+
+    def test_check_reports_drift_and_rebuild_repairs_it(self):
+        kept = CollectionRequest.objects.create(
+            creator=self.user,
+            title="그대로",
+            deadline=timezone.now() + timedelta(days=1),
+        )
+        renamed = CollectionRequest.objects.create(
+            creator=self.user,
+            title="이전 제목",
+            deadline=timezone.now() + timedelta(days=3),
+        )
+        CollectionRequest.objects.filter(id=renamed.id).update(title="새 제목")
+        CalendarHubItem.objects.filter(source_id=str(kept.id)).delete()
+        CalendarHubItem.objects.create(
+            owner=self.user,
+            item_kind=CalendarHubItem.Kind.COLLECT,
+            source_id="gone",
+            hub_id="collect:gone",
+            date_key=timezone.localdate(),
+            start_at=timezone.now(),
+            end_at=timezone.now(),
+            title="삭제된 수합",
+        )
+
+        report = check_hub_index([CalendarHubItem.Kind.COLLECT])[CalendarHubItem.Kind.COLLECT]
+        self.assertEqual(report, {"missing": [str(kept.id)], "stale": [str(renamed.id)], "orphaned": ["gone"]})
+
+        counts = rebuild_hub_index([CalendarHubItem.Kind.COLLECT])
+        self.assertEqual(counts[CalendarHubItem.Kind.COLLECT], {"created": 1, "updated": 1, "deleted": 1})
+        self.assertEqual(self._collect_item(renamed).title, "새 제목")
+        self.assertEqual(check_hub_index()[CalendarHubItem.Kind.COLLECT], {"missing": [], "stale": [], "orphaned": []})
+
+    def test_check_command_fails_on_drift_until_fixed(self):
+        request_item = CollectionRequest.objects.create(
+            creator=self.user,
+            title="수합",
+            deadline=timezone.now() + timedelta(days=1),
+        )
+        CalendarHubItem.objects.filter(source_id=str(request_item.id)).delete()
+
+        with self.assertRaises(CommandError):
+            call_command("check_calendar_hub_index", stdout=StringIO())
+        call_command("check_calendar_hub_index", "--fix", stdout=StringIO())
+
+        out = StringIO()
+        call_command("check_calendar_hub_index", stdout=out)
+        self.assertIn("consistent", out.getvalue())
@@ -354,3 +354,102 @@ class IntegrationLinksAndSettingsTests(TestCase):
         self.assertNotIn("SUMMARY:할 일 항목", content)
         self.assertNotIn("SUMMARY:다른 교사 일정", content)
         self.assertNotIn("SUMMARY:다른 교사 수합", content)
+
+    def _create_local_event(self, title, start_time):
+        return CalendarEvent.objects.create(
+            title=title,
+            author=self.user,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            is_all_day=False,
+            source=CalendarEvent.SOURCE_LOCAL,
+            visibility=CalendarEvent.VISIBILITY_TEACHER,
+        )
+
+    def test_api_events_window_limits_events_and_hub_items(self):
+        now = timezone.now()
+        self._create_local_event("창 안 일정", now)
+        self._create_local_event("창 밖 일정", now + timedelta(days=90))
+        CollectionRequest.objects.create(creator=self.user, title="창 안 수합", deadline=now + timedelta(days=1))
+        CollectionRequest.objects.create(creator=self.user, title="창 밖 수합", deadline=now + timedelta(days=90))
+        today = timezone.localdate()
+
+        response = self.client.get(
+            reverse("classcalendar:api_events"),
+            {"from": (today - timedelta(days=7)).isoformat(), "to": (today + timedelta(days=7)).isoformat()},
+        )
+
+        payload = response.json()
+        self.assertEqual([event["title"] for event in payload["events"]], ["창 안 일정"])
+        collect_titles = [item["title"] for item in self._hub_items(response) if item.get("item_kind") == "collect"]
+        self.assertIn("창 안 수합", " ".join(collect_titles))
+        self.assertNotIn("창 밖 수합", " ".join(collect_titles))
+        self.assertEqual(payload["window"]["from"], (today - timedelta(days=7)).isoformat())
+        self.assertTrue(payload["sync_token"])
+
+    def test_api_events_since_returns_changed_items_and_window_ids(self):
+        now = timezone.now()
+        unchanged = self._create_local_event("그대로 일정", now)
+        changed = self._create_local_event("바뀐 일정", now + timedelta(hours=2))
+        today = timezone.localdate()
+        window = {"from": (today - timedelta(days=7)).isoformat(), "to": (today + timedelta(days=7)).isoformat()}
+        CalendarEvent.objects.filter(id=unchanged.id).update(updated_at=now - timedelta(hours=1))
+
+        response = self.client.get(
+            reverse("classcalendar:api_events"),
+            {**window, "since": (now - timedelta(minutes=30)).isoformat()},
+        )
+
+        payload = response.json()
+        self.assertTrue(payload["changed_only"])
+        self.assertEqual([event["id"] for event in payload["events"]], [str(changed.id)])
+        self.assertEqual(payload["event_ids"], [str(unchanged.id), str(changed.id)])
+
+    def test_api_events_answers_not_modified_for_matching_etag(self):
+        self._create_local_event("캐시 일정", timezone.now())
+
+        first = self.client.get(reverse("classcalendar:api_events"))
+        second = self.client.get(reverse("classcalendar:api_events"), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+
+    def test_api_events_rejects_invalid_window(self):
+        response = self.client.get(reverse("classcalendar:api_events"), {"from": "2026-03-10", "to": "2026-03-01"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["status"], "error")
+
+    def test_external_ical_feed_revalidates_until_a_source_changes(self):
+        owner = User.objects.create_user(
+            username="user694",
+            password="pw12345",
+            email="user694@example.com",
+        )
+        SocialAccount.objects.create(user=owner, provider="naver", uid="naver-user694")
+        event = CalendarEvent.objects.create(
+            title="학급 회의",
+            author=owner,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=1),
+            is_all_day=False,
+            source=CalendarEvent.SOURCE_LOCAL,
+            visibility=CalendarEvent.VISIBILITY_TEACHER,
+        )
+        feed_url = reverse("classcalendar:external_ical_feed")
+
+        with patch.dict(os.environ, {"EDUITIT_API_KEY": "test-fixed-key"}, clear=False):
+            first = Client().get(feed_url, {"api_key": "test-fixed-key"})
+            repeated = Client().get(feed_url, {"api_key": "test-fixed-key"})
+            revalidated = Client().get(feed_url, {"api_key": "test-fixed-key"}, HTTP_IF_NONE_MATCH=first["ETag"])
+            event.title = "학급 회의 변경"
+            event.save()
+            changed = Client().get(feed_url, {"api_key": "test-fixed-key"}, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first["Last-Modified"])
+        self.assertEqual(repeated.content, first.content)
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+        self.assertIn("SUMMARY:학급 회의 변경", changed.content.decode("utf-8"))
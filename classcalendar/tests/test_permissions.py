@@ -34,12 +34,14 @@ class PermissionTest(TestCase):
 
     def _create_event(self, title="기존 일정", author=None):
         owner = author or self.teacher
+        # Near today so the event is inside the month the calendar page ships.
+        start_time = timezone.now().replace(second=0, microsecond=0)
         return CalendarEvent.objects.create(
             title=title,
             classroom=self.classroom,
             author=owner,
-            start_time="2026-03-01T10:00:00Z",
-            end_time="2026-03-01T11:00:00Z",
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
             color="indigo",
             visibility=CalendarEvent.VISIBILITY_TEACHER,
         )
@@ -50,7 +52,7 @@ class PermissionTest(TestCase):
             title=title,
             classroom=self.classroom,
             author=owner,
-            due_at="2026-03-01T10:00:00Z",
+            due_at=timezone.now().replace(second=0, microsecond=0),
             has_time=True,
         )
 
@@ -5,6 +5,7 @@ import os
 import secrets
 import uuid
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from urllib.parse import urlencode
 
 from allauth.socialaccount.models import SocialAccount
@@ -12,19 +13,23 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.files.base import File
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError, transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Max, Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import NoReverseMatch, reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.http import http_date
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.clickjacking import xframe_options_sameorigin
 from django.views.decorators.http import require_GET, require_POST
-from korean_lunar_calendar import KoreanLunarCalendar
 
+from core import korean_calendar
 from core.active_classroom import get_active_classroom_for_request
 from core.ai_usage_limits import consume_ai_usage_limit, user_usage_subject
 from products.models import Product
@@ -58,15 +63,18 @@ from .message_capture_classifier import (
     predict_item_type as predict_message_capture_item_type,
 )
 from .calendar_scope import (
+    build_month_calendar_window,
     get_calendar_access_for_user as resolve_calendar_access_for_user,
     get_visible_events_queryset,
     get_visible_tasks_queryset,
+    parse_calendar_window,
 )
 from .today_memos import build_today_execution_context, normalize_today_focus
 from .models import (
     CalendarCollaborator,
     CalendarEvent,
     CalendarEventAttachment,
+    CalendarHubItem,
     CalendarIntegrationSetting,
     CalendarMessageCapture,
     CalendarMessageCaptureCandidate,
@@ -106,13 +114,15 @@ DIRECT_HUB_INTEGRATION_SOURCES = {
     SOURCE_RESERVATION,
     SOURCE_SIGNATURES_TRAINING,
 }
+CALENDAR_SYNC_TOKEN_OVERLAP_SECONDS = 5
+EXTERNAL_ICAL_CACHE_SECONDS = 60 * 60
+EXTERNAL_ICAL_CACHE_KEY_TEMPLATE = "classcalendar:ical:{user_id}:{version}"
+EXTERNAL_ICAL_EVENT_MEMO_SIZE = 4096
 HUB_TONE_PRIORITY = {
     "warning": 3,
     "neutral": 2,
     "done": 1,
 }
-KOREAN_HOLIDAY_MIN_YEAR = 1900
-KOREAN_HOLIDAY_MAX_YEAR = 2100
 HUB_SERVICE_LABELS = {
     "event": "일정",
     "task": "할 일",
@@ -464,10 +474,20 @@ def _build_ical_event_lines(item, *, dtstamp_utc):
     return lines
 
 
-def _render_external_ical_feed(*, user, hub_items):
+@lru_cache(maxsize=EXTERNAL_ICAL_EVENT_MEMO_SIZE)
+def _render_ical_event_parts(item_key):
+    """Folded VEVENT text before and after its DTSTAMP line, memoized by the hub item's content."""
+    folded_lines = [_ical_fold_line(line) for line in _build_ical_event_lines(dict(item_key), dtstamp_utc="")]
+    if not folded_lines:
+        return None
+    # _build_ical_event_lines puts DTSTAMP third, after BEGIN:VEVENT and UID.
+    return "\r\n".join(folded_lines[:2]), "\r\n".join(folded_lines[3:])
+
+
+def _render_external_ical_feed(*, user, hub_items, dtstamp_at=None):
     calendar_name = f"에듀잇티 캘린더 - {_display_user_name(user)}"
-    dtstamp_utc = timezone.now().astimezone(timezone.UTC).strftime("%Y%m%dT%H%M%SZ")
-    lines = [
+    dtstamp_utc = (dtstamp_at or timezone.now()).astimezone(timezone.UTC).strftime("%Y%m%dT%H%M%SZ")
+    header_lines = [
         "BEGIN:VCALENDAR",
         "VERSION:2.0",
         "PRODID:-//Eduitit//ClassCalendar//KO",
@@ -476,10 +496,68 @@ def _render_external_ical_feed(*, user, hub_items):
         f"X-WR-CALNAME:{_ical_escape_text(calendar_name)}",
         "X-WR-TIMEZONE:Asia/Seoul",
     ]
+    blocks = [_ical_fold_line(line) for line in header_lines]
+    dtstamp_line = _ical_fold_line(f"DTSTAMP:{dtstamp_utc}")
     for item in hub_items:
-        lines.extend(_build_ical_event_lines(item, dtstamp_utc=dtstamp_utc))
-    lines.append("END:VCALENDAR")
-    return "\r\n".join(_ical_fold_line(line) for line in lines) + "\r\n"
+        event_parts = _render_ical_event_parts(tuple(sorted(item.items())))
+        if event_parts is not None:
+            blocks.extend((event_parts[0], dtstamp_line, event_parts[1]))
+    blocks.append("END:VCALENDAR")
+    return "\r\n".join(blocks) + "\r\n"
+
+
+def _build_external_ical_version(request, *, user, visible_owner_ids, visible_events_queryset):
+    """
+    Fingerprint and Last-Modified time of the external feed, from aggregate queries only.
+
+    Deletions change a count and edits raise a max ``updated_at``. Hub labels
+    that change with time ("마감 지남", "오늘") are covered by the latest
+    deadline already passed and by today's date.
+    """
+    now = timezone.now()
+    local_midnight = timezone.make_aware(
+        datetime.combine(timezone.localdate(), time.min),
+        timezone.get_current_timezone(),
+    )
+    event_state = visible_events_queryset.aggregate(count=Count("id", distinct=True), last=Max("updated_at"))
+    hub_state = CalendarHubItem.objects.filter(owner_id__in=visible_owner_ids).aggregate(
+        count=Count("id"),
+        last=Max("updated_at"),
+        last_passed=Max("start_at", filter=Q(start_at__lte=now)),
+    )
+    capture_state = CalendarMessageCapture.objects.filter(author=user).aggregate(
+        count=Count("id"),
+        last=Max("updated_at"),
+    )
+    setting_state = CalendarIntegrationSetting.objects.filter(user_id__in=visible_owner_ids).aggregate(
+        last=Max("updated_at")
+    )
+    last_modified = max(
+        value
+        for value in (
+            local_midnight,
+            event_state["last"],
+            hub_state["last"],
+            hub_state["last_passed"],
+            capture_state["last"],
+            setting_state["last"],
+        )
+        if value is not None
+    )
+    fingerprint = {
+        "user": [user.id, _display_user_name(user), sorted(visible_owner_ids)],
+        "host": request.build_absolute_uri("/"),
+        "message_capture": _is_message_capture_enabled_for_user(user),
+        "events": event_state,
+        "hub": hub_state,
+        "captures": capture_state,
+        "settings": setting_state,
+        "last_modified": last_modified,
+    }
+    digest = hashlib.sha1(
+        json.dumps(fingerprint, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return digest, last_modified
 
 
 def _is_message_capture_enabled_for_user(user):
@@ -774,154 +852,12 @@ def _parse_iso_date(value):
     return parse_date(str(value))
 
 
-def _solar_date_from_lunar(year, month, day, *, intercalation=False):
-    calendar = KoreanLunarCalendar()
-    calendar.setLunarDate(year, month, day, intercalation)
-    solar_value = _parse_iso_date(calendar.SolarIsoFormat())
-    if solar_value is None:
-        raise ValueError(f"Unable to convert lunar date {year}-{month}-{day}")
-    return solar_value
-
-
-def _merge_holiday_marker(markers, marker_date, *, name, kind="public", is_observed=False):
-    if not isinstance(marker_date, date):
-        return
-    date_key = marker_date.isoformat()
-    existing = markers.get(date_key)
-    if existing is None:
-        markers[date_key] = {
-            "name": name,
-            "kind": kind,
-            "is_observed": bool(is_observed),
-        }
-        return
-
-    existing_names = [part.strip() for part in str(existing.get("name") or "").split(" / ") if part.strip()]
-    if name not in existing_names:
-        existing_names.append(name)
-    existing["name"] = " / ".join(existing_names)
-    if existing.get("kind") != "public" and kind == "public":
-        existing["kind"] = "public"
-    existing["is_observed"] = bool(existing.get("is_observed")) or bool(is_observed)
-
-
-def _is_public_holiday_day(target_date, public_dates):
-    if not isinstance(target_date, date):
-        return False
-    return target_date.weekday() == 6 or target_date in public_dates
-
-
-def _next_substitute_holiday(start_date, public_dates, observed_dates):
-    candidate = start_date
-    while (
-        candidate.weekday() == 5
-        or _is_public_holiday_day(candidate, public_dates)
-        or candidate in observed_dates
-    ):
-        candidate += timedelta(days=1)
-    return candidate
-
-
-def _build_korean_holiday_markers(year):
-    year = int(year)
-    if year < KOREAN_HOLIDAY_MIN_YEAR or year > KOREAN_HOLIDAY_MAX_YEAR:
-        return {}
-
-    markers = {}
-    public_dates = {}
-    observed_dates = set()
-    observed_candidates = []
-
-    def add_public_holiday(marker_date, name, *, substitute_group=""):
-        if not isinstance(marker_date, date) or marker_date.year != year:
-            return
-        _merge_holiday_marker(markers, marker_date, name=name, kind="public", is_observed=False)
-        public_dates.setdefault(marker_date, []).append(
-            {
-                "name": name,
-                "substitute_group": substitute_group,
-            }
-        )
-
-    fixed_public_holidays = (
-        (date(year, 1, 1), "신정", ""),
-        (date(year, 3, 1), "삼일절", "single"),
-        (date(year, 5, 5), "어린이날", "single"),
-        (date(year, 6, 6), "현충일", ""),
-        (date(year, 8, 15), "광복절", "single"),
-        (date(year, 10, 3), "개천절", "single"),
-        (date(year, 10, 9), "한글날", "single"),
-        (date(year, 12, 25), "기독탄신일", "single"),
-    )
-    for marker_date, name, substitute_group in fixed_public_holidays:
-        add_public_holiday(marker_date, name, substitute_group=substitute_group)
-
-    seollal_date = _solar_date_from_lunar(year, 1, 1)
-    seollal_days = (
-        (seollal_date - timedelta(days=1), "설날 연휴"),
-        (seollal_date, "설날"),
-        (seollal_date + timedelta(days=1), "설날 연휴"),
-    )
-    for marker_date, name in seollal_days:
-        add_public_holiday(marker_date, name, substitute_group="seollal")
-
-    buddha_birthday = _solar_date_from_lunar(year, 4, 8)
-    add_public_holiday(buddha_birthday, "부처님오신날", substitute_group="single")
-
-    chuseok_date = _solar_date_from_lunar(year, 8, 15)
-    chuseok_days = (
-        (chuseok_date - timedelta(days=1), "추석 연휴"),
-        (chuseok_date, "추석"),
-        (chuseok_date + timedelta(days=1), "추석 연휴"),
-    )
-    for marker_date, name in chuseok_days:
-        add_public_holiday(marker_date, name, substitute_group="chuseok")
-
-    _merge_holiday_marker(markers, date(year, 5, 1), name="근로자의 날", kind="labor", is_observed=False)
-
-    for marker_date, entries in public_dates.items():
-        if marker_date.weekday() not in {5, 6} and len(entries) <= 1:
-            continue
-        single_entry = next(
-            (entry for entry in entries if (entry.get("substitute_group") or "") == "single"),
-            None,
-        )
-        if single_entry is None:
-            continue
-        observed_candidates.append((marker_date + timedelta(days=1), f"{single_entry['name']} 대체공휴일"))
-
-    for group_name, label in (("seollal", "설날 대체공휴일"), ("chuseok", "추석 대체공휴일")):
-        group_dates = sorted(
-            marker_date
-            for marker_date, entries in public_dates.items()
-            if any((entry.get("substitute_group") or "") == group_name for entry in entries)
-        )
-        if not group_dates:
-            continue
-        has_sunday = any(marker_date.weekday() == 6 for marker_date in group_dates)
-        has_overlap = any(
-            len(public_dates.get(marker_date, [])) > 1 and marker_date.weekday() not in {5, 6}
-            for marker_date in group_dates
-        )
-        if not has_sunday and not has_overlap:
-            continue
-        observed_candidates.append((max(group_dates) + timedelta(days=1), label))
-
-    ordered_public_dates = set(public_dates.keys())
-    for start_date, name in sorted(observed_candidates, key=lambda item: item[0]):
-        observed_date = _next_substitute_holiday(start_date, ordered_public_dates, observed_dates)
-        observed_dates.add(observed_date)
-        _merge_holiday_marker(markers, observed_date, name=name, kind="public", is_observed=True)
-
-    return markers
-
-
 def _build_initial_holiday_payload(*, selected_date_key, fallback_date):
     selected_date = _parse_iso_date(selected_date_key) or fallback_date
     target_year = selected_date.year if selected_date else timezone.localdate().year
     return {
         "year": target_year,
-        "markers": _build_korean_holiday_markers(target_year),
+        "markers": korean_calendar.holiday_markers(target_year),
     }
 
 
@@ -2786,309 +2722,178 @@ def _is_owner_integration_enabled(setting_lookup, *, owner_id, field_name):
     return bool(getattr(setting, field_name, True))
 
 
-def _reservation_period_times(reservation):
-    school_config = getattr(getattr(reservation.room, "school", None), "config", None)
-    slot_time = ""
-    slot_label = f"{reservation.period}교시"
-    if school_config:
-        for slot in school_config.get_period_slots():
-            if int(slot.get("id") or 0) != int(reservation.period or 0):
-                continue
-            slot_label = slot.get("label") or slot_label
-            slot_time = slot.get("time") or ""
-            break
-    if slot_time and "-" in slot_time:
-        start_text, end_text = [segment.strip() for segment in slot_time.split("-", 1)]
-        try:
-            start_clock = datetime.strptime(start_text, "%H:%M").time()
-            end_clock = datetime.strptime(end_text, "%H:%M").time()
-        except ValueError:
-            start_clock = None
-            end_clock = None
+HUB_INDEX_SETTING_FIELDS = {
+    CalendarHubItem.Kind.COLLECT: "collect_deadline_enabled",
+    CalendarHubItem.Kind.SIGNATURE: "signatures_training_enabled",
+    CalendarHubItem.Kind.CONSENT: "consent_expiry_enabled",
+    CalendarHubItem.Kind.RESERVATION: "reservation_enabled",
+}
+
+
+def _build_collect_indexed_hub_item(item, *, now, today, slot_counts):
+    deadline = _normalize_hub_datetime(item.start_at)
+    if item.is_done:
+        status_label = "완료"
+        tone = "done"
+    elif now > deadline:
+        status_label = "마감 지남"
+        tone = "warning"
+    elif deadline.date() == today:
+        status_label = "오늘 마감"
+        tone = "warning"
     else:
-        start_clock = None
-        end_clock = None
-    if not start_clock or not end_clock:
-        start_hour = min(22, 8 + max(1, int(reservation.period or 1)))
-        start_clock = time(hour=start_hour, minute=0)
-        end_clock = (datetime.combine(timezone.localdate(), start_clock) + timedelta(minutes=40)).time()
-    start_at = timezone.make_aware(
-        datetime.combine(reservation.date, start_clock),
-        timezone.get_current_timezone(),
-    )
-    end_at = timezone.make_aware(
-        datetime.combine(reservation.date, end_clock),
-        timezone.get_current_timezone(),
+        status_label = "진행 중"
+        tone = "neutral"
+    meta_bits = [_format_hub_clock(deadline)]
+    meta_bits.append(f"제출 {item.total_count}건" if item.total_count else "제출 대기")
+    return _build_hub_item(
+        hub_id=item.hub_id,
+        item_kind="collect",
+        title=item.title,
+        start_at=deadline,
+        end_at=deadline,
+        sort_at=deadline,
+        is_all_day=False,
+        meta_text=" · ".join(bit for bit in meta_bits if bit),
+        status_label=status_label,
+        tone=tone,
+        source_url=item.source_url,
+        source_label="수합 상세로 이동",
+        has_attachment=False,
+        is_readonly=True,
     )
-    if end_at <= start_at:
-        end_at = start_at + timedelta(minutes=40)
-    return slot_label, start_at, end_at
 
 
-def _build_collect_direct_hub_items(owner_ids, setting_lookup):
-    enabled_owner_ids = [
-        owner_id
-        for owner_id in owner_ids
-        if _is_owner_integration_enabled(
-            setting_lookup,
-            owner_id=owner_id,
-            field_name="collect_deadline_enabled",
-        )
-    ]
-    if not enabled_owner_ids:
-        return []
-    try:
-        from collect.models import CollectionRequest
-    except Exception:
-        logger.exception("[ClassCalendar] collect direct hub import failed")
-        return []
-
-    today = timezone.localdate()
-    queryset = (
-        CollectionRequest.objects.filter(creator_id__in=enabled_owner_ids, deadline__isnull=False)
-        .exclude(status="archived")
-        .annotate(submission_total=Count("submissions", distinct=True))
-        .order_by("deadline", "id")
+def _build_signature_indexed_hub_item(item, *, now, today, slot_counts):
+    session_datetime = _normalize_hub_datetime(item.start_at)
+    if item.is_done:
+        status_label = "완료"
+        tone = "done"
+    elif session_datetime.date() < today:
+        status_label = "지난 일정"
+        tone = "warning"
+    elif session_datetime.date() == today:
+        status_label = "오늘"
+        tone = "warning"
+    else:
+        status_label = "예정"
+        tone = "neutral"
+    meta_bits = [_format_hub_clock(session_datetime)]
+    if item.detail_text:
+        meta_bits.append(_compact_hub_text(item.detail_text))
+    return _build_hub_item(
+        hub_id=item.hub_id,
+        item_kind="signature",
+        title=item.title,
+        start_at=session_datetime,
+        end_at=item.end_at,
+        sort_at=session_datetime,
+        is_all_day=False,
+        meta_text=" · ".join(bit for bit in meta_bits if bit),
+        status_label=status_label,
+        tone=tone,
+        source_url=item.source_url,
+        source_label="사인 상세로 이동",
+        has_attachment=False,
+        is_readonly=True,
     )
-    items = []
-    for request_item in queryset:
-        deadline = _normalize_hub_datetime(request_item.deadline)
-        if deadline is None:
-            continue
-        if request_item.status == "closed":
-            status_label = "완료"
-            tone = "done"
-        elif request_item.is_deadline_passed:
-            status_label = "마감 지남"
-            tone = "warning"
-        elif deadline.date() == today:
-            status_label = "오늘 마감"
-            tone = "warning"
-        else:
-            status_label = "진행 중"
-            tone = "neutral"
-        submission_total = int(getattr(request_item, "submission_total", 0) or 0)
-        meta_bits = [_format_hub_clock(deadline)]
-        meta_bits.append(f"제출 {submission_total}건" if submission_total else "제출 대기")
-        items.append(
-            _build_hub_item(
-                hub_id=f"collect:{request_item.id}",
-                item_kind="collect",
-                title=request_item.title,
-                start_at=deadline,
-                end_at=deadline,
-                sort_at=deadline,
-                is_all_day=False,
-                meta_text=" · ".join(bit for bit in meta_bits if bit),
-                status_label=status_label,
-                tone=tone,
-                source_url=reverse("collect:request_detail", kwargs={"request_id": request_item.id}),
-                source_label="수합 상세로 이동",
-                has_attachment=False,
-                is_readonly=True,
-            )
-        )
-    return items
 
 
-def _build_signature_direct_hub_items(owner_ids, setting_lookup):
-    enabled_owner_ids = [
-        owner_id
-        for owner_id in owner_ids
-        if _is_owner_integration_enabled(
-            setting_lookup,
-            owner_id=owner_id,
-            field_name="signatures_training_enabled",
-        )
-    ]
-    if not enabled_owner_ids:
-        return []
-    try:
-        from signatures.models import TrainingSession
-    except Exception:
-        logger.exception("[ClassCalendar] signatures direct hub import failed")
-        return []
-
-    today = timezone.localdate()
-    queryset = (
-        TrainingSession.objects.filter(created_by_id__in=enabled_owner_ids)
-        .annotate(signature_total=Count("signatures", distinct=True))
-        .order_by("datetime", "id")
+def _build_consent_indexed_hub_item(item, *, now, today, slot_counts):
+    expires_at = _normalize_hub_datetime(item.start_at)
+    if item.is_done:
+        status_label = "완료"
+        tone = "done"
+    elif now > expires_at:
+        status_label = "만료"
+        tone = "warning"
+    elif expires_at.date() == today:
+        status_label = "오늘 만료"
+        tone = "warning"
+    else:
+        status_label = "응답 대기"
+        tone = "neutral"
+    meta_bits = [_format_hub_clock(expires_at)]
+    meta_bits.append(
+        f"미완료 {item.pending_count}명"
+        if item.pending_count
+        else (f"대상 {item.total_count}명" if item.total_count else "응답 확인")
+    )
+    return _build_hub_item(
+        hub_id=item.hub_id,
+        item_kind="consent",
+        title=item.title,
+        start_at=expires_at,
+        end_at=expires_at,
+        sort_at=expires_at,
+        is_all_day=False,
+        meta_text=" · ".join(bit for bit in meta_bits if bit),
+        status_label=status_label,
+        tone=tone,
+        source_url=item.source_url,
+        source_label="동의서 상세로 이동",
+        has_attachment=False,
+        is_readonly=True,
     )
-    items = []
-    for session in queryset:
-        session_datetime = _normalize_hub_datetime(session.datetime)
-        if session_datetime is None:
-            continue
-        if not session.is_active:
-            status_label = "완료"
-            tone = "done"
-        elif session_datetime.date() < today:
-            status_label = "지난 일정"
-            tone = "warning"
-        elif session_datetime.date() == today:
-            status_label = "오늘"
-            tone = "warning"
-        else:
-            status_label = "예정"
-            tone = "neutral"
-        meta_bits = [_format_hub_clock(session_datetime)]
-        if session.location:
-            meta_bits.append(_compact_hub_text(session.location))
-        items.append(
-            _build_hub_item(
-                hub_id=f"signature:{session.uuid}",
-                item_kind="signature",
-                title=session.title,
-                start_at=session_datetime,
-                end_at=session_datetime + timedelta(minutes=60),
-                sort_at=session_datetime,
-                is_all_day=False,
-                meta_text=" · ".join(bit for bit in meta_bits if bit),
-                status_label=status_label,
-                tone=tone,
-                source_url=reverse("signatures:detail", kwargs={"uuid": session.uuid}),
-                source_label="사인 상세로 이동",
-                has_attachment=False,
-                is_readonly=True,
-            )
-        )
-    return items
 
 
-def _build_consent_direct_hub_items(owner_ids, setting_lookup):
-    enabled_owner_ids = [
-        owner_id
-        for owner_id in owner_ids
-        if _is_owner_integration_enabled(
-            setting_lookup,
-            owner_id=owner_id,
-            field_name="consent_expiry_enabled",
-        )
-    ]
-    if not enabled_owner_ids:
-        return []
-    try:
-        from consent.models import SignatureRecipient, SignatureRequest
-    except Exception:
-        logger.exception("[ClassCalendar] consent direct hub import failed")
-        return []
-
-    pending_statuses = [
-        SignatureRecipient.STATUS_PENDING,
-        SignatureRecipient.STATUS_VERIFIED,
-    ]
-    today = timezone.localdate()
-    queryset = (
-        SignatureRequest.objects.filter(created_by_id__in=enabled_owner_ids, sent_at__isnull=False)
-        .annotate(
-            recipient_count=Count("recipients", distinct=True),
-            pending_recipient_count=Count(
-                "recipients",
-                filter=Q(recipients__status__in=pending_statuses),
-                distinct=True,
-            ),
-        )
-        .order_by("sent_at", "id")
+def _build_reservation_indexed_hub_item(item, *, now, today, slot_counts):
+    has_conflict = slot_counts.get((item.owner_id, item.date_key, item.slot_no), 0) > 1
+    meta_bits = [item.detail_text, _compact_hub_text(item.title)]
+    return _build_hub_item(
+        hub_id=item.hub_id,
+        item_kind="reservation",
+        title=item.title,
+        start_at=item.start_at,
+        end_at=item.end_at,
+        sort_at=item.start_at,
+        is_all_day=False,
+        meta_text=" · ".join(bit for bit in meta_bits if bit),
+        status_label="확인 필요" if has_conflict else "예약됨",
+        tone="warning" if has_conflict else "neutral",
+        source_url=item.source_url,
+        source_label="예약 상세로 이동",
+        has_attachment=False,
+        is_readonly=True,
     )
-    items = []
-    for request_item in queryset:
-        expires_at = _normalize_hub_datetime(request_item.link_expires_at)
-        if expires_at is None:
-            continue
-        pending_count = int(getattr(request_item, "pending_recipient_count", 0) or 0)
-        recipient_count = int(getattr(request_item, "recipient_count", 0) or 0)
-        if request_item.status == request_item.STATUS_COMPLETED or pending_count == 0:
-            status_label = "완료"
-            tone = "done"
-        elif request_item.is_link_expired:
-            status_label = "만료"
-            tone = "warning"
-        elif expires_at.date() == today:
-            status_label = "오늘 만료"
-            tone = "warning"
-        else:
-            status_label = "응답 대기"
-            tone = "neutral"
-        meta_bits = [_format_hub_clock(expires_at)]
-        meta_bits.append(f"미완료 {pending_count}명" if pending_count else (f"대상 {recipient_count}명" if recipient_count else "응답 확인"))
-        items.append(
-            _build_hub_item(
-                hub_id=f"consent:{request_item.request_id}",
-                item_kind="consent",
-                title=request_item.title,
-                start_at=expires_at,
-                end_at=expires_at,
-                sort_at=expires_at,
-                is_all_day=False,
-                meta_text=" · ".join(bit for bit in meta_bits if bit),
-                status_label=status_label,
-                tone=tone,
-                source_url=reverse("consent:detail", kwargs={"request_id": request_item.request_id}),
-                source_label="동의서 상세로 이동",
-                has_attachment=False,
-                is_readonly=True,
-            )
-        )
-    return items
 
 
-def _build_reservation_direct_hub_items(owner_ids, setting_lookup):
-    enabled_owner_ids = [
-        owner_id
-        for owner_id in owner_ids
+INDEXED_HUB_ITEM_BUILDERS = {
+    CalendarHubItem.Kind.COLLECT: _build_collect_indexed_hub_item,
+    CalendarHubItem.Kind.SIGNATURE: _build_signature_indexed_hub_item,
+    CalendarHubItem.Kind.CONSENT: _build_consent_indexed_hub_item,
+    CalendarHubItem.Kind.RESERVATION: _build_reservation_indexed_hub_item,
+}
+
+
+def _build_indexed_direct_hub_items(owner_ids, setting_lookup, window=None):
+    queryset = CalendarHubItem.objects.filter(owner_id__in=owner_ids)
+    if window is not None:
+        queryset = queryset.filter(date_key__gte=window.start_date, date_key__lte=window.end_date)
+    hub_index_items = [
+        item
+        for item in queryset
         if _is_owner_integration_enabled(
             setting_lookup,
-            owner_id=owner_id,
-            field_name="reservation_enabled",
+            owner_id=item.owner_id,
+            field_name=HUB_INDEX_SETTING_FIELDS[item.item_kind],
         )
     ]
-    if not enabled_owner_ids:
-        return []
-    try:
-        from reservations.models import Reservation
-    except Exception:
-        logger.exception("[ClassCalendar] reservation direct hub import failed")
-        return []
-
-    reservations = list(
-        Reservation.objects.filter(created_by_id__in=enabled_owner_ids)
-        .select_related("room", "room__school", "room__school__config")
-        .order_by("date", "period", "id")
-    )
     slot_counts = {}
-    for reservation in reservations:
-        slot_key = (reservation.created_by_id, reservation.date.isoformat(), int(reservation.period or 0))
-        slot_counts[slot_key] = slot_counts.get(slot_key, 0) + 1
+    for item in hub_index_items:
+        if item.item_kind == CalendarHubItem.Kind.RESERVATION:
+            slot_key = (item.owner_id, item.date_key, item.slot_no)
+            slot_counts[slot_key] = slot_counts.get(slot_key, 0) + 1
 
-    items = []
-    for reservation in reservations:
-        slot_label, start_at, end_at = _reservation_period_times(reservation)
-        slot_key = (reservation.created_by_id, reservation.date.isoformat(), int(reservation.period or 0))
-        has_conflict = slot_counts.get(slot_key, 0) > 1
-        meta_bits = [slot_label, _compact_hub_text(reservation.room.name)]
-        items.append(
-            _build_hub_item(
-                hub_id=f"reservation:{reservation.id}",
-                item_kind="reservation",
-                title=reservation.room.name,
-                start_at=start_at,
-                end_at=end_at,
-                sort_at=start_at,
-                is_all_day=False,
-                meta_text=" · ".join(bit for bit in meta_bits if bit),
-                status_label="확인 필요" if has_conflict else "예약됨",
-                tone="warning" if has_conflict else "neutral",
-                source_url=f"{reverse('reservations:reservation_index', kwargs={'school_slug': reservation.room.school.slug})}?{urlencode({'date': reservation.date.strftime('%Y-%m-%d'), 'reservation': reservation.id})}",
-                source_label="예약 상세로 이동",
-                has_attachment=False,
-                is_readonly=True,
-            )
-        )
-    return items
+    now = timezone.now()
+    today = timezone.localdate()
+    return [
+        INDEXED_HUB_ITEM_BUILDERS[item.item_kind](item, now=now, today=today, slot_counts=slot_counts)
+        for item in hub_index_items
+    ]
 
 
-def _build_message_direct_hub_items(user):
+def _build_message_direct_hub_items(user, window=None):
     if not getattr(user, "is_authenticated", False) or not _is_message_capture_enabled_for_user(user):
         return []
 
@@ -3110,6 +2915,8 @@ def _build_message_direct_hub_items(user):
         .prefetch_related("attachments")
         .order_by("linked_for_at", "created_at", "id")
     )
+    if window is not None:
+        captures = captures.filter(linked_for_at__gte=window.start_at, linked_for_at__lt=window.end_at)
     items = []
     for capture in captures:
         linked_for_at = _normalize_hub_datetime(capture.linked_for_at)
@@ -3222,7 +3029,15 @@ def _sort_hub_items(hub_items):
     return sorted(hub_items, key=item_key)
 
 
-def _build_calendar_hub_payload(*, request_user, visible_owner_ids, editable_owner_ids, visible_events, visible_tasks):
+def _build_calendar_hub_payload(
+    *,
+    request_user,
+    visible_owner_ids,
+    editable_owner_ids,
+    visible_events,
+    visible_tasks,
+    window=None,
+):
     setting_lookup = _build_owner_setting_lookup(visible_owner_ids)
     hub_items = [
         _build_native_event_hub_item(
@@ -3236,11 +3051,8 @@ def _build_calendar_hub_payload(*, request_user, visible_owner_ids, editable_own
         _build_native_task_hub_item(task, current_user_id=request_user.id)
         for task in visible_tasks
     )
-    hub_items.extend(_build_collect_direct_hub_items(visible_owner_ids, setting_lookup))
-    hub_items.extend(_build_signature_direct_hub_items(visible_owner_ids, setting_lookup))
-    hub_items.extend(_build_consent_direct_hub_items(visible_owner_ids, setting_lookup))
-    hub_items.extend(_build_reservation_direct_hub_items(visible_owner_ids, setting_lookup))
-    hub_items.extend(_build_message_direct_hub_items(request_user))
+    hub_items.extend(_build_indexed_direct_hub_items(visible_owner_ids, setting_lookup, window))
+    hub_items.extend(_build_message_direct_hub_items(request_user, window))
     sorted_items = _sort_hub_items(hub_items)
     return sorted_items, _build_day_markers(sorted_items)
 
@@ -3326,12 +3138,13 @@ def _resolve_event_owner_for_create(request_user, requested_owner_id, editable_o
     return User.objects.filter(id=owner_id).first()
 
 
-def _get_teacher_visible_events(request, visible_owner_ids):
+def _get_teacher_visible_events(request, visible_owner_ids, window=None):
     active_classroom = _get_active_classroom_for_user(request)
     return get_visible_events_queryset(
         request.user,
         active_classroom=active_classroom,
         visible_owner_ids=visible_owner_ids,
+        window=window,
     ).exclude(
         is_locked=True,
         integration_source__in=DIRECT_HUB_INTEGRATION_SOURCES,
@@ -3339,8 +3152,8 @@ def _get_teacher_visible_events(request, visible_owner_ids):
 
 
 
-def _get_teacher_visible_tasks(request):
-    return get_visible_tasks_queryset(request.user)
+def _get_teacher_visible_tasks(request, window=None):
+    return get_visible_tasks_queryset(request.user, window=window)
 
 
 def _get_editable_event(request, event_id, editable_owner_ids):
@@ -3359,6 +3172,22 @@ def _get_editable_task(request, task_id):
     )
 
 
+def _append_deep_linked_items(items, queryset, raw_ids):
+    """Add the events or tasks a page link opens (``open_event`` etc.) when they fall outside the page window."""
+    loaded_ids = {str(item.id) for item in items}
+    missing_ids = []
+    for raw_id in raw_ids:
+        try:
+            item_id = uuid.UUID(str(raw_id or "").strip())
+        except ValueError:
+            continue
+        if str(item_id) not in loaded_ids:
+            missing_ids.append(item_id)
+    if missing_ids:
+        items.extend(queryset.filter(id__in=missing_ids))
+    return items
+
+
 def _sync_integrations_if_needed(request, force=False):
     return
 
@@ -3488,14 +3317,26 @@ def build_calendar_surface_context(
     message_capture_ui = build_message_capture_ui_context(request.user)
     messagebox_home_card = build_messagebox_home_card_context(request.user)
     active_classroom = _get_active_classroom_for_user(request)
-    visible_events = list(_get_teacher_visible_events(request, visible_owner_ids))
-    visible_tasks = list(_get_teacher_visible_tasks(request))
+    # The page ships the current month; the calendar fetches other months from api_events.
+    calendar_window = build_month_calendar_window(timezone.localdate())
+    calendar_sync_token = timezone.now() - timedelta(seconds=CALENDAR_SYNC_TOKEN_OVERLAP_SECONDS)
+    visible_events = _append_deep_linked_items(
+        list(_get_teacher_visible_events(request, visible_owner_ids, calendar_window)),
+        _get_teacher_visible_events(request, visible_owner_ids),
+        (request.GET.get("open_event"), request.GET.get("highlight_event")),
+    )
+    visible_tasks = _append_deep_linked_items(
+        list(_get_teacher_visible_tasks(request, calendar_window)),
+        _get_teacher_visible_tasks(request),
+        (request.GET.get("open_task"),),
+    )
     hub_items, day_markers = _build_calendar_hub_payload(
         request_user=request.user,
         visible_owner_ids=visible_owner_ids,
         editable_owner_ids=editable_owner_ids,
         visible_events=visible_events,
         visible_tasks=visible_tasks,
+        window=calendar_window,
     )
     center_url = _build_calendar_center_url(request, include_request_state=False)
     home_surface_url = _build_home_calendar_surface_url(request, include_request_state=False)
@@ -3547,6 +3388,11 @@ def build_calendar_surface_context(
         ),
         "hub_items_json": hub_items,
         "day_markers_json": day_markers,
+        "calendar_window_json": {
+            "from": calendar_window.start_date.isoformat(),
+            "to": calendar_window.end_date.isoformat(),
+            "sync_token": calendar_sync_token.isoformat(),
+        },
         "holiday_markers_json": initial_holiday_payload,
         "integration_settings_json": serialize_integration_setting(integration_setting),
         "reservation_windows": _build_reservation_windows_for_user(request.user),
@@ -3738,33 +3584,53 @@ def external_ical_feed(request):
         return _external_api_unavailable_response()
 
     visible_owner_ids, editable_owner_ids, _ = _get_calendar_access_for_user(user)
-    visible_events = list(
-        get_visible_events_queryset(
-            user,
-            visible_owner_ids=visible_owner_ids,
-        ).exclude(
-            is_locked=True,
-            integration_source__in=DIRECT_HUB_INTEGRATION_SOURCES,
-        )
+    visible_events_queryset = get_visible_events_queryset(
+        user,
+        visible_owner_ids=visible_owner_ids,
+    ).exclude(
+        is_locked=True,
+        integration_source__in=DIRECT_HUB_INTEGRATION_SOURCES,
     )
-    visible_tasks = list(get_visible_tasks_queryset(user))
-    hub_items, _ = _build_calendar_hub_payload(
-        request_user=user,
+    version, last_modified = _build_external_ical_version(
+        request,
+        user=user,
         visible_owner_ids=visible_owner_ids,
-        editable_owner_ids=editable_owner_ids,
-        visible_events=visible_events,
-        visible_tasks=visible_tasks,
+        visible_events_queryset=visible_events_queryset,
     )
-    exportable_items = [
-        _absolutize_hub_item_source_url(request, item)
-        for item in hub_items
-        if str(item.get("item_kind") or "").strip().lower() != "task"
-        and str(item.get("date_key") or "").strip()
-    ]
-    content = _render_external_ical_feed(user=user, hub_items=exportable_items)
+    etag = f'"{version}"'
+    not_modified = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()),
+    )
+    if not_modified is not None:
+        return _apply_workspace_cache_headers(not_modified)
+
+    cache_key = EXTERNAL_ICAL_CACHE_KEY_TEMPLATE.format(user_id=user.id, version=version)
+    content = cache.get(cache_key)
+    if content is None:
+        hub_items, _ = _build_calendar_hub_payload(
+            request_user=user,
+            visible_owner_ids=visible_owner_ids,
+            editable_owner_ids=editable_owner_ids,
+            visible_events=list(visible_events_queryset),
+            visible_tasks=list(get_visible_tasks_queryset(user)),
+        )
+        exportable_items = [
+            _absolutize_hub_item_source_url(request, item)
+            for item in hub_items
+            if str(item.get("item_kind") or "").strip().lower() != "task"
+            and str(item.get("date_key") or "").strip()
+        ]
+        # DTSTAMP follows Last-Modified so one version always renders the same bytes (strong ETag).
+        content = _render_external_ical_feed(user=user, hub_items=exportable_items, dtstamp_at=last_modified)
+        cache.set(cache_key, content, EXTERNAL_ICAL_CACHE_SECONDS)
     response = HttpResponse(content, content_type="text/calendar; charset=utf-8")
     response["Content-Disposition"] = f'inline; filename="eduitit-{user.username}-calendar.ics"'
-    return _apply_sensitive_cache_headers(response)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified.timestamp())
+    # Revalidated on every poll instead of no-store, so feed clients can send If-None-Match.
+    return _apply_workspace_cache_headers(response)
 
 
 @csrf_exempt
@@ -3916,38 +3782,82 @@ def shared_view(request, share_uuid):
     return _apply_sensitive_cache_headers(response)
 
 
+def _parse_sync_token(raw_value):
+    parsed = parse_datetime(str(raw_value or "").strip())
+    if parsed is None:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, timezone.get_current_timezone())
+    return parsed
+
+
+def _json_response_with_etag(request, payload, *, etag_exclude_keys=()):
+    """JSON response with a weak ETag of ``payload``; answers 304 when ``If-None-Match`` matches."""
+    fingerprint_source = {key: value for key, value in payload.items() if key not in etag_exclude_keys}
+    digest = hashlib.sha1(
+        json.dumps(fingerprint_source, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    response = JsonResponse(payload)
+    response["ETag"] = f'W/"{digest}"'
+    response = get_conditional_response(request, etag=response["ETag"], response=response)
+    return _apply_workspace_cache_headers(response)
+
+
 @login_required
 @require_GET
 def api_events(request):
+    try:
+        window = parse_calendar_window(request.GET.get("from"), request.GET.get("to"))
+    except ValueError:
+        return JsonResponse(
+            {
+                "status": "error",
+                "message": "조회 기간을 확인해 주세요.",
+            },
+            status=400,
+        )
+    since = _parse_sync_token(request.GET.get("since")) if window is not None else None
+    # Edits committed while this request runs may carry an earlier updated_at; overlap a little.
+    sync_token = timezone.now() - timedelta(seconds=CALENDAR_SYNC_TOKEN_OVERLAP_SECONDS)
+
     visible_owner_ids, editable_owner_ids, _ = _get_calendar_access_for_user(request.user)
-    visible_events = list(_get_teacher_visible_events(request, visible_owner_ids))
-    visible_tasks = list(_get_teacher_visible_tasks(request))
+    visible_events = list(_get_teacher_visible_events(request, visible_owner_ids, window))
+    visible_tasks = list(_get_teacher_visible_tasks(request, window))
     hub_items, day_markers = _build_calendar_hub_payload(
         request_user=request.user,
         visible_owner_ids=visible_owner_ids,
         editable_owner_ids=editable_owner_ids,
         visible_events=visible_events,
         visible_tasks=visible_tasks,
+        window=window,
     )
+    changed_events = visible_events if since is None else [event for event in visible_events if event.updated_at > since]
+    changed_tasks = visible_tasks if since is None else [task for task in visible_tasks if task.updated_at > since]
     events_data = _serialize_event_list(
-        visible_events,
+        changed_events,
         current_user_id=request.user.id,
         editable_owner_ids=editable_owner_ids,
     )
     tasks_data = _serialize_task_list(
-        visible_tasks,
+        changed_tasks,
         current_user_id=request.user.id,
     )
-    response = JsonResponse(
-        {
-            "status": "success",
-            "events": events_data,
-            "tasks": tasks_data,
-            "hub_items": hub_items,
-            "day_markers": day_markers,
-        }
-    )
-    return _apply_workspace_cache_headers(response)
+    payload = {
+        "status": "success",
+        "events": events_data,
+        "tasks": tasks_data,
+        "hub_items": hub_items,
+        "day_markers": day_markers,
+    }
+    if window is not None:
+        payload["window"] = {"from": window.start_date.isoformat(), "to": window.end_date.isoformat()}
+        payload["sync_token"] = sync_token.isoformat()
+    if since is not None:
+        # Only changed events/tasks are listed; the IDs let the client drop deleted ones.
+        payload["changed_only"] = True
+        payload["event_ids"] = [str(event.id) for event in visible_events]
+        payload["task_ids"] = [str(task.id) for task in visible_tasks]
+    return _json_response_with_etag(request, payload, etag_exclude_keys=("sync_token",))
 
 
 @login_required
@@ -3965,11 +3875,11 @@ def api_holidays(request):
             status=400,
         )
 
-    if year < KOREAN_HOLIDAY_MIN_YEAR or year > KOREAN_HOLIDAY_MAX_YEAR:
+    if year < korean_calendar.MIN_YEAR or year > korean_calendar.MAX_YEAR:
         return JsonResponse(
             {
                 "status": "error",
-                "message": f"휴일은 {KOREAN_HOLIDAY_MIN_YEAR}년부터 {KOREAN_HOLIDAY_MAX_YEAR}년까지 확인할 수 있어요.",
+                "message": f"휴일은 {korean_calendar.MIN_YEAR}년부터 {korean_calendar.MAX_YEAR}년까지 확인할 수 있어요.",
             },
             status=400,
         )
@@ -3978,7 +3888,7 @@ def api_holidays(request):
         {
             "status": "success",
             "year": year,
-            "holiday_markers": _build_korean_holiday_markers(year),
+            "holiday_markers": korean_calendar.holiday_markers(year),
         }
     )
 
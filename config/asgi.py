@@ -29,6 +29,7 @@ warnings.filterwarnings(
 django_asgi_app = get_asgi_application()
 
 from config.websocket_urls import websocket_urlpatterns  # noqa: E402
+from core.background_jobs import start_embedded_runner  # noqa: E402
 
 application = ProtocolTypeRouter(
     {
@@ -41,3 +42,6 @@ application = ProtocolTypeRouter(
 
 if settings.DEBUG:
     application = ASGIStaticFilesHandler(application)
+
+# 재시작 전에 쌓인 작업도 다음 요청을 기다리지 않고 바로 처리
+start_embedded_runner()
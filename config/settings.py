@@ -597,6 +597,37 @@ SEED_QUIZ_ALLOW_RAG = os.environ.get('SEED_QUIZ_ALLOW_RAG', 'False').lower() in
 SEED_QUIZ_CSV_MAX_FILE_BYTES = int(os.environ.get('SEED_QUIZ_CSV_MAX_FILE_BYTES', str(2 * 1024 * 1024)))
 SEED_QUIZ_CSV_MAX_ROWS = int(os.environ.get('SEED_QUIZ_CSV_MAX_ROWS', '1200'))
 SEED_QUIZ_CSV_MAX_SETS = int(os.environ.get('SEED_QUIZ_CSV_MAX_SETS', '400'))
+HOME_SURFACE_CACHE_ENABLED = os.environ.get(
+    'HOME_SURFACE_CACHE_ENABLED',
+    'False' if TESTING else 'True',
+).lower() in ('true', '1', 'yes')
+HOME_SURFACE_CATALOG_CACHE_TTL_SECONDS = int(os.environ.get('HOME_SURFACE_CATALOG_CACHE_TTL_SECONDS', '600'))
+HOME_SURFACE_USER_CACHE_TTL_SECONDS = int(os.environ.get('HOME_SURFACE_USER_CACHE_TTL_SECONDS', '120'))
+POST_FEED_CACHE_ENABLED = os.environ.get(
+    'POST_FEED_CACHE_ENABLED',
+    'False' if TESTING else 'True',
+).lower() in ('true', '1', 'yes')
+POST_FEED_CACHE_TTL_SECONDS = int(os.environ.get('POST_FEED_CACHE_TTL_SECONDS', '30'))
+VISITOR_TRACKING_BUFFERED = os.environ.get('VISITOR_TRACKING_BUFFERED', 'False').lower() in ('true', '1', 'yes')
+VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS = float(os.environ.get('VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS', '5'))
+VISITOR_TRACKING_FLUSH_BATCH_SIZE = int(os.environ.get('VISITOR_TRACKING_FLUSH_BATCH_SIZE', '200'))
+VISITOR_TRACKING_BUFFER_MAX_RECORDS = int(os.environ.get('VISITOR_TRACKING_BUFFER_MAX_RECORDS', '20000'))
+DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS = float(
+    os.environ.get('DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS', '0' if TESTING else '2')
+)
+DOCCOLLAB_EDIT_EVENT_FLUSH_BATCH_SIZE = int(os.environ.get('DOCCOLLAB_EDIT_EVENT_FLUSH_BATCH_SIZE', '50'))
+DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS = float(os.environ.get('DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS', '30'))
+RAG_EMBEDDING_BACKEND = os.environ.get('RAG_EMBEDDING_BACKEND', 'hashing' if TESTING else 'onnx')
+RAG_EMBEDDING_MODEL_DIR = os.environ.get(
+    'RAG_EMBEDDING_MODEL_DIR',
+    str(BASE_DIR / 'data' / 'onnx_models' / 'all-MiniLM-L6-v2'),
+)
+RAG_EMBEDDING_BATCH_SIZE = int(os.environ.get('RAG_EMBEDDING_BATCH_SIZE', '32'))
+RAG_QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get('RAG_QUERY_EMBEDDING_CACHE_SIZE', '512'))
+RAG_INGEST_ASYNC = os.environ.get(
+    'RAG_INGEST_ASYNC',
+    'False' if TESTING else 'True',
+).lower() in ('true', '1', 'yes')
 NEWS_INGEST_MAX_PENDING = int(os.environ.get('NEWS_INGEST_MAX_PENDING', '200'))
 NEWS_INGEST_ALLOWED_HOSTS = [
     host.strip().lower()
@@ -612,7 +643,34 @@ TEACHER_LAW_DETAIL_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_DETAIL_TIME
 TEACHER_LAW_LLM_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_LLM_TIMEOUT_SECONDS', '12'))
 TEACHER_LAW_SEARCH_RESULT_LIMIT = int(os.environ.get('TEACHER_LAW_SEARCH_RESULT_LIMIT', '5'))
 TEACHER_LAW_DETAIL_FETCH_LIMIT = int(os.environ.get('TEACHER_LAW_DETAIL_FETCH_LIMIT', '3'))
+TEACHER_LAW_FETCH_WORKERS = int(os.environ.get('TEACHER_LAW_FETCH_WORKERS', '6'))
+TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS', '8'))
 TEACHER_LAW_FAQ_CACHE_TTL_SECONDS = int(os.environ.get('TEACHER_LAW_FAQ_CACHE_TTL_SECONDS', '43200'))
+# 법령·조문·판례 로컬 코퍼스 (refresh_teacher_law_corpus 명령을 주기 실행해 갱신)
+TEACHER_LAW_CORPUS_ENABLED = os.environ.get('TEACHER_LAW_CORPUS_ENABLED', 'False' if TESTING else 'True').lower() in ('true', '1', 'yes')
+TEACHER_LAW_CORPUS_REFRESH_SECONDS = int(os.environ.get('TEACHER_LAW_CORPUS_REFRESH_SECONDS', '86400'))
+TEACHER_LAW_CORPUS_MAX_AGE_SECONDS = int(os.environ.get('TEACHER_LAW_CORPUS_MAX_AGE_SECONDS', '2592000'))
+TEACHER_LAW_CORPUS_BACKGROUND_REFRESH = os.environ.get('TEACHER_LAW_CORPUS_BACKGROUND_REFRESH', 'True').lower() in ('true', '1', 'yes')
+
+# 전담 시간표 자동 배치: bitset(단일 탐색) / portfolio(여러 설정을 프로세스 풀에서 경쟁) / backtracking(기존)
+TIMETABLE_SOLVER = os.environ.get('TIMETABLE_SOLVER', 'bitset' if TESTING else 'portfolio')
+TIMETABLE_SOLVER_WORKERS = int(os.environ.get('TIMETABLE_SOLVER_WORKERS', str(min(8, os.cpu_count() or 1))))
+TIMETABLE_SOLVER_TIME_BUDGET_SECONDS = float(os.environ.get('TIMETABLE_SOLVER_TIME_BUDGET_SECONDS', '8'))
+
+# PDF 내보내기 등 무거운 작업을 요청 밖에서 처리하는 DB 작업 큐 (끄면 요청 안에서 바로 실행)
+BACKGROUND_JOBS_ENABLED = os.environ.get('BACKGROUND_JOBS_ENABLED', 'False' if TESTING else 'True').lower() in ('true', '1', 'yes')
+# 웹 프로세스 안에서 러너를 띄울지 여부 (manage.py run_background_jobs를 따로 돌리면 False)
+BACKGROUND_JOBS_EMBEDDED_RUNNER = os.environ.get('BACKGROUND_JOBS_EMBEDDED_RUNNER', 'True').lower() in ('true', '1', 'yes')
+BACKGROUND_JOBS_WORKERS = int(os.environ.get('BACKGROUND_JOBS_WORKERS', '2'))
+BACKGROUND_JOBS_POLL_SECONDS = float(os.environ.get('BACKGROUND_JOBS_POLL_SECONDS', '2'))
+BACKGROUND_JOBS_STALE_SECONDS = int(os.environ.get('BACKGROUND_JOBS_STALE_SECONDS', '600'))
+BACKGROUND_JOBS_RETENTION_SECONDS = int(os.environ.get('BACKGROUND_JOBS_RETENTION_SECONDS', '86400'))
+BACKGROUND_JOBS_MAX_ATTEMPTS = int(os.environ.get('BACKGROUND_JOBS_MAX_ATTEMPTS', '2'))
+
+# 배포 시 bootstrap_runtime: 서로 독립인 ensure_* 단계를 동시에 몇 개 돌릴지 (SQLite면 항상 1)
+BOOTSTRAP_RUNTIME_WORKERS = int(os.environ.get('BOOTSTRAP_RUNTIME_WORKERS', '4'))
+# 코드/시드/스키마가 그대로인 단계도 이 시간이 지나면 한 번 다시 실행해 데이터 어긋남을 바로잡음
+BOOTSTRAP_RUNTIME_MAX_SKIP_AGE_SECONDS = int(os.environ.get('BOOTSTRAP_RUNTIME_MAX_SKIP_AGE_SECONDS', str(7 * 24 * 60 * 60)))
 
 # =============================================================================
 # SENTRY ERROR TRACKING (production only)
@@ -262,11 +262,15 @@ CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "auto").strip().lower() or "auto
 if CACHE_BACKEND not in {"auto", "redis", "locmem", "database"}:
     CACHE_BACKEND = "auto"
 
+# Django 기본값(300개)이면 시간표 충돌 색인(칸마다 항목 하나) 하나만으로도 넘친다.
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "20000"))
+
 if CACHE_BACKEND == "database":
     CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.db.DatabaseCache",
             "LOCATION": "django_cache_table",
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
         }
     }
 elif REDIS_URL and CACHE_BACKEND in {"auto", "redis"}:
@@ -281,12 +285,39 @@ else:
         "default": {
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "eduitit-production-cache",
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
         }
     }
 
+HOME_SURFACE_CACHE_ENABLED = _env_bool("HOME_SURFACE_CACHE_ENABLED", "True")
+HOME_SURFACE_CATALOG_CACHE_TTL_SECONDS = int(os.environ.get("HOME_SURFACE_CATALOG_CACHE_TTL_SECONDS", "600"))
+HOME_SURFACE_USER_CACHE_TTL_SECONDS = int(os.environ.get("HOME_SURFACE_USER_CACHE_TTL_SECONDS", "120"))
+
+POST_FEED_CACHE_ENABLED = _env_bool("POST_FEED_CACHE_ENABLED", "True")
+POST_FEED_CACHE_TTL_SECONDS = int(os.environ.get("POST_FEED_CACHE_TTL_SECONDS", "30"))
+
 # Disable visitor analytics in production by default. This avoids DB writes for
 # anonymous, bot, and authenticated page visits unless explicitly re-enabled.
 VISITOR_TRACKING_ENABLED = _env_bool("VISITOR_TRACKING_ENABLED", "False")
+# When re-enabled, visits are buffered in-process and upserted in batches by a
+# background flusher instead of hitting the DB on every HTML GET.
+VISITOR_TRACKING_BUFFERED = _env_bool("VISITOR_TRACKING_BUFFERED", "True")
+VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS = float(os.environ.get("VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS", "5"))
+VISITOR_TRACKING_FLUSH_BATCH_SIZE = int(os.environ.get("VISITOR_TRACKING_FLUSH_BATCH_SIZE", "200"))
+VISITOR_TRACKING_BUFFER_MAX_RECORDS = int(os.environ.get("VISITOR_TRACKING_BUFFER_MAX_RECORDS", "20000"))
+DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS = float(os.environ.get("DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS", "2"))
+DOCCOLLAB_EDIT_EVENT_FLUSH_BATCH_SIZE = int(os.environ.get("DOCCOLLAB_EDIT_EVENT_FLUSH_BATCH_SIZE", "50"))
+DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS = float(os.environ.get("DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS", "30"))
+# One embedding model per process for the Chroma RAG helpers; the ONNX model is
+# read from RAG_EMBEDDING_MODEL_DIR (see ensure_embedding_model) so boots stay offline.
+RAG_EMBEDDING_BACKEND = os.environ.get("RAG_EMBEDDING_BACKEND", "onnx")
+RAG_EMBEDDING_MODEL_DIR = os.environ.get(
+    "RAG_EMBEDDING_MODEL_DIR",
+    str(BASE_DIR / "data" / "onnx_models" / "all-MiniLM-L6-v2"),
+)
+RAG_EMBEDDING_BATCH_SIZE = int(os.environ.get("RAG_EMBEDDING_BATCH_SIZE", "32"))
+RAG_QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get("RAG_QUERY_EMBEDDING_CACHE_SIZE", "512"))
+RAG_INGEST_ASYNC = _env_bool("RAG_INGEST_ASYNC", "True")
 
 # =============================================================================
 # PASSWORD VALIDATION
@@ -736,7 +767,19 @@ TEACHER_LAW_DETAIL_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_DETAIL_TIME
 TEACHER_LAW_LLM_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_LLM_TIMEOUT_SECONDS', '12'))
 TEACHER_LAW_SEARCH_RESULT_LIMIT = int(os.environ.get('TEACHER_LAW_SEARCH_RESULT_LIMIT', '5'))
 TEACHER_LAW_DETAIL_FETCH_LIMIT = int(os.environ.get('TEACHER_LAW_DETAIL_FETCH_LIMIT', '3'))
+TEACHER_LAW_FETCH_WORKERS = int(os.environ.get('TEACHER_LAW_FETCH_WORKERS', '6'))
+TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS = int(os.environ.get('TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS', '8'))
 TEACHER_LAW_FAQ_CACHE_TTL_SECONDS = int(os.environ.get('TEACHER_LAW_FAQ_CACHE_TTL_SECONDS', '43200'))
+# 법령·조문·판례 로컬 코퍼스 (refresh_teacher_law_corpus 명령을 주기 실행해 갱신)
+TEACHER_LAW_CORPUS_ENABLED = os.environ.get('TEACHER_LAW_CORPUS_ENABLED', 'True').lower() in ('true', '1', 'yes')
+TEACHER_LAW_CORPUS_REFRESH_SECONDS = int(os.environ.get('TEACHER_LAW_CORPUS_REFRESH_SECONDS', '86400'))
+TEACHER_LAW_CORPUS_MAX_AGE_SECONDS = int(os.environ.get('TEACHER_LAW_CORPUS_MAX_AGE_SECONDS', '2592000'))
+TEACHER_LAW_CORPUS_BACKGROUND_REFRESH = os.environ.get('TEACHER_LAW_CORPUS_BACKGROUND_REFRESH', 'True').lower() in ('true', '1', 'yes')
+
+# 전담 시간표 자동 배치: bitset(단일 탐색) / portfolio(여러 설정을 프로세스 풀에서 경쟁) / backtracking(기존)
+TIMETABLE_SOLVER = os.environ.get('TIMETABLE_SOLVER', 'portfolio')
+TIMETABLE_SOLVER_WORKERS = int(os.environ.get('TIMETABLE_SOLVER_WORKERS', str(min(8, os.cpu_count() or 1))))
+TIMETABLE_SOLVER_TIME_BUDGET_SECONDS = float(os.environ.get('TIMETABLE_SOLVER_TIME_BUDGET_SECONDS', '8'))
 
 # Fortune async rollout flags (safe default: OFF)
 # - STREAM: /fortune/api/streaming/ 경로에서 AsyncOpenAI 직접 사용
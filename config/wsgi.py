@@ -16,3 +16,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings_production')
 
 application = get_wsgi_application()
+
+from core.background_jobs import start_embedded_runner  # noqa: E402
+
+# 재시작 전에 쌓인 작업도 다음 요청을 기다리지 않고 바로 처리
+start_embedded_runner()
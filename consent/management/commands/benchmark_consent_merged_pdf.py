@@ -0,0 +1,147 @@
+import base64
+import io
+import multiprocessing
+import resource
+import tempfile
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from core.document_signing import (
+    DOCUMENT_MARK_TYPE_CHECKMARK,
+    DOCUMENT_MARK_TYPE_NAME,
+    DOCUMENT_MARK_TYPE_SIGNATURE,
+    append_stamped_pages,
+    build_mark_overlay_pages,
+    build_signed_pdf_bytes,
+    ensure_pdf_runtime,
+    get_page_sizes,
+    normalize_document_marks,
+)
+
+
+def build_benchmark_source_pdf(page_count):
+    """A text-heavy A4 form of ``page_count`` pages, standing in for a school consent document."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    packet = io.BytesIO()
+    pdf = canvas.Canvas(packet, pagesize=A4)
+    for page_no in range(1, page_count + 1):
+        pdf.setFont("Helvetica", 9)
+        for line_no in range(70):
+            pdf.drawString(40, 800 - line_no * 11, f"page {page_no} line {line_no} " + "consent form body text " * 4)
+        pdf.rect(40, 40, 515, 60)
+        pdf.showPage()
+    pdf.save()
+    return packet.getvalue()
+
+
+def build_benchmark_signature_data():
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGBA", (300, 100), (255, 255, 255, 0))
+    ImageDraw.Draw(image).line([(10, 80), (90, 20), (170, 70), (290, 15)], fill=(0, 0, 0, 255), width=4)
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(output.getvalue()).decode("ascii")
+
+
+def build_benchmark_marks(recipient_no, page_count):
+    # Name, agree check and signature on the last page, as on a typical consent form.
+    return [
+        {"page": page_count, "x": 60, "y": 60, "width": 120, "height": 30, "mark_type": DOCUMENT_MARK_TYPE_NAME, "text_value": f"Student {recipient_no}"},
+        {"page": page_count, "x": 200, "y": 60, "width": 20, "height": 20, "mark_type": DOCUMENT_MARK_TYPE_CHECKMARK},
+        {"page": page_count, "x": 400, "y": 50, "width": 120, "height": 40, "mark_type": DOCUMENT_MARK_TYPE_SIGNATURE},
+    ]
+
+
+def merge_per_recipient_render(source_pdf_bytes, recipient_marks, signature_data):
+    """The previous pipeline: render and re-parse the whole source for every recipient."""
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for marks in recipient_marks:
+        recipient_pdf_bytes = build_signed_pdf_bytes(source_pdf_bytes, marks=marks, signature_data=signature_data)
+        for page in PdfReader(io.BytesIO(recipient_pdf_bytes)).pages:
+            writer.add_page(page)
+    output = io.BytesIO()
+    writer.write(output)
+    return len(output.getvalue())
+
+
+def merge_stamped(source_pdf_bytes, recipient_marks, signature_data):
+    """The current pipeline (see consent.services.generate_merged_pdf)."""
+    from pypdf import PdfReader, PdfWriter
+
+    source_pages = PdfReader(io.BytesIO(source_pdf_bytes)).pages
+    page_sizes = get_page_sizes(source_pages)
+    writer = PdfWriter()
+    for marks in recipient_marks:
+        overlays_by_page = build_mark_overlay_pages(
+            page_sizes,
+            normalize_document_marks(marks, page_count=len(source_pages), signature_data=signature_data),
+            signature_data=signature_data,
+        )
+        append_stamped_pages(writer, source_pages, overlays_by_page)
+    with tempfile.TemporaryFile(suffix=".pdf") as output:
+        writer.write(output)
+        return output.tell()
+
+
+PIPELINES = {
+    "per-recipient": merge_per_recipient_render,
+    "stamped": merge_stamped,
+}
+
+
+def _run_in_child(connection, pipeline, source_pdf_bytes, recipient_marks, signature_data):
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = perf_counter()
+    output_size = PIPELINES[pipeline](source_pdf_bytes, recipient_marks, signature_data)
+    elapsed_ms = (perf_counter() - started) * 1000
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    connection.send((elapsed_ms, max(0, peak_kb - baseline_kb), output_size))
+    connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare merged consent PDF pipelines (per-recipient render vs parse-once with stamped overlays) "
+        "on a generated form: wall time, peak RSS growth and output size. Each run uses a fresh forked process."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=10)
+        parser.add_argument("--recipients", type=int, default=35)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        ensure_pdf_runtime()
+        page_count = max(1, options["pages"])
+        source_pdf_bytes = build_benchmark_source_pdf(page_count)
+        signature_data = build_benchmark_signature_data()
+        recipient_marks = [build_benchmark_marks(no, page_count) for no in range(1, max(1, options["recipients"]) + 1)]
+        context = multiprocessing.get_context("fork")
+
+        for pipeline in PIPELINES:
+            timings = []
+            peaks = []
+            output_size = 0
+            for _ in range(max(1, options["repeat"])):
+                parent_connection, child_connection = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_run_in_child,
+                    args=(child_connection, pipeline, source_pdf_bytes, recipient_marks, signature_data),
+                )
+                process.start()
+                elapsed_ms, peak_growth_kb, output_size = parent_connection.recv()
+                process.join()
+                timings.append(elapsed_ms)
+                peaks.append(peak_growth_kb)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[bench] pages={page_count} recipients={len(recipient_marks)} {pipeline:<13} "
+                    f"best={min(timings):.0f}ms peak_rss+={max(peaks) / 1024:.1f}MB output={output_size / 1024:.0f}KB"
+                )
+            )
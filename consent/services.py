@@ -1,9 +1,11 @@
 import hashlib
 import io
 import logging
+import tempfile
 from datetime import datetime
+from typing import Callable, Optional
 
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.utils import timezone
 
 from core.document_signing import (
@@ -11,12 +13,16 @@ from core.document_signing import (
     DOCUMENT_MARK_TYPE_NAME,
     DOCUMENT_MARK_TYPE_SIGNATURE,
     PdfRuntimeUnavailable,
+    append_stamped_pages,
     basename as _basename,
+    build_mark_overlay_pages,
     build_signed_pdf_bytes,
     ensure_pdf_runtime as _ensure_pdf_runtime,
     get_file_field_bytes,
+    get_page_sizes,
     get_pdf_bytes_from_file_field,
     guess_file_type,
+    normalize_document_marks,
     normalize_pdf_bytes,
     split_data_url as _split_data_url,
 )
@@ -686,6 +692,32 @@ def _build_recipient_evidence_section_pdf(
     return packet.read()
 
 
+def _resolved_overlay_signature_data(recipient: SignatureRecipient, overlay_marks: list[dict]) -> str:
+    if not any(mark["mark_type"] == DOCUMENT_MARK_TYPE_SIGNATURE for mark in overlay_marks):
+        return ""
+    return recipient.signature_data or ""
+
+
+def _append_resolved_source_pages(
+    writer,
+    recipient: SignatureRecipient,
+    *,
+    source_pages,
+    page_sizes: list[tuple[float, float]],
+) -> int:
+    """Append the parsed source pages with this recipient's marks stamped on its own copies."""
+    overlays_by_page = {}
+    overlay_marks = _build_resolved_overlay_marks(recipient)
+    if overlay_marks:
+        signature_data = _resolved_overlay_signature_data(recipient, overlay_marks)
+        overlays_by_page = build_mark_overlay_pages(
+            page_sizes,
+            normalize_document_marks(overlay_marks, page_count=len(source_pages), signature_data=signature_data),
+            signature_data=signature_data,
+        )
+    return append_stamped_pages(writer, source_pages, overlays_by_page)
+
+
 def _build_resolved_source_pdf_bytes(
     recipient: SignatureRecipient,
     *,
@@ -699,9 +731,7 @@ def _build_resolved_source_pdf_bytes(
     if not overlay_marks:
         return source_pdf_bytes
 
-    signature_data = recipient.signature_data or ""
-    if not any(mark["mark_type"] == DOCUMENT_MARK_TYPE_SIGNATURE for mark in overlay_marks):
-        signature_data = ""
+    signature_data = _resolved_overlay_signature_data(recipient, overlay_marks)
 
     return build_signed_pdf_bytes(
         source_pdf_bytes,
@@ -748,7 +778,13 @@ def generate_recipient_evidence_pdf(recipient: SignatureRecipient) -> ContentFil
         raise
 
 
-def generate_merged_pdf(request: SignatureRequest, include_decline_summary: bool = False) -> ContentFile:
+def generate_merged_pdf(
+    request: SignatureRequest,
+    include_decline_summary: bool = False,
+    *,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> File:
+    """Every completed recipient's stamped copy in one PDF; ``on_progress(done, total)`` follows each recipient."""
     _ensure_pdf_runtime()
     recipients = list(
         request.recipients.filter(
@@ -768,19 +804,22 @@ def generate_merged_pdf(request: SignatureRequest, include_decline_summary: bool
         source_pdf_bytes = normalize_pdf_bytes(get_document_pdf_bytes(request.document))
         title_seed = (request.title or request.document.title or "동의서 제출 결과").strip() or "동의서 제출 결과"
 
+        # Parsed once; each recipient's marked pages are fresh copies, so stamps never leak across recipients.
+        source_pages = PdfReader(io.BytesIO(source_pdf_bytes)).pages
+        page_sizes = get_page_sizes(source_pages)
+
         writer = PdfWriter()
         added_pages = 0
 
-        for recipient in recipients:
-            recipient_pdf_bytes = _build_resolved_source_pdf_bytes(
+        for done, recipient in enumerate(recipients, start=1):
+            added_pages += _append_resolved_source_pages(
+                writer,
                 recipient,
-                source_pdf_bytes=source_pdf_bytes,
-                pdf_title=f"{title_seed} - {recipient.student_name} 제출본",
+                source_pages=source_pages,
+                page_sizes=page_sizes,
             )
-            recipient_reader = PdfReader(io.BytesIO(recipient_pdf_bytes))
-            for page in recipient_reader.pages:
-                writer.add_page(page)
-                added_pages += 1
+            if on_progress is not None:
+                on_progress(done, len(recipients))
 
         if include_decline_summary:
             try:
@@ -804,10 +843,12 @@ def generate_merged_pdf(request: SignatureRequest, include_decline_summary: bool
             }
         )
 
-        output = io.BytesIO()
+        # A class set runs to tens of megabytes; spool it to disk rather than holding it in memory.
+        output = tempfile.TemporaryFile(suffix=".pdf")
         writer.write(output)
+        output.seek(0)
         filename = f"merged_{request.id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.pdf"
-        return ContentFile(output.getvalue(), name=filename)
+        return File(output, name=filename)
     except ValueError:
         raise
     except Exception:
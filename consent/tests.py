@@ -9,7 +9,7 @@ from django.contrib.auth.models import User
 from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.utils import DataError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
@@ -22,7 +22,8 @@ from consent.models import (
 )
 from consent.services import PdfRuntimeUnavailable, generate_merged_pdf, generate_recipient_evidence_pdf, generate_summary_pdf
 from consent.views import CONSENT_SHARED_LOOKUP_SESSION_KEY, DEFAULT_LEGAL_NOTICE
-from core.models import UserPolicyConsent
+from core.background_jobs import claim_next_background_job, run_claimed_background_job
+from core.models import BackgroundJob, UserPolicyConsent
 from core.models import TeacherActivityEvent, TeacherActivityProfile
 from core.policy_meta import PRIVACY_VERSION, TERMS_VERSION
 from handoff.models import HandoffRosterGroup, HandoffRosterMember
@@ -1114,6 +1115,31 @@ class ConsentFlowTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "응답 완료 후 완성본 PDF를 받을 수 있습니다.")
 
+    @override_settings(BACKGROUND_JOBS_ENABLED=True, BACKGROUND_JOBS_EMBEDDED_RUNNER=False)
+    @patch("consent.views.generate_merged_pdf")
+    def test_merged_pdf_download_waits_for_background_job(self, mocked_generate_merged_pdf):
+        mocked_generate_merged_pdf.return_value = ContentFile(
+            b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF",
+            name="merged.pdf",
+        )
+        self.client.login(username="teacher", password="pw123456")
+        url = reverse("consent:download_merged", kwargs={"request_id": self.request_obj.request_id})
+
+        first = self.client.get(url)
+        second = self.client.get(url)
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(second.status_code, 202)
+        job = BackgroundJob.objects.get(dedupe_key=f"consent.merged_pdf:{self.request_obj.pk}:{self.teacher.pk}")
+        self.assertContains(first, f"?job={job.pk}", status_code=202)
+
+        self.assertEqual(run_claimed_background_job(claim_next_background_job(worker_id="test")), BackgroundJob.STATUS_DONE)
+        response = self.client.get(f"{url}?job={job.pk}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("attachment;", response.get("Content-Disposition", ""))
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+        mocked_generate_merged_pdf.assert_called_once()
+
     def test_sign_link_expired(self):
         self.request_obj.status = SignatureRequest.STATUS_SENT
         self.request_obj.sent_at = timezone.now() - timezone.timedelta(days=20)
@@ -2182,6 +2208,9 @@ class ConsentEvidenceTests(TestCase):
         self.assertIn("Student A", first_text)
         self.assertIn("merged-source-page", second_text)
         self.assertIn("Student B", second_text)
+        # Each copy carries only its own recipient's stamps.
+        self.assertNotIn("Student B", first_text)
+        self.assertNotIn("Student A", second_text)
 
         first_stream = reader.pages[0].get_contents().get_data().decode("latin-1", errors="ignore")
         second_stream = reader.pages[1].get_contents().get_data().decode("latin-1", errors="ignore")
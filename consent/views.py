@@ -57,7 +57,14 @@ from .services import (
     get_document_pdf_bytes,
     guess_file_type,
 )
+from core.background_jobs import (
+    background_job_wait_response,
+    get_requested_background_job,
+    report_background_job_progress,
+    submit_background_job,
+)
 from core.document_signing import basename, get_pdf_page_sizes, normalize_pdf_bytes
+from core.models import BackgroundJob
 from handoff.shared_roster import consent_recipients as build_shared_roster_recipients
 from core.teacher_activity import ACTIVITY_CATEGORY_REQUEST_SENT, award_teacher_activity
 
@@ -471,6 +478,18 @@ def _build_recipient_download_filename(recipient: SignatureRecipient) -> str:
     return f"{safe_base}_{request_short}.pdf"
 
 
+MERGED_PDF_JOB = "consent.views.run_merged_pdf_job"
+RECIPIENT_EVIDENCE_JOB = "consent.views.run_recipient_evidence_job"
+
+
+def _merged_pdf_job_key(consent_request: SignatureRequest, user) -> str:
+    return f"consent.merged_pdf:{consent_request.pk}:{user.pk}"
+
+
+def _recipient_evidence_job_key(recipient: SignatureRecipient) -> str:
+    return f"consent.recipient_evidence:{recipient.pk}"
+
+
 def _store_recipient_evidence_pdf(recipient: SignatureRecipient):
     evidence_file = generate_recipient_evidence_pdf(recipient)
     if hasattr(evidence_file, "seek"):
@@ -486,6 +505,21 @@ def _store_recipient_evidence_pdf(recipient: SignatureRecipient):
     recipient.save(update_fields=["signed_pdf"])
 
 
+def run_recipient_evidence_job(job):
+    recipient = SignatureRecipient.objects.select_related("request__document").get(pk=job.payload["recipient_id"])
+    _store_recipient_evidence_pdf(recipient)
+    return {"recipient_id": recipient.pk}
+
+
+def _submit_recipient_evidence_job(recipient: SignatureRecipient):
+    return submit_background_job(
+        RECIPIENT_EVIDENCE_JOB,
+        owner=recipient.request.created_by,
+        payload={"recipient_id": recipient.pk},
+        dedupe_key=_recipient_evidence_job_key(recipient),
+    )
+
+
 def _log_document_view(recipient: SignatureRecipient, request, *, mode: str):
     ConsentAuditLog.objects.create(
         request=recipient.request,
@@ -1973,6 +2007,22 @@ def consent_download_summary_pdf(request, request_id):
         return redirect("consent:detail", request_id=consent_request.request_id)
 
 
+def run_merged_pdf_job(job):
+    consent_request = SignatureRequest.objects.select_related("document").get(pk=job.payload["request_id"])
+
+    def on_progress(done, total):
+        report_background_job_progress(job, done * 90 // max(1, total), f"{done}/{total}명 반영")
+
+    merged_file = generate_merged_pdf(consent_request, on_progress=on_progress)
+    if not merged_file.size:
+        raise ValueError("merged pdf is empty")
+    filename = _build_merged_download_filename(consent_request)
+    merged_file.seek(0)
+    consent_request.merged_pdf.save(filename, merged_file, save=True)
+    merged_file.close()
+    return {"filename": filename}
+
+
 @login_required
 def consent_download_merged(request, request_id):
     schema_block = _schema_guard_response(request)
@@ -1980,58 +2030,67 @@ def consent_download_merged(request, request_id):
         return schema_block
 
     consent_request = get_object_or_404(SignatureRequest, request_id=request_id, created_by=request.user)
-    try:
-        merged_file = generate_merged_pdf(consent_request)
-        filename = _build_merged_download_filename(consent_request)
-        if hasattr(merged_file, "seek"):
-            merged_file.seek(0)
-        pdf_bytes = merged_file.read() if hasattr(merged_file, "read") else b""
-        if not pdf_bytes:
-            raise ValueError("merged pdf is empty")
-
-        try:
-            consent_request.merged_pdf.save(filename, ContentFile(pdf_bytes), save=True)
-        except Exception:
-            logger.exception(
-                "[consent] merged save failed but download fallback used request_id=%s",
-                consent_request.request_id,
-            )
-
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
-        response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
-        logger.info(
-            "[consent] merged pdf download request_id=%s user=%s",
-            consent_request.request_id,
-            request.user.username,
+    job_key = _merged_pdf_job_key(consent_request, request.user)
+    job = get_requested_background_job(request, dedupe_key=job_key)
+    if job is None:
+        job = submit_background_job(
+            MERGED_PDF_JOB,
+            owner=request.user,
+            payload={"request_id": consent_request.pk},
+            dedupe_key=job_key,
         )
-        return _apply_sensitive_cache_headers(response)
-    except ValueError as exc:
-        if "completed recipients" in str(exc):
+    if not job.is_finished:
+        return background_job_wait_response(
+            request,
+            job,
+            title="완성본 PDF",
+            back_url=reverse("consent:detail", kwargs={"request_id": consent_request.request_id}),
+        )
+
+    if job.status == BackgroundJob.STATUS_FAILED:
+        if job.error_type == "ValueError" and "completed recipients" in job.error_message:
             logger.info(
                 "[consent] merged pdf download blocked without completed recipients request_id=%s user=%s",
                 consent_request.request_id,
                 request.user.username,
             )
             messages.error(request, "응답 완료 후 완성본 PDF를 받을 수 있습니다.")
+        elif job.error_type == PdfRuntimeUnavailable.__name__:
+            logger.error(
+                "[consent] merged download blocked by missing pdf runtime request_id=%s err=%s",
+                consent_request.request_id,
+                job.error_message,
+            )
+            messages.error(
+                request,
+                "PDF 엔진(reportlab, pypdf)이 준비되지 않아 완성본 PDF를 생성할 수 없습니다. 운영팀에 환경 설정을 요청해 주세요.",
+            )
         else:
-            logger.exception("[consent] merged download failed request_id=%s", consent_request.request_id)
+            logger.error(
+                "[consent] merged download failed request_id=%s job=%s err=%s",
+                consent_request.request_id,
+                job.pk,
+                job.error_message,
+            )
             messages.error(request, "완성본 PDF 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
         return redirect("consent:detail", request_id=consent_request.request_id)
-    except PdfRuntimeUnavailable as exc:
-        logger.error(
-            "[consent] merged download blocked by missing pdf runtime request_id=%s err=%s",
-            consent_request.request_id,
-            exc,
-        )
-        messages.error(
-            request,
-            "PDF 엔진(reportlab, pypdf)이 준비되지 않아 완성본 PDF를 생성할 수 없습니다. 운영팀에 환경 설정을 요청해 주세요.",
-        )
-        return redirect("consent:detail", request_id=consent_request.request_id)
+
+    consent_request.refresh_from_db(fields=["merged_pdf"])
+    filename = job.result.get("filename") or _build_merged_download_filename(consent_request)
+    try:
+        merged_file = consent_request.merged_pdf.open("rb")
     except Exception:
-        logger.exception("[consent] merged download failed request_id=%s", consent_request.request_id)
+        logger.exception("[consent] merged pdf open failed request_id=%s", consent_request.request_id)
         messages.error(request, "완성본 PDF 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
         return redirect("consent:detail", request_id=consent_request.request_id)
+    response = FileResponse(merged_file, content_type="application/pdf")
+    response["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    logger.info(
+        "[consent] merged pdf download request_id=%s user=%s",
+        consent_request.request_id,
+        request.user.username,
+    )
+    return _apply_sensitive_cache_headers(response)
 
 
 @login_required
@@ -2049,19 +2108,29 @@ def consent_download_recipient_pdf(request, recipient_id):
         raise Http404("개별 증빙 PDF는 응답 완료 후에만 내려받을 수 있습니다.")
 
     if not recipient.signed_pdf or not recipient.signed_pdf.name:
-        try:
-            _store_recipient_evidence_pdf(recipient)
-        except PdfRuntimeUnavailable:
-            messages.error(request, "PDF 엔진(reportlab, pypdf)이 준비되지 않아 개별 증빙 PDF를 생성할 수 없습니다.")
-            return redirect("consent:detail", request_id=recipient.request.request_id)
-        except Exception:
-            logger.exception(
-                "[consent] recipient pdf download generation failed request_id=%s recipient_id=%s",
-                recipient.request.request_id,
-                recipient.id,
+        job = get_requested_background_job(request, dedupe_key=_recipient_evidence_job_key(recipient))
+        if job is None:
+            job = _submit_recipient_evidence_job(recipient)
+        if not job.is_finished:
+            return background_job_wait_response(
+                request,
+                job,
+                title="개별 증빙 PDF",
+                back_url=reverse("consent:detail", kwargs={"request_id": recipient.request.request_id}),
             )
-            messages.error(request, "개별 증빙 PDF 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
+        if job.status == BackgroundJob.STATUS_FAILED:
+            if job.error_type == PdfRuntimeUnavailable.__name__:
+                messages.error(request, "PDF 엔진(reportlab, pypdf)이 준비되지 않아 개별 증빙 PDF를 생성할 수 없습니다.")
+            else:
+                logger.error(
+                    "[consent] recipient pdf download generation failed request_id=%s recipient_id=%s err=%s",
+                    recipient.request.request_id,
+                    recipient.id,
+                    job.error_message,
+                )
+                messages.error(request, "개별 증빙 PDF 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
             return redirect("consent:detail", request_id=recipient.request.request_id)
+        recipient.refresh_from_db(fields=["signed_pdf"])
 
     logger.info(
         "[consent] recipient pdf download request_id=%s recipient_id=%s user=%s",
@@ -2329,17 +2398,12 @@ def consent_sign(request, token):
                         user_agent=verified_user_agent,
                     )
 
+                # Rendered by the job runner so the parent's submit does not wait on PDF work.
                 try:
-                    _store_recipient_evidence_pdf(recipient)
-                except PdfRuntimeUnavailable:
-                    logger.warning(
-                        "[consent] recipient evidence pdf skipped by missing runtime request_id=%s recipient_id=%s",
-                        recipient.request.request_id,
-                        recipient.id,
-                    )
+                    _submit_recipient_evidence_job(recipient)
                 except Exception:
                     logger.exception(
-                        "[consent] recipient evidence pdf save failed request_id=%s recipient_id=%s",
+                        "[consent] recipient evidence pdf job submit failed request_id=%s recipient_id=%s",
                         recipient.request.request_id,
                         recipient.id,
                     )
@@ -5,6 +5,8 @@ from django.db.models import Count
 from django.utils import timezone
 from core.admin_helpers import ReadOnlyModelAdmin
 from .models import (
+    BackgroundJob,
+    BootstrapStepRecord,
     UserProfile,
     UserMarketingEmailConsent,
     UserPolicyConsent,
@@ -271,6 +273,15 @@ class PageViewLogAdmin(admin.ModelAdmin):
     search_fields = ['path', 'route_name', 'user__username', 'visitor_key']
 
 
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'job_type', 'status', 'progress', 'owner', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status', 'job_type']
+    search_fields = ['job_type', 'dedupe_key', 'owner__username']
+    readonly_fields = ['created_at', 'started_at', 'heartbeat_at', 'finished_at']
+    raw_id_fields = ['owner']
+
+
 @admin.register(TeacherActivityProfile)
 class TeacherActivityProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'total_score', 'active_day_count', 'last_earned_at', 'updated_at']
@@ -411,4 +422,4 @@ class TeacherBuddyGiftCouponAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 
-admin.site.register([ProductWorkbenchBundle, VisitorLog], ReadOnlyModelAdmin)
+admin.site.register([BootstrapStepRecord, ProductWorkbenchBundle, VisitorLog], ReadOnlyModelAdmin)
@@ -0,0 +1,414 @@
+"""
+DB-backed background jobs.
+
+Slow exports such as merged consent PDFs, recipient evidence PDFs and the
+signatures register PDF are queued as ``BackgroundJob`` rows instead of running
+inside the request. A runner claims queued rows and executes them in a process
+pool. Handlers report progress on the row and leave their output in
+``artifact``, ``result`` or the app's own models. Views then answer with a
+waiting page that polls ``background_job_status``, and serve the output once
+the job is done.
+
+``job_type`` is the dotted path of the handler, as with ``import_string``. A
+handler takes the job row and may return a JSON-serialisable ``result`` dict.
+A ``dedupe_key`` makes a submission reuse the job already queued or running
+for that key, so repeated clicks do not stack up exports.
+
+The runner starts with the web process (``config.asgi`` / ``config.wsgi``)
+when ``BACKGROUND_JOBS_EMBEDDED_RUNNER`` is on, so jobs queued before a restart
+are picked up without waiting for the next submit. Otherwise it runs as its
+own process via ``manage.py run_background_jobs``. With ``BACKGROUND_JOBS_ENABLED`` off (the
+test default) jobs run inline on submit.
+"""
+
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, connections, transaction
+from django.db.models import F
+from django.http import Http404
+from django.shortcuts import render
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_STALE_SECONDS = 600
+DEFAULT_RETENTION_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ATTEMPTS = 2
+# Worker processes are replaced after this many jobs so PDF buffers do not pile up.
+MAX_JOBS_PER_WORKER_PROCESS = 50
+MAINTENANCE_INTERVAL_SECONDS = 60
+CLAIM_BATCH_SIZE = 5
+
+
+def is_background_jobs_enabled():
+    return bool(getattr(settings, "BACKGROUND_JOBS_ENABLED", False))
+
+
+def _get_workers():
+    return max(1, int(getattr(settings, "BACKGROUND_JOBS_WORKERS", DEFAULT_WORKERS)))
+
+
+def _get_poll_seconds():
+    return float(getattr(settings, "BACKGROUND_JOBS_POLL_SECONDS", DEFAULT_POLL_SECONDS))
+
+
+def _get_stale_seconds():
+    return int(getattr(settings, "BACKGROUND_JOBS_STALE_SECONDS", DEFAULT_STALE_SECONDS))
+
+
+def _get_retention_seconds():
+    return int(getattr(settings, "BACKGROUND_JOBS_RETENTION_SECONDS", DEFAULT_RETENTION_SECONDS))
+
+
+def _get_max_attempts():
+    return max(1, int(getattr(settings, "BACKGROUND_JOBS_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)))
+
+
+def _default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"[:80]
+
+
+def _active_job_for_key(dedupe_key):
+    return (
+        BackgroundJob.objects.filter(dedupe_key=dedupe_key, status__in=BackgroundJob.ACTIVE_STATUSES)
+        .order_by("created_at", "id")
+        .first()
+    )
+
+
+def submit_background_job(job_type, *, owner=None, payload=None, dedupe_key=""):
+    """Queue ``job_type`` (or return the active job with the same ``dedupe_key``)."""
+    import_string(job_type)
+    dedupe_key = str(dedupe_key or "")[:200]
+    if dedupe_key:
+        existing = _active_job_for_key(dedupe_key)
+        if existing is not None:
+            return existing
+    try:
+        with transaction.atomic():
+            job = BackgroundJob.objects.create(
+                job_type=job_type,
+                dedupe_key=dedupe_key,
+                owner=owner,
+                payload=payload or {},
+            )
+    except IntegrityError:
+        existing = _active_job_for_key(dedupe_key) if dedupe_key else None
+        if existing is None:
+            raise
+        return existing
+
+    if not is_background_jobs_enabled():
+        if _claim_job(job.pk, worker_id="inline"):
+            run_claimed_background_job(job.pk)
+        job.refresh_from_db()
+        return job
+
+    transaction.on_commit(_wake_runner)
+    return job
+
+
+def report_background_job_progress(job, percent, message=""):
+    """Record handler progress (0-100) on the job row; also keeps its heartbeat fresh."""
+    job.progress = max(0, min(100, int(percent)))
+    job.progress_message = str(message or "")[:200]
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        progress=job.progress,
+        progress_message=job.progress_message,
+        heartbeat_at=timezone.now(),
+    )
+
+
+def _claim_job(job_id, *, worker_id):
+    now = timezone.now()
+    return bool(
+        BackgroundJob.objects.filter(pk=job_id, status=BackgroundJob.STATUS_QUEUED).update(
+            status=BackgroundJob.STATUS_RUNNING,
+            worker_id=worker_id,
+            attempts=F("attempts") + 1,
+            started_at=now,
+            heartbeat_at=now,
+        )
+    )
+
+
+def claim_next_background_job(*, worker_id):
+    queued_ids = (
+        BackgroundJob.objects.filter(status=BackgroundJob.STATUS_QUEUED)
+        .order_by("created_at", "id")
+        .values_list("pk", flat=True)[:CLAIM_BATCH_SIZE]
+    )
+    for job_id in queued_ids:
+        if _claim_job(job_id, worker_id=worker_id):
+            return job_id
+    return None
+
+
+def _call_handler(handler, job):
+    # Inline jobs run inside the caller's transaction; a savepoint keeps a failing
+    # handler from breaking it.
+    if connection.in_atomic_block:
+        with transaction.atomic():
+            return handler(job)
+    return handler(job)
+
+
+def _mark_job_failed(job_id, *, error_type, error_message):
+    BackgroundJob.objects.filter(pk=job_id, status=BackgroundJob.STATUS_RUNNING).update(
+        status=BackgroundJob.STATUS_FAILED,
+        error_type=str(error_type)[:80],
+        error_message=str(error_message)[:2000],
+        finished_at=timezone.now(),
+    )
+
+
+def run_claimed_background_job(job_id):
+    """Run a job this worker has claimed and store its outcome; returns the final status."""
+    job = BackgroundJob.objects.filter(pk=job_id, status=BackgroundJob.STATUS_RUNNING).first()
+    if job is None:
+        return None
+    try:
+        handler = import_string(job.job_type)
+        result = _call_handler(handler, job)
+    except Exception as exc:
+        logger.exception("[background_jobs] job failed id=%s type=%s", job.pk, job.job_type)
+        _mark_job_failed(job.pk, error_type=type(exc).__name__, error_message=exc)
+        return BackgroundJob.STATUS_FAILED
+
+    job.status = BackgroundJob.STATUS_DONE
+    job.progress = 100
+    job.result = result or {}
+    job.error_type = ""
+    job.error_message = ""
+    job.finished_at = timezone.now()
+    job.save(
+        update_fields=[
+            "status",
+            "progress",
+            "result",
+            "artifact",
+            "error_type",
+            "error_message",
+            "finished_at",
+        ]
+    )
+    logger.info("[background_jobs] job done id=%s type=%s", job.pk, job.job_type)
+    return BackgroundJob.STATUS_DONE
+
+
+def requeue_stale_background_jobs(*, stale_seconds=None):
+    """Jobs whose runner stopped heartbeating go back to the queue until they run out of attempts."""
+    cutoff = timezone.now() - timedelta(seconds=stale_seconds or _get_stale_seconds())
+    stale = BackgroundJob.objects.filter(status=BackgroundJob.STATUS_RUNNING, heartbeat_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=_get_max_attempts()).update(
+        status=BackgroundJob.STATUS_FAILED,
+        error_type="WorkerLost",
+        error_message="작업을 실행하던 워커가 응답하지 않습니다.",
+        finished_at=timezone.now(),
+    )
+    requeued = stale.filter(attempts__lt=_get_max_attempts()).update(
+        status=BackgroundJob.STATUS_QUEUED,
+        worker_id="",
+    )
+    if failed or requeued:
+        logger.warning("[background_jobs] stale jobs requeued=%s failed=%s", requeued, failed)
+    return requeued, failed
+
+
+def purge_finished_background_jobs(*, retention_seconds=None):
+    """Delete finished jobs (and their artifacts) older than the retention window."""
+    cutoff = timezone.now() - timedelta(seconds=retention_seconds or _get_retention_seconds())
+    finished = BackgroundJob.objects.filter(
+        status__in=[BackgroundJob.STATUS_DONE, BackgroundJob.STATUS_FAILED],
+        finished_at__lt=cutoff,
+    )
+    deleted = 0
+    for job in finished.iterator():
+        if job.artifact:
+            try:
+                job.artifact.delete(save=False)
+            except Exception:
+                logger.warning("[background_jobs] artifact delete failed id=%s", job.pk, exc_info=True)
+        job.delete()
+        deleted += 1
+    return deleted
+
+
+def _init_pool_worker():
+    import django
+
+    django.setup()
+
+
+class BackgroundJobRunner:
+    """Claims queued jobs and runs them in a pool of spawned worker processes."""
+
+    def __init__(self, *, workers=None, poll_seconds=None, worker_id=None):
+        self.workers = workers or _get_workers()
+        self.poll_seconds = poll_seconds if poll_seconds is not None else _get_poll_seconds()
+        self.worker_id = worker_id or _default_worker_id()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._last_maintenance = 0.0
+
+    def wake(self):
+        self._wakeup.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def _maintain(self, running_ids):
+        if running_ids:
+            BackgroundJob.objects.filter(pk__in=running_ids, status=BackgroundJob.STATUS_RUNNING).update(
+                heartbeat_at=timezone.now()
+            )
+        if time.monotonic() - self._last_maintenance < MAINTENANCE_INTERVAL_SECONDS:
+            return
+        self._last_maintenance = time.monotonic()
+        requeue_stale_background_jobs()
+        purge_finished_background_jobs()
+
+    def _make_executor(self):
+        # Connections opened so far must not be shared with the workers.
+        connections.close_all()
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pool_worker,
+            max_tasks_per_child=MAX_JOBS_PER_WORKER_PROCESS,
+        )
+
+    def run(self, *, drain=False):
+        """Run until stopped; with ``drain`` return once the queue is empty and nothing is running."""
+        while not self._stop.is_set():
+            executor = self._make_executor()
+            try:
+                if self._run_pool(executor, drain=drain):
+                    return
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_pool(self, executor, *, drain):
+        running = {}
+        while not self._stop.is_set():
+            while len(running) < self.workers:
+                job_id = claim_next_background_job(worker_id=self.worker_id)
+                if job_id is None:
+                    break
+                future = executor.submit(run_claimed_background_job, job_id)
+                future.add_done_callback(lambda _future: self._wakeup.set())
+                running[future] = job_id
+
+            pool_broken = False
+            for future in [future for future in running if future.done()]:
+                job_id = running.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    continue
+                logger.error("[background_jobs] worker crashed id=%s error=%r", job_id, exc)
+                _mark_job_failed(job_id, error_type=type(exc).__name__, error_message=exc)
+                pool_broken = pool_broken or isinstance(exc, BrokenProcessPool)
+            if pool_broken:
+                for job_id in running.values():
+                    _mark_job_failed(job_id, error_type="BrokenProcessPool", error_message="worker pool stopped")
+                return False
+
+            if drain and not running:
+                return True
+            self._maintain(list(running.values()))
+            self._wakeup.wait(timeout=self.poll_seconds)
+            self._wakeup.clear()
+        return True
+
+
+_embedded_runner = None
+_embedded_lock = threading.Lock()
+
+
+def _start_embedded_runner():
+    global _embedded_runner
+    with _embedded_lock:
+        if _embedded_runner is not None:
+            return _embedded_runner
+        runner = BackgroundJobRunner()
+        thread = threading.Thread(target=runner.run, name="background-job-runner", daemon=True)
+        thread.start()
+        _embedded_runner = runner
+        logger.info("[background_jobs] embedded runner started workers=%s", runner.workers)
+        return runner
+
+
+def _is_embedded_runner_enabled():
+    return is_background_jobs_enabled() and bool(getattr(settings, "BACKGROUND_JOBS_EMBEDDED_RUNNER", True))
+
+
+def start_embedded_runner():
+    """Start the in-process runner at server boot; returns ``None`` when it is switched off."""
+    if not _is_embedded_runner_enabled():
+        return None
+    return _start_embedded_runner()
+
+
+def _wake_runner():
+    if not getattr(settings, "BACKGROUND_JOBS_EMBEDDED_RUNNER", True):
+        return
+    _start_embedded_runner().wake()
+
+
+def serialize_background_job(job):
+    return {
+        "id": job.pk,
+        "status": job.status,
+        "progress": job.progress,
+        "progress_message": job.progress_message,
+        "is_finished": job.is_finished,
+        "result": job.result if job.status == BackgroundJob.STATUS_DONE else {},
+        "status_url": reverse("background_job_status", kwargs={"job_id": job.pk}),
+    }
+
+
+def get_requested_background_job(request, *, dedupe_key):
+    """The job named by ``?job=`` when it belongs to this user and resource, else ``None``."""
+    raw_job_id = str(request.GET.get("job") or "").strip()
+    if not raw_job_id:
+        return None
+    if not raw_job_id.isdigit():
+        raise Http404("작업을 찾을 수 없습니다.")
+    job = BackgroundJob.objects.filter(pk=int(raw_job_id), owner=request.user, dedupe_key=dedupe_key).first()
+    if job is None:
+        raise Http404("작업을 찾을 수 없습니다.")
+    return job
+
+
+def background_job_wait_response(request, job, *, title, back_url=""):
+    """A 202 page that polls the job and reloads this URL (with ``?job=``) once it finishes."""
+    response = render(
+        request,
+        "core/background_job_wait.html",
+        {
+            "job": job,
+            "job_payload": serialize_background_job(job),
+            "title": title,
+            "back_url": back_url,
+            "continue_url": f"{request.path}?job={job.pk}",
+        },
+        status=202,
+    )
+    response["Cache-Control"] = "no-store, private"
+    return response
@@ -0,0 +1,164 @@
+"""
+Compact BM25 inverted index for Korean document chunks.
+
+Hangul runs are indexed as syllable bigrams (a one-syllable run as itself),
+because Korean words carry attached particles and endings ("광합성은",
+"광합성을") that whole-word matching would miss. Runs of Latin letters and
+digits are indexed as whole lowercase words.
+
+Postings live in three flat ``array`` buffers (chunk position, term frequency,
+chunk length), so an index over a 300-page textbook serializes to a few
+hundred KB. ``to_bytes``/``from_bytes`` round-trip it for storage next to the
+source artifact. A query merges the postings of its terms into a score table
+and takes the top k with a heap.
+"""
+
+import heapq
+import json
+import math
+import re
+import sys
+import zlib
+from array import array
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[0-9a-z]+")
+_MAGIC = b"BM25"
+_FORMAT_VERSION = 1
+_TF_MAX = 65535
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def tokenize(text):
+    tokens = []
+    for run in _TOKEN_RE.findall(str(text or "").lower()):
+        if run[0] < "가" or len(run) == 1:
+            tokens.append(run)
+            continue
+        tokens.extend(run[index : index + 2] for index in range(len(run) - 1))
+    return tokens
+
+
+class BM25Index:
+    def __init__(self, *, doc_ids, doc_lengths, terms, posting_docs, posting_tfs, k1=DEFAULT_K1, b=DEFAULT_B):
+        self.doc_ids = list(doc_ids)
+        self.doc_lengths = doc_lengths
+        # term -> (start, count) into the posting arrays
+        self.terms = terms
+        self.posting_docs = posting_docs
+        self.posting_tfs = posting_tfs
+        self.k1 = k1
+        self.b = b
+        self.avg_length = (sum(doc_lengths) / len(doc_lengths)) if len(doc_lengths) else 0.0
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    @classmethod
+    def build(cls, documents, *, k1=DEFAULT_K1, b=DEFAULT_B):
+        """Build from ``(doc_id, text)`` pairs; ``doc_id`` must be JSON-serializable."""
+        doc_ids = []
+        doc_lengths = array("I")
+        postings = {}
+        for position, (doc_id, text) in enumerate(documents):
+            tokens = tokenize(text)
+            doc_ids.append(doc_id)
+            doc_lengths.append(len(tokens))
+            for term, frequency in Counter(tokens).items():
+                postings.setdefault(term, []).append((position, min(frequency, _TF_MAX)))
+
+        terms = {}
+        posting_docs = array("I")
+        posting_tfs = array("H")
+        for term in sorted(postings):
+            entries = postings[term]
+            terms[term] = (len(posting_docs), len(entries))
+            for position, frequency in entries:
+                posting_docs.append(position)
+                posting_tfs.append(frequency)
+        return cls(
+            doc_ids=doc_ids,
+            doc_lengths=doc_lengths,
+            terms=terms,
+            posting_docs=posting_docs,
+            posting_tfs=posting_tfs,
+            k1=k1,
+            b=b,
+        )
+
+    def search(self, query, *, limit=10):
+        """Return up to ``limit`` ``(doc_id, score)`` pairs, best first; ties keep document order."""
+        total = len(self.doc_ids)
+        if not total or limit <= 0:
+            return []
+        scores = {}
+        k1, b, avg_length = self.k1, self.b, self.avg_length or 1.0
+        for term in set(tokenize(query)):
+            span = self.terms.get(term)
+            if span is None:
+                continue
+            start, count = span
+            idf = math.log(1 + (total - count + 0.5) / (count + 0.5))
+            for offset in range(start, start + count):
+                position = self.posting_docs[offset]
+                frequency = self.posting_tfs[offset]
+                norm = k1 * (1 - b + b * self.doc_lengths[position] / avg_length)
+                scores[position] = scores.get(position, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.doc_ids[position], score) for position, score in top]
+
+    def to_bytes(self):
+        header = json.dumps(
+            {
+                "version": _FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "k1": self.k1,
+                "b": self.b,
+                "doc_ids": self.doc_ids,
+                "terms": self.terms,
+                "postings": len(self.posting_docs),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        body = b"".join(
+            [
+                len(header).to_bytes(4, "big"),
+                header,
+                self.doc_lengths.tobytes(),
+                self.posting_docs.tobytes(),
+                self.posting_tfs.tobytes(),
+            ]
+        )
+        return _MAGIC + zlib.compress(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if not data.startswith(_MAGIC):
+            raise ValueError("not a BM25 index")
+        body = zlib.decompress(data[len(_MAGIC) :])
+        header_length = int.from_bytes(body[:4], "big")
+        header = json.loads(body[4 : 4 + header_length].decode("utf-8"))
+        if header.get("version") != _FORMAT_VERSION:
+            raise ValueError("unsupported BM25 index version")
+        cursor = 4 + header_length
+        arrays = []
+        for typecode, count in (("I", len(header["doc_ids"])), ("I", header["postings"]), ("H", header["postings"])):
+            values = array(typecode)
+            size = values.itemsize * count
+            values.frombytes(body[cursor : cursor + size])
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            arrays.append(values)
+            cursor += size
+        return cls(
+            doc_ids=header["doc_ids"],
+            doc_lengths=arrays[0],
+            terms={term: tuple(span) for term, span in header["terms"].items()},
+            posting_docs=arrays[1],
+            posting_tfs=arrays[2],
+            k1=header["k1"],
+            b=header["b"],
+        )
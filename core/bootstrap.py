@@ -0,0 +1,219 @@
+"""
+Step engine behind ``manage.py bootstrap_runtime``.
+
+Each ``BootstrapStep`` names the steps it must run ``after``. Steps whose
+dependencies are done run concurrently on a thread pool. A ``cacheable`` step
+is skipped when its fingerprint matches the one recorded after its last
+successful run. The fingerprint covers the command module, any declared
+``fingerprint_paths`` (seed data files or directories) and the set of applied
+migrations, so a code, seed or schema change reruns the step. Records older
+than ``max_skip_age`` are ignored so seed commands still repair drift now and
+then.
+
+``deferred`` steps (slow warmups) are only a hint for the command, which
+leaves them out of the engine run and starts them once the web server accepts
+connections. Nothing may depend on a deferred step.
+"""
+
+import hashlib
+import importlib.util
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional
+
+from django.core.management import get_commands
+from django.db import DatabaseError, connection, connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.utils import timezone
+
+from .models import BootstrapStepRecord
+
+logger = logging.getLogger(__name__)
+
+STEP_RAN = "ran"
+STEP_SKIPPED = "skipped"
+STEP_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class BootstrapStep:
+    name: str
+    run: Callable[[], None]
+    after: tuple = ()
+    command: str = ""
+    fingerprint_paths: tuple = ()
+    cacheable: bool = True
+    deferred: bool = False
+
+
+@dataclass
+class StepOutcome:
+    name: str
+    status: str
+    elapsed_ms: int = 0
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+
+def _hash_path(digest, path):
+    path = Path(path)
+    if path.is_dir():
+        for child in sorted(path.rglob("*")):
+            if child.is_file() and "__pycache__" not in child.parts:
+                digest.update(str(child.relative_to(path)).encode("utf-8"))
+                digest.update(child.read_bytes())
+    elif path.is_file():
+        digest.update(path.read_bytes())
+    else:
+        digest.update(f"missing:{path}".encode("utf-8"))
+
+
+def command_source_path(command_name):
+    app_name = get_commands().get(command_name)
+    if not isinstance(app_name, str):
+        return None
+    spec = importlib.util.find_spec(f"{app_name}.management.commands.{command_name}")
+    return spec.origin if spec and spec.origin else None
+
+
+def schema_state_digest():
+    applied = sorted(MigrationRecorder(connection).applied_migrations())
+    return hashlib.sha256(repr(applied).encode("utf-8")).hexdigest()
+
+
+def step_fingerprint(step, schema_digest):
+    digest = hashlib.sha256()
+    digest.update(step.name.encode("utf-8"))
+    digest.update(schema_digest.encode("utf-8"))
+    source_path = command_source_path(step.command) if step.command else None
+    if source_path:
+        _hash_path(digest, source_path)
+    for path in step.fingerprint_paths:
+        _hash_path(digest, path)
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    """``BootstrapStepRecord`` rows; unavailable (everything runs) until the table exists."""
+
+    def load(self):
+        try:
+            return {
+                record.step_name: record
+                for record in BootstrapStepRecord.objects.all()
+            }
+        except DatabaseError:
+            logger.warning("[bootstrap] step records unavailable; running every step")
+            return None
+
+    def record(self, step_name, fingerprint, elapsed_ms):
+        BootstrapStepRecord.objects.update_or_create(
+            step_name=step_name,
+            defaults={
+                "fingerprint": fingerprint,
+                "elapsed_ms": elapsed_ms,
+                "completed_at": timezone.now(),
+            },
+        )
+
+
+def _ordered_steps(steps):
+    """Steps in dependency order; raises ``ValueError`` on unknown or cyclic dependencies."""
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        unknown = [name for name in step.after if name not in by_name]
+        if unknown:
+            raise ValueError(f"bootstrap step {step.name} depends on unknown steps: {', '.join(unknown)}")
+    ordered = []
+    done = set()
+    pending = list(steps)
+    while pending:
+        ready = [step for step in pending if all(name in done for name in step.after)]
+        if not ready:
+            raise ValueError(f"bootstrap steps form a cycle: {', '.join(step.name for step in pending)}")
+        for step in ready:
+            ordered.append(step)
+            done.add(step.name)
+        pending = [step for step in pending if step.name not in done]
+    return ordered
+
+
+class BootstrapEngine:
+    def __init__(self, steps, *, workers=1, store=None, force=False, max_skip_age=None, log=None):
+        self.steps = _ordered_steps(list(steps))
+        self.workers = max(1, int(workers))
+        self.store = store
+        self.force = force
+        self.max_skip_age = max_skip_age
+        self.log = log or logger.info
+
+    def _fingerprints(self):
+        if self.store is None:
+            return {}, {}
+        records = self.store.load()
+        if records is None:
+            return {}, {}
+        schema_digest = schema_state_digest()
+        fingerprints = {
+            step.name: step_fingerprint(step, schema_digest)
+            for step in self.steps
+            if step.cacheable
+        }
+        return fingerprints, records
+
+    def _is_fresh(self, step, fingerprints, records):
+        if self.force or step.name not in fingerprints:
+            return False
+        record = records.get(step.name)
+        if record is None or record.fingerprint != fingerprints[step.name]:
+            return False
+        if self.max_skip_age is not None and timezone.now() - record.completed_at > self.max_skip_age:
+            return False
+        return True
+
+    def _run_step(self, step, fingerprints, records):
+        started = perf_counter()
+        try:
+            if self._is_fresh(step, fingerprints, records):
+                self.log(f"[bootstrap] skip (unchanged): {step.name}")
+                return StepOutcome(step.name, STEP_SKIPPED)
+            self.log(f"[bootstrap] running: {step.name}")
+            step.run()
+            elapsed_ms = int((perf_counter() - started) * 1000)
+            if step.name in fingerprints:
+                self.store.record(step.name, fingerprints[step.name], elapsed_ms)
+            self.log(f"[bootstrap] done: {step.name} ({elapsed_ms} ms)")
+            return StepOutcome(step.name, STEP_RAN, elapsed_ms)
+        except Exception as exc:
+            return StepOutcome(step.name, STEP_FAILED, int((perf_counter() - started) * 1000), exc)
+        finally:
+            # Steps run on pool threads, each with its own connections; do not leave them open.
+            connections.close_all()
+
+    def run(self):
+        """Run every step once its dependencies finished; stops scheduling at the first failure and re-raises it."""
+        fingerprints, records = self._fingerprints()
+        outcomes = {}
+        pending = list(self.steps)
+        failure = None
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bootstrap") as executor:
+            running = {}
+            while pending or running:
+                if failure is None:
+                    for step in [step for step in pending if all(name in outcomes for name in step.after)]:
+                        pending.remove(step)
+                        running[executor.submit(self._run_step, step, fingerprints, records)] = step
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    running.pop(future)
+                    outcome = future.result()
+                    outcomes[outcome.name] = outcome
+                    if outcome.status == STEP_FAILED and failure is None:
+                        failure = outcome
+        if failure is not None:
+            raise failure.error
+        return [outcomes[step.name] for step in self.steps]
@@ -274,10 +274,7 @@ def get_pdf_page_sizes(source_pdf_bytes: bytes) -> list[tuple[float, float]]:
     from pypdf import PdfReader
 
     reader = PdfReader(io.BytesIO(source_pdf_bytes))
-    return [
-        (float(page.mediabox.width), float(page.mediabox.height))
-        for page in reader.pages
-    ]
+    return get_page_sizes(reader.pages)
 
 
 def normalize_pdf_bytes(source_pdf_bytes: bytes) -> bytes:
@@ -440,21 +437,11 @@ def draw_checkmark(pdf_canvas, *, x: float, y: float, width: float, height: floa
     pdf_canvas.restoreState()
 
 
-def _build_mark_overlay_pdf_bytes(
-    *,
-    page_width: float,
-    page_height: float,
-    marks: list[dict],
-    signature_data: str,
-) -> bytes:
-    from reportlab.pdfgen import canvas
-
-    packet = io.BytesIO()
-    pdf = canvas.Canvas(packet, pagesize=(page_width, page_height))
+def _draw_marks(pdf_canvas, marks: list[dict], *, signature_data: str):
     for mark in marks:
         if mark["mark_type"] == DOCUMENT_MARK_TYPE_CHECKMARK:
             draw_checkmark(
-                pdf,
+                pdf_canvas,
                 x=mark["x"],
                 y=mark["y"],
                 width=mark["width"],
@@ -462,7 +449,7 @@ def _build_mark_overlay_pdf_bytes(
             )
         elif mark["mark_type"] == DOCUMENT_MARK_TYPE_NAME:
             draw_name_text(
-                pdf,
+                pdf_canvas,
                 mark.get("text_value", ""),
                 x=mark["x"],
                 y=mark["y"],
@@ -471,48 +458,16 @@ def _build_mark_overlay_pdf_bytes(
             )
         else:
             draw_signature_image(
-                pdf,
+                pdf_canvas,
                 signature_data,
                 x=mark["x"],
                 y=mark["y"],
                 width=mark["width"],
                 height=mark["height"],
             )
-    pdf.showPage()
-    pdf.save()
-    packet.seek(0)
-    return packet.read()
-
-
-def build_signed_pdf_bytes(
-    source_pdf_bytes: bytes,
-    *,
-    marks: list[dict] | None = None,
-    page_number: int | None = None,
-    x: float | None = None,
-    y: float | None = None,
-    width: float | None = None,
-    height: float | None = None,
-    signature_data: str,
-    mark_type: str = DOCUMENT_MARK_TYPE_SIGNATURE,
-    pdf_title: str = "",
-) -> bytes:
-    ensure_pdf_runtime()
-    from pypdf import PdfReader, PdfWriter
 
-    reader = PdfReader(io.BytesIO(source_pdf_bytes))
-    if marks is None:
-        marks = [
-            {
-                "page": page_number,
-                "x": x,
-                "y": y,
-                "width": width,
-                "height": height,
-                "mark_type": mark_type,
-            }
-        ]
 
+def normalize_document_marks(marks: list[dict], *, page_count: int, signature_data: str) -> list[dict]:
     normalized_marks = []
     for item in marks:
         if not isinstance(item, dict):
@@ -529,7 +484,7 @@ def build_signed_pdf_bytes(
             item.get("mark_type") or DOCUMENT_MARK_TYPE_SIGNATURE
         ).strip().lower()
         normalized_text_value = str(item.get("text_value") or "").strip()
-        if normalized_page < 1 or normalized_page > len(reader.pages):
+        if normalized_page < 1 or normalized_page > page_count:
             raise ValueError("표시 페이지가 문서 범위를 벗어났습니다.")
         if normalized_width <= 0 or normalized_height <= 0:
             raise ValueError("표시 크기가 올바르지 않습니다.")
@@ -559,25 +514,109 @@ def build_signed_pdf_bytes(
         signature_data or ""
     ).strip():
         raise ValueError("서명 이미지가 없습니다.")
+    return normalized_marks
 
-    overlays_by_page = {}
-    for index, page in enumerate(reader.pages, start=1):
-        page_marks = [mark for mark in normalized_marks if mark["page"] == index]
-        if not page_marks:
-            continue
-        overlay_bytes = _build_mark_overlay_pdf_bytes(
-            page_width=float(page.mediabox.width),
-            page_height=float(page.mediabox.height),
-            marks=page_marks,
+
+def get_page_sizes(pages) -> list[tuple[float, float]]:
+    return [(float(page.mediabox.width), float(page.mediabox.height)) for page in pages]
+
+
+def build_mark_overlay_pages(
+    page_sizes: list[tuple[float, float]],
+    marks: list[dict],
+    *,
+    signature_data: str,
+) -> dict:
+    """
+    Overlay pages keyed by source page number, for already normalized ``marks``.
+
+    Only marked pages are drawn, all into one small PDF that is parsed once;
+    the source document is never re-rendered.
+    """
+    from pypdf import PdfReader
+    from reportlab.pdfgen import canvas
+
+    marked_pages = sorted({mark["page"] for mark in marks})
+    if not marked_pages:
+        return {}
+    packet = io.BytesIO()
+    pdf = canvas.Canvas(packet, pagesize=page_sizes[marked_pages[0] - 1])
+    for page_number in marked_pages:
+        pdf.setPageSize(page_sizes[page_number - 1])
+        _draw_marks(
+            pdf,
+            [mark for mark in marks if mark["page"] == page_number],
             signature_data=signature_data,
         )
-        overlays_by_page[index] = PdfReader(io.BytesIO(overlay_bytes)).pages[0]
+        pdf.showPage()
+    pdf.save()
+    overlay_reader = PdfReader(io.BytesIO(packet.getvalue()))
+    return dict(zip(marked_pages, overlay_reader.pages))
+
+
+def append_stamped_pages(writer, source_pages, overlays_by_page: dict) -> int:
+    """
+    Add ``source_pages`` to ``writer`` with the overlays merged onto the writer's copies.
+
+    ``PdfWriter.add_page`` hands back the same page object every time a source
+    page is added, so a stamp merged onto it would show up in every copy. Marked
+    pages are therefore drawn onto a fresh blank page with the same boxes and
+    rotation; the source content is copied in while its fonts and images stay
+    shared. Unmarked pages are never
+    modified and are added as the shared page.
+    """
+    for page_number, page in enumerate(source_pages, start=1):
+        overlay_page = overlays_by_page.get(page_number)
+        if overlay_page is None:
+            writer.add_page(page)
+            continue
+        writer_page = writer.add_blank_page(float(page.mediabox.width), float(page.mediabox.height))
+        writer_page.mediabox = page.mediabox
+        writer_page.cropbox = page.cropbox
+        writer_page.rotation = page.rotation
+        writer_page.merge_page(page)
+        writer_page.merge_page(overlay_page)
+    return len(source_pages)
+
+
+def build_signed_pdf_bytes(
+    source_pdf_bytes: bytes,
+    *,
+    marks: list[dict] | None = None,
+    page_number: int | None = None,
+    x: float | None = None,
+    y: float | None = None,
+    width: float | None = None,
+    height: float | None = None,
+    signature_data: str,
+    mark_type: str = DOCUMENT_MARK_TYPE_SIGNATURE,
+    pdf_title: str = "",
+) -> bytes:
+    ensure_pdf_runtime()
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(io.BytesIO(source_pdf_bytes))
+    if marks is None:
+        marks = [
+            {
+                "page": page_number,
+                "x": x,
+                "y": y,
+                "width": width,
+                "height": height,
+                "mark_type": mark_type,
+            }
+        ]
+
+    normalized_marks = normalize_document_marks(marks, page_count=len(reader.pages), signature_data=signature_data)
+    overlays_by_page = build_mark_overlay_pages(
+        get_page_sizes(reader.pages),
+        normalized_marks,
+        signature_data=signature_data,
+    )
 
     writer = PdfWriter()
-    for index, page in enumerate(reader.pages, start=1):
-        if index in overlays_by_page:
-            page.merge_page(overlays_by_page[index])
-        writer.add_page(page)
+    append_stamped_pages(writer, reader.pages, overlays_by_page)
 
     metadata = {"/Producer": "Eduitit Docsign"}
     if (pdf_title or "").strip():
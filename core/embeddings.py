@@ -0,0 +1,298 @@
+"""
+Shared embedding service for the Chroma-backed RAG helpers
+(``school_violence.rag_utils`` and ``padlet_bot.rag_utils``).
+
+- One embedding function per process. The ``onnx`` backend is Chroma's
+  all-MiniLM-L6-v2 ONNX model read from ``RAG_EMBEDDING_MODEL_DIR`` (filled by
+  ``ensure_embedding_model``, which ``bootstrap_runtime`` runs as a deferred
+  warmup when a RAG app is installed), so no request waits on a model download.
+  The ``hashing`` backend is a deterministic feature-hashing embedder
+  with no model files, used by tests and as an offline fallback.
+- Query embeddings are kept in an LRU keyed by normalized text.
+- ``sync_collection_chunks`` embeds document chunks in batches and skips chunks
+  whose content hash is already stored, so re-indexing an edited file only pays
+  for the changed chunks.
+- ``submit_ingest_job`` runs ingestion on a background worker thread and
+  publishes progress through the cache, so any web worker can report it.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import queue
+import re
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_QUERY_CACHE_SIZE = 512
+EMBEDDING_DIMENSIONS = 384
+INGEST_STATUS_TTL_SECONDS = 24 * 60 * 60
+INGEST_STATUS_KEY_TEMPLATE = "rag_ingest:{job_id}"
+ONNX_MODEL_FILES = (
+    "config.json",
+    "model.onnx",
+    "special_tokens_map.json",
+    "tokenizer_config.json",
+    "tokenizer.json",
+    "vocab.txt",
+)
+
+_function_lock = threading.Lock()
+_embedding_function = None
+_query_cache_lock = threading.Lock()
+_query_cache = OrderedDict()
+_worker_lock = threading.Lock()
+_worker = None
+_jobs = queue.Queue()
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_embedding_text(text):
+    return _SPACE_RE.sub(" ", unicodedata.normalize("NFKC", str(text or ""))).strip()
+
+
+def content_hash(text):
+    return hashlib.sha1(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+
+
+def _as_list(vector):
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+
+class HashingEmbeddingFunction:
+    """Character-bigram feature hashing into ``EMBEDDING_DIMENSIONS`` signed buckets, L2-normalized."""
+
+    def __init__(self, dimensions=EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+
+    def __call__(self, input):
+        return [self._embed(text) for text in input]
+
+    def _embed(self, text):
+        value = normalize_embedding_text(text).lower()
+        grams = [value[index : index + 2] for index in range(len(value) - 1)] or ([value] if value else [])
+        vector = [0.0] * self.dimensions
+        for gram in grams:
+            digest = hashlib.md5(gram.encode("utf-8")).digest()
+            bucket = int.from_bytes(digest[:4], "big") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(item * item for item in vector)) or 1.0
+        return [item / norm for item in vector]
+
+
+def onnx_model_present(model_dir):
+    onnx_dir = os.path.join(str(model_dir or ""), "onnx")
+    return all(os.path.exists(os.path.join(onnx_dir, name)) for name in ONNX_MODEL_FILES)
+
+
+def _build_onnx_function():
+    from chromadb.utils import embedding_functions
+
+    model_dir = Path(settings.RAG_EMBEDDING_MODEL_DIR)
+    if not onnx_model_present(model_dir):
+        logger.warning("[embeddings] no bundled ONNX model in %s; Chroma will download it on first use", model_dir)
+    # Chroma resolves the model files from this class attribute.
+    embedding_functions.ONNXMiniLM_L6_V2.DOWNLOAD_PATH = model_dir
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+def get_embedding_function():
+    """Return the process-wide embedding function, loading the model once."""
+    global _embedding_function
+    if _embedding_function is None:
+        with _function_lock:
+            if _embedding_function is None:
+                backend = getattr(settings, "RAG_EMBEDDING_BACKEND", "onnx")
+                _embedding_function = HashingEmbeddingFunction() if backend == "hashing" else _build_onnx_function()
+    return _embedding_function
+
+
+def reset_embedding_service():
+    global _embedding_function
+    with _function_lock:
+        _embedding_function = None
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+def _query_cache_size():
+    return max(0, int(getattr(settings, "RAG_QUERY_EMBEDDING_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE)))
+
+
+def embed_query(text):
+    key = normalize_embedding_text(text)
+    with _query_cache_lock:
+        vector = _query_cache.get(key)
+        if vector is not None:
+            _query_cache.move_to_end(key)
+            return vector
+    vector = _as_list(get_embedding_function()([key])[0])
+    limit = _query_cache_size()
+    if limit:
+        with _query_cache_lock:
+            _query_cache[key] = vector
+            while len(_query_cache) > limit:
+                _query_cache.popitem(last=False)
+    return vector
+
+
+def _batch_size():
+    return max(1, int(getattr(settings, "RAG_EMBEDDING_BATCH_SIZE", DEFAULT_BATCH_SIZE)))
+
+
+def sync_collection_chunks(collection, *, doc_key, id_prefix, chunks, metadata, progress=None):
+    """
+    Make ``collection`` hold exactly ``chunks`` for ``doc_key``.
+
+    Chunk ids are derived from content hashes, so unchanged chunks keep their
+    stored embeddings even when they move; only their metadata is refreshed.
+    ``progress(done, total)`` is called after every embedded batch.
+    """
+    existing = collection.get(where={"doc_id": doc_key}, include=["metadatas"])
+    stored = dict(zip(existing.get("ids") or [], existing.get("metadatas") or []))
+
+    targets = []
+    occurrences = Counter()
+    for index, text in enumerate(chunks):
+        digest = content_hash(text)
+        occurrences[digest] += 1
+        suffix = f"_{occurrences[digest]}" if occurrences[digest] > 1 else ""
+        chunk_metadata = dict(metadata, doc_id=doc_key, chunk_index=index, content_hash=digest)
+        targets.append((f"{id_prefix}_{digest[:20]}{suffix}", text, chunk_metadata))
+
+    target_ids = {chunk_id for chunk_id, _text, _metadata in targets}
+    stale_ids = [chunk_id for chunk_id in stored if chunk_id not in target_ids]
+    if stale_ids:
+        collection.delete(ids=stale_ids)
+
+    pending = []
+    relabel = []
+    for target in targets:
+        previous = stored.get(target[0])
+        if not previous or previous.get("content_hash") != target[2]["content_hash"]:
+            pending.append(target)
+        elif previous != target[2]:
+            relabel.append(target)
+    if relabel:
+        collection.update(ids=[item[0] for item in relabel], metadatas=[item[2] for item in relabel])
+
+    embed = get_embedding_function()
+    total = len(pending)
+    if progress:
+        progress(0, total)
+    batch_size = _batch_size()
+    for start in range(0, total, batch_size):
+        batch = pending[start : start + batch_size]
+        vectors = embed([text for _chunk_id, text, _metadata in batch])
+        collection.upsert(
+            ids=[chunk_id for chunk_id, _text, _metadata in batch],
+            embeddings=[_as_list(vector) for vector in vectors],
+            documents=[text for _chunk_id, text, _metadata in batch],
+            metadatas=[chunk_metadata for _chunk_id, _text, chunk_metadata in batch],
+        )
+        if progress:
+            progress(start + len(batch), total)
+    return {
+        "chunk_count": len(targets),
+        "embedded": total,
+        "skipped": len(targets) - total,
+        "deleted": len(stale_ids),
+    }
+
+
+def _status_key(job_id):
+    return INGEST_STATUS_KEY_TEMPLATE.format(job_id=job_id)
+
+
+def _set_status(job_id, status, **fields):
+    payload = {"job_id": job_id, "status": status, "done": 0, "total": 0, "error": ""}
+    payload.update(fields)
+    cache.set(_status_key(job_id), payload, INGEST_STATUS_TTL_SECONDS)
+    return payload
+
+
+def get_ingest_status(job_id):
+    return cache.get(_status_key(job_id))
+
+
+def _run_job(job_id, task):
+    _set_status(job_id, "running")
+
+    def progress(done, total):
+        _set_status(job_id, "running", done=done, total=total)
+
+    try:
+        result = task(progress) or {}
+    except Exception as exc:
+        logger.exception("[embeddings] ingest job failed job=%s", job_id)
+        return _set_status(job_id, "failed", error=str(exc))
+    return _set_status(job_id, "done", **result)
+
+
+def _worker_loop():
+    while True:
+        job_id, task = _jobs.get()
+        close_old_connections()
+        try:
+            _run_job(job_id, task)
+        finally:
+            close_old_connections()
+            _jobs.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, name="rag-ingest-worker", daemon=True)
+            _worker.start()
+
+
+def submit_ingest_job(job_id, task):
+    """
+    Queue ``task(progress)`` for the ingestion worker and return its status.
+
+    ``task`` returns a dict merged into the final ``done`` status, or raises to
+    mark the job ``failed``. With ``RAG_INGEST_ASYNC`` off the job runs inline.
+    """
+    if not getattr(settings, "RAG_INGEST_ASYNC", True):
+        return _run_job(job_id, task)
+    status = _set_status(job_id, "queued")
+    _ensure_worker()
+    _jobs.put((job_id, task))
+    return status
+
+
+def ingest_status_payload(status):
+    """Map an ingest status to the ``(json, http_status)`` the doc-processing endpoints return."""
+    if not status:
+        return {"error": "처리 작업을 찾을 수 없습니다."}, 404
+    if status["status"] == "failed":
+        return {"error": status.get("error") or "처리 중 오류가 발생했습니다."}, 400
+    if status["status"] == "done":
+        chunk_count = status.get("chunk_count", 0)
+        return {
+            "success": True,
+            "message": f"{chunk_count}개의 청크로 처리되었습니다.",
+            "chunk_count": chunk_count,
+            "embedded": status.get("embedded", 0),
+        }, 200
+    return {
+        "success": True,
+        "pending": True,
+        "status": status["status"],
+        "done": status.get("done", 0),
+        "total": status.get("total", 0),
+        "message": "문서를 처리하고 있습니다.",
+    }, 202
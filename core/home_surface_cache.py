@@ -0,0 +1,129 @@
+"""
+Two-tier cache for the home surface.
+
+Tier 1 is a versioned product catalog snapshot per audience (launch meta,
+purpose sections, display groups, nav sections, guide URL map). It is rebuilt
+only after ``bump_home_catalog_version()`` runs, which the Product/ServiceManual
+signals do.
+
+Tier 2 is a small per-user overlay (favorite/recent/quick-action product ids and
+the teacher buddy card). It is keyed by both the catalog version and a per-user
+version that favorites, usage logs, profile and buddy signals bump.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+HOME_SURFACE_CACHE_PREFIX = "home_surface"
+HOME_CATALOG_AUDIENCE_AUTHENTICATED = "authenticated"
+HOME_CATALOG_AUDIENCE_GUEST = "guest"
+DEFAULT_CATALOG_CACHE_TTL_SECONDS = 60 * 10
+DEFAULT_USER_OVERLAY_CACHE_TTL_SECONDS = 60 * 2
+
+
+def is_home_surface_cache_enabled():
+    return bool(getattr(settings, "HOME_SURFACE_CACHE_ENABLED", True))
+
+
+def _catalog_version_key():
+    return f"{HOME_SURFACE_CACHE_PREFIX}:catalog_version"
+
+
+def _user_version_key(user_id):
+    return f"{HOME_SURFACE_CACHE_PREFIX}:user_version:{user_id}"
+
+
+def _read_version(key):
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, 1, timeout=None)
+            version = cache.get(key)
+    except Exception:
+        logger.exception("[home surface cache] version read failed key=%s", key)
+        return None
+    return int(version or 1)
+
+
+def _bump_version(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
+        return 2
+    except Exception:
+        logger.exception("[home surface cache] version bump failed key=%s", key)
+        return None
+
+
+def get_home_catalog_version():
+    return _read_version(_catalog_version_key())
+
+
+def bump_home_catalog_version():
+    return _bump_version(_catalog_version_key())
+
+
+def get_home_user_overlay_version(user_id):
+    return _read_version(_user_version_key(user_id))
+
+
+def bump_home_user_overlay_version(user_id):
+    if not user_id:
+        return None
+    return _bump_version(_user_version_key(user_id))
+
+
+def _get_or_build(key, builder, *, timeout, label):
+    try:
+        cached = cache.get(key)
+    except Exception:
+        logger.exception("[home surface cache] %s read failed key=%s", label, key)
+        cached = None
+    if cached is not None:
+        return cached
+
+    value = builder()
+    if isinstance(value, dict) and value.get("cacheable") is False:
+        return value
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception:
+        logger.exception("[home surface cache] %s write failed key=%s", label, key)
+    return value
+
+
+def get_home_catalog_snapshot(audience, builder):
+    """Return the shared catalog snapshot for ``audience``, building it on a miss."""
+    if not is_home_surface_cache_enabled():
+        return builder()
+    version = get_home_catalog_version()
+    if version is None:
+        return builder()
+    return _get_or_build(
+        f"{HOME_SURFACE_CACHE_PREFIX}:catalog:{version}:{audience}",
+        builder,
+        timeout=getattr(settings, "HOME_SURFACE_CATALOG_CACHE_TTL_SECONDS", DEFAULT_CATALOG_CACHE_TTL_SECONDS),
+        label="catalog",
+    )
+
+
+def get_home_user_overlay(user, builder):
+    """Return the per-user overlay, building it on a miss."""
+    user_id = getattr(user, "pk", None)
+    if not is_home_surface_cache_enabled() or not user_id:
+        return builder()
+    catalog_version = get_home_catalog_version()
+    user_version = get_home_user_overlay_version(user_id)
+    if catalog_version is None or user_version is None:
+        return builder()
+    return _get_or_build(
+        f"{HOME_SURFACE_CACHE_PREFIX}:user:{user_id}:{user_version}:{catalog_version}",
+        builder,
+        timeout=getattr(settings, "HOME_SURFACE_USER_CACHE_TTL_SECONDS", DEFAULT_USER_OVERLAY_CACHE_TTL_SECONDS),
+        label="user overlay",
+    )
@@ -0,0 +1,266 @@
+"""
+Korean calendar data shared by the class calendar, the daily notice
+recommendations and saju charts: public holiday markers, lunar to solar
+conversion and the 24 solar terms.
+
+Everything is computed per year and memoized. ``manage.py
+build_korean_calendar_table`` writes the holiday markers for MIN_YEAR..MAX_YEAR
+into ``core/data/korean_holidays.json``; when that file exists it is read
+instead of running the lunar conversions.
+"""
+
+import json
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+from korean_lunar_calendar import KoreanLunarCalendar
+
+logger = logging.getLogger(__name__)
+
+MIN_YEAR = 1900
+# korean-lunar-calendar converts lunar dates only up to 2050.
+MAX_YEAR = 2050
+HOLIDAY_TABLE_PATH = Path(__file__).resolve().parent / "data" / "korean_holidays.json"
+
+HOLIDAY_KIND_PUBLIC = "public"
+HOLIDAY_KIND_LABOR = "labor"
+
+SOLAR_TERM_KOREAN_NAMES = {
+    "Lichun": "입춘",
+    "Usu": "우수",
+    "Gyeongchip": "경칩",
+    "Chunbun": "춘분",
+    "Cheongmyeong": "청명",
+    "Gokwoo": "곡우",
+    "Ipha": "입하",
+    "Soman": "소만",
+    "Mangjong": "망종",
+    "Haji": "하지",
+    "Soseo": "소서",
+    "Daeseo": "대서",
+    "Ipchu": "입추",
+    "Cheoseo": "처서",
+    "Baekro": "백로",
+    "Chubun": "추분",
+    "Hallo": "한로",
+    "Sanggang": "상강",
+    "Ipdong": "입동",
+    "Soseol": "소설",
+    "Daeseol": "대설",
+    "Dongji": "동지",
+    "Sohan": "소한",
+    "Daehan": "대한",
+}
+
+
+@lru_cache(maxsize=4096)
+def lunar_to_solar(year, month, day, *, intercalation=False):
+    """Solar date of a lunar date; raises ``ValueError`` when it does not exist."""
+    calendar = KoreanLunarCalendar()
+    if not calendar.setLunarDate(int(year), int(month), int(day), bool(intercalation)):
+        raise ValueError(f"Unable to convert lunar date {year}-{month}-{day}")
+    try:
+        return date.fromisoformat(calendar.SolarIsoFormat())
+    except ValueError as exc:
+        raise ValueError(f"Unable to convert lunar date {year}-{month}-{day}") from exc
+
+
+def _merge_holiday_marker(markers, marker_date, *, name, kind=HOLIDAY_KIND_PUBLIC, is_observed=False):
+    if not isinstance(marker_date, date):
+        return
+    date_key = marker_date.isoformat()
+    existing = markers.get(date_key)
+    if existing is None:
+        markers[date_key] = {
+            "name": name,
+            "kind": kind,
+            "is_observed": bool(is_observed),
+        }
+        return
+
+    existing_names = [part.strip() for part in str(existing.get("name") or "").split(" / ") if part.strip()]
+    if name not in existing_names:
+        existing_names.append(name)
+    existing["name"] = " / ".join(existing_names)
+    if existing.get("kind") != HOLIDAY_KIND_PUBLIC and kind == HOLIDAY_KIND_PUBLIC:
+        existing["kind"] = HOLIDAY_KIND_PUBLIC
+    existing["is_observed"] = bool(existing.get("is_observed")) or bool(is_observed)
+
+
+def _is_public_holiday_day(target_date, public_dates):
+    if not isinstance(target_date, date):
+        return False
+    return target_date.weekday() == 6 or target_date in public_dates
+
+
+def _next_substitute_holiday(start_date, public_dates, observed_dates):
+    candidate = start_date
+    while (
+        candidate.weekday() == 5
+        or _is_public_holiday_day(candidate, public_dates)
+        or candidate in observed_dates
+    ):
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def compute_holiday_markers(year):
+    """Holiday markers keyed by ISO date, computed from the holiday rules (no table, no cache)."""
+    year = int(year)
+    if year < MIN_YEAR or year > MAX_YEAR:
+        return {}
+
+    markers = {}
+    public_dates = {}
+    observed_dates = set()
+    observed_candidates = []
+
+    def add_public_holiday(marker_date, name, *, substitute_group=""):
+        if not isinstance(marker_date, date) or marker_date.year != year:
+            return
+        _merge_holiday_marker(markers, marker_date, name=name, kind=HOLIDAY_KIND_PUBLIC, is_observed=False)
+        public_dates.setdefault(marker_date, []).append(
+            {
+                "name": name,
+                "substitute_group": substitute_group,
+            }
+        )
+
+    fixed_public_holidays = (
+        (date(year, 1, 1), "신정", ""),
+        (date(year, 3, 1), "삼일절", "single"),
+        (date(year, 5, 5), "어린이날", "single"),
+        (date(year, 6, 6), "현충일", ""),
+        (date(year, 8, 15), "광복절", "single"),
+        (date(year, 10, 3), "개천절", "single"),
+        (date(year, 10, 9), "한글날", "single"),
+        (date(year, 12, 25), "기독탄신일", "single"),
+    )
+    for marker_date, name, substitute_group in fixed_public_holidays:
+        add_public_holiday(marker_date, name, substitute_group=substitute_group)
+
+    seollal_date = lunar_to_solar(year, 1, 1)
+    seollal_days = (
+        (seollal_date - timedelta(days=1), "설날 연휴"),
+        (seollal_date, "설날"),
+        (seollal_date + timedelta(days=1), "설날 연휴"),
+    )
+    for marker_date, name in seollal_days:
+        add_public_holiday(marker_date, name, substitute_group="seollal")
+
+    buddha_birthday = lunar_to_solar(year, 4, 8)
+    add_public_holiday(buddha_birthday, "부처님오신날", substitute_group="single")
+
+    chuseok_date = lunar_to_solar(year, 8, 15)
+    chuseok_days = (
+        (chuseok_date - timedelta(days=1), "추석 연휴"),
+        (chuseok_date, "추석"),
+        (chuseok_date + timedelta(days=1), "추석 연휴"),
+    )
+    for marker_date, name in chuseok_days:
+        add_public_holiday(marker_date, name, substitute_group="chuseok")
+
+    _merge_holiday_marker(markers, date(year, 5, 1), name="근로자의 날", kind=HOLIDAY_KIND_LABOR, is_observed=False)
+
+    for marker_date, entries in public_dates.items():
+        if marker_date.weekday() not in {5, 6} and len(entries) <= 1:
+            continue
+        single_entry = next(
+            (entry for entry in entries if (entry.get("substitute_group") or "") == "single"),
+            None,
+        )
+        if single_entry is None:
+            continue
+        observed_candidates.append((marker_date + timedelta(days=1), f"{single_entry['name']} 대체공휴일"))
+
+    for group_name, label in (("seollal", "설날 대체공휴일"), ("chuseok", "추석 대체공휴일")):
+        group_dates = sorted(
+            marker_date
+            for marker_date, entries in public_dates.items()
+            if any((entry.get("substitute_group") or "") == group_name for entry in entries)
+        )
+        if not group_dates:
+            continue
+        has_sunday = any(marker_date.weekday() == 6 for marker_date in group_dates)
+        has_overlap = any(
+            len(public_dates.get(marker_date, [])) > 1 and marker_date.weekday() not in {5, 6}
+            for marker_date in group_dates
+        )
+        if not has_sunday and not has_overlap:
+            continue
+        observed_candidates.append((max(group_dates) + timedelta(days=1), label))
+
+    ordered_public_dates = set(public_dates.keys())
+    for start_date, name in sorted(observed_candidates, key=lambda item: item[0]):
+        observed_date = _next_substitute_holiday(start_date, ordered_public_dates, observed_dates)
+        observed_dates.add(observed_date)
+        _merge_holiday_marker(markers, observed_date, name=name, kind=HOLIDAY_KIND_PUBLIC, is_observed=True)
+
+    return markers
+
+
+@lru_cache(maxsize=1)
+def _holiday_table():
+    try:
+        with open(HOLIDAY_TABLE_PATH, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("[korean_calendar] unreadable holiday table %s; computing holidays", HOLIDAY_TABLE_PATH)
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_holiday_markers(year):
+    table = _holiday_table()
+    if table is not None and str(year) in table:
+        return table[str(year)]
+    return compute_holiday_markers(year)
+
+
+def holiday_markers(year):
+    """
+    Holiday markers for a year, keyed by ISO date:
+    ``{"2026-03-02": {"name": "삼일절 대체공휴일", "kind": "public", "is_observed": True}}``.
+
+    Empty outside MIN_YEAR..MAX_YEAR. Returns a copy, so callers may modify it.
+    """
+    return {date_key: dict(marker) for date_key, marker in _cached_holiday_markers(int(year)).items()}
+
+
+def public_holiday_name(target_date):
+    """Name of the public (or substitute) holiday on a date, or ``""``."""
+    marker = _cached_holiday_markers(target_date.year).get(target_date.isoformat())
+    if not marker or marker.get("kind") != HOLIDAY_KIND_PUBLIC:
+        return ""
+    return marker["name"]
+
+
+@lru_cache(maxsize=32)
+def _cached_solar_terms(year):
+    # The ephemeris (table and ephem fallback) lives with the saju engine.
+    from fortune.libs import manse
+
+    terms = {
+        SOLAR_TERM_KOREAN_NAMES[name]: term_datetime
+        for name, term_datetime in manse.get_all_solar_terms(year).items()
+    }
+    return dict(sorted(terms.items(), key=lambda item: item[1]))
+
+
+def solar_terms(year):
+    """The 24 solar terms of a year as ``{korean name: aware KST datetime}``, in calendar order."""
+    return dict(_cached_solar_terms(int(year)))
+
+
+@lru_cache(maxsize=32)
+def _solar_term_names_by_date(year):
+    return {term_datetime.date(): name for name, term_datetime in _cached_solar_terms(year).items()}
+
+
+def solar_term_name(target_date):
+    """Korean name of the solar term falling on a (KST) date, or ``""``."""
+    return _solar_term_names_by_date(target_date.year).get(target_date, "")
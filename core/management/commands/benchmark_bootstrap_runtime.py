@@ -0,0 +1,38 @@
+from io import StringIO
+from time import perf_counter
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Time bootstrap_runtime the old way (serial, every step, warmups inline) against a forced parallel run "
+        "and a warm run that skips unchanged steps. Runs the real seed commands against the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=None)
+
+    def handle(self, *args, **options):
+        scenarios = (
+            ("serial-forced", {"workers": 1, "force": True, "no_defer": True}),
+            ("parallel-forced", {"workers": options["workers"], "force": True, "no_defer": True}),
+            ("parallel-warm", {"workers": options["workers"], "no_defer": True}),
+        )
+        baseline_ms = None
+        for label, kwargs in scenarios:
+            output = StringIO()
+            started = perf_counter()
+            call_command("bootstrap_runtime", stdout=output, **kwargs)
+            elapsed_ms = (perf_counter() - started) * 1000
+            baseline_ms = baseline_ms or elapsed_ms
+            lines = output.getvalue().splitlines()
+            ran = sum(1 for line in lines if line.startswith("[bootstrap] done:"))
+            skipped = sum(1 for line in lines if line.startswith("[bootstrap] skip (unchanged):"))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[bench] {label:<16} wall={elapsed_ms:.0f}ms ran={ran} skipped={skipped} "
+                    f"speedup={baseline_ms / elapsed_ms:.1f}x"
+                )
+            )
@@ -0,0 +1,79 @@
+from statistics import median
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.home_surface_cache import bump_home_catalog_version, bump_home_user_overlay_version
+from core.models import UserProfile
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Measure home() query count and latency for cold vs warm home surface cache (guest and authenticated)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def handle(self, *args, **options):
+        repeat = max(1, options["repeat"])
+        try:
+            with transaction.atomic():
+                user = get_user_model().objects.create_user(
+                    username="home-surface-bench",
+                    email="home-surface-bench@example.com",
+                    password="bench-password-123",
+                )
+                UserProfile.objects.update_or_create(
+                    user=user,
+                    defaults={"nickname": "벤치마크교사", "role": "school"},
+                )
+                guest_client = Client()
+                auth_client = Client()
+                auth_client.force_login(user)
+
+                with override_settings(HOME_SURFACE_CACHE_ENABLED=True):
+                    for label, client in (("guest", guest_client), ("authenticated", auth_client)):
+                        cold = self._measure(client, repeat=repeat, user=user, invalidate=True)
+                        warm = self._measure(client, repeat=repeat, user=user, invalidate=False)
+                        self._report(label, cold, warm)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _measure(self, client, *, repeat, user, invalidate):
+        # Prime once so session/profile side effects do not skew the warm numbers.
+        client.get("/")
+        latencies = []
+        query_counts = []
+        for _ in range(repeat):
+            if invalidate:
+                bump_home_catalog_version()
+                bump_home_user_overlay_version(user.pk)
+            with CaptureQueriesContext(connection) as ctx:
+                started = perf_counter()
+                response = client.get("/")
+                latencies.append((perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f"[bench] unexpected status {response.status_code}"))
+            query_counts.append(len(ctx))
+        return {
+            "p50_ms": median(latencies),
+            "max_ms": max(latencies),
+            "queries": median(query_counts),
+        }
+
+    def _report(self, label, cold, warm):
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[bench] {label:<13} cold p50={cold['p50_ms']:.1f}ms queries={cold['queries']:.0f} | "
+                f"warm p50={warm['p50_ms']:.1f}ms queries={warm['queries']:.0f} | "
+                f"saved {cold['queries'] - warm['queries']:.0f} queries/request"
+            )
+        )
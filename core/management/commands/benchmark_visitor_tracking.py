@@ -0,0 +1,106 @@
+from time import perf_counter
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.middleware import VisitorTrackingMiddleware
+from core.visitor_ingest import flush_visit_buffer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compare requests/sec through VisitorTrackingMiddleware with tracking off, inline and buffered."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--visitors", type=int, default=200)
+        parser.add_argument("--paths", type=int, default=10)
+
+    def handle(self, *args, **options):
+        total = max(1, options["requests"])
+        visitors = max(1, options["visitors"])
+        paths = [f"/bench/{index}/" for index in range(max(1, options["paths"]))]
+
+        modes = [
+            ("off", {"VISITOR_TRACKING_ENABLED": False}),
+            ("inline", {"VISITOR_TRACKING_ENABLED": True, "VISITOR_TRACKING_BUFFERED": False}),
+            (
+                "buffered",
+                {
+                    "VISITOR_TRACKING_ENABLED": True,
+                    "VISITOR_TRACKING_BUFFERED": True,
+                    "VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS": 3600,
+                    "VISITOR_TRACKING_FLUSH_BATCH_SIZE": total * 4,
+                },
+            ),
+        ]
+
+        self.stdout.write(f"[bench] requests={total} visitors={visitors} paths={len(paths)}")
+        for label, overrides in modes:
+            with override_settings(**overrides):
+                result = self._run_mode(total=total, visitors=visitors, paths=paths)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[bench] {label:<8} {result['rps']:>9.1f} req/s | "
+                    f"request queries={result['request_queries']} | "
+                    f"flush {result['flush_ms']} ms / {result['flush_queries']} queries"
+                )
+            )
+
+    def _build_requests(self, *, total, visitors, paths):
+        factory = RequestFactory()
+        sessions = []
+        for _ in range(visitors):
+            request = factory.get("/")
+            SessionMiddleware(lambda req: None).process_request(request)
+            sessions.append(request.session)
+
+        requests = []
+        for index in range(total):
+            request = factory.get(
+                paths[index % len(paths)],
+                REMOTE_ADDR="203.0.113.10",
+                HTTP_USER_AGENT="Mozilla/5.0 (bench)",
+            )
+            request.user = AnonymousUser()
+            request.session = sessions[index % visitors]
+            requests.append(request)
+        return requests
+
+    def _run_mode(self, *, total, visitors, paths):
+        middleware = VisitorTrackingMiddleware(
+            lambda request: HttpResponse("<html><body>ok</body></html>", content_type="text/html")
+        )
+        requests = self._build_requests(total=total, visitors=visitors, paths=paths)
+        result = {}
+        try:
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as request_ctx:
+                    started = perf_counter()
+                    for request in requests:
+                        middleware(request)
+                    elapsed = perf_counter() - started
+
+                with CaptureQueriesContext(connection) as flush_ctx:
+                    flush_started = perf_counter()
+                    flush_visit_buffer()
+                    flush_elapsed = perf_counter() - flush_started
+
+                result = {
+                    "rps": total / elapsed if elapsed else float("inf"),
+                    "request_queries": len(request_ctx),
+                    "flush_ms": int(flush_elapsed * 1000),
+                    "flush_queries": len(flush_ctx),
+                }
+                raise _Rollback
+        except _Rollback:
+            pass
+        return result
@@ -1,77 +1,234 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import timedelta
 from time import perf_counter
 
+from django.apps import apps
 from django.conf import settings
 from django.core.management import call_command, get_commands
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from core.bootstrap import STEP_RAN, STEP_SKIPPED, BootstrapEngine, BootstrapStep, FingerprintStore
+from core.home_surface_cache import bump_home_catalog_version
+
+DEFERRED_PORT_WAIT_SECONDS = 180
+
+# ensure_* commands that only seed their own product rows; they have no ordering between them.
+SEED_COMMANDS = (
+    "ensure_ssambti",
+    "ensure_studentmbti",
+    "ensure_notebooklm",
+    "ensure_collect",
+    "ensure_handoff",
+    "ensure_qrgen",
+    "ensure_hwpxchat",
+    "ensure_consent",
+    "ensure_docsign",
+    "ensure_reservations",
+    "ensure_janggi",
+    "ensure_fairy_games",
+    "ensure_reflex_game",
+    "ensure_colorbeat",
+    "ensure_math_games",
+    "ensure_mancala",
+    "ensure_ppobgi",
+    "ensure_happy_seed",
+    "ensure_seed_quiz",
+    "ensure_noticegen",
+    "ensure_bamboo",
+    "ensure_timetable",
+    "ensure_classcalendar",
+    "ensure_schoolprograms",
+    "ensure_quickdrop",
+    "ensure_ocrdesk",
+    "ensure_parentcomm",
+    "ensure_insights",
+    "ensure_docviewer",
+    "ensure_pdfhub",
+    "ensure_slidesmith",
+    "ensure_blockclass",
+    "ensure_textbooks",
+    "ensure_textbook_ai",
+    "ensure_edu_materials",
+    "ensure_edu_materials_next",
+    "ensure_tts_announce",
+    "ensure_infoboard",
+    "ensure_teacher_law",
+)
+
+# Apps whose Chroma RAG helpers read the shared embedding model.
+RAG_APPS = ("school_violence", "padlet_bot")
+
+
+def _command_step(name, *, after=(), fingerprint_paths=(), cacheable=True):
+    return BootstrapStep(
+        name=name,
+        run=lambda: call_command(name),
+        after=tuple(after),
+        command=name,
+        fingerprint_paths=tuple(fingerprint_paths),
+        cacheable=cacheable,
+    )
+
 
 class Command(BaseCommand):
-    help = "Run runtime bootstrap tasks once before app server starts."
+    help = (
+        "Run runtime bootstrap tasks before the app server starts: unchanged ensure_* steps are skipped, "
+        "independent steps run in parallel and slow warmups run once the server accepts connections."
+    )
 
-    def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS("[bootstrap] start"))
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=None, help="Parallel steps (default BOOTSTRAP_RUNTIME_WORKERS).")
+        parser.add_argument("--force", action="store_true", help="Run every step even when its fingerprint is unchanged.")
+        parser.add_argument("--migrate", action="store_true", help="Run migrate first (the start command normally already did).")
+        parser.add_argument("--no-defer", action="store_true", help="Run warmups inline instead of after the server starts.")
+        parser.add_argument("--deferred-only", action="store_true", help="Only run the deferred warmups.")
+        parser.add_argument("--wait-for-port", type=int, default=None, help="With --deferred-only, wait until this port accepts connections.")
 
+    def build_steps(self):
         steps = [
-            ("migrate", lambda: call_command("migrate", "--noinput")),
-            ("check_consent_schema", lambda: call_command("check_consent_schema")),
-            ("check_collect_schema", lambda: call_command("check_collect_schema")),
-            ("createcachetable_if_needed", self._create_cache_table_if_needed),
-            ("ensure_ssambti", lambda: call_command("ensure_ssambti")),
-            ("ensure_studentmbti", lambda: call_command("ensure_studentmbti")),
-            ("ensure_notebooklm", lambda: call_command("ensure_notebooklm")),
-            ("ensure_collect", lambda: call_command("ensure_collect")),
-            ("ensure_handoff", lambda: call_command("ensure_handoff")),
-            ("ensure_qrgen", lambda: call_command("ensure_qrgen")),
-            ("ensure_hwpxchat", lambda: call_command("ensure_hwpxchat")),
-            ("ensure_doccollab", lambda: call_command("ensure_doccollab")),
-            ("ensure_consent", lambda: call_command("ensure_consent")),
-            ("ensure_docsign", lambda: call_command("ensure_docsign")),
-            ("ensure_reservations", lambda: call_command("ensure_reservations")),
-            ("ensure_version_manager", lambda: call_command("ensure_version_manager")),
-            ("ensure_janggi", lambda: call_command("ensure_janggi")),
-            ("ensure_fairy_games", lambda: call_command("ensure_fairy_games")),
-            ("ensure_reflex_game", lambda: call_command("ensure_reflex_game")),
-            ("ensure_colorbeat", lambda: call_command("ensure_colorbeat")),
-            ("ensure_math_games", lambda: call_command("ensure_math_games")),
-            ("ensure_mancala", lambda: call_command("ensure_mancala")),
-            ("ensure_ppobgi", lambda: call_command("ensure_ppobgi")),
-            ("ensure_happy_seed", lambda: call_command("ensure_happy_seed")),
-            ("ensure_seed_quiz", lambda: call_command("ensure_seed_quiz")),
-            ("seed_quiz_bank", lambda: call_command("seed_quiz_bank")),
-            ("ensure_noticegen", lambda: call_command("ensure_noticegen")),
-            ("ensure_bamboo", lambda: call_command("ensure_bamboo")),
-            ("ensure_timetable", lambda: call_command("ensure_timetable")),
-            ("ensure_classcalendar", lambda: call_command("ensure_classcalendar")),
-            ("ensure_schoolcomm", lambda: call_command("ensure_schoolcomm")),
-            ("ensure_schoolprograms", lambda: call_command("ensure_schoolprograms")),
-            ("ensure_quickdrop", lambda: call_command("ensure_quickdrop")),
-            ("ensure_ocrdesk", lambda: call_command("ensure_ocrdesk")),
-            ("warm_ocrdesk", lambda: self._run_optional_command("warm_ocrdesk")),
-            ("ensure_parentcomm", lambda: call_command("ensure_parentcomm")),
-            ("ensure_insights", lambda: call_command("ensure_insights")),
-            ("ensure_docviewer", lambda: call_command("ensure_docviewer")),
-            ("ensure_pdfhub", lambda: call_command("ensure_pdfhub")),
-            ("ensure_slidesmith", lambda: call_command("ensure_slidesmith")),
-            ("ensure_blockclass", lambda: call_command("ensure_blockclass")),
-            ("ensure_textbooks", lambda: call_command("ensure_textbooks")),
-            ("ensure_textbook_ai", lambda: call_command("ensure_textbook_ai")),
-            ("ensure_edu_materials", lambda: call_command("ensure_edu_materials")),
-            ("ensure_edu_materials_next", lambda: call_command("ensure_edu_materials_next")),
-            ("ensure_tts_announce", lambda: call_command("ensure_tts_announce")),
-            ("ensure_infoboard", lambda: call_command("ensure_infoboard")),
-            ("ensure_teacher_law", lambda: call_command("ensure_teacher_law")),
+            BootstrapStep("check_consent_schema", lambda: call_command("check_consent_schema"), cacheable=False),
+            BootstrapStep("check_collect_schema", lambda: call_command("check_collect_schema"), cacheable=False),
+            BootstrapStep("createcachetable_if_needed", self._create_cache_table_if_needed, cacheable=False),
         ]
+        steps.extend(_command_step(name) for name in SEED_COMMANDS)
+        seed_quiz_data = settings.BASE_DIR / "seed_quiz" / "data"
+        steps.extend(
+            [
+                # Both move version_manager documents between groups, so keep the original order.
+                _command_step("ensure_doccollab"),
+                _command_step("ensure_version_manager", after=("ensure_doccollab",)),
+                _command_step("seed_quiz_bank", after=("ensure_seed_quiz",), fingerprint_paths=(seed_quiz_data,)),
+                # These reconcile data that changes at runtime, so they always run.
+                _command_step(
+                    "backfill_calendar_hub_index",
+                    after=("ensure_classcalendar", "ensure_collect", "ensure_consent", "ensure_reservations"),
+                    cacheable=False,
+                ),
+                _command_step("ensure_schoolcomm", cacheable=False),
+                BootstrapStep(
+                    "warm_ocrdesk",
+                    lambda: self._run_optional_command("warm_ocrdesk"),
+                    after=("ensure_ocrdesk",),
+                    cacheable=False,
+                    deferred=True,
+                ),
+            ]
+        )
+        if any(apps.is_installed(app_name) for app_name in RAG_APPS):
+            # Cheap when the model is already on disk; otherwise fetched after the server is up.
+            steps.append(
+                BootstrapStep("ensure_embedding_model", self._ensure_embedding_model, cacheable=False, deferred=True)
+            )
+        return steps
+
+    def handle(self, *args, **options):
+        started = perf_counter()
+        steps = self.build_steps()
+        deferred = [step for step in steps if step.deferred]
+        if options.get("deferred_only"):
+            self._wait_for_port(options.get("wait_for_port"))
+            self._run_deferred(deferred)
+            return
+
+        self.stdout.write(self.style.SUCCESS("[bootstrap] start"))
+        if options.get("migrate"):
+            call_command("migrate", "--noinput")
 
-        for name, fn in steps:
-            started = perf_counter()
-            self.stdout.write(f"[bootstrap] running: {name}")
-            fn()
-            elapsed_ms = int((perf_counter() - started) * 1000)
-            self.stdout.write(self.style.SUCCESS(f"[bootstrap] done: {name} ({elapsed_ms} ms)"))
+        # Without $PORT there is no server to wait for, so warmups stay in the main run.
+        defer_warmups = bool(deferred) and not options.get("no_defer") and self._deferred_port() is not None
+        if defer_warmups:
+            steps = [step for step in steps if not step.deferred]
 
+        workers = options.get("workers") or self._default_workers()
+        engine = BootstrapEngine(
+            steps,
+            workers=workers,
+            store=self._fingerprint_store(),
+            force=options.get("force", False),
+            max_skip_age=timedelta(seconds=getattr(settings, "BOOTSTRAP_RUNTIME_MAX_SKIP_AGE_SECONDS", 7 * 24 * 60 * 60)),
+            log=self.stdout.write,
+        )
+        outcomes = engine.run()
+
+        # ensure_* commands may touch products through queryset updates that skip
+        # signals, so drop any home catalog snapshot built before this deploy.
+        bump_home_catalog_version()
+
+        if defer_warmups:
+            self._launch_deferred_runner()
+        self._write_report(outcomes, workers=workers, wall_ms=int((perf_counter() - started) * 1000))
         self.stdout.write(self.style.SUCCESS("[bootstrap] complete"))
 
+    def _write_report(self, outcomes, *, workers, wall_ms):
+        ran = [outcome for outcome in outcomes if outcome.status == STEP_RAN]
+        skipped = [outcome for outcome in outcomes if outcome.status == STEP_SKIPPED]
+        step_ms = sum(outcome.elapsed_ms for outcome in ran)
+        self.stdout.write(
+            f"[bootstrap] report wall={wall_ms}ms step_sum={step_ms}ms workers={workers} "
+            f"ran={len(ran)} skipped={len(skipped)}"
+        )
+        for outcome in sorted(ran, key=lambda outcome: outcome.elapsed_ms, reverse=True)[:5]:
+            self.stdout.write(f"[bootstrap] slowest: {outcome.name} ({outcome.elapsed_ms} ms)")
+
+    def _run_deferred(self, deferred):
+        for step in deferred:
+            step_started = perf_counter()
+            self.stdout.write(f"[bootstrap] running deferred: {step.name}")
+            try:
+                step.run()
+            except Exception as exc:
+                self.stderr.write(self.style.WARNING(f"[bootstrap] deferred step failed: {step.name}: {exc}"))
+                continue
+            elapsed_ms = int((perf_counter() - step_started) * 1000)
+            self.stdout.write(self.style.SUCCESS(f"[bootstrap] done deferred: {step.name} ({elapsed_ms} ms)"))
+
+    @staticmethod
+    def _deferred_port():
+        raw_port = str(os.environ.get("PORT") or "").strip()
+        return int(raw_port) if raw_port.isdigit() else None
+
+    def _launch_deferred_runner(self):
+        """Warm up in a detached process that starts once the server listens on $PORT."""
+        port = self._deferred_port()
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(settings.BASE_DIR / "manage.py"),
+                "bootstrap_runtime",
+                "--deferred-only",
+                "--wait-for-port",
+                str(port),
+            ],
+            start_new_session=True,
+        )
+        self.stdout.write(f"[bootstrap] deferred warmups will run once port {port} accepts connections")
+
+    def _wait_for_port(self, port):
+        if not port:
+            return
+        deadline = time.monotonic() + DEFERRED_PORT_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(1)
+        self.stdout.write(f"[bootstrap] port {port} not accepting connections; running deferred warmups anyway")
+
+    def _default_workers(self):
+        # SQLite allows one writer at a time, so parallel seeding only helps on a server database.
+        if connection.vendor == "sqlite":
+            return 1
+        return max(1, int(getattr(settings, "BOOTSTRAP_RUNTIME_WORKERS", 4)))
+
+    def _fingerprint_store(self):
+        return FingerprintStore()
+
     def _create_cache_table_if_needed(self):
         cache_table = "django_cache_table"
         table_names = connection.introspection.table_names()
@@ -80,6 +237,16 @@ class Command(BaseCommand):
             return
         call_command("createcachetable")
 
+    def _ensure_embedding_model(self):
+        if getattr(settings, "RAG_EMBEDDING_BACKEND", "onnx") != "onnx":
+            self.stdout.write("[bootstrap] skip ensure_embedding_model: RAG_EMBEDDING_BACKEND is not onnx")
+            return
+        try:
+            call_command("ensure_embedding_model")
+        except Exception as exc:
+            # RAG falls back to Chroma's own download, so a missing model must not block boot.
+            self.stderr.write(self.style.WARNING(f"[bootstrap] ensure_embedding_model failed: {exc}"))
+
     def _run_optional_command(self, command_name, *args):
         if not self._command_exists(command_name):
             self.stdout.write(f"[bootstrap] skip {command_name}: command not available")
@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from core import korean_calendar
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate core/data/korean_holidays.json, the static holiday table "
+        f"({korean_calendar.MIN_YEAR}-{korean_calendar.MAX_YEAR}) read by core.korean_calendar."
+    )
+
+    def handle(self, *args, **options):
+        table = {
+            str(year): korean_calendar.compute_holiday_markers(year)
+            for year in range(korean_calendar.MIN_YEAR, korean_calendar.MAX_YEAR + 1)
+        }
+        path = korean_calendar.HOLIDAY_TABLE_PATH
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(table, ensure_ascii=False, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(path)
+        korean_calendar._holiday_table.cache_clear()
+        korean_calendar._cached_holiday_markers.cache_clear()
+        marker_count = sum(len(markers) for markers in table.values())
+        self.stdout.write(self.style.SUCCESS(f"Wrote {marker_count} holiday markers for {len(table)} years to {path}"))
@@ -0,0 +1,46 @@
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.embeddings import ONNX_MODEL_FILES, onnx_model_present
+
+
+class Command(BaseCommand):
+    help = "RAG 임베딩용 ONNX 모델(all-MiniLM-L6-v2)을 RAG_EMBEDDING_MODEL_DIR에 준비합니다. 빌드 단계에서 실행하세요."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            default="",
+            help="모델 파일이 들어 있는 onnx 디렉터리. 지정하면 내려받지 않고 복사합니다.",
+        )
+
+    def handle(self, *args, **options):
+        model_dir = Path(getattr(settings, "RAG_EMBEDDING_MODEL_DIR", "") or "")
+        if not str(model_dir):
+            raise CommandError("RAG_EMBEDDING_MODEL_DIR 설정이 비어 있습니다.")
+        if onnx_model_present(model_dir):
+            self.stdout.write(self.style.SUCCESS(f"임베딩 모델이 이미 준비되어 있습니다: {model_dir}"))
+            return
+
+        source = options["source"]
+        if source:
+            target = model_dir / "onnx"
+            target.mkdir(parents=True, exist_ok=True)
+            for name in ONNX_MODEL_FILES:
+                path = Path(source) / name
+                if not path.exists():
+                    raise CommandError(f"모델 파일이 없습니다: {path}")
+                shutil.copy2(path, target / name)
+        else:
+            from chromadb.utils import embedding_functions
+
+            embedding_functions.ONNXMiniLM_L6_V2.DOWNLOAD_PATH = model_dir
+            # 첫 호출에서 모델을 내려받아 압축을 풉니다.
+            embedding_functions.ONNXMiniLM_L6_V2()(["warmup"])
+
+        if not onnx_model_present(model_dir):
+            raise CommandError(f"임베딩 모델 준비에 실패했습니다: {model_dir}")
+        self.stdout.write(self.style.SUCCESS(f"임베딩 모델 준비 완료: {model_dir}"))
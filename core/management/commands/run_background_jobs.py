@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.background_jobs import BackgroundJobRunner
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (PDF exports and the like) in a worker process pool. "
+        "Use this as a separate process with BACKGROUND_JOBS_EMBEDDED_RUNNER=False."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=None)
+        parser.add_argument("--poll-seconds", type=float, default=None)
+        parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty.")
+
+    def handle(self, *args, **options):
+        runner = BackgroundJobRunner(workers=options["workers"], poll_seconds=options["poll_seconds"])
+        self.stdout.write(f"[background_jobs] runner {runner.worker_id} workers={runner.workers}")
+        try:
+            runner.run(drain=options["drain"])
+        except KeyboardInterrupt:
+            runner.stop()
+        self.stdout.write(self.style.SUCCESS("[background_jobs] runner stopped"))
@@ -14,7 +14,7 @@ from django.utils.html import strip_tags
 from django.utils import timezone
 
 from .logging_filters import clear_current_request_id, set_current_request_id
-from .models import PageViewLog, SiteConfig, VisitorLog
+from .models import SiteConfig, VisitorLog
 from .openclo_login import OPENCLO_LOGIN_URL
 from .policy_consent import (
     get_pending_policy_consent_redirect,
@@ -22,6 +22,7 @@ from .policy_consent import (
     get_social_signup_consent_redirect_url,
 )
 from .seo import DEFAULT_HOME_DESCRIPTION, DEFAULT_HOME_TITLE, DEFAULT_HOME_TITLE_KO
+from .visitor_ingest import RECORD_KIND_PAGE_VIEW, RECORD_KIND_VISIT, VisitRecord, enqueue_visit_record
 
 logger = logging.getLogger(__name__)
 
@@ -326,63 +327,6 @@ def build_page_view_session_key(today, visitor_key, path):
     return f"page_view_recorded_{today.isoformat()}_{digest}"
 
 
-def migrate_today_session_log_to_user(*, today, session_visitor_key, user_visitor_key, user, ip, user_agent):
-    if not session_visitor_key or session_visitor_key == user_visitor_key:
-        return
-
-    session_log = (
-        VisitorLog.objects
-        .filter(visit_date=today, visitor_key=session_visitor_key, is_bot=False)
-        .first()
-    )
-    if not session_log:
-        return
-
-    existing_user_log = (
-        VisitorLog.objects
-        .filter(visit_date=today, visitor_key=user_visitor_key)
-        .first()
-    )
-    if existing_user_log:
-        session_log.delete()
-        return existing_user_log
-
-    session_log.visitor_key = user_visitor_key
-    session_log.identity_type = VisitorLog.IDENTITY_USER
-    session_log.user = user
-    session_log.ip_address = ip
-    session_log.user_agent = user_agent
-    session_log.save(update_fields=["visitor_key", "identity_type", "user", "ip_address", "user_agent"])
-    return session_log
-
-
-def migrate_today_page_view_to_user(*, today, path, session_visitor_key, user_visitor_key, user):
-    if not session_visitor_key or session_visitor_key == user_visitor_key:
-        return
-
-    session_log = (
-        PageViewLog.objects
-        .filter(view_date=today, path=path, visitor_key=session_visitor_key, is_bot=False)
-        .first()
-    )
-    if not session_log:
-        return
-
-    existing_user_log = (
-        PageViewLog.objects
-        .filter(view_date=today, path=path, visitor_key=user_visitor_key)
-        .first()
-    )
-    if existing_user_log:
-        session_log.delete()
-        return existing_user_log
-
-    session_log.visitor_key = user_visitor_key
-    session_log.identity_type = VisitorLog.IDENTITY_USER
-    session_log.user = user
-    session_log.save(update_fields=["visitor_key", "identity_type", "user"])
-    return session_log
-
 class VisitorTrackingMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -416,39 +360,21 @@ class VisitorTrackingMiddleware:
 
             if not already_recorded:
                 try:
-                    if identity["identity_type"] == VisitorLog.IDENTITY_USER:
-                        migrate_today_session_log_to_user(
-                            today=today,
+                    enqueue_visit_record(
+                        VisitRecord(
+                            kind=RECORD_KIND_VISIT,
+                            date=today,
+                            visitor_key=identity["visitor_key"],
+                            identity_type=identity["identity_type"],
+                            user_id=getattr(identity["user"], "pk", None),
                             session_visitor_key=identity["session_visitor_key"],
-                            user_visitor_key=identity["visitor_key"],
-                            user=identity["user"],
-                            ip=ip,
+                            is_bot=is_bot,
+                            ip_address=ip,
                             user_agent=user_agent,
                         )
-
-                    obj, created = VisitorLog.objects.update_or_create(
-                        visit_date=today,
-                        visitor_key=identity["visitor_key"],
-                        defaults={
-                            'ip_address': ip,
-                            'user': identity["user"],
-                            'visitor_key': identity["visitor_key"],
-                            'identity_type': identity["identity_type"],
-                            'user_agent': user_agent,
-                            'is_bot': is_bot,
-                        }
                     )
                     if session is not None:
                         session[session_key] = True
-                    logger.info(
-                        "[VISITOR] DB operation - Created: %s | VisitorKey: %s | Identity: %s | IP: %s | Bot: %s | Date: %s",
-                        created,
-                        identity["visitor_key"],
-                        identity["identity_type"],
-                        ip,
-                        is_bot,
-                        today,
-                    )
                 except Exception as e:
                     logger.error(f"[VISITOR] Error: {e}", exc_info=True)
 
@@ -466,15 +392,6 @@ class VisitorTrackingMiddleware:
             page_already_recorded = bool(session and session.get(page_view_session_key, False))
             if not page_already_recorded:
                 try:
-                    if identity["identity_type"] == VisitorLog.IDENTITY_USER:
-                        migrate_today_page_view_to_user(
-                            today=today,
-                            path=request.path,
-                            session_visitor_key=identity["session_visitor_key"],
-                            user_visitor_key=identity["visitor_key"],
-                            user=identity["user"],
-                        )
-
                     resolver_match = getattr(request, "resolver_match", None)
                     route_name = ""
                     if resolver_match is not None:
@@ -483,16 +400,18 @@ class VisitorTrackingMiddleware:
                             or getattr(resolver_match, "url_name", "")
                             or ""
                         ).strip()[:120]
-                    PageViewLog.objects.update_or_create(
-                        view_date=today,
-                        visitor_key=identity["visitor_key"],
-                        path=request.path,
-                        defaults={
-                            "user": identity["user"],
-                            "identity_type": identity["identity_type"],
-                            "is_bot": bool(identity["identity_type"] == VisitorLog.IDENTITY_BOT),
-                            "route_name": route_name,
-                        },
+                    enqueue_visit_record(
+                        VisitRecord(
+                            kind=RECORD_KIND_PAGE_VIEW,
+                            date=today,
+                            visitor_key=identity["visitor_key"],
+                            identity_type=identity["identity_type"],
+                            user_id=getattr(identity["user"], "pk", None),
+                            session_visitor_key=identity["session_visitor_key"],
+                            is_bot=bool(identity["identity_type"] == VisitorLog.IDENTITY_BOT),
+                            path=request.path,
+                            route_name=route_name,
+                        )
                     )
                     if session is not None:
                         session[page_view_session_key] = True
@@ -0,0 +1,53 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0040_homeagentquotaboost_homeagentquotastate_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(max_length=120, verbose_name='작업 함수')),
+                ('dedupe_key', models.CharField(blank=True, default='', max_length=200, verbose_name='중복 방지 키')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=20, verbose_name='상태')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='입력값')),
+                ('progress', models.PositiveSmallIntegerField(default=0, verbose_name='진행률')),
+                ('progress_message', models.CharField(blank=True, default='', max_length=200, verbose_name='진행 메시지')),
+                ('result', models.JSONField(blank=True, default=dict, verbose_name='결과')),
+                ('artifact', models.FileField(blank=True, upload_to='background_jobs/%Y/%m/', verbose_name='결과 파일')),
+                ('error_type', models.CharField(blank=True, default='', max_length=80, verbose_name='오류 종류')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='오류 내용')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='실행 횟수')),
+                ('worker_id', models.CharField(blank=True, default='', max_length=80, verbose_name='실행 워커')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록 시각')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작 시각')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='최근 확인 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시각')),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='background_jobs', to=settings.AUTH_USER_MODEL, verbose_name='요청자')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [
+                    models.Index(fields=['status', 'created_at'], name='core_backgr_status_e66a68_idx'),
+                    models.Index(fields=['owner', '-created_at'], name='core_backgr_owner_i_b5ae8e_idx'),
+                ],
+                'constraints': [
+                    models.UniqueConstraint(
+                        condition=models.Q(('status__in', ['queued', 'running']), models.Q(('dedupe_key', ''), _negated=True)),
+                        fields=('dedupe_key',),
+                        name='core_unique_active_background_job',
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0041_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BootstrapStepRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('step_name', models.CharField(max_length=80, unique=True, verbose_name='단계')),
+                ('fingerprint', models.CharField(max_length=64, verbose_name='지문')),
+                ('elapsed_ms', models.PositiveIntegerField(default=0, verbose_name='소요 시간(ms)')),
+                ('completed_at', models.DateTimeField(verbose_name='완료 시각')),
+            ],
+            options={
+                'verbose_name': '부트스트랩 단계 기록',
+                'verbose_name_plural': '부트스트랩 단계 기록',
+                'ordering': ['step_name'],
+            },
+        ),
+    ]
@@ -944,3 +944,80 @@ class PageViewLog(models.Model):
 
     def __str__(self):
         return f"{self.view_date} - {self.path} ({self.identity_type}:{self.visitor_key})"
+
+
+class BackgroundJob(models.Model):
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "대기"),
+        (STATUS_RUNNING, "실행 중"),
+        (STATUS_DONE, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+    job_type = models.CharField(max_length=120, verbose_name="작업 함수")
+    dedupe_key = models.CharField(max_length=200, blank=True, default="", verbose_name="중복 방지 키")
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="background_jobs",
+        verbose_name="요청자",
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED, verbose_name="상태")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="입력값")
+    progress = models.PositiveSmallIntegerField(default=0, verbose_name="진행률")
+    progress_message = models.CharField(max_length=200, blank=True, default="", verbose_name="진행 메시지")
+    result = models.JSONField(default=dict, blank=True, verbose_name="결과")
+    artifact = models.FileField(upload_to="background_jobs/%Y/%m/", blank=True, verbose_name="결과 파일")
+    error_type = models.CharField(max_length=80, blank=True, default="", verbose_name="오류 종류")
+    error_message = models.TextField(blank=True, default="", verbose_name="오류 내용")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="실행 횟수")
+    worker_id = models.CharField(max_length=80, blank=True, default="", verbose_name="실행 워커")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="등록 시각")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="시작 시각")
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name="최근 확인 시각")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료 시각")
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=models.Q(status__in=["queued", "running"]) & ~models.Q(dedupe_key=""),
+                name="core_unique_active_background_job",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["owner", "-created_at"]),
+        ]
+        verbose_name = "백그라운드 작업"
+        verbose_name_plural = "백그라운드 작업"
+
+    def __str__(self):
+        return f"{self.job_type} #{self.pk} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
+
+
+class BootstrapStepRecord(models.Model):
+    step_name = models.CharField(max_length=80, unique=True, verbose_name="단계")
+    fingerprint = models.CharField(max_length=64, verbose_name="지문")
+    elapsed_ms = models.PositiveIntegerField(default=0, verbose_name="소요 시간(ms)")
+    completed_at = models.DateTimeField(verbose_name="완료 시각")
+
+    class Meta:
+        ordering = ["step_name"]
+        verbose_name = "부트스트랩 단계 기록"
+        verbose_name_plural = "부트스트랩 단계 기록"
+
+    def __str__(self):
+        return f"{self.step_name} ({self.fingerprint[:12]})"
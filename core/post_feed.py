@@ -0,0 +1,192 @@
+"""
+Keyset (cursor) pagination for the SNS post feed.
+
+The feed is two ordered segments: posts inside an active feature window
+(newest ``featured_from`` first) followed by everything else (newest
+``created_at`` first). Each page is fetched with a ``WHERE (key) < cursor``
+predicate plus ``LIMIT page_size + 1``, so it never issues ``COUNT(*)`` and a
+deep page costs the same as the first one.
+"""
+
+import base64
+import json
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+POST_FEED_CURSOR_PARAM = "cursor"
+SEGMENT_FEATURED = "f"
+SEGMENT_REGULAR = "r"
+POST_FEED_CACHE_PREFIX = "post_feed"
+DEFAULT_POST_FEED_CACHE_TTL_SECONDS = 30
+
+
+class PostFeedPage(Sequence):
+    """Page-like container that templates can iterate just like ``Paginator`` pages."""
+
+    def __init__(self, object_list, *, next_cursor=""):
+        self.object_list = list(object_list)
+        self.next_cursor = next_cursor or ""
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __repr__(self):
+        return f"<PostFeedPage size={len(self.object_list)} has_next={self.has_next()}>"
+
+    def has_next(self):
+        return bool(self.next_cursor)
+
+
+def encode_post_feed_cursor(segment, post=None):
+    payload = [segment]
+    if post is not None:
+        featured_from = getattr(post, "featured_from", None)
+        payload.extend(
+            [
+                post.created_at.isoformat(),
+                featured_from.isoformat() if featured_from else "",
+                post.pk,
+            ]
+        )
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_post_feed_cursor(raw_cursor):
+    """Return ``(segment, key)`` or ``None`` for an empty or malformed cursor."""
+    raw_cursor = str(raw_cursor or "").strip()
+    if not raw_cursor:
+        return None
+    try:
+        padded = raw_cursor + "=" * (-len(raw_cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        segment = payload[0]
+        if segment not in {SEGMENT_FEATURED, SEGMENT_REGULAR}:
+            return None
+        if len(payload) == 1:
+            return segment, None
+        created_at = datetime.fromisoformat(payload[1])
+        featured_from = datetime.fromisoformat(payload[2]) if payload[2] else None
+        post_id = int(payload[3])
+    except (ValueError, TypeError, IndexError, KeyError, json.JSONDecodeError):
+        return None
+    if segment == SEGMENT_FEATURED and featured_from is None:
+        return None
+    return segment, {"created_at": created_at, "featured_from": featured_from, "id": post_id}
+
+
+def _featured_after(key):
+    return (
+        Q(featured_from__lt=key["featured_from"])
+        | Q(featured_from=key["featured_from"], created_at__lt=key["created_at"])
+        | Q(featured_from=key["featured_from"], created_at=key["created_at"], id__lt=key["id"])
+    )
+
+
+def _regular_after(key):
+    return Q(created_at__lt=key["created_at"]) | Q(created_at=key["created_at"], id__lt=key["id"])
+
+
+def paginate_post_feed(queryset, *, cursor=None, page_size):
+    """
+    Fetch one feed page from ``queryset``, which must carry the
+    ``active_feature_order`` annotation built by the feed base queryset.
+    """
+    decoded = decode_post_feed_cursor(cursor) or (SEGMENT_FEATURED, None)
+    segment, key = decoded
+    rows = []
+
+    if segment == SEGMENT_FEATURED:
+        featured_qs = queryset.filter(active_feature_order=1)
+        if key is not None:
+            featured_qs = featured_qs.filter(_featured_after(key))
+        rows = list(featured_qs.order_by("-featured_from", "-created_at", "-id")[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            return PostFeedPage(rows, next_cursor=encode_post_feed_cursor(SEGMENT_FEATURED, rows[-1]))
+        key = None
+
+    remaining = page_size - len(rows)
+    regular_qs = queryset.filter(active_feature_order=0)
+    if key is not None:
+        regular_qs = regular_qs.filter(_regular_after(key))
+    regular_rows = list(regular_qs.order_by("-created_at", "-id")[: remaining + 1])
+    has_more = len(regular_rows) > remaining
+    regular_rows = regular_rows[:remaining]
+    rows.extend(regular_rows)
+
+    next_cursor = ""
+    if has_more:
+        next_cursor = encode_post_feed_cursor(SEGMENT_REGULAR, regular_rows[-1] if regular_rows else None)
+    return PostFeedPage(rows, next_cursor=next_cursor)
+
+
+def is_post_feed_cache_enabled():
+    return bool(getattr(settings, "POST_FEED_CACHE_ENABLED", True))
+
+
+def _post_feed_version_key():
+    return f"{POST_FEED_CACHE_PREFIX}:version"
+
+
+def get_post_feed_cache_version():
+    try:
+        version = cache.get(_post_feed_version_key())
+        if version is None:
+            cache.add(_post_feed_version_key(), 1, timeout=None)
+            version = cache.get(_post_feed_version_key())
+    except Exception:
+        logger.exception("[post feed] cache version read failed")
+        return None
+    return int(version or 1)
+
+
+def bump_post_feed_cache_version():
+    try:
+        return cache.incr(_post_feed_version_key())
+    except ValueError:
+        cache.set(_post_feed_version_key(), 2, timeout=None)
+        return 2
+    except Exception:
+        logger.exception("[post feed] cache version bump failed")
+        return None
+
+
+def get_cached_post_feed_value(name, builder):
+    """
+    Serve a feed fragment (first page or pinned notices of a scope) from a
+    short-TTL cache that post/like/comment signals invalidate.
+    """
+    version = get_post_feed_cache_version() if is_post_feed_cache_enabled() else None
+    if version is None:
+        return builder()
+
+    key = f"{POST_FEED_CACHE_PREFIX}:{version}:{name}"
+    try:
+        cached = cache.get(key)
+    except Exception:
+        logger.exception("[post feed] cache read failed key=%s", key)
+        cached = None
+    if cached is not None:
+        return cached
+
+    value = builder()
+    try:
+        cache.set(
+            key,
+            value,
+            timeout=getattr(settings, "POST_FEED_CACHE_TTL_SECONDS", DEFAULT_POST_FEED_CACHE_TTL_SECONDS),
+        )
+    except Exception:
+        logger.exception("[post feed] cache write failed key=%s", key)
+    return value
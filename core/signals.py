@@ -2,12 +2,26 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_login_failed
 from django.dispatch import receiver
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.conf import settings
 from django.db.models import Q
 from django.utils import timezone
 import logging
 
+from products.models import Product, ServiceManual
+
+from .home_surface_cache import bump_home_catalog_version, bump_home_user_overlay_version
+from .post_feed import bump_post_feed_cache_version
+from .models import (
+    Comment,
+    Post,
+    ProductFavorite,
+    ProductUsageLog,
+    TeacherBuddySkinUnlock,
+    TeacherBuddyState,
+    TeacherBuddyUnlock,
+    UserProfile,
+)
 from .teacher_activity import ACTIVITY_CATEGORY_DAILY_LOGIN, award_teacher_activity
 
 logger = logging.getLogger(__name__)
@@ -166,3 +180,42 @@ def log_staff_login_failure(sender, credentials, request, **kwargs):
         _client_ip(request),
         getattr(request, "path", ""),
     )
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ServiceManual)
+@receiver(post_delete, sender=ServiceManual)
+def invalidate_home_catalog_snapshot(sender, **kwargs):
+    """제품/매뉴얼이 바뀌면 홈 카탈로그 스냅샷 버전을 올린다."""
+    bump_home_catalog_version()
+
+
+@receiver(post_save, sender=ProductFavorite)
+@receiver(post_delete, sender=ProductFavorite)
+@receiver(post_save, sender=ProductUsageLog)
+@receiver(post_delete, sender=ProductUsageLog)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=TeacherBuddyState)
+@receiver(post_save, sender=TeacherBuddyUnlock)
+@receiver(post_delete, sender=TeacherBuddyUnlock)
+@receiver(post_save, sender=TeacherBuddySkinUnlock)
+@receiver(post_delete, sender=TeacherBuddySkinUnlock)
+def invalidate_home_user_overlay(sender, instance, **kwargs):
+    """사용자별 홈 오버레이(즐겨찾기·최근 사용·선생님 버디)를 무효화한다."""
+    bump_home_user_overlay_version(getattr(instance, "user_id", None))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_post_feed_cache(sender, **kwargs):
+    """SNS 글/댓글이 바뀌면 캐시된 첫 페이지와 고정 공지를 버린다."""
+    bump_post_feed_cache_version()
+
+
+@receiver(m2m_changed, sender=Post.likes.through)
+def invalidate_post_feed_cache_on_like(sender, action, **kwargs):
+    if action in {"post_add", "post_remove", "post_clear"}:
+        bump_post_feed_cache_version()
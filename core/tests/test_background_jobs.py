@@ -0,0 +1,118 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.background_jobs import (
+    claim_next_background_job,
+    report_background_job_progress,
+    requeue_stale_background_jobs,
+    run_claimed_background_job,
+    start_embedded_runner,
+    submit_background_job,
+)
+from core.models import BackgroundJob
+
+
+User = get_user_model()
+
+ECHO_JOB = "core.tests.test_background_jobs.echo_job"
+FAILING_JOB = "core.tests.test_background_jobs.failing_job"
+
+
+def echo_job(job):
+    report_background_job_progress(job, 50, "half")
+    job.artifact.save("echo.txt", ContentFile(str(job.payload.get("text", "")).encode("utf-8")), save=False)
+    return {"echo": job.payload.get("text")}
+
+
+def failing_job(job):
+    raise ValueError("nothing to export")
+
+
+class BackgroundJobInlineTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="jobs_user", password="pw12345", email="jobs_user@example.com")
+
+    def test_disabled_queue_runs_job_on_submit(self):
+        job = submit_background_job(ECHO_JOB, owner=self.user, payload={"text": "hello"})
+
+        self.assertEqual(job.status, BackgroundJob.STATUS_DONE)
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(job.result, {"echo": "hello"})
+        with job.artifact.open("rb") as handle:
+            self.assertEqual(handle.read(), b"hello")
+
+    def test_handler_error_is_recorded(self):
+        job = submit_background_job(FAILING_JOB, owner=self.user)
+
+        self.assertEqual(job.status, BackgroundJob.STATUS_FAILED)
+        self.assertEqual(job.error_type, "ValueError")
+        self.assertIn("nothing to export", job.error_message)
+
+    def test_status_endpoint_is_owner_only(self):
+        job = submit_background_job(ECHO_JOB, owner=self.user, payload={"text": "x"})
+        url = reverse("background_job_status", kwargs={"job_id": job.pk})
+
+        self.client.force_login(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["job"]["status"], BackgroundJob.STATUS_DONE)
+        self.assertTrue(response.json()["job"]["is_finished"])
+
+        other = User.objects.create_user(username="jobs_other", password="pw12345", email="jobs_other@example.com")
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+@override_settings(BACKGROUND_JOBS_ENABLED=True, BACKGROUND_JOBS_EMBEDDED_RUNNER=False)
+class BackgroundJobQueueTests(TestCase):
+    def test_dedupe_key_reuses_active_job(self):
+        first = submit_background_job(ECHO_JOB, payload={"text": "a"}, dedupe_key="echo:1")
+        second = submit_background_job(ECHO_JOB, payload={"text": "b"}, dedupe_key="echo:1")
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(first.status, BackgroundJob.STATUS_QUEUED)
+
+        job_id = claim_next_background_job(worker_id="test")
+        self.assertEqual(job_id, first.pk)
+        self.assertEqual(run_claimed_background_job(job_id), BackgroundJob.STATUS_DONE)
+
+        third = submit_background_job(ECHO_JOB, payload={"text": "c"}, dedupe_key="echo:1")
+        self.assertNotEqual(third.pk, first.pk)
+
+    def test_stale_running_job_is_requeued_then_failed(self):
+        job = submit_background_job(ECHO_JOB, payload={"text": "a"})
+        claim_next_background_job(worker_id="gone")
+        BackgroundJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(requeue_stale_background_jobs(stale_seconds=60), (1, 0))
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.STATUS_QUEUED)
+
+        with override_settings(BACKGROUND_JOBS_MAX_ATTEMPTS=2):
+            claim_next_background_job(worker_id="gone")
+            BackgroundJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+            self.assertEqual(requeue_stale_background_jobs(stale_seconds=60), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.STATUS_FAILED)
+        self.assertEqual(job.error_type, "WorkerLost")
+
+
+class BackgroundJobEmbeddedRunnerBootTests(TestCase):
+    @override_settings(BACKGROUND_JOBS_ENABLED=True, BACKGROUND_JOBS_EMBEDDED_RUNNER=True)
+    @patch("core.background_jobs._start_embedded_runner")
+    def test_boot_starts_runner_for_jobs_queued_before_restart(self, start_mock):
+        self.assertIs(start_embedded_runner(), start_mock.return_value)
+        start_mock.assert_called_once_with()
+
+    @patch("core.background_jobs._start_embedded_runner")
+    def test_boot_skips_runner_when_switched_off(self, start_mock):
+        for enabled, embedded in ((False, True), (True, False)):
+            with override_settings(BACKGROUND_JOBS_ENABLED=enabled, BACKGROUND_JOBS_EMBEDDED_RUNNER=embedded):
+                self.assertIsNone(start_embedded_runner())
+        start_mock.assert_not_called()
@@ -1,15 +1,26 @@
+from types import SimpleNamespace
 from unittest.mock import call, patch
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 
+from core.bootstrap import STEP_RAN, STEP_SKIPPED, BootstrapEngine, BootstrapStep
 from core.management.commands.bootstrap_runtime import Command
 
 
 class BootstrapRuntimeCommandTests(SimpleTestCase):
+    @patch.object(Command, "_deferred_port", return_value=None)
+    @patch.object(Command, "_fingerprint_store", return_value=None)
     @patch.object(Command, "_create_cache_table_if_needed")
     @patch.object(Command, "_run_optional_command")
     @patch("core.management.commands.bootstrap_runtime.call_command")
-    def test_handle_runs_ensure_edu_materials(self, mocked_call_command, mocked_optional, mocked_cache):
+    def test_handle_runs_ensure_edu_materials(
+        self,
+        mocked_call_command,
+        mocked_optional,
+        mocked_cache,
+        mocked_store,
+        mocked_port,
+    ):
         command = Command()
 
         command.handle()
@@ -17,7 +28,11 @@ class BootstrapRuntimeCommandTests(SimpleTestCase):
         self.assertIn(call("ensure_math_games"), mocked_call_command.call_args_list)
         self.assertIn(call("ensure_edu_materials"), mocked_call_command.call_args_list)
         self.assertIn(call("ensure_tts_announce"), mocked_call_command.call_args_list)
+        self.assertIn(call("backfill_calendar_hub_index"), mocked_call_command.call_args_list)
+        self.assertNotIn(call("migrate", "--noinput"), mocked_call_command.call_args_list)
 
+    @patch.object(Command, "_deferred_port", return_value=None)
+    @patch.object(Command, "_fingerprint_store", return_value=None)
     @patch.object(Command, "_create_cache_table_if_needed")
     @patch.object(Command, "_run_optional_command")
     @patch("core.management.commands.bootstrap_runtime.call_command")
@@ -26,6 +41,8 @@ class BootstrapRuntimeCommandTests(SimpleTestCase):
         mocked_call_command,
         mocked_optional,
         mocked_cache,
+        mocked_store,
+        mocked_port,
     ):
         command = Command()
 
@@ -33,3 +50,113 @@ class BootstrapRuntimeCommandTests(SimpleTestCase):
 
         self.assertIn(call("warm_ocrdesk"), mocked_optional.call_args_list)
         self.assertNotIn(call("warm_ocrdesk", "--strict"), mocked_optional.call_args_list)
+
+    @patch.object(Command, "_launch_deferred_runner")
+    @patch.object(Command, "_deferred_port", return_value=8000)
+    @patch.object(Command, "_fingerprint_store", return_value=None)
+    @patch.object(Command, "_create_cache_table_if_needed")
+    @patch.object(Command, "_run_optional_command")
+    @patch("core.management.commands.bootstrap_runtime.call_command")
+    def test_handle_hands_ocr_warmup_to_deferred_runner(
+        self,
+        mocked_call_command,
+        mocked_optional,
+        mocked_cache,
+        mocked_store,
+        mocked_port,
+        mocked_launch,
+    ):
+        command = Command()
+
+        command.handle()
+
+        self.assertNotIn(call("warm_ocrdesk"), mocked_optional.call_args_list)
+        mocked_launch.assert_called_once_with()
+
+
+    def test_embedding_model_step_is_left_out_without_a_rag_app(self):
+        steps = Command().build_steps()
+
+        self.assertNotIn("ensure_embedding_model", [step.name for step in steps])
+
+    @override_settings(RAG_EMBEDDING_BACKEND="onnx")
+    @patch("core.management.commands.bootstrap_runtime.apps.is_installed", side_effect=lambda name: name == "padlet_bot")
+    @patch("core.management.commands.bootstrap_runtime.call_command")
+    def test_embedding_model_is_a_deferred_warmup_for_rag_apps(self, mocked_call_command, mocked_is_installed):
+        def fail_model_download(name, *args, **kwargs):
+            if name == "ensure_embedding_model":
+                raise RuntimeError("offline")
+
+        mocked_call_command.side_effect = fail_model_download
+        steps = {step.name: step for step in Command().build_steps()}
+
+        step = steps["ensure_embedding_model"]
+        self.assertTrue(step.deferred)
+        step.run()
+        mocked_call_command.assert_called_once_with("ensure_embedding_model")
+
+
+class InMemoryStore:
+    def __init__(self):
+        self.records = {}
+
+    def load(self):
+        return dict(self.records)
+
+    def record(self, step_name, fingerprint, elapsed_ms):
+        from django.utils import timezone
+
+        self.records[step_name] = SimpleNamespace(fingerprint=fingerprint, completed_at=timezone.now())
+
+
+@patch("core.bootstrap.schema_state_digest", return_value="schema-v1")
+class BootstrapEngineTests(SimpleTestCase):
+    def test_unchanged_steps_are_skipped_on_the_next_run(self, mocked_schema):
+        calls = []
+        steps = [BootstrapStep("seed", lambda: calls.append("seed"))]
+        store = InMemoryStore()
+
+        first = BootstrapEngine(steps, store=store).run()
+        second = BootstrapEngine(steps, store=store).run()
+        forced = BootstrapEngine(steps, store=store, force=True).run()
+
+        self.assertEqual([outcome.status for outcome in first], [STEP_RAN])
+        self.assertEqual([outcome.status for outcome in second], [STEP_SKIPPED])
+        self.assertEqual([outcome.status for outcome in forced], [STEP_RAN])
+        self.assertEqual(calls, ["seed", "seed"])
+
+        mocked_schema.return_value = "schema-v2"
+        rerun = BootstrapEngine(steps, store=store).run()
+        self.assertEqual([outcome.status for outcome in rerun], [STEP_RAN])
+
+    def test_dependencies_finish_before_dependents_start(self, mocked_schema):
+        calls = []
+        steps = [
+            BootstrapStep("index", lambda: calls.append("index"), after=("calendar", "consent"), cacheable=False),
+            BootstrapStep("calendar", lambda: calls.append("calendar")),
+            BootstrapStep("consent", lambda: calls.append("consent")),
+        ]
+
+        BootstrapEngine(steps, workers=3).run()
+
+        self.assertEqual(calls[-1], "index")
+        self.assertCountEqual(calls, ["calendar", "consent", "index"])
+
+    def test_failure_is_raised_and_dependents_do_not_run(self, mocked_schema):
+        calls = []
+
+        def broken():
+            raise RuntimeError("seed failed")
+
+        steps = [
+            BootstrapStep("seed", broken),
+            BootstrapStep("backfill", lambda: calls.append("backfill"), after=("seed",)),
+        ]
+
+        with self.assertRaisesMessage(RuntimeError, "seed failed"):
+            BootstrapEngine(steps, workers=2).run()
+        self.assertEqual(calls, [])
+
+    def test_unknown_dependency_is_rejected(self, mocked_schema):
+        with self.assertRaises(ValueError):
+            BootstrapEngine([BootstrapStep("backfill", lambda: None, after=("missing",))])
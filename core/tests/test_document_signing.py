@@ -8,6 +8,7 @@ import requests
 from django.test import SimpleTestCase, override_settings
 
 from core.document_signing import (
+    append_stamped_pages,
     get_pdf_bytes_from_file_field,
     get_signature_image_bytes,
     normalize_pdf_bytes,
@@ -119,6 +120,74 @@ class DocumentSigningFallbackTests(SimpleTestCase):
         self.assertEqual(round(float(normalized_page.mediabox.width)), 200)
         self.assertEqual(round(float(normalized_page.mediabox.height)), 400)
 
+    def test_append_stamped_pages_keeps_each_recipients_marks_on_its_own_copy(self):
+        try:
+            from reportlab.pdfgen import canvas
+            from pypdf import PdfReader, PdfWriter
+        except ModuleNotFoundError:
+            self.skipTest("pdf runtime unavailable")
+
+        def build_pdf(page_texts):
+            packet = io.BytesIO()
+            pdf = canvas.Canvas(packet, pagesize=(400, 200))
+            for text in page_texts:
+                pdf.drawString(40, 140, text)
+                pdf.showPage()
+            pdf.save()
+            return packet.getvalue()
+
+        source_pages = PdfReader(io.BytesIO(build_pdf(["source-one", "source-two"]))).pages
+        recipients = ["recipient-a", "recipient-b", "recipient-c"]
+        writer = PdfWriter()
+        for name in recipients:
+            overlay_page = PdfReader(io.BytesIO(build_pdf([name]))).pages[0]
+            append_stamped_pages(writer, source_pages, {1: overlay_page})
+        merged = io.BytesIO()
+        writer.write(merged)
+
+        pages = PdfReader(io.BytesIO(merged.getvalue())).pages
+        self.assertEqual(len(pages), 6)
+        for copy_index, name in enumerate(recipients):
+            marked_text = pages[copy_index * 2].extract_text() or ""
+            unmarked_text = pages[copy_index * 2 + 1].extract_text() or ""
+            self.assertIn("source-one", marked_text)
+            self.assertIn(name, marked_text)
+            self.assertEqual([other for other in recipients if other in marked_text], [name])
+            self.assertIn("source-two", unmarked_text)
+            self.assertFalse(any(other in unmarked_text for other in recipients))
+
+    def test_append_stamped_pages_keeps_source_rotation_on_marked_pages(self):
+        try:
+            from reportlab.pdfgen import canvas
+            from pypdf import PdfReader, PdfWriter
+        except ModuleNotFoundError:
+            self.skipTest("pdf runtime unavailable")
+
+        def build_pdf(pages):
+            packet = io.BytesIO()
+            pdf = canvas.Canvas(packet, pagesize=(400, 200))
+            for _ in range(pages):
+                pdf.drawString(40, 140, "page")
+                pdf.showPage()
+            pdf.save()
+            return packet.getvalue()
+
+        rotated = PdfWriter()
+        for page in PdfReader(io.BytesIO(build_pdf(2))).pages:
+            rotated.add_page(page).rotate(90)
+        rotated_payload = io.BytesIO()
+        rotated.write(rotated_payload)
+
+        source_pages = PdfReader(io.BytesIO(rotated_payload.getvalue())).pages
+        overlay_page = PdfReader(io.BytesIO(build_pdf(1))).pages[0]
+        writer = PdfWriter()
+        append_stamped_pages(writer, source_pages, {1: overlay_page})
+        merged = io.BytesIO()
+        writer.write(merged)
+
+        pages = PdfReader(io.BytesIO(merged.getvalue())).pages
+        self.assertEqual([page.rotation for page in pages], [90, 90])
+
     def test_signature_image_bytes_trim_transparent_margins(self):
         try:
             from PIL import Image, ImageDraw
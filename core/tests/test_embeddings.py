@@ -0,0 +1,136 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from core.embeddings import (
+    ONNX_MODEL_FILES,
+    HashingEmbeddingFunction,
+    embed_query,
+    get_embedding_function,
+    onnx_model_present,
+    reset_embedding_service,
+    sync_collection_chunks,
+)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.rows = {}
+        self.upserted = []
+
+    def get(self, where, include):
+        ids = [chunk_id for chunk_id, row in self.rows.items() if row["metadata"]["doc_id"] == where["doc_id"]]
+        return {"ids": ids, "metadatas": [self.rows[chunk_id]["metadata"] for chunk_id in ids]}
+
+    def delete(self, ids):
+        for chunk_id in ids:
+            self.rows.pop(chunk_id, None)
+
+    def update(self, ids, metadatas):
+        for chunk_id, metadata in zip(ids, metadatas):
+            self.rows[chunk_id]["metadata"] = metadata
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.upserted.extend(ids)
+        for chunk_id, embedding, document, metadata in zip(ids, embeddings, documents, metadatas):
+            self.rows[chunk_id] = {"embedding": embedding, "document": document, "metadata": metadata}
+
+
+@override_settings(RAG_EMBEDDING_BACKEND="hashing", RAG_EMBEDDING_BATCH_SIZE=2, RAG_QUERY_EMBEDDING_CACHE_SIZE=2)
+class EmbeddingServiceTests(SimpleTestCase):
+    def setUp(self):
+        reset_embedding_service()
+        self.addCleanup(reset_embedding_service)
+
+    def test_hashing_embeddings_are_normalized_and_deterministic(self):
+        embed = HashingEmbeddingFunction()
+        first, second = embed(["학교폭력 신고 절차", "학교폭력 신고 절차"])
+
+        self.assertEqual(len(first), 384)
+        self.assertEqual(first, second)
+        self.assertAlmostEqual(sum(value * value for value in first), 1.0)
+
+    def test_embed_query_reuses_cached_vector(self):
+        vector = embed_query("신고  절차")
+
+        self.assertIs(embed_query("신고 절차"), vector)
+
+    def test_sync_only_embeds_changed_chunks_and_drops_stale_ones(self):
+        collection = FakeCollection()
+        progress = []
+        first = sync_collection_chunks(
+            collection,
+            doc_key="1",
+            id_prefix="doc_1",
+            chunks=["가", "나", "다"],
+            metadata={"title": "안내"},
+            progress=lambda done, total: progress.append((done, total)),
+        )
+        collection.upserted.clear()
+        second = sync_collection_chunks(
+            collection,
+            doc_key="1",
+            id_prefix="doc_1",
+            chunks=["나", "다", "라"],
+            metadata={"title": "안내"},
+        )
+
+        self.assertEqual(first, {"chunk_count": 3, "embedded": 3, "skipped": 0, "deleted": 0})
+        self.assertEqual(progress, [(0, 3), (2, 3), (3, 3)])
+        self.assertEqual(second, {"chunk_count": 3, "embedded": 1, "skipped": 2, "deleted": 1})
+        self.assertEqual(len(collection.upserted), 1)
+        self.assertEqual(
+            sorted(row["document"] for row in collection.rows.values()),
+            ["나", "다", "라"],
+        )
+        self.assertEqual(
+            {row["document"]: row["metadata"]["chunk_index"] for row in collection.rows.values()},
+            {"나": 0, "다": 1, "라": 2},
+        )
+
+
+class OnnxEmbeddingBackendTests(SimpleTestCase):
+    def setUp(self):
+        from chromadb.utils import embedding_functions
+
+        self.onnx_class = embedding_functions.ONNXMiniLM_L6_V2
+        original_path = self.onnx_class.DOWNLOAD_PATH
+        self.addCleanup(setattr, self.onnx_class, "DOWNLOAD_PATH", original_path)
+        reset_embedding_service()
+        self.addCleanup(reset_embedding_service)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _bundle_model(self):
+        source = self.root / "source"
+        source.mkdir()
+        for name in ONNX_MODEL_FILES:
+            (source / name).write_bytes(b"model")
+        model_dir = self.root / "model"
+        with override_settings(RAG_EMBEDDING_MODEL_DIR=str(model_dir)):
+            call_command("ensure_embedding_model", source=str(source), stdout=StringIO())
+        return model_dir
+
+    def test_onnx_backend_reads_the_bundled_model_dir(self):
+        model_dir = self._bundle_model()
+
+        with override_settings(RAG_EMBEDDING_BACKEND="onnx", RAG_EMBEDDING_MODEL_DIR=str(model_dir)):
+            with self.assertNoLogs("core.embeddings", level="WARNING"):
+                embed = get_embedding_function()
+
+        self.assertTrue(onnx_model_present(model_dir))
+        self.assertNotIsInstance(embed, HashingEmbeddingFunction)
+        self.assertEqual(self.onnx_class.DOWNLOAD_PATH, model_dir)
+
+    def test_onnx_backend_warns_when_model_is_missing(self):
+        model_dir = self.root / "missing"
+
+        with override_settings(RAG_EMBEDDING_BACKEND="onnx", RAG_EMBEDDING_MODEL_DIR=str(model_dir)):
+            with self.assertLogs("core.embeddings", level="WARNING"):
+                get_embedding_function()
+
+        self.assertEqual(self.onnx_class.DOWNLOAD_PATH, model_dir)
@@ -0,0 +1,119 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.home_surface_cache import get_home_catalog_version, get_home_user_overlay_version
+from core.models import ProductFavorite, UserProfile
+from products.models import Product
+
+
+def _create_onboarded_user(username):
+    user = User.objects.create_user(username, f"{username}@test.com", "pass1234")
+    profile, _ = UserProfile.objects.get_or_create(user=user)
+    profile.nickname = username
+    profile.role = "school"
+    profile.save()
+    return user
+
+
+@override_settings(HOME_SURFACE_CACHE_ENABLED=True)
+class HomeSurfaceCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = Client()
+        self.p1 = Product.objects.create(
+            title="수업 도구",
+            description="수업용",
+            price=0,
+            is_active=True,
+            service_type="classroom",
+            is_featured=True,
+        )
+        self.p2 = Product.objects.create(
+            title="행정 도구",
+            description="행정용",
+            price=0,
+            is_active=True,
+            service_type="work",
+        )
+
+    def _login(self, username="cacheuser"):
+        user = _create_onboarded_user(username)
+        self.client.login(username=username, password="pass1234")
+        return user
+
+    def _get_home_with_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/")
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx)
+
+    def test_warm_authenticated_home_issues_fewer_queries(self):
+        self._login()
+
+        _, cold_queries = self._get_home_with_query_count()
+        response, warm_queries = self._get_home_with_query_count()
+
+        self.assertLess(warm_queries, cold_queries)
+        product_ids = {product.id for product in response.context["products"]}
+        # Seeded products from data migrations are listed too.
+        self.assertLessEqual({self.p1.id, self.p2.id}, product_ids)
+
+    def test_warm_guest_home_issues_fewer_queries(self):
+        _, cold_queries = self._get_home_with_query_count()
+        _, warm_queries = self._get_home_with_query_count()
+
+        self.assertLess(warm_queries, cold_queries)
+
+    def test_product_change_rebuilds_catalog_snapshot(self):
+        self._login()
+        self.client.get("/")
+        version_before = get_home_catalog_version()
+
+        new_product = Product.objects.create(
+            title="새 도구",
+            description="새로 추가",
+            price=0,
+            is_active=True,
+            service_type="work",
+        )
+        response = self.client.get("/")
+
+        self.assertGreater(get_home_catalog_version(), version_before)
+        self.assertIn(new_product.id, {product.id for product in response.context["products"]})
+
+    def test_favorite_change_invalidates_user_overlay(self):
+        user = self._login()
+        first_response = self.client.get("/")
+        self.assertEqual(first_response.context["favorite_product_ids"], [])
+        version_before = get_home_user_overlay_version(user.pk)
+
+        ProductFavorite.objects.create(user=user, product=self.p2, pin_order=1)
+        response = self.client.get("/")
+
+        self.assertGreater(get_home_user_overlay_version(user.pk), version_before)
+        self.assertEqual(response.context["favorite_product_ids"], [self.p2.id])
+
+
+@override_settings(HOME_SURFACE_CACHE_ENABLED=False)
+class HomeSurfaceWithoutCacheTest(TestCase):
+    def test_authenticated_home_renders_user_overlay(self):
+        user = _create_onboarded_user("nocacheuser")
+        product = Product.objects.create(
+            title="즐겨찾기 도구",
+            description="즐겨찾기",
+            price=0,
+            is_active=True,
+            service_type="classroom",
+        )
+        ProductFavorite.objects.create(user=user, product=product, pin_order=1)
+        self.client.login(username="nocacheuser", password="pass1234")
+
+        response = self.client.get("/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["favorite_product_ids"], [product.id])
+        self.assertIn("teacher_buddy_current_avatar", response.context)
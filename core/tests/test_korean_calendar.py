@@ -0,0 +1,451 @@
+from collections import Counter
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.utils.dateparse import parse_date
+from korean_lunar_calendar import KoreanLunarCalendar
+
+from core import korean_calendar
+
+
+# The holiday rules as they stood in noticegen/daily_recommendations.py and
+# classcalendar/views.py before both moved to core.korean_calendar, kept
+# verbatim (helpers renamed) to cross-check the shared rules against them.
+
+
+def _notice_solar_date_from_lunar(year, month, day):
+    try:
+        calendar = KoreanLunarCalendar()
+        calendar.setLunarDate(year, month, day, False)
+        return date.fromisoformat(calendar.SolarIsoFormat())
+    except Exception:
+        return None
+
+
+def _notice_merge_marker(markers, marker_date, name):
+    if not marker_date:
+        return
+    existing = markers.get(marker_date)
+    if existing:
+        markers[marker_date] = f"{existing} / {name}" if name not in existing else existing
+    else:
+        markers[marker_date] = name
+
+
+def _notice_next_substitute_date(start_date, occupied_dates):
+    candidate = start_date + timedelta(days=1)
+    while candidate.weekday() >= 5 or candidate in occupied_dates:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def _notice_add_substitute_holidays(markers, substitute_rules, base_holidays):
+    occupied_dates = set(markers)
+    holiday_counts = Counter(marker_date for marker_date, _name, _enabled in base_holidays if marker_date)
+    merged_rules = {}
+    for rule in substitute_rules:
+        dates = tuple(sorted(marker_date for marker_date in rule.get("dates", ()) if marker_date))
+        if not dates:
+            continue
+        merged = merged_rules.setdefault(
+            dates,
+            {
+                "names": [],
+                "weekend_days": set(),
+            },
+        )
+        name = str(rule.get("name") or "").strip()
+        if name and name not in merged["names"]:
+            merged["names"].append(name)
+        merged["weekend_days"].update(rule.get("weekend_days", set()))
+
+    for dates, rule in merged_rules.items():
+        weekend_days = rule["weekend_days"] or {6}
+        should_substitute = any(
+            marker_date.weekday() in weekend_days or holiday_counts[marker_date] > 1
+            for marker_date in dates
+        )
+        if not should_substitute:
+            continue
+        substitute_date = _notice_next_substitute_date(max(dates), occupied_dates)
+        occupied_dates.add(substitute_date)
+        substitute_name = " / ".join(rule["names"]) or "공휴일"
+        _notice_merge_marker(markers, substitute_date, f"{substitute_name} 대체공휴일")
+
+
+def _notice_holiday_markers(year):
+    markers = {}
+    substitute_rules = []
+    base_holidays = [
+        (date(year, 1, 1), "신정", False),
+        (date(year, 3, 1), "삼일절", True),
+        (date(year, 5, 5), "어린이날", True),
+        (date(year, 6, 6), "현충일", False),
+        (date(year, 8, 15), "광복절", True),
+        (date(year, 10, 3), "개천절", True),
+        (date(year, 10, 9), "한글날", True),
+        (date(year, 12, 25), "기독탄신일", True),
+    ]
+    for marker_date, name, _substitute_enabled in base_holidays:
+        _notice_merge_marker(markers, marker_date, name)
+    for marker_date, name, substitute_enabled in base_holidays:
+        if substitute_enabled:
+            substitute_rules.append(
+                {
+                    "dates": (marker_date,),
+                    "name": name,
+                    "weekend_days": {5, 6},
+                }
+            )
+
+    seollal = _notice_solar_date_from_lunar(year, 1, 1)
+    if seollal:
+        seollal_dates = (
+            seollal - timedelta(days=1),
+            seollal,
+            seollal + timedelta(days=1),
+        )
+        for marker_date, name in (
+            (seollal_dates[0], "설날 연휴"),
+            (seollal_dates[1], "설날"),
+            (seollal_dates[2], "설날 연휴"),
+        ):
+            base_holidays.append((marker_date, name, True))
+            _notice_merge_marker(markers, marker_date, name)
+        substitute_rules.append(
+            {
+                "dates": seollal_dates,
+                "name": "설날",
+                "weekend_days": {6},
+            }
+        )
+
+    buddha = _notice_solar_date_from_lunar(year, 4, 8)
+    base_holidays.append((buddha, "부처님오신날", True))
+    _notice_merge_marker(markers, buddha, "부처님오신날")
+    substitute_rules.append(
+        {
+            "dates": (buddha,),
+            "name": "부처님오신날",
+            "weekend_days": {5, 6},
+        }
+    )
+
+    chuseok = _notice_solar_date_from_lunar(year, 8, 15)
+    if chuseok:
+        chuseok_dates = (
+            chuseok - timedelta(days=1),
+            chuseok,
+            chuseok + timedelta(days=1),
+        )
+        for marker_date, name in (
+            (chuseok_dates[0], "추석 연휴"),
+            (chuseok_dates[1], "추석"),
+            (chuseok_dates[2], "추석 연휴"),
+        ):
+            base_holidays.append((marker_date, name, True))
+            _notice_merge_marker(markers, marker_date, name)
+        substitute_rules.append(
+            {
+                "dates": chuseok_dates,
+                "name": "추석",
+                "weekend_days": {6},
+            }
+        )
+
+    _notice_add_substitute_holidays(markers, substitute_rules, base_holidays)
+    return markers
+
+
+def _calendar_parse_iso_date(value):
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+    return parse_date(str(value))
+
+
+def _calendar_solar_date_from_lunar(year, month, day, *, intercalation=False):
+    calendar = KoreanLunarCalendar()
+    calendar.setLunarDate(year, month, day, intercalation)
+    solar_value = _calendar_parse_iso_date(calendar.SolarIsoFormat())
+    if solar_value is None:
+        raise ValueError(f"Unable to convert lunar date {year}-{month}-{day}")
+    return solar_value
+
+
+def _calendar_merge_holiday_marker(markers, marker_date, *, name, kind="public", is_observed=False):
+    if not isinstance(marker_date, date):
+        return
+    date_key = marker_date.isoformat()
+    existing = markers.get(date_key)
+    if existing is None:
+        markers[date_key] = {
+            "name": name,
+            "kind": kind,
+            "is_observed": bool(is_observed),
+        }
+        return
+
+    existing_names = [part.strip() for part in str(existing.get("name") or "").split(" / ") if part.strip()]
+    if name not in existing_names:
+        existing_names.append(name)
+    existing["name"] = " / ".join(existing_names)
+    if existing.get("kind") != "public" and kind == "public":
+        existing["kind"] = "public"
+    existing["is_observed"] = bool(existing.get("is_observed")) or bool(is_observed)
+
+
+def _calendar_is_public_holiday_day(target_date, public_dates):
+    if not isinstance(target_date, date):
+        return False
+    return target_date.weekday() == 6 or target_date in public_dates
+
+
+def _calendar_next_substitute_holiday(start_date, public_dates, observed_dates):
+    candidate = start_date
+    while (
+        candidate.weekday() == 5
+        or _calendar_is_public_holiday_day(candidate, public_dates)
+        or candidate in observed_dates
+    ):
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def _calendar_holiday_markers(year):
+    year = int(year)
+    if year < 1900 or year > 2100:
+        return {}
+
+    markers = {}
+    public_dates = {}
+    observed_dates = set()
+    observed_candidates = []
+
+    def add_public_holiday(marker_date, name, *, substitute_group=""):
+        if not isinstance(marker_date, date) or marker_date.year != year:
+            return
+        _calendar_merge_holiday_marker(markers, marker_date, name=name, kind="public", is_observed=False)
+        public_dates.setdefault(marker_date, []).append(
+            {
+                "name": name,
+                "substitute_group": substitute_group,
+            }
+        )
+
+    fixed_public_holidays = (
+        (date(year, 1, 1), "신정", ""),
+        (date(year, 3, 1), "삼일절", "single"),
+        (date(year, 5, 5), "어린이날", "single"),
+        (date(year, 6, 6), "현충일", ""),
+        (date(year, 8, 15), "광복절", "single"),
+        (date(year, 10, 3), "개천절", "single"),
+        (date(year, 10, 9), "한글날", "single"),
+        (date(year, 12, 25), "기독탄신일", "single"),
+    )
+    for marker_date, name, substitute_group in fixed_public_holidays:
+        add_public_holiday(marker_date, name, substitute_group=substitute_group)
+
+    seollal_date = _calendar_solar_date_from_lunar(year, 1, 1)
+    seollal_days = (
+        (seollal_date - timedelta(days=1), "설날 연휴"),
+        (seollal_date, "설날"),
+        (seollal_date + timedelta(days=1), "설날 연휴"),
+    )
+    for marker_date, name in seollal_days:
+        add_public_holiday(marker_date, name, substitute_group="seollal")
+
+    buddha_birthday = _calendar_solar_date_from_lunar(year, 4, 8)
+    add_public_holiday(buddha_birthday, "부처님오신날", substitute_group="single")
+
+    chuseok_date = _calendar_solar_date_from_lunar(year, 8, 15)
+    chuseok_days = (
+        (chuseok_date - timedelta(days=1), "추석 연휴"),
+        (chuseok_date, "추석"),
+        (chuseok_date + timedelta(days=1), "추석 연휴"),
+    )
+    for marker_date, name in chuseok_days:
+        add_public_holiday(marker_date, name, substitute_group="chuseok")
+
+    _calendar_merge_holiday_marker(markers, date(year, 5, 1), name="근로자의 날", kind="labor", is_observed=False)
+
+    for marker_date, entries in public_dates.items():
+        if marker_date.weekday() not in {5, 6} and len(entries) <= 1:
+            continue
+        single_entry = next(
+            (entry for entry in entries if (entry.get("substitute_group") or "") == "single"),
+            None,
+        )
+        if single_entry is None:
+            continue
+        observed_candidates.append((marker_date + timedelta(days=1), f"{single_entry['name']} 대체공휴일"))
+
+    for group_name, label in (("seollal", "설날 대체공휴일"), ("chuseok", "추석 대체공휴일")):
+        group_dates = sorted(
+            marker_date
+            for marker_date, entries in public_dates.items()
+            if any((entry.get("substitute_group") or "") == group_name for entry in entries)
+        )
+        if not group_dates:
+            continue
+        has_sunday = any(marker_date.weekday() == 6 for marker_date in group_dates)
+        has_overlap = any(
+            len(public_dates.get(marker_date, [])) > 1 and marker_date.weekday() not in {5, 6}
+            for marker_date in group_dates
+        )
+        if not has_sunday and not has_overlap:
+            continue
+        observed_candidates.append((max(group_dates) + timedelta(days=1), label))
+
+    ordered_public_dates = set(public_dates.keys())
+    for start_date, name in sorted(observed_candidates, key=lambda item: item[0]):
+        observed_date = _calendar_next_substitute_holiday(start_date, ordered_public_dates, observed_dates)
+        observed_dates.add(observed_date)
+        _calendar_merge_holiday_marker(markers, observed_date, name=name, kind="public", is_observed=True)
+
+    return markers
+
+
+# Where the shared public holidays differ from the old noticegen rules
+# (date: (noticegen name, shared name)). The old class calendar rules match exactly.
+ACCEPTED_NOTICE_DIFFERENCES = {
+    # noticegen did not know Labor Day, so it is missing from merged names.
+    "1906-05-01": ("부처님오신날", "부처님오신날 / 근로자의 날"),
+    "1944-05-01": ("부처님오신날 대체공휴일", "근로자의 날 / 부처님오신날 대체공휴일"),
+    "1952-05-01": ("부처님오신날", "부처님오신날 / 근로자의 날"),
+    "1963-05-01": ("부처님오신날", "부처님오신날 / 근로자의 날"),
+    "1982-05-01": ("부처님오신날", "부처님오신날 / 근로자의 날"),
+    "2001-05-01": ("부처님오신날", "부처님오신날 / 근로자의 날"),
+    # Children's Day and Buddha's Birthday on one day: one substitute, named after the first holiday.
+    "1949-05-06": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    "1968-05-06": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    "1987-05-06": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    "2006-05-08": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    "2025-05-06": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    "2044-05-06": ("어린이날 / 부처님오신날 대체공휴일", "어린이날 대체공휴일"),
+    # 개천절 on the Saturday of Chuseok: only 개천절 gets a substitute (10-05).
+    "1925-10-06": ("추석 대체공휴일", ""),
+}
+
+
+# Public holidays and substitute holidays as announced for these years.
+ANNOUNCED_HOLIDAYS = {
+    2024: {
+        "2024-02-09": "설날 연휴",
+        "2024-02-10": "설날",
+        "2024-02-11": "설날 연휴",
+        "2024-02-12": "설날 대체공휴일",
+        "2024-05-06": "어린이날 대체공휴일",
+        "2024-05-15": "부처님오신날",
+        "2024-09-17": "추석",
+    },
+    2025: {
+        "2025-01-29": "설날",
+        "2025-03-03": "삼일절 대체공휴일",
+        "2025-05-05": "어린이날 / 부처님오신날",
+        "2025-05-06": "어린이날 대체공휴일",
+        "2025-10-06": "추석",
+        "2025-10-08": "추석 대체공휴일",
+    },
+    2026: {
+        "2026-02-17": "설날",
+        "2026-03-02": "삼일절 대체공휴일",
+        "2026-05-25": "부처님오신날 대체공휴일",
+        "2026-08-17": "광복절 대체공휴일",
+        "2026-09-25": "추석",
+        "2026-10-05": "개천절 대체공휴일",
+    },
+}
+
+
+class KoreanCalendarHolidayTests(SimpleTestCase):
+    def test_markers_match_announced_holidays(self):
+        for year, expected in ANNOUNCED_HOLIDAYS.items():
+            markers = korean_calendar.holiday_markers(year)
+            for date_key, name in expected.items():
+                with self.subTest(date=date_key):
+                    self.assertEqual(markers[date_key]["name"], name)
+                    self.assertEqual(markers[date_key]["kind"], "public")
+
+    def test_labor_day_is_marked_but_not_a_public_holiday(self):
+        markers = korean_calendar.holiday_markers(2026)
+
+        self.assertEqual(markers["2026-05-01"]["kind"], "labor")
+        self.assertEqual(korean_calendar.public_holiday_name(date(2026, 5, 1)), "")
+        self.assertEqual(korean_calendar.public_holiday_name(date(2026, 3, 2)), "삼일절 대체공휴일")
+
+    def test_out_of_range_years_have_no_markers(self):
+        self.assertEqual(korean_calendar.holiday_markers(korean_calendar.MIN_YEAR - 1), {})
+        self.assertEqual(korean_calendar.holiday_markers(korean_calendar.MAX_YEAR + 1), {})
+
+    def test_cached_markers_are_not_shared_with_callers(self):
+        markers = korean_calendar.holiday_markers(2026)
+        markers["2026-03-01"]["name"] = "changed"
+        markers.clear()
+
+        self.assertEqual(korean_calendar.holiday_markers(2026)["2026-03-01"]["name"], "삼일절")
+
+    def test_static_table_matches_computed_rules(self):
+        table = korean_calendar._holiday_table()
+        self.assertIsNotNone(table, "run manage.py build_korean_calendar_table")
+        self.assertEqual(set(table), {str(year) for year in range(korean_calendar.MIN_YEAR, korean_calendar.MAX_YEAR + 1)})
+        for year in range(korean_calendar.MIN_YEAR, korean_calendar.MAX_YEAR + 1):
+            with self.subTest(year=year):
+                self.assertEqual(table[str(year)], korean_calendar.compute_holiday_markers(year))
+
+    def test_markers_match_old_class_calendar_rules(self):
+        for year in range(korean_calendar.MIN_YEAR, korean_calendar.MAX_YEAR + 1):
+            with self.subTest(year=year):
+                self.assertEqual(korean_calendar.holiday_markers(year), _calendar_holiday_markers(year))
+
+    def test_public_holidays_match_old_notice_rules_except_accepted_differences(self):
+        differences = {}
+        for year in range(korean_calendar.MIN_YEAR, korean_calendar.MAX_YEAR + 1):
+            notice_names = _notice_holiday_markers(year)
+            day = date(year, 1, 1)
+            while day.year == year:
+                notice_name = notice_names.get(day, "")
+                shared_name = korean_calendar.public_holiday_name(day)
+                if shared_name != notice_name:
+                    differences[day.isoformat()] = (notice_name, shared_name)
+                day += timedelta(days=1)
+
+        self.assertEqual(differences, ACCEPTED_NOTICE_DIFFERENCES)
+
+    def test_max_year_is_the_last_year_the_lunar_library_converts(self):
+        self.assertEqual(korean_calendar.MAX_YEAR, 2050)
+        with self.assertRaises(ValueError):
+            korean_calendar.lunar_to_solar(korean_calendar.MAX_YEAR + 1, 1, 1)
+
+    def test_year_is_computed_once(self):
+        korean_calendar._cached_holiday_markers.cache_clear()
+        with patch.object(korean_calendar, "_holiday_table", return_value=None), patch.object(
+            korean_calendar, "compute_holiday_markers", wraps=korean_calendar.compute_holiday_markers
+        ) as mocked_compute:
+            korean_calendar.holiday_markers(2031)
+            korean_calendar.holiday_markers(2031)
+            korean_calendar.public_holiday_name(date(2031, 1, 1))
+        korean_calendar._cached_holiday_markers.cache_clear()
+
+        mocked_compute.assert_called_once_with(2031)
+
+
+class KoreanCalendarConversionTests(SimpleTestCase):
+    def test_lunar_to_solar(self):
+        self.assertEqual(korean_calendar.lunar_to_solar(1990, 1, 1), date(1990, 1, 27))
+        self.assertEqual(korean_calendar.lunar_to_solar(2026, 8, 15), date(2026, 9, 25))
+
+    def test_invalid_lunar_date_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            korean_calendar.lunar_to_solar(2026, 13, 1)
+
+    def test_solar_terms_are_named_in_korean_and_in_calendar_order(self):
+        terms = korean_calendar.solar_terms(2024)
+
+        self.assertEqual(len(terms), 24)
+        self.assertEqual(list(terms)[:3], ["소한", "대한", "입춘"])
+        self.assertEqual(terms["입춘"].date(), date(2024, 2, 4))
+        self.assertEqual(korean_calendar.solar_term_name(date(2024, 12, 21)), "동지")
+        self.assertEqual(korean_calendar.solar_term_name(date(2024, 12, 20)), "")
@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import Post, UserProfile
+from core.post_feed import decode_post_feed_cursor, paginate_post_feed
+from core.views import _build_post_feed_queryset
+
+
+def _create_author(username="feedauthor"):
+    user = User.objects.create_user(username, f"{username}@test.com", "pass1234")
+    profile, _ = UserProfile.objects.get_or_create(user=user)
+    profile.nickname = username
+    profile.role = "school"
+    profile.save()
+    return user
+
+
+class PostFeedKeysetPaginationTest(TestCase):
+    def setUp(self):
+        self.author = _create_author()
+        now = timezone.now()
+        self.posts = []
+        for index in range(12):
+            post = Post.objects.create(author=self.author, content=f"글 {index}")
+            Post.objects.filter(pk=post.pk).update(created_at=now - timedelta(minutes=index))
+            self.posts.append(post)
+        # Two posts share a timestamp so the id tie-breaker is exercised.
+        Post.objects.filter(pk=self.posts[5].pk).update(created_at=now - timedelta(minutes=4))
+        self.featured = self.posts[9]
+        Post.objects.filter(pk=self.featured.pk).update(featured_from=now - timedelta(hours=1))
+
+    def _walk(self, page_size):
+        seen = []
+        cursor = ""
+        for _ in range(20):
+            page = paginate_post_feed(_build_post_feed_queryset(), cursor=cursor, page_size=page_size)
+            seen.extend(post.id for post in page)
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+        return seen
+
+    def test_cursor_walk_returns_every_post_once_with_featured_first(self):
+        for page_size in (1, 3, 5):
+            with self.subTest(page_size=page_size):
+                seen = self._walk(page_size)
+                self.assertEqual(len(seen), len(self.posts))
+                self.assertEqual(len(set(seen)), len(self.posts))
+                self.assertEqual(seen[0], self.featured.id)
+
+    def test_page_queries_never_count_rows(self):
+        first_page = paginate_post_feed(_build_post_feed_queryset(), page_size=5)
+
+        with CaptureQueriesContext(connection) as ctx:
+            page = paginate_post_feed(
+                _build_post_feed_queryset(),
+                cursor=first_page.next_cursor,
+                page_size=5,
+            )
+            list(page)
+
+        self.assertEqual(len(page), 5)
+        self.assertFalse(any("COUNT(*)" in query["sql"].upper() for query in ctx.captured_queries))
+
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        self.assertIsNone(decode_post_feed_cursor("not-a-cursor"))
+        page = paginate_post_feed(_build_post_feed_queryset(), cursor="not-a-cursor", page_size=2)
+        self.assertEqual(page[0].id, self.featured.id)
+
+
+@override_settings(POST_FEED_CACHE_ENABLED=True)
+class PostFeedCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.author = _create_author("cachedfeed")
+        Post.objects.create(author=self.author, content="첫 글")
+        self.client = Client()
+
+    def test_first_page_is_cached_and_invalidated_by_new_post(self):
+        headers = {"HTTP_HX_REQUEST": "true"}
+        self.client.get("/community/", **headers)
+
+        with CaptureQueriesContext(connection) as ctx:
+            warm = self.client.get("/community/", **headers)
+        self.assertEqual(warm.status_code, 200)
+        self.assertFalse(any("core_post" in query["sql"] for query in ctx.captured_queries))
+
+        Post.objects.create(author=self.author, content="새로 올라온 글")
+        response = self.client.get("/community/", **headers)
+
+        self.assertContains(response, "새로 올라온 글")
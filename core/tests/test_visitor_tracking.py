@@ -1,6 +1,7 @@
 import datetime
 import uuid
 from types import SimpleNamespace
+from unittest import mock
 
 from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.messages.storage.fallback import FallbackStorage
@@ -16,6 +17,7 @@ from core.context_processors import visitor_counts
 from core.middleware import VISITOR_IDENTITY_COOKIE_NAME, VisitorTrackingMiddleware
 from core.models import PageViewLog, VisitorLog
 from core.utils import get_unique_visitor_count, get_weekly_stats
+from core.visitor_ingest import VisitRecordBuffer, flush_visit_buffer, get_visit_buffer
 
 
 def _attach_session(request):
@@ -175,6 +177,95 @@ class VisitorTrackingMiddlewareTest(TestCase):
         self.assertEqual(list(page_logs.values_list("path", flat=True)), ["/", "/about/"])
 
 
+@override_settings(
+    VISITOR_TRACKING_ENABLED=True,
+    VISITOR_TRACKING_BUFFERED=True,
+    VISITOR_TRACKING_FLUSH_BATCH_SIZE=1000,
+)
+class BufferedVisitorTrackingTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = VisitorTrackingMiddleware(
+            lambda request: HttpResponse("<p>ok</p>", content_type="text/html")
+        )
+        flusher_patch = mock.patch.object(VisitRecordBuffer, "_ensure_flusher")
+        flusher_patch.start()
+        self.addCleanup(flusher_patch.stop)
+        get_visit_buffer().drain()
+        self.addCleanup(get_visit_buffer().drain)
+
+    def _build_request(self, path="/", user=None):
+        request = self.factory.get(path, REMOTE_ADDR="203.0.113.10", HTTP_USER_AGENT="Mozilla/5.0")
+        request.user = user or AnonymousUser()
+        _attach_session(request)
+        return request
+
+    def test_request_thread_does_not_write_tracking_rows(self):
+        request = self._build_request()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.middleware(request)
+
+        self.assertEqual(len(ctx), 0)
+        self.assertEqual(VisitorLog.objects.count(), 0)
+        self.assertEqual(len(get_visit_buffer()), 2)
+
+        flush_visit_buffer()
+
+        self.assertEqual(VisitorLog.objects.count(), 1)
+        self.assertEqual(PageViewLog.objects.count(), 1)
+
+    def test_flush_dedupes_per_visitor_and_path(self):
+        first_response = self.middleware(self._build_request("/"))
+        visitor_cookie = first_response.cookies[VISITOR_IDENTITY_COOKIE_NAME].value
+        for path in ("/", "/about/", "/about/"):
+            request = self._build_request(path)
+            request.COOKIES[VISITOR_IDENTITY_COOKIE_NAME] = visitor_cookie
+            self.middleware(request)
+
+        with CaptureQueriesContext(connection) as ctx:
+            flush_visit_buffer()
+
+        self.assertLessEqual(len(ctx), 4)
+        self.assertEqual(VisitorLog.objects.count(), 1)
+        self.assertEqual(
+            sorted(PageViewLog.objects.values_list("path", flat=True)),
+            ["/", "/about/"],
+        )
+
+    def test_login_within_batch_folds_session_rows_into_user(self):
+        user = User.objects.create_user(username="buffered", password="password123")
+        request = self._build_request()
+        response = self.middleware(request)
+        request.COOKIES[VISITOR_IDENTITY_COOKIE_NAME] = response.cookies[VISITOR_IDENTITY_COOKIE_NAME].value
+        request.user = user
+        self.middleware(request)
+
+        flush_visit_buffer()
+
+        log = VisitorLog.objects.get(is_bot=False)
+        self.assertEqual(log.visitor_key, f"user:{user.pk}")
+        self.assertEqual(log.user, user)
+        page_log = PageViewLog.objects.get(is_bot=False)
+        self.assertEqual(page_log.visitor_key, f"user:{user.pk}")
+
+    def test_flush_upgrades_session_row_written_by_earlier_batch(self):
+        user = User.objects.create_user(username="buffered-later", password="password123")
+        request = self._build_request()
+        response = self.middleware(request)
+        flush_visit_buffer()
+        self.assertEqual(VisitorLog.objects.get().identity_type, VisitorLog.IDENTITY_SESSION)
+
+        request.COOKIES[VISITOR_IDENTITY_COOKIE_NAME] = response.cookies[VISITOR_IDENTITY_COOKIE_NAME].value
+        request.user = user
+        self.middleware(request)
+        flush_visit_buffer()
+
+        log = VisitorLog.objects.get()
+        self.assertEqual(log.identity_type, VisitorLog.IDENTITY_USER)
+        self.assertEqual(log.user, user)
+
+
 class VisitorMetricsUtilsTest(TestCase):
     def _create_log(self, *, visitor_key, visit_date, ip_address):
         log = VisitorLog.objects.create(
@@ -41,6 +41,19 @@ from .home_agent_service_bridge import (
     HomeAgentExecutionError,
     execute_service_action,
 )
+from .post_feed import (
+    POST_FEED_CURSOR_PARAM,
+    decode_post_feed_cursor,
+    get_cached_post_feed_value,
+    paginate_post_feed,
+)
+from .home_surface_cache import (
+    HOME_CATALOG_AUDIENCE_AUTHENTICATED,
+    HOME_CATALOG_AUDIENCE_GUEST,
+    bump_home_user_overlay_version,
+    get_home_catalog_snapshot,
+    get_home_user_overlay,
+)
 from .home_surface_context import (
     HomeSurfaceProviderCards,
     HomeSurfaceProviderSpec,
@@ -60,7 +73,9 @@ from .models import (
     ProductFavorite,
     ProductWorkbenchBundle,
     UserModeration,
+    BackgroundJob,
 )
+from .background_jobs import serialize_background_job
 from .forms import PolicyConsentForm, SocialSignupConsentForm
 from allauth.account.internal.decorators import login_not_required
 from .policy_consent import (
@@ -410,24 +425,21 @@ def _get_post_surface_variant(request):
     return POST_SURFACE_VARIANT_DEFAULT
 
 
-def _render_post_list_partial(request, page_obj, feed_scope, *, pinned_notice_posts=None):
+def _render_post_list_partial(request, page_obj, feed_scope, *, pinned_notice_posts=None, avatars_attached=False):
     empty_title = None
     empty_subtitle = None
     if feed_scope == POST_FEED_SCOPE_NOTICE:
         empty_title = "등록된 공지사항이 없습니다."
         empty_subtitle = "새 공지가 올라오면 여기서 바로 확인할 수 있어요."
     if pinned_notice_posts is None:
-        pinned_notice_posts = _build_pinned_notice_queryset(feed_scope=feed_scope)
-    _attach_teacher_buddy_avatar_context_safe(
-        getattr(page_obj, "object_list", []),
-        user=request.user,
-        label='post list partial page posts',
-    )
-    _attach_teacher_buddy_avatar_context_safe(
-        pinned_notice_posts,
-        user=request.user,
-        label='post list partial pinned notices',
-    )
+        pinned_notice_posts = list(_build_pinned_notice_queryset(feed_scope=feed_scope))
+        avatars_attached = False
+    if not avatars_attached:
+        _attach_teacher_buddy_avatar_context_safe(
+            [*getattr(page_obj, "object_list", []), *pinned_notice_posts],
+            user=request.user,
+            label='post list partial posts',
+        )
 
     return render(
         request,
@@ -508,6 +520,56 @@ def _build_post_feed_queryset(feed_scope=POST_FEED_SCOPE_ALL):
     return queryset.order_by('-active_feature_order', '-active_feature_from', '-created_at')
 
 
+def _build_pinned_notice_posts(request, feed_scope):
+    pinned_notice_posts = list(_build_pinned_notice_queryset(feed_scope=feed_scope))
+    _attach_teacher_buddy_avatar_context_safe(
+        pinned_notice_posts,
+        user=request.user,
+        label='post feed pinned notices',
+    )
+    return pinned_notice_posts
+
+
+def _load_post_feed(request, feed_scope, *, page_size, cursor=''):
+    """
+    Return ``(page_obj, pinned_notice_posts)`` with teacher buddy avatars attached.
+
+    The first page and pinned notices of each scope come from a short-TTL cache;
+    deeper pages are keyset queries that never count rows.
+    """
+    def _build_page():
+        return paginate_post_feed(
+            _build_post_feed_queryset(feed_scope=feed_scope),
+            cursor=cursor,
+            page_size=page_size,
+        )
+
+    if not decode_post_feed_cursor(cursor):
+        def _build_first_page():
+            page_obj = _build_page()
+            pinned_notice_posts = list(_build_pinned_notice_queryset(feed_scope=feed_scope))
+            _attach_teacher_buddy_avatar_context_safe(
+                [*page_obj.object_list, *pinned_notice_posts],
+                user=request.user,
+                label='post feed first page',
+            )
+            return page_obj, pinned_notice_posts
+
+        return get_cached_post_feed_value(f'first:{feed_scope}:{page_size}', _build_first_page)
+
+    pinned_notice_posts = get_cached_post_feed_value(
+        f'pinned:{feed_scope}',
+        lambda: _build_pinned_notice_posts(request, feed_scope),
+    )
+    page_obj = _build_page()
+    _attach_teacher_buddy_avatar_context_safe(
+        page_obj.object_list,
+        user=request.user,
+        label='post feed page',
+    )
+    return page_obj, pinned_notice_posts
+
+
 def _get_home_layout_version():
     raw_version = str(getattr(settings, 'HOME_LAYOUT_VERSION', '') or '').strip().lower()
     if raw_version in {'v1', 'v2', 'v4', 'v5', 'v6'}:
@@ -5541,7 +5603,7 @@ def _build_home_surface_calendar_provider(request):
         return _build_home_surface_calendar_fallback(request)
 
 
-def _build_home_surface_provider_registry(request, *, favorite_products, product_list):
+def _build_home_surface_provider_registry(request, *, favorite_products, product_list, teacher_buddy_context=None):
     # Keep provider definitions centralized so the home surface can add/remove cards
     # without reshaping the view contract or touching the templates.
     return (
@@ -5568,7 +5630,11 @@ def _build_home_surface_provider_registry(request, *, favorite_products, product
                     source='teacher buddy provider registry fallback',
                 ),
             },
-            builder=lambda: _build_home_surface_teacher_buddy_provider(request.user),
+            builder=lambda: (
+                teacher_buddy_context
+                if teacher_buddy_context is not None
+                else _build_home_surface_teacher_buddy_provider(request.user)
+            ),
         ),
         HomeSurfaceProviderSpec(
             key='quickdrop_home_card',
@@ -5589,12 +5655,13 @@ def _build_home_surface_provider_registry(request, *, favorite_products, product
     )
 
 
-def _build_home_surface_provider_cards(request, *, favorite_products, product_list):
+def _build_home_surface_provider_cards(request, *, favorite_products, product_list, teacher_buddy_context=None):
     provider_values = {}
     for provider_spec in _build_home_surface_provider_registry(
         request,
         favorite_products=favorite_products,
         product_list=product_list,
+        teacher_buddy_context=teacher_buddy_context,
     ):
         provider_values[provider_spec.key] = _build_home_surface_safe_value(
             request,
@@ -5722,54 +5789,146 @@ def _build_home_surface_frontend_config(*, favorite_product_ids=()):
     }
 
 
-def build_home_surface_context(
-    request,
-    *,
-    products,
-    page_obj,
-    pinned_notice_posts,
-    feed_scope,
-    home_design_version,
-):
-    product_list = _build_home_surface_safe_value(
-        request,
-        label='product launch meta',
-        fallback_factory=list,
-        builder=lambda: _attach_product_launch_meta(list(products), user=request.user),
+def _build_home_catalog_snapshot(request, products, *, label_prefix='', include_nav_sections=True):
+    """Build the user-independent part of the home surface for one audience."""
+    failed_labels = []
+
+    def _safe(label, fallback_factory, builder):
+        def _fallback():
+            failed_labels.append(label)
+            return fallback_factory()
+
+        return _build_home_surface_safe_value(
+            request,
+            label=f'{label_prefix}{label}',
+            fallback_factory=_fallback,
+            builder=builder,
+        )
+
+    products = list(products)
+    product_list = _safe(
+        'product launch meta',
+        list,
+        lambda: _attach_product_launch_meta(products, user=request.user),
     )
     section_product_list = [
         product
         for product in product_list
         if str(getattr(product, 'launch_route_name', '') or '').strip().lower() != 'messagebox:main'
     ]
-    sections, aux_sections, games = _build_home_surface_safe_value(
-        request,
-        label='purpose sections',
-        fallback_factory=lambda: ([], [], []),
-        builder=lambda: get_purpose_sections(
+    sections, aux_sections, games = _safe(
+        'purpose sections',
+        lambda: ([], [], []),
+        lambda: get_purpose_sections(
             section_product_list,
             preview_limit=2,
         ),
     )
-    primary_display_sections, secondary_display_sections = _build_home_surface_safe_value(
-        request,
-        label='display groups',
-        fallback_factory=lambda: ([], []),
-        builder=lambda: _build_home_display_groups(sections, aux_sections),
+    primary_display_sections, secondary_display_sections = _safe(
+        'display groups',
+        lambda: ([], []),
+        lambda: _build_home_display_groups(sections, aux_sections),
+    )
+    home_nav_sections = None
+    if include_nav_sections:
+        home_nav_sections = _safe(
+            'navigation sections',
+            list,
+            lambda: _ensure_home_direct_nav_sections(
+                _build_home_nav_sections(
+                    primary_display_sections,
+                    secondary_display_sections,
+                    games,
+                ),
+                product_list,
+            ),
+        )
+    return {
+        'products': products,
+        'product_list': product_list,
+        'sections': sections,
+        'aux_sections': aux_sections,
+        'games': games,
+        'primary_display_sections': primary_display_sections,
+        'secondary_display_sections': secondary_display_sections,
+        'home_nav_sections': home_nav_sections,
+        'cacheable': not failed_labels and len(product_list) == len(products),
+    }
+
+
+def _load_home_catalog_snapshot(request, products, *, audience, label_prefix=''):
+    catalog = get_home_catalog_snapshot(
+        audience,
+        lambda: _build_home_catalog_snapshot(
+            request,
+            products,
+            label_prefix=label_prefix,
+            include_nav_sections=audience == HOME_CATALOG_AUDIENCE_AUTHENTICATED,
+        ),
     )
-    home_nav_sections = _build_home_surface_safe_value(
+    # The service launcher context processor can reuse the snapshot rows instead
+    # of evaluating the product queryset again.
+    prime_service_launcher_products(request, catalog['products'])
+    return catalog
+
+
+def _resolve_home_overlay_products(product_ids, product_by_id):
+    return [product_by_id[product_id] for product_id in product_ids if product_id in product_by_id]
+
+
+def _build_home_user_overlay(request, *, product_list):
+    """Per-user home state stored as product ids so it can be cached apart from the catalog."""
+    failed_labels = []
+
+    def _usage_fallback():
+        failed_labels.append('usage state')
+        return {
+            'favorite_products': [],
+            'recent_products': [],
+            'quick_actions': [],
+        }
+
+    UserProfile.objects.get_or_create(user=request.user)
+    usage_state = _build_home_surface_safe_value(
         request,
-        label='navigation sections',
-        fallback_factory=list,
-        builder=lambda: _ensure_home_direct_nav_sections(
-            _build_home_nav_sections(
-                primary_display_sections,
-                secondary_display_sections,
-                games,
-            ),
-            product_list,
+        label='usage state',
+        fallback_factory=_usage_fallback,
+        builder=lambda: _build_home_surface_usage_state(
+            request,
+            product_list=product_list,
         ),
     )
+    return {
+        'favorite_product_ids': [product.id for product in usage_state['favorite_products']],
+        'recent_product_ids': [product.id for product in usage_state['recent_products']],
+        'quick_action_product_ids': [product.id for product in usage_state['quick_actions']],
+        'teacher_buddy': _build_home_surface_teacher_buddy_provider(request.user),
+        'cacheable': not failed_labels,
+    }
+
+
+def build_home_surface_context(
+    request,
+    *,
+    products,
+    page_obj,
+    pinned_notice_posts,
+    feed_scope,
+    home_design_version,
+):
+    catalog = _load_home_catalog_snapshot(
+        request,
+        products,
+        audience=HOME_CATALOG_AUDIENCE_AUTHENTICATED,
+    )
+    products = catalog['products']
+    product_list = catalog['product_list']
+    sections = catalog['sections']
+    aux_sections = catalog['aux_sections']
+    games = catalog['games']
+    primary_display_sections = catalog['primary_display_sections']
+    secondary_display_sections = catalog['secondary_display_sections']
+    home_nav_sections = catalog['home_nav_sections']
     sns_summary_posts = _build_home_surface_safe_value(
         request,
         label='community summary',
@@ -5796,23 +5955,14 @@ def build_home_surface_context(
         'full_url': reverse('community_feed'),
     }
 
-    UserProfile.objects.get_or_create(user=request.user)
-    usage_state = _build_home_surface_safe_value(
-        request,
-        label='usage state',
-        fallback_factory=lambda: {
-            'favorite_products': [],
-            'recent_products': [],
-            'quick_actions': [],
-        },
-        builder=lambda: _build_home_surface_usage_state(
-            request,
-            product_list=product_list,
-        ),
+    user_overlay = get_home_user_overlay(
+        request.user,
+        lambda: _build_home_user_overlay(request, product_list=product_list),
     )
-    favorite_products = usage_state['favorite_products']
-    recent_products = usage_state['recent_products']
-    quick_actions = usage_state['quick_actions']
+    product_by_id = {product.id: product for product in product_list}
+    favorite_products = _resolve_home_overlay_products(user_overlay['favorite_product_ids'], product_by_id)
+    recent_products = _resolve_home_overlay_products(user_overlay['recent_product_ids'], product_by_id)
+    quick_actions = _resolve_home_overlay_products(user_overlay['quick_action_product_ids'], product_by_id)
 
     discovery_state = _build_home_surface_safe_value(
         request,
@@ -5880,6 +6030,7 @@ def build_home_surface_context(
         request,
         favorite_products=favorite_products,
         product_list=product_list,
+        teacher_buddy_context=user_overlay['teacher_buddy'],
     )
     schoolcomm_home_card = _build_home_surface_safe_value(
         request,
@@ -6077,33 +6228,19 @@ def build_guest_home_surface_context(
     feed_scope,
     home_design_version,
 ):
-    product_list = _build_home_surface_safe_value(
+    catalog = _load_home_catalog_snapshot(
         request,
-        label='guest product launch meta',
-        fallback_factory=list,
-        builder=lambda: _attach_product_launch_meta(list(products), user=request.user),
-    )
-
-    section_product_list = [
-        product
-        for product in product_list
-        if str(getattr(product, 'launch_route_name', '') or '').strip().lower() != 'messagebox:main'
-    ]
-    sections, aux_sections, games = _build_home_surface_safe_value(
-        request,
-        label='guest purpose sections',
-        fallback_factory=lambda: ([], [], []),
-        builder=lambda: get_purpose_sections(
-            section_product_list,
-            preview_limit=2,
-        ),
-    )
-    primary_display_sections, secondary_display_sections = _build_home_surface_safe_value(
-        request,
-        label='guest display groups',
-        fallback_factory=lambda: ([], [], []),
-        builder=lambda: _build_home_display_groups(sections, aux_sections),
-    )
+        products,
+        audience=HOME_CATALOG_AUDIENCE_GUEST,
+        label_prefix='guest ',
+    )
+    products = catalog['products']
+    product_list = catalog['product_list']
+    sections = catalog['sections']
+    aux_sections = catalog['aux_sections']
+    games = catalog['games']
+    primary_display_sections = catalog['primary_display_sections']
+    secondary_display_sections = catalog['secondary_display_sections']
     sns_summary_posts = _build_home_surface_safe_value(
         request,
         label='guest community summary',
@@ -6376,14 +6513,14 @@ def _home_guest_v6(request, products, posts, page_obj, feed_scope, pinned_notice
 def home(request):
     feed_scope = _get_post_feed_scope(request)
 
-    # SNS Posts - 모든 사용자에게 제공 (최신순 정렬)
-    posts = _build_post_feed_queryset(feed_scope=feed_scope)
-    pinned_notice_posts = _build_pinned_notice_queryset(feed_scope=feed_scope)
-
-    # 페이징 처리 (PC 우측 및 모바일 하단 SNS 위젯용)
-    paginator = Paginator(posts, 5) # 한 페이지에 5개씩
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # SNS Posts - 모든 사용자에게 제공 (최신순, cursor 기반 5개씩)
+    page_obj, pinned_notice_posts = _load_post_feed(
+        request,
+        feed_scope,
+        page_size=5,
+        cursor=request.GET.get(POST_FEED_CURSOR_PARAM, ''),
+    )
+    posts = page_obj.object_list
 
     # HTMX 요청이면 post_list 영역만 반환
     if request.headers.get('HX-Request'):
@@ -6392,22 +6529,9 @@ def home(request):
             page_obj,
             feed_scope,
             pinned_notice_posts=pinned_notice_posts,
+            avatars_attached=True,
         )
 
-    _build_teacher_buddy_avatar_context_safe(
-        request.user,
-        source='home main request',
-    )
-    _attach_teacher_buddy_avatar_context_safe(
-        getattr(page_obj, 'object_list', []),
-        user=request.user,
-        label='home main page posts',
-    )
-    _attach_teacher_buddy_avatar_context_safe(
-        pinned_notice_posts,
-        user=request.user,
-        label='home main pinned notices',
-    )
     # 홈 전체 렌더가 아닐 때는 서비스 런처용 제품 목록이 필요 없다.
     products = prime_service_launcher_products(
         request,
@@ -6430,11 +6554,20 @@ def community_feed(request):
             home_url = f"{home_url}?feed_scope={POST_FEED_SCOPE_NOTICE}"
         return redirect(f"{home_url}#home-community-section")
 
-    posts = _build_post_feed_queryset(feed_scope=feed_scope)
-    paginator = Paginator(posts, 10)
-    page_obj = paginator.get_page(request.GET.get('page'))
+    page_obj, pinned_notice_posts = _load_post_feed(
+        request,
+        feed_scope,
+        page_size=10,
+        cursor=request.GET.get(POST_FEED_CURSOR_PARAM, ''),
+    )
 
-    return _render_post_list_partial(request, page_obj, feed_scope)
+    return _render_post_list_partial(
+        request,
+        page_obj,
+        feed_scope,
+        pinned_notice_posts=pinned_notice_posts,
+        avatars_attached=True,
+    )
 
 
 @login_required
@@ -6499,10 +6632,14 @@ def post_create(request):
 
     if request.headers.get('HX-Request'):
         feed_scope = _get_post_feed_scope(request)
-        posts = _build_post_feed_queryset(feed_scope=feed_scope)
-        paginator = Paginator(posts, 5)
-        page_obj = paginator.get_page(1)
-        response = _render_post_list_partial(request, page_obj, feed_scope)
+        page_obj, pinned_notice_posts = _load_post_feed(request, feed_scope, page_size=5)
+        response = _render_post_list_partial(
+            request,
+            page_obj,
+            feed_scope,
+            pinned_notice_posts=pinned_notice_posts,
+            avatars_attached=True,
+        )
         if sns_reward_payload:
             response['HX-Trigger'] = json.dumps({'teacherBuddy:snsReward': sns_reward_payload})
         return response
@@ -8024,6 +8161,15 @@ def home_agent_quota_dismiss(request):
     )
 
 
+@require_GET
+@login_required
+def background_job_status(request, job_id):
+    job = get_object_or_404(BackgroundJob, pk=job_id, owner=request.user)
+    response = JsonResponse({'status': 'ok', 'job': serialize_background_job(job)})
+    response['Cache-Control'] = 'no-store, private'
+    return response
+
+
 @require_POST
 @login_required
 def teacher_buddy_draw(request):
@@ -8309,6 +8455,7 @@ def apply_workbench_bundle(request, bundle_id):
             if favorite.pin_order != order:
                 ProductFavorite.objects.filter(pk=favorite.pk).update(pin_order=order)
         ProductWorkbenchBundle.objects.filter(pk=bundle.pk).update(last_used_at=timezone.now())
+    bump_home_user_overlay_version(request.user.id)
 
     return JsonResponse({
         'status': 'ok',
@@ -8379,6 +8526,7 @@ def reorder_product_favorites(request):
             favorite = favorite_map[product_id]
             if favorite.pin_order != order:
                 ProductFavorite.objects.filter(pk=favorite.pk).update(pin_order=order)
+    bump_home_user_overlay_version(request.user.id)
 
     return JsonResponse({
         'status': 'ok',
@@ -0,0 +1,252 @@
+"""
+Buffered visitor / page-view ingestion.
+
+The tracking middleware only appends compact records to an in-process ring
+buffer. A background flusher drains the buffer every few seconds (or as soon
+as a batch fills up), dedupes records per (date, visitor_key[, path]) and
+writes them with a single upsert per table, so HTML GETs no longer pay for
+analytics round-trips.
+"""
+
+import atexit
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import PageViewLog, VisitorLog
+
+logger = logging.getLogger(__name__)
+
+RECORD_KIND_VISIT = "visit"
+RECORD_KIND_PAGE_VIEW = "page_view"
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_FLUSH_BATCH_SIZE = 200
+DEFAULT_BUFFER_MAX_RECORDS = 20000
+
+VISITOR_UPDATE_FIELDS = ["ip_address", "user", "identity_type", "user_agent", "is_bot"]
+PAGE_VIEW_UPDATE_FIELDS = ["user", "identity_type", "is_bot", "route_name"]
+
+
+@dataclass(frozen=True, slots=True)
+class VisitRecord:
+    kind: str
+    date: object
+    visitor_key: str
+    identity_type: str
+    user_id: int | None = None
+    session_visitor_key: str | None = None
+    is_bot: bool = False
+    ip_address: str = ""
+    user_agent: str = ""
+    path: str = ""
+    route_name: str = ""
+
+
+def is_buffered_ingestion_enabled():
+    return bool(getattr(settings, "VISITOR_TRACKING_BUFFERED", False))
+
+
+def _get_flush_interval():
+    return float(getattr(settings, "VISITOR_TRACKING_FLUSH_INTERVAL_SECONDS", DEFAULT_FLUSH_INTERVAL_SECONDS))
+
+
+def _get_flush_batch_size():
+    return max(1, int(getattr(settings, "VISITOR_TRACKING_FLUSH_BATCH_SIZE", DEFAULT_FLUSH_BATCH_SIZE)))
+
+
+def _get_buffer_max_records():
+    return max(1, int(getattr(settings, "VISITOR_TRACKING_BUFFER_MAX_RECORDS", DEFAULT_BUFFER_MAX_RECORDS)))
+
+
+def _needs_user_migration(record):
+    return (
+        record.identity_type == VisitorLog.IDENTITY_USER
+        and bool(record.session_visitor_key)
+        and record.session_visitor_key != record.visitor_key
+    )
+
+
+def _dedupe_records(records):
+    """
+    Collapse records to the last write per unique key, folding anonymous
+    session rows into the user row when the same browser logged in.
+    """
+    visits = {}
+    page_views = {}
+    visit_migrations = set()
+    page_view_migrations = set()
+
+    for record in records:
+        if record.kind == RECORD_KIND_VISIT:
+            if _needs_user_migration(record):
+                stale_key = (record.date, record.session_visitor_key)
+                visits.pop(stale_key, None)
+                visit_migrations.add(stale_key)
+            visits[(record.date, record.visitor_key)] = record
+        elif record.kind == RECORD_KIND_PAGE_VIEW:
+            if _needs_user_migration(record):
+                stale_key = (record.date, record.session_visitor_key, record.path)
+                page_views.pop(stale_key, None)
+                page_view_migrations.add(stale_key)
+            page_views[(record.date, record.visitor_key, record.path)] = record
+
+    visit_migrations.difference_update(visits.keys())
+    page_view_migrations.difference_update(page_views.keys())
+    return visits, page_views, visit_migrations, page_view_migrations
+
+
+def _delete_migrated_session_rows(visit_migrations, page_view_migrations):
+    for visit_date, session_visitor_key in visit_migrations:
+        VisitorLog.objects.filter(
+            visit_date=visit_date,
+            visitor_key=session_visitor_key,
+            is_bot=False,
+        ).delete()
+    for view_date, session_visitor_key, path in page_view_migrations:
+        PageViewLog.objects.filter(
+            view_date=view_date,
+            visitor_key=session_visitor_key,
+            path=path,
+            is_bot=False,
+        ).delete()
+
+
+def write_visit_records(records):
+    """Dedupe and upsert a batch of records. Returns (visits, page_views) written."""
+    visits, page_views, visit_migrations, page_view_migrations = _dedupe_records(records)
+    if not (visits or page_views or visit_migrations or page_view_migrations):
+        return 0, 0
+
+    visitor_logs = [
+        VisitorLog(
+            visit_date=record.date,
+            visitor_key=record.visitor_key,
+            identity_type=record.identity_type,
+            user_id=record.user_id,
+            ip_address=record.ip_address or "0.0.0.0",
+            user_agent=record.user_agent,
+            is_bot=record.is_bot,
+        )
+        for record in visits.values()
+    ]
+    page_view_logs = [
+        PageViewLog(
+            view_date=record.date,
+            visitor_key=record.visitor_key,
+            identity_type=record.identity_type,
+            user_id=record.user_id,
+            is_bot=record.is_bot,
+            path=record.path,
+            route_name=record.route_name,
+        )
+        for record in page_views.values()
+    ]
+
+    with transaction.atomic():
+        _delete_migrated_session_rows(visit_migrations, page_view_migrations)
+        if visitor_logs:
+            VisitorLog.objects.bulk_create(
+                visitor_logs,
+                update_conflicts=True,
+                unique_fields=["visit_date", "visitor_key"],
+                update_fields=VISITOR_UPDATE_FIELDS,
+            )
+        if page_view_logs:
+            PageViewLog.objects.bulk_create(
+                page_view_logs,
+                update_conflicts=True,
+                unique_fields=["view_date", "visitor_key", "path"],
+                update_fields=PAGE_VIEW_UPDATE_FIELDS,
+            )
+    return len(visitor_logs), len(page_view_logs)
+
+
+class VisitRecordBuffer:
+    """Bounded ring buffer drained by a lazily started daemon flusher thread."""
+
+    def __init__(self, *, max_records=None):
+        self._records = deque(maxlen=max_records or _get_buffer_max_records())
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.dropped_count = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, record):
+        with self._lock:
+            if len(self._records) == self._records.maxlen:
+                self.dropped_count += 1
+            self._records.append(record)
+            pending = len(self._records)
+        if pending >= _get_flush_batch_size():
+            self._wakeup.set()
+        self._ensure_flusher()
+
+    def drain(self):
+        with self._lock:
+            records = list(self._records)
+            self._records.clear()
+        return records
+
+    def flush(self):
+        with self._flush_lock:
+            records = self.drain()
+            if not records:
+                return 0, 0
+            try:
+                return write_visit_records(records)
+            except Exception as exc:
+                logger.error("[VISITOR] buffered flush failed records=%s error=%s", len(records), exc, exc_info=True)
+                return 0, 0
+
+    def _ensure_flusher(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="visitor-ingest-flusher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        from django.db import close_old_connections
+
+        while True:
+            self._wakeup.wait(timeout=_get_flush_interval())
+            self._wakeup.clear()
+            close_old_connections()
+            self.flush()
+
+
+_buffer = VisitRecordBuffer()
+
+
+def get_visit_buffer():
+    return _buffer
+
+
+def enqueue_visit_record(record):
+    """Buffer a record, or write it straight away when buffering is disabled."""
+    if not is_buffered_ingestion_enabled():
+        write_visit_records([record])
+        return
+    _buffer.append(record)
+
+
+def flush_visit_buffer():
+    return _buffer.flush()
+
+
+atexit.register(flush_visit_buffer)
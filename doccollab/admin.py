@@ -5,6 +5,7 @@ from .models import (
     DocAssistantQuestion,
     DocEditEvent,
     DocGeneratedDraft,
+    DocLiveState,
     DocMembership,
     DocPresence,
     DocRevision,
@@ -70,6 +71,12 @@ class DocSnapshotAdmin(admin.ModelAdmin):
     search_fields = ("room__title",)
 
 
+@admin.register(DocLiveState)
+class DocLiveStateAdmin(admin.ModelAdmin):
+    list_display = ("room", "base_revision", "last_seq", "compacted_seq", "updated_at")
+    search_fields = ("room__title",)
+
+
 @admin.register(DocEditEvent)
 class DocEditEventAdmin(admin.ModelAdmin):
     list_display = ("room", "display_name", "command_type", "summary", "created_at")
@@ -0,0 +1,309 @@
+"""
+Operational transform for doccollab live command batches.
+
+Commands are the rhwp-studio editor commands that the room page relays
+(``insert_text``, ``delete_text``, ``split_paragraph`` ...). Positions are
+``DocumentPosition`` dicts: body positions use ``paragraphIndex``/``charOffset``
+and single-level table cells add ``parentParaIndex``/``controlIndex``/
+``cellIndex``/``cellParaIndex``.
+
+``transform_commands(incoming, applied)`` rebases a batch that was built
+against an older room sequence onto the commands other editors already
+appended in between. Earlier-sequenced commands win ties, so every client
+that replays the server log in sequence order ends up with the same text.
+
+The server does not know paragraph lengths, so merging a paragraph into the
+previous one (backspace at a paragraph start) keeps the merged text's offsets
+unchanged; nested tables, text boxes and table structure commands
+(row/column insert/delete) pass through untouched.
+"""
+
+import copy
+
+RANGE_COMMAND_TYPES = {"delete_text", "delete_selection"}
+
+
+def _as_int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _text_length(text):
+    # Editor offsets are UTF-16 code units, like JavaScript string lengths.
+    return len(str(text or "").encode("utf-16-le")) // 2
+
+
+def _read_point(position):
+    """Return ``(scope, paragraph, offset)`` or ``None`` for positions we cannot place."""
+    if not isinstance(position, dict) or position.get("isTextBox"):
+        return None
+    cell_path = position.get("cellPath") or []
+    if len(cell_path) > 1:
+        return None
+    section = _as_int(position.get("sectionIndex"))
+    offset = _as_int(position.get("charOffset"))
+    if position.get("parentParaIndex") is None:
+        return (section, None), _as_int(position.get("paragraphIndex")), offset
+    anchor = (
+        _as_int(position.get("parentParaIndex")),
+        _as_int(position.get("controlIndex")),
+        _as_int(position.get("cellIndex")),
+    )
+    return (section, anchor), _as_int(position.get("cellParaIndex")), offset
+
+
+def _write_point(position, point):
+    updated = copy.deepcopy(position)
+    (section, anchor), paragraph, offset = point
+    updated["charOffset"] = offset
+    if anchor is None:
+        updated["paragraphIndex"] = paragraph
+        return updated
+    updated["parentParaIndex"] = anchor[0]
+    updated["cellParaIndex"] = paragraph
+    cell_path = updated.get("cellPath")
+    if isinstance(cell_path, list) and cell_path and isinstance(cell_path[0], dict):
+        cell_path[0]["cellParaIndex"] = paragraph
+    return updated
+
+
+def _command_edit(command):
+    """Describe how ``command`` moves text, or ``None`` when it does not move any."""
+    command_type = command.get("type")
+    if command_type in {"insert_text", "insert_tab"} or (
+        command_type == "table_cell_text" and command.get("action") != "delete"
+    ):
+        point = _read_point(command.get("position"))
+        length = 1 if command_type == "insert_tab" else _text_length(command.get("text"))
+        if point is None or length <= 0:
+            return None
+        return ("insert", point, length)
+    if command_type in {"delete_text", "delete_selection", "table_cell_text"}:
+        bounds = _command_range(command)
+        return ("delete", *bounds) if bounds else None
+    if command_type == "split_paragraph":
+        point = _read_point(command.get("position"))
+        return ("split", point) if point else None
+    if command_type == "merge_paragraph":
+        return _join_edit(command)
+    return None
+
+
+def _join_edit(command):
+    point = _read_point(command.get("position"))
+    if point is None:
+        return None
+    scope, paragraph, offset = point
+    if command.get("action") == "delete":
+        # Delete at the end of ``paragraph`` pulls the next paragraph up to ``offset``.
+        return ("join", scope, paragraph, offset)
+    if paragraph <= 0:
+        return None
+    return ("join", scope, paragraph - 1, None)
+
+
+def _command_range(command):
+    if command.get("type") == "delete_selection":
+        start = _read_point(command.get("start"))
+        end = _read_point(command.get("end"))
+        if start is None or end is None or start[0] != end[0]:
+            return None
+        if (end[1], end[2]) < (start[1], start[2]):
+            start, end = end, start
+        return start, end
+    point = _read_point(command.get("position"))
+    if point is None:
+        return None
+    scope, paragraph, offset = point
+    count = max(0, _as_int(command.get("count"), 1))
+    if command.get("direction") == "backward":
+        start_offset = max(0, offset - count)
+    else:
+        start_offset = offset
+    return (scope, paragraph, start_offset), (scope, paragraph, start_offset + count)
+
+
+def _before(left, right):
+    return (left[1], left[2]) < (right[1], right[2])
+
+
+def _map_anchor(scope, edit):
+    """Shift a table cell's anchor paragraph when the body around it changes."""
+    section, anchor = scope
+    if anchor is None:
+        return scope
+    anchor_point = ((section, None), anchor[0], 0)
+    mapped = _map_point(anchor_point, edit, after_ties=False)
+    if mapped[1] == anchor[0]:
+        return scope
+    return section, (mapped[1], anchor[1], anchor[2])
+
+
+def _map_point(point, edit, *, after_ties):
+    scope, paragraph, offset = point
+    kind = edit[0]
+    edit_scope = edit[1][0] if kind in {"insert", "delete", "split"} else edit[1]
+    if scope != edit_scope:
+        if scope[0] == edit_scope[0] and edit_scope[1] is None and scope[1] is not None:
+            return _map_anchor(scope, edit), paragraph, offset
+        return point
+
+    if kind == "insert":
+        _, (_, at_paragraph, at_offset), length = edit
+        if paragraph == at_paragraph and (offset > at_offset or (offset == at_offset and after_ties)):
+            return scope, paragraph, offset + length
+        return point
+
+    if kind == "delete":
+        _, start, end = edit
+        if not _before(start, point):
+            return point
+        if not _before(end, point):
+            return start
+        if paragraph == end[1]:
+            return scope, start[1], start[2] + offset - end[2]
+        return scope, paragraph - (end[1] - start[1]), offset
+
+    if kind == "split":
+        _, (_, at_paragraph, at_offset) = edit
+        if paragraph > at_paragraph:
+            return scope, paragraph + 1, offset
+        if paragraph == at_paragraph and (offset > at_offset or (offset == at_offset and after_ties)):
+            return scope, paragraph + 1, offset - at_offset
+        return point
+
+    # join: ``at_paragraph + 1`` is appended to ``at_paragraph`` at ``join_offset``.
+    _, _, at_paragraph, join_offset = edit
+    if paragraph == at_paragraph + 1:
+        return scope, at_paragraph, (join_offset or 0) + offset
+    if paragraph > at_paragraph + 1:
+        return scope, paragraph - 1, offset
+    return point
+
+
+def _range_command(command, start, end):
+    if not _before(start, end):
+        return None
+    updated = copy.deepcopy(command)
+    if command.get("type") == "delete_selection" or start[1] != end[1]:
+        original_start = command.get("start") or command.get("position") or {}
+        original_end = command.get("end") or command.get("position") or {}
+        updated.pop("position", None)
+        updated.pop("count", None)
+        updated.pop("direction", None)
+        updated.pop("deletedText", None)
+        updated["type"] = "delete_selection"
+        updated["start"] = _write_point(original_start, start)
+        updated["end"] = _write_point(original_end, end)
+        return updated
+    count = end[2] - start[2]
+    if count != _as_int(command.get("count"), 1):
+        updated.pop("deletedText", None)
+    updated["position"] = _write_point(command.get("position") or {}, start)
+    updated["count"] = count
+    updated["direction"] = "forward"
+    return updated
+
+
+def _transform_range(command, edit, bounds):
+    start, end = bounds
+    kind = edit[0]
+    if kind in {"insert", "split"}:
+        at = edit[1]
+        if at[0] == start[0] and _before(start, at) and _before(at, end):
+            # The other editor typed or split inside the range: keep their
+            # change and delete both sides of it, later piece first.
+            if kind == "insert":
+                resume = (at[0], at[1], at[2] + edit[2])
+            else:
+                resume = (at[0], at[1] + 1, 0)
+            tail_end = _map_point(end, edit, after_ties=False)
+            pieces = [_range_command(command, resume, tail_end), _range_command(command, start, at)]
+            return [piece for piece in pieces if piece is not None]
+    mapped = _range_command(
+        command,
+        _map_point(start, edit, after_ties=True),
+        _map_point(end, edit, after_ties=False),
+    )
+    return [mapped] if mapped is not None else []
+
+
+def transform_command(command, against, *, after_ties=True):
+    """
+    Return ``command`` rewritten to apply after ``against``, as a list because
+    a delete may split in two or vanish. ``after_ties`` decides who goes first
+    when both touch the same offset.
+    """
+    edit = _command_edit(against)
+    if edit is None:
+        return [command]
+
+    own_edit = _command_edit(command)
+    if own_edit is not None and own_edit[0] == "join":
+        scope, paragraph = own_edit[1], own_edit[2]
+        if edit[0] == "join" and (edit[1], edit[2]) == (scope, paragraph):
+            # Both editors removed the same paragraph break.
+            return []
+        if edit[0] == "delete" and edit[1][0] == scope and edit[1][1] <= paragraph < edit[2][1]:
+            # The other editor's selection delete already removed this break.
+            return []
+
+    if command.get("type") in RANGE_COMMAND_TYPES or (
+        command.get("type") == "table_cell_text" and command.get("action") == "delete"
+    ):
+        bounds = _command_range(command)
+        if bounds is None:
+            return [command]
+        return _transform_range(command, edit, bounds)
+
+    point = _read_point(command.get("position"))
+    if point is None:
+        return [command]
+    if own_edit is not None and own_edit[0] == "join" and own_edit[3] is not None:
+        # A forward merge sits at the paragraph end, so text typed there lands before it.
+        after_ties = True
+    mapped = _map_point(point, edit, after_ties=after_ties)
+    if mapped == point:
+        return [command]
+    updated = copy.deepcopy(command)
+    updated["position"] = _write_point(command["position"], mapped)
+    return [updated]
+
+
+def _transform_lists(incoming, applied):
+    """
+    Transform two concurrent command lists against each other.
+
+    Returns ``(incoming', applied')`` where ``incoming'`` applies after
+    ``applied`` and ``applied'`` applies after ``incoming``. ``applied`` wins ties.
+    """
+    incoming_out = []
+    for command in incoming:
+        current = [command]
+        applied_out = []
+        for op in applied:
+            if not current:
+                applied_out.append(op)
+                continue
+            if len(current) == 1:
+                next_current = transform_command(current[0], op, after_ties=True)
+                next_op = transform_command(op, current[0], after_ties=False)
+            else:
+                next_current, next_op = _transform_lists(current, [op])
+            current = next_current
+            applied_out.extend(next_op)
+        applied = applied_out
+        incoming_out.extend(current)
+    return incoming_out, applied
+
+
+def transform_commands(incoming, applied):
+    """Rebase ``incoming`` commands onto the already-sequenced ``applied`` commands."""
+    incoming = [command for command in incoming or [] if isinstance(command, dict)]
+    applied = [command for command in applied or [] if isinstance(command, dict)]
+    if not incoming or not applied:
+        return incoming
+    transformed, _ = _transform_lists(incoming, applied)
+    return transformed
@@ -1,12 +1,20 @@
+import asyncio
+import logging
+from time import monotonic
+
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
 
 from .models import DocEditEvent, DocMembership
 from .services import (
+    advance_edit_history_head,
     append_room_command_batch,
+    build_edit_events,
     display_name_for_user,
+    edit_history_head,
+    flush_edit_events,
     get_room_for_user,
-    record_edit_events,
     room_group_name,
     serialize_edit_event,
     serialize_edit_history,
@@ -16,8 +24,23 @@ from .services import (
     update_presence,
 )
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_EDIT_EVENT_FLUSH_SECONDS = 2.0
+DEFAULT_EDIT_EVENT_FLUSH_BATCH_SIZE = 50
+DEFAULT_PRESENCE_HEARTBEAT_SECONDS = 30.0
+
 
 class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Presence heartbeats are written at most once per
+    ``DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS`` per connection, edit events are
+    buffered and bulk-inserted, and edit history goes out as deltas of the newest
+    group that every consumer in the room keeps in memory.
+    """
+
+    pending_edit_events = None
+    history_head = None
     async def connect(self):
         user = self.scope.get("user")
         self.room_id = self.scope["url_route"]["kwargs"]["room_id"]
@@ -32,9 +55,13 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
         self.membership = membership
         self.group_name = room_group_name(room)
         self.session_key = self.channel_name
+        self.pending_edit_events = []
+        self.flush_task = None
+        self.presence_written_at = None
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
         await self._touch_presence(True)
+        self.history_head = await self._load_history_head()
         await self.send_json(
             {
                 "type": "room.snapshot",
@@ -59,6 +86,7 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
         if hasattr(self, "group_name"):
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
         if hasattr(self, "room"):
+            await self._flush_edit_events()
             await self._touch_presence(False)
             await self.channel_layer.group_send(
                 self.group_name,
@@ -74,20 +102,21 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
     async def receive_json(self, content, **kwargs):
         event_type = content.get("type")
         if event_type == "ping":
-            await self._touch_presence(True)
+            await self._heartbeat()
             await self.send_json({"type": "pong", "payload": {}})
             return
         if event_type == "editor.command":
             if self.membership.role not in {DocMembership.Role.OWNER, DocMembership.Role.EDITOR}:
                 await self.send_json({"type": "error", "payload": {"message": "editor only"}})
                 return
-            await self._touch_presence(True)
+            await self._heartbeat()
             payload = content.get("payload", {}) or {}
             commands = payload.get("commands") or []
             state, accepted, reason = await self._append_command_batch(
                 {
                     "batchId": payload.get("batchId"),
                     "baseRevisionId": payload.get("baseRevisionId"),
+                    "baseSeq": payload.get("baseSeq"),
                     "senderSessionKey": payload.get("senderSessionKey") or self.session_key,
                     "commands": commands,
                     "selection": payload.get("selection") or {},
@@ -98,29 +127,35 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
                     return
                 await self.send_json({"type": "error", "payload": {"message": reason or "invalid command batch"}})
                 return
-            event_payload = await self._record_edit_events(commands)
+            update = state.get("update") or {}
+            event_payload = await self._record_edit_events(commands, state.get("base_revision_id"))
             await self.channel_layer.group_send(
                 self.group_name,
                 {
                     "type": "doccollab.event",
+                    "history_head": self.history_head,
                     "message": {
                         "type": "editor.command",
                         "payload": {
                             "batchId": payload.get("batchId"),
+                            "seq": state.get("seq"),
+                            "baseSeq": update.get("baseSeq"),
                             "baseRevisionId": payload.get("baseRevisionId") or state.get("base_revision_id"),
                             "senderSessionKey": payload.get("senderSessionKey") or self.session_key,
                             "sender": display_name_for_user(self.scope.get("user")),
-                            "commands": commands,
+                            "commands": update.get("commands", commands),
+                            "transformed": bool(update.get("transformed")),
+                            "checkpointDue": bool(state.get("checkpoint_due")),
                             "selection": payload.get("selection") or {},
                             "edit_events": event_payload["edit_events"],
-                            "edit_history": event_payload["edit_history"],
+                            "edit_history_delta": event_payload["edit_history_delta"],
                         },
                     },
                 },
             )
             return
         if event_type == "editor.selection":
-            await self._touch_presence(True)
+            await self._heartbeat()
             payload = content.get("payload", {}) or {}
             await self.channel_layer.group_send(
                 self.group_name,
@@ -141,7 +176,8 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
             if self.membership.role not in {DocMembership.Role.OWNER, DocMembership.Role.EDITOR}:
                 await self.send_json({"type": "error", "payload": {"message": "editor only"}})
                 return
-            await self._touch_presence(True)
+            await self._heartbeat()
+            await self._flush_edit_events()
             payload = content.get("payload", {}) or {}
             revision_payload = await self._revision_payload(
                 payload.get("revisionId"),
@@ -150,10 +186,12 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
             if revision_payload is None:
                 await self.send_json({"type": "error", "payload": {"message": "invalid revision"}})
                 return
+            self.history_head = await self._load_history_head()
             await self.channel_layer.group_send(
                 self.group_name,
                 {
                     "type": "doccollab.event",
+                    "history_head": self.history_head,
                     "message": {
                         "type": "revision.saved",
                         "payload": revision_payload,
@@ -164,24 +202,76 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
         await self.send_json({"type": "error", "payload": {"message": "unsupported event"}})
 
     async def doccollab_event(self, event):
+        if "history_head" in event:
+            self.history_head = event["history_head"]
         await self.send_json(event["message"])
 
+    async def _heartbeat(self):
+        interval = getattr(settings, "DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS", DEFAULT_PRESENCE_HEARTBEAT_SECONDS)
+        if self.presence_written_at is not None and monotonic() - self.presence_written_at < interval:
+            return
+        await self._touch_presence(True)
+
+    async def _record_edit_events(self, commands, base_revision_id):
+        events = build_edit_events(
+            room=self.room,
+            user=self.scope.get("user"),
+            display_name=display_name_for_user(self.scope.get("user")),
+            commands=commands,
+            base_revision_id=base_revision_id,
+        )
+        self.history_head, delta = advance_edit_history_head(self.history_head, events)
+        self.pending_edit_events.extend(events)
+        flush_seconds = getattr(settings, "DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS", DEFAULT_EDIT_EVENT_FLUSH_SECONDS)
+        batch_size = getattr(settings, "DOCCOLLAB_EDIT_EVENT_FLUSH_BATCH_SIZE", DEFAULT_EDIT_EVENT_FLUSH_BATCH_SIZE)
+        if flush_seconds <= 0 or len(self.pending_edit_events) >= batch_size:
+            await self._flush_edit_events()
+        elif self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self._flush_edit_events_later(flush_seconds))
+        return {
+            "edit_events": [serialize_edit_event(event) for event in events],
+            "edit_history_delta": delta,
+        }
+
+    async def _flush_edit_events_later(self, delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+        self.flush_task = None
+        await self._flush_edit_events()
+
+    async def _flush_edit_events(self):
+        if self.flush_task is not None and self.flush_task is not asyncio.current_task():
+            self.flush_task.cancel()
+        self.flush_task = None
+        events, self.pending_edit_events = self.pending_edit_events or [], []
+        if not events:
+            return
+        try:
+            await database_sync_to_async(flush_edit_events)(events)
+        except Exception:
+            logger.exception("doccollab edit-event flush failed for room=%s count=%s", self.room_id, len(events))
+
     @database_sync_to_async
     def _resolve_room(self, user):
         return get_room_for_user(self.room_id, user)
 
     @database_sync_to_async
     def _build_snapshot(self):
-        fresh_room, fresh_membership = get_room_for_user(self.room_id, self.scope.get("user"))
-        return serialize_room(fresh_room, membership=fresh_membership)
+        return serialize_room(self.room, membership=self.membership)
 
     @database_sync_to_async
     def _presence_payload(self):
-        fresh_room, _membership = get_room_for_user(self.room_id, self.scope.get("user"))
-        return serialize_presence_list(fresh_room)
+        return serialize_presence_list(self.room)
+
+    @database_sync_to_async
+    def _load_history_head(self):
+        return edit_history_head(self.room)
 
     @database_sync_to_async
     def _touch_presence(self, connected):
+        self.presence_written_at = monotonic()
         update_presence(
             room=self.room,
             user=self.scope.get("user"),
@@ -195,19 +285,6 @@ class DoccollabRoomConsumer(AsyncJsonWebsocketConsumer):
     def _append_command_batch(self, batch):
         return append_room_command_batch(self.room, batch)
 
-    @database_sync_to_async
-    def _record_edit_events(self, commands):
-        events = record_edit_events(
-            room=self.room,
-            user=self.scope.get("user"),
-            display_name=display_name_for_user(self.scope.get("user")),
-            commands=commands,
-        )
-        return {
-            "edit_events": [serialize_edit_event(event) for event in events],
-            "edit_history": serialize_edit_history(self.room, limit=10),
-        }
-
     @database_sync_to_async
     def _revision_payload(self, revision_id, fallback_edit_events=None):
         if not revision_id:
@@ -0,0 +1,342 @@
+// Client copy of doccollab/collab_ot.py. The room client rebases peer batches
+// over its unacknowledged local batches with the same rules the server uses to
+// rebase those local batches, so both ends of a concurrent edit converge.
+// Keep the two files in step; test_collab_engine compares them case by case.
+
+const RANGE_COMMAND_TYPES = new Set(["delete_text", "delete_selection"]);
+
+function asInt(value, fallback = 0) {
+  if (typeof value === "number") {
+    return Number.isFinite(value) ? Math.trunc(value) : fallback;
+  }
+  if (typeof value === "boolean") {
+    return Number(value);
+  }
+  if (typeof value === "string" && /^\s*[+-]?\d+\s*$/.test(value)) {
+    return Number.parseInt(value, 10);
+  }
+  return fallback;
+}
+
+function textLength(text) {
+  // Editor offsets are UTF-16 code units, which is what String#length counts.
+  return String(text || "").length;
+}
+
+function clone(value) {
+  return JSON.parse(JSON.stringify(value));
+}
+
+function isObject(value) {
+  return Boolean(value) && typeof value === "object" && !Array.isArray(value);
+}
+
+function sameScope(left, right) {
+  return JSON.stringify(left) === JSON.stringify(right);
+}
+
+function samePoint(left, right) {
+  return sameScope(left[0], right[0]) && left[1] === right[1] && left[2] === right[2];
+}
+
+function readPoint(position) {
+  if (!isObject(position) || position.isTextBox) {
+    return null;
+  }
+  const cellPath = position.cellPath || [];
+  if (cellPath.length > 1) {
+    return null;
+  }
+  const section = asInt(position.sectionIndex);
+  const offset = asInt(position.charOffset);
+  if (position.parentParaIndex == null) {
+    return [[section, null], asInt(position.paragraphIndex), offset];
+  }
+  const anchor = [asInt(position.parentParaIndex), asInt(position.controlIndex), asInt(position.cellIndex)];
+  return [[section, anchor], asInt(position.cellParaIndex), offset];
+}
+
+function writePoint(position, point) {
+  const updated = clone(position);
+  const [[, anchor], paragraph, offset] = point;
+  updated.charOffset = offset;
+  if (anchor === null) {
+    updated.paragraphIndex = paragraph;
+    return updated;
+  }
+  updated.parentParaIndex = anchor[0];
+  updated.cellParaIndex = paragraph;
+  if (Array.isArray(updated.cellPath) && isObject(updated.cellPath[0])) {
+    updated.cellPath[0].cellParaIndex = paragraph;
+  }
+  return updated;
+}
+
+function commandEdit(command) {
+  const commandType = command.type;
+  if (
+    commandType === "insert_text"
+    || commandType === "insert_tab"
+    || (commandType === "table_cell_text" && command.action !== "delete")
+  ) {
+    const point = readPoint(command.position);
+    const length = commandType === "insert_tab" ? 1 : textLength(command.text);
+    if (point === null || length <= 0) {
+      return null;
+    }
+    return ["insert", point, length];
+  }
+  if (commandType === "delete_text" || commandType === "delete_selection" || commandType === "table_cell_text") {
+    const bounds = commandRange(command);
+    return bounds ? ["delete", ...bounds] : null;
+  }
+  if (commandType === "split_paragraph") {
+    const point = readPoint(command.position);
+    return point ? ["split", point] : null;
+  }
+  if (commandType === "merge_paragraph") {
+    return joinEdit(command);
+  }
+  return null;
+}
+
+function joinEdit(command) {
+  const point = readPoint(command.position);
+  if (point === null) {
+    return null;
+  }
+  const [scope, paragraph, offset] = point;
+  if (command.action === "delete") {
+    // Delete at the end of ``paragraph`` pulls the next paragraph up to ``offset``.
+    return ["join", scope, paragraph, offset];
+  }
+  if (paragraph <= 0) {
+    return null;
+  }
+  return ["join", scope, paragraph - 1, null];
+}
+
+function commandRange(command) {
+  if (command.type === "delete_selection") {
+    let start = readPoint(command.start);
+    let end = readPoint(command.end);
+    if (start === null || end === null || !sameScope(start[0], end[0])) {
+      return null;
+    }
+    if (before(end, start)) {
+      [start, end] = [end, start];
+    }
+    return [start, end];
+  }
+  const point = readPoint(command.position);
+  if (point === null) {
+    return null;
+  }
+  const [scope, paragraph, offset] = point;
+  const count = Math.max(0, asInt(command.count, 1));
+  const startOffset = command.direction === "backward" ? Math.max(0, offset - count) : offset;
+  return [[scope, paragraph, startOffset], [scope, paragraph, startOffset + count]];
+}
+
+function before(left, right) {
+  return left[1] < right[1] || (left[1] === right[1] && left[2] < right[2]);
+}
+
+function mapAnchor(scope, edit) {
+  const [section, anchor] = scope;
+  if (anchor === null) {
+    return scope;
+  }
+  const mapped = mapPoint([[section, null], anchor[0], 0], edit, false);
+  if (mapped[1] === anchor[0]) {
+    return scope;
+  }
+  return [section, [mapped[1], anchor[1], anchor[2]]];
+}
+
+function mapPoint(point, edit, afterTies) {
+  const [scope, paragraph, offset] = point;
+  const kind = edit[0];
+  const editScope = kind === "join" ? edit[1] : edit[1][0];
+  if (!sameScope(scope, editScope)) {
+    if (scope[0] === editScope[0] && editScope[1] === null && scope[1] !== null) {
+      return [mapAnchor(scope, edit), paragraph, offset];
+    }
+    return point;
+  }
+
+  if (kind === "insert") {
+    const [, [, atParagraph, atOffset], length] = edit;
+    if (paragraph === atParagraph && (offset > atOffset || (offset === atOffset && afterTies))) {
+      return [scope, paragraph, offset + length];
+    }
+    return point;
+  }
+
+  if (kind === "delete") {
+    const [, start, end] = edit;
+    if (!before(start, point)) {
+      return point;
+    }
+    if (!before(end, point)) {
+      return start;
+    }
+    if (paragraph === end[1]) {
+      return [scope, start[1], start[2] + offset - end[2]];
+    }
+    return [scope, paragraph - (end[1] - start[1]), offset];
+  }
+
+  if (kind === "split") {
+    const [, [, atParagraph, atOffset]] = edit;
+    if (paragraph > atParagraph) {
+      return [scope, paragraph + 1, offset];
+    }
+    if (paragraph === atParagraph && (offset > atOffset || (offset === atOffset && afterTies))) {
+      return [scope, paragraph + 1, offset - atOffset];
+    }
+    return point;
+  }
+
+  // join: ``atParagraph + 1`` is appended to ``atParagraph`` at ``joinOffset``.
+  const [, , atParagraph, joinOffset] = edit;
+  if (paragraph === atParagraph + 1) {
+    return [scope, atParagraph, (joinOffset || 0) + offset];
+  }
+  if (paragraph > atParagraph + 1) {
+    return [scope, paragraph - 1, offset];
+  }
+  return point;
+}
+
+function rangeCommand(command, start, end) {
+  if (!before(start, end)) {
+    return null;
+  }
+  const updated = clone(command);
+  if (command.type === "delete_selection" || start[1] !== end[1]) {
+    const originalStart = command.start || command.position || {};
+    const originalEnd = command.end || command.position || {};
+    delete updated.position;
+    delete updated.count;
+    delete updated.direction;
+    delete updated.deletedText;
+    updated.type = "delete_selection";
+    updated.start = writePoint(originalStart, start);
+    updated.end = writePoint(originalEnd, end);
+    return updated;
+  }
+  const count = end[2] - start[2];
+  if (count !== asInt(command.count, 1)) {
+    delete updated.deletedText;
+  }
+  updated.position = writePoint(command.position || {}, start);
+  updated.count = count;
+  updated.direction = "forward";
+  return updated;
+}
+
+function transformRange(command, edit, bounds) {
+  const [start, end] = bounds;
+  const kind = edit[0];
+  if (kind === "insert" || kind === "split") {
+    const at = edit[1];
+    if (sameScope(at[0], start[0]) && before(start, at) && before(at, end)) {
+      // The other editor typed or split inside the range: keep their
+      // change and delete both sides of it, later piece first.
+      const resume = kind === "insert" ? [at[0], at[1], at[2] + edit[2]] : [at[0], at[1] + 1, 0];
+      const tailEnd = mapPoint(end, edit, false);
+      return [rangeCommand(command, resume, tailEnd), rangeCommand(command, start, at)].filter(Boolean);
+    }
+  }
+  const mapped = rangeCommand(command, mapPoint(start, edit, true), mapPoint(end, edit, false));
+  return mapped ? [mapped] : [];
+}
+
+export function transformCommand(command, against, afterTies = true) {
+  const edit = commandEdit(against);
+  if (edit === null) {
+    return [command];
+  }
+
+  const ownEdit = commandEdit(command);
+  if (ownEdit !== null && ownEdit[0] === "join") {
+    const [, scope, paragraph] = ownEdit;
+    if (edit[0] === "join" && sameScope(edit[1], scope) && edit[2] === paragraph) {
+      // Both editors removed the same paragraph break.
+      return [];
+    }
+    if (edit[0] === "delete" && sameScope(edit[1][0], scope) && edit[1][1] <= paragraph && paragraph < edit[2][1]) {
+      // The other editor's selection delete already removed this break.
+      return [];
+    }
+  }
+
+  if (RANGE_COMMAND_TYPES.has(command.type) || (command.type === "table_cell_text" && command.action === "delete")) {
+    const bounds = commandRange(command);
+    if (bounds === null) {
+      return [command];
+    }
+    return transformRange(command, edit, bounds);
+  }
+
+  const point = readPoint(command.position);
+  if (point === null) {
+    return [command];
+  }
+  if (ownEdit !== null && ownEdit[0] === "join" && ownEdit[3] !== null) {
+    // A forward merge sits at the paragraph end, so text typed there lands before it.
+    afterTies = true;
+  }
+  const mapped = mapPoint(point, edit, afterTies);
+  if (samePoint(mapped, point)) {
+    return [command];
+  }
+  const updated = clone(command);
+  updated.position = writePoint(command.position, mapped);
+  return [updated];
+}
+
+/**
+ * Transform two concurrent command lists against each other.
+ *
+ * Returns ``[incoming', applied']`` where ``incoming'`` applies after
+ * ``applied`` and ``applied'`` applies after ``incoming``. ``applied`` wins ties.
+ */
+export function transformCommandLists(incoming, applied) {
+  const incomingOut = [];
+  let remaining = applied.filter(isObject);
+  for (const command of incoming.filter(isObject)) {
+    let current = [command];
+    const appliedOut = [];
+    for (const op of remaining) {
+      if (!current.length) {
+        appliedOut.push(op);
+        continue;
+      }
+      let nextCurrent;
+      let nextOp;
+      if (current.length === 1) {
+        nextCurrent = transformCommand(current[0], op, true);
+        nextOp = transformCommand(op, current[0], false);
+      } else {
+        [nextCurrent, nextOp] = transformCommandLists(current, [op]);
+      }
+      current = nextCurrent;
+      appliedOut.push(...nextOp);
+    }
+    remaining = appliedOut;
+    incomingOut.push(...current);
+  }
+  return [incomingOut, remaining];
+}
+
+/** Rebase ``incoming`` commands onto the already-sequenced ``applied`` commands. */
+export function transformCommands(incoming, applied) {
+  const incomingList = (incoming || []).filter(isObject);
+  const appliedList = (applied || []).filter(isObject);
+  if (!incomingList.length || !appliedList.length) {
+    return incomingList;
+  }
+  return transformCommandLists(incomingList, appliedList)[0];
+}
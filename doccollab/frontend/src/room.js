@@ -1,3 +1,5 @@
+import { transformCommandLists } from "./collab-ot.js";
+
 class RhwpStudioEmbed {
   constructor(iframe) {
     this.iframe = iframe;
@@ -256,8 +258,17 @@ class DoccollabRoom {
     this.assistantBusy = false;
     this.questionBusy = false;
     this.baseRevisionId = payload.collabState?.base_revision_id || payload.currentRevision?.id || "";
+    // Sequenced batches from the room log, kept in seq order until applied.
     this.pendingReplayBatches = [];
-    this.localBatchIds = new Set();
+    this.replayingBatches = false;
+    this.sequenceGapTimer = null;
+    this.sequenceGapExpired = false;
+    this.skippedSeqs = new Set();
+    // Highest room seq applied to this document; null until the first snapshot.
+    this.lastSeq = null;
+    // Local batches already in the editor but not yet sequenced; only the first is in flight.
+    this.unackedBatches = [];
+    this.inflightBatchId = "";
     this.participantCount = 1;
     this.selectionState = null;
     this.clientSessionKey = createSessionKey();
@@ -532,7 +543,13 @@ class DoccollabRoom {
         this.lastLocalRevisionId = payload.revision.id || "";
         this.baseRevisionId = payload.revision.id || this.baseRevisionId;
         this.requiresCollabRefresh = false;
+        // The saved file already holds every local batch, and the room log restarts from it.
         this.pendingReplayBatches = [];
+        this.unackedBatches = [];
+        this.inflightBatchId = "";
+        if (payload.collab_seq != null) {
+          this.lastSeq = Number(payload.collab_seq);
+        }
         this.upsertRevision(payload.revision);
         this.broadcastSavedRevision(payload.revision.id || "", payload.edit_events || []);
         this.resetAssistantForNewRevision();
@@ -824,11 +841,14 @@ class DoccollabRoom {
     this.syncRevisionState(payload || {});
     this.replaceEditHistory(payload.edit_history || []);
     this.queueSnapshotBatches(payload.collab_state || {});
+    this.flushLocalBatches();
   }
 
   handleBroadcastCommand(payload) {
     if (Array.isArray(payload.edit_history)) {
       this.replaceEditHistory(payload.edit_history);
+    } else if (payload.edit_history_delta) {
+      this.mergeEditHistoryDelta(payload.edit_history_delta);
     } else if (Array.isArray(payload.edit_events)) {
       this.prependEditHistory(payload.edit_events);
     }
@@ -836,20 +856,18 @@ class DoccollabRoom {
     if (!batchId) {
       return;
     }
-    if (this.localBatchIds.has(batchId)) {
-      this.localBatchIds.delete(batchId);
-      return;
-    }
-    if (payload.baseRevisionId && this.baseRevisionId && payload.baseRevisionId !== this.baseRevisionId) {
+    const isOwnBatch = this.unackedBatches.some((batch) => batch.batchId === batchId);
+    if (!isOwnBatch && payload.baseRevisionId && this.baseRevisionId && payload.baseRevisionId !== this.baseRevisionId) {
       this.requiresCollabRefresh = true;
       this.setStatus("다른 저장본 기준의 수정이 들어왔습니다. 저장 후 다시 열어 주세요.", true);
       return;
     }
-    this.pendingReplayBatches.push({
+    this.receiveSequencedBatch({
       batchId,
+      seq: Number(payload.seq || 0),
       commands: Array.isArray(payload.commands) ? payload.commands : [],
+      checkpointDue: Boolean(payload.checkpointDue),
     });
-    void this.replayPendingBatches().catch(() => undefined);
   }
 
   handleBroadcastSelection(_payload) {
@@ -889,7 +907,7 @@ class DoccollabRoom {
 
   handleSocketError(payload) {
     const message = String(payload.message || "연결 오류");
-    if (message.includes("stale base revision")) {
+    if (message.includes("stale base revision") || message.includes("stale base sequence")) {
       this.requiresCollabRefresh = true;
       this.setStatus("다른 저장본 기준이라 함께 수정이 잠시 멈췄습니다. 저장 후 다시 열어 주세요.", true);
       this.updateTablePanel();
@@ -990,16 +1008,13 @@ class DoccollabRoom {
       return;
     }
     const batchId = this.nextBatchId();
-    this.localBatchIds.add(batchId);
-    trimSet(this.localBatchIds, 180);
     const applied = await this.editor.applyCommandBatch(batchId, [command]).catch(() => null);
     if (!applied?.applied) {
-      this.localBatchIds.delete(batchId);
       this.setStatus("표 수정이 반영되지 않았습니다.", true);
       await this.refreshSelectionState();
       return;
     }
-    this.sendExistingBatch(batchId, [command], this.selectionState || {});
+    this.sendCommandBatch([command], this.selectionState || {}, batchId);
     this.setStatus("표 수정 반영 중");
     await this.refreshSelectionState();
   }
@@ -1008,50 +1023,153 @@ class DoccollabRoom {
     if (collabState?.base_revision_id) {
       this.baseRevisionId = collabState.base_revision_id;
     }
-    const updates = Array.isArray(collabState?.updates) ? collabState.updates : [];
-    this.pendingReplayBatches = updates
+    const headSeq = Number(collabState?.seq || 0);
+    const updates = (Array.isArray(collabState?.updates) ? collabState.updates : [])
       .filter((batch) => batch && batch.batchId)
       .map((batch) => ({
         batchId: String(batch.batchId),
+        seq: Number(batch.seq || 0),
         commands: Array.isArray(batch.commands) ? batch.commands : [],
+        compacted: Boolean(batch.compacted),
       }));
+    if (this.lastSeq === null) {
+      // A freshly opened document replays the whole log, then follows the head.
+      this.lastSeq = updates.length ? updates[0].seq - 1 : headSeq;
+    } else if (updates.some((batch) => batch.compacted && batch.seq > this.lastSeq)) {
+      // Batches this tab never applied were folded together while it was away.
+      this.requiresCollabRefresh = true;
+      this.setStatus("연결이 끊긴 사이 수정이 많이 쌓였습니다. 저장 후 다시 열어 주세요.", true);
+      this.updateTablePanel();
+      return;
+    }
+    const recentBatchIds = new Set([
+      ...(Array.isArray(collabState?.recent_batch_ids) ? collabState.recent_batch_ids : []),
+      ...updates.map((batch) => batch.batchId),
+    ]);
+    if (this.inflightBatchId && !recentBatchIds.has(this.inflightBatchId)) {
+      // The connection dropped before the server sequenced it; send it again.
+      this.inflightBatchId = "";
+    }
+    updates.forEach((batch) => this.receiveSequencedBatch(batch));
+  }
+
+  receiveSequencedBatch(batch) {
+    if (this.skippedSeqs.has(batch.seq)) {
+      this.requiresCollabRefresh = true;
+      this.setStatus("늦게 도착한 수정이 있습니다. 저장 후 다시 열어 주세요.", true);
+      this.updateTablePanel();
+      return;
+    }
+    if (this.lastSeq !== null && batch.seq <= this.lastSeq) {
+      return;
+    }
+    if (this.pendingReplayBatches.some((pending) => pending.seq === batch.seq)) {
+      return;
+    }
+    // Broadcasts can overtake each other between server workers; apply them in seq order.
+    const index = this.pendingReplayBatches.findIndex((pending) => pending.seq > batch.seq);
+    this.pendingReplayBatches.splice(index < 0 ? this.pendingReplayBatches.length : index, 0, batch);
     void this.replayPendingBatches().catch(() => undefined);
   }
 
   async replayPendingBatches() {
-    if (!this.documentLoaded || !this.editor || !this.pendingReplayBatches.length) {
+    if (this.replayingBatches || !this.documentLoaded || !this.editor) {
       return;
     }
-    while (this.pendingReplayBatches.length) {
-      const batch = this.pendingReplayBatches.shift();
-      if (!batch?.batchId) {
-        continue;
+    this.replayingBatches = true;
+    try {
+      while (this.pendingReplayBatches.length) {
+        const batch = this.pendingReplayBatches[0];
+        if (!batch.compacted && batch.seq > this.lastSeq + 1 && !this.sequenceGapExpired) {
+          this.waitForSequenceGap();
+          return;
+        }
+        this.pendingReplayBatches.shift();
+        if (!batch.compacted) {
+          for (let seq = this.lastSeq + 1; seq < batch.seq; seq += 1) {
+            this.skippedSeqs.add(seq);
+          }
+        }
+        this.sequenceGapExpired = false;
+        if (!(await this.applySequencedBatch(batch))) {
+          this.setStatus("다른 탭 수정 반영 실패", true);
+          return;
+        }
       }
-      const result = await this.editor.applyCommandBatch(batch.batchId, batch.commands || []);
+    } finally {
+      this.replayingBatches = false;
+    }
+    this.flushLocalBatches();
+  }
+
+  waitForSequenceGap() {
+    if (this.sequenceGapTimer) {
+      return;
+    }
+    // A batch that never arrives must not stall the room; carry on after a short wait.
+    this.sequenceGapTimer = window.setTimeout(() => {
+      this.sequenceGapTimer = null;
+      this.sequenceGapExpired = true;
+      void this.replayPendingBatches().catch(() => undefined);
+    }, 1500);
+  }
+
+  async applySequencedBatch(batch) {
+    if (this.unackedBatches[0]?.batchId === batch.batchId) {
+      // Our own batch came back; the editor already shows it, rebased the same way the server did.
+      this.unackedBatches.shift();
+      this.inflightBatchId = "";
+      this.lastSeq = batch.seq;
+      if (batch.checkpointDue && this.runtimeEditingEnabled && !this.isSaving) {
+        void this.saveRevision();
+      }
+      return true;
+    }
+    // The server sequenced this batch before our unacknowledged ones, so it goes
+    // first: rebase it over them and rebase them after it, as the server will.
+    let commands = batch.commands || [];
+    for (const local of this.unackedBatches) {
+      const [localCommands, peerCommands] = transformCommandLists(local.commands, commands);
+      local.commands = localCommands;
+      commands = peerCommands;
+    }
+    if (commands.length) {
+      const result = await this.editor.applyCommandBatch(batch.batchId, commands);
       if (!result?.applied) {
-        this.setStatus("다른 탭 수정 반영 실패", true);
-        return;
+        return false;
       }
     }
+    this.lastSeq = batch.seq;
+    return true;
   }
 
-  sendCommandBatch(commands, selection) {
-    if (
-      !this.socket
-      || this.socket.readyState !== WebSocket.OPEN
-      || !Array.isArray(commands)
-      || !commands.length
-    ) {
+  sendCommandBatch(commands, selection, batchId = this.nextBatchId()) {
+    if (!Array.isArray(commands) || !commands.length) {
       return;
     }
     if (this.requiresCollabRefresh) {
       this.setStatus("새 저장본 확인 전에는 함께 수정이 잠시 멈춥니다.", true);
       return;
     }
-    const batchId = this.nextBatchId();
-    this.localBatchIds.add(batchId);
-    trimSet(this.localBatchIds, 180);
-    this.sendExistingBatch(batchId, commands, selection);
+    this.unackedBatches.push({ batchId, commands, selection: selection || {} });
+    this.flushLocalBatches();
+  }
+
+  flushLocalBatches() {
+    // One batch in flight: its baseSeq is then always a seq this tab has applied,
+    // and the batches queued behind it are rebased here before they are sent.
+    if (this.inflightBatchId || this.lastSeq === null || this.requiresCollabRefresh) {
+      return;
+    }
+    while (this.unackedBatches.length && !this.unackedBatches[0].commands.length) {
+      this.unackedBatches.shift();
+    }
+    const batch = this.unackedBatches[0];
+    if (!batch || !this.socket || this.socket.readyState !== WebSocket.OPEN) {
+      return;
+    }
+    this.inflightBatchId = batch.batchId;
+    this.sendExistingBatch(batch.batchId, batch.commands, batch.selection);
   }
 
   sendExistingBatch(batchId, commands, selection) {
@@ -1069,6 +1187,7 @@ class DoccollabRoom {
         payload: {
           batchId,
           baseRevisionId: this.baseRevisionId || this.payload.currentRevision?.id || "",
+          baseSeq: this.lastSeq,
           senderSessionKey: this.sessionKey(),
           commands,
           selection: selection || {},
@@ -1240,6 +1359,29 @@ class DoccollabRoom {
     });
   }
 
+  mergeEditHistoryDelta(delta) {
+    if (!this.editHistoryList) {
+      return;
+    }
+    const replaces = String(delta?.replaces || "");
+    if (replaces) {
+      this.editHistoryList
+        .querySelectorAll("[data-edit-event-id]")
+        .forEach((row) => {
+          if (row.dataset.editEventId === replaces) {
+            row.remove();
+          }
+        });
+      this.renderedEditEventIds.delete(replaces);
+    }
+    this.prependEditHistory(Array.isArray(delta?.groups) ? delta.groups : []);
+    const rows = this.editHistoryList.querySelectorAll("[data-edit-event-id]");
+    for (let index = EDIT_HISTORY_LIMIT; index < rows.length; index += 1) {
+      this.renderedEditEventIds.delete(rows[index].dataset.editEventId);
+      rows[index].remove();
+    }
+  }
+
   buildEditHistoryRow(event) {
     const row = document.createElement("div");
     row.className = "doccollab-room-row doccollab-room-row--history";
@@ -1317,6 +1459,8 @@ class DoccollabRoom {
   }
 }
 
+const EDIT_HISTORY_LIMIT = 10;
+
 function buildWebSocketUrl(path) {
   if (/^wss?:\/\//.test(path)) {
     return path;
@@ -1383,13 +1527,6 @@ function delay(ms) {
   });
 }
 
-function trimSet(set, limit) {
-  while (set.size > limit) {
-    const [first] = set;
-    set.delete(first);
-  }
-}
-
 function createSessionKey() {
   if (window.crypto?.randomUUID) {
     return window.crypto.randomUUID();
@@ -0,0 +1,253 @@
+import asyncio
+import random
+import threading
+from collections import Counter
+from contextlib import contextmanager, suppress
+from time import perf_counter
+from unittest import mock
+
+from channels.testing.websocket import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+from django.db.backends.utils import CursorWrapper
+from django.test import override_settings
+from django.utils import timezone
+
+from doccollab.models import DocLiveState, DocMembership, DocRoom, DocWorkspace
+
+
+def _percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * len(ordered))) - 1))
+    return ordered[index]
+
+
+@contextmanager
+def _count_statements():
+    """Count SQL statements by verb on every connection, including consumer worker threads."""
+    counts = Counter()
+    lock = threading.Lock()
+    original_execute = CursorWrapper._execute
+    original_executemany = CursorWrapper._executemany
+
+    def record(sql):
+        verb = str(sql or "").lstrip().split(" ", 1)[0].upper()
+        with lock:
+            counts[verb] += 1
+
+    def execute(cursor, sql, *args):
+        record(sql)
+        return original_execute(cursor, sql, *args)
+
+    def executemany(cursor, sql, *args):
+        record(sql)
+        return original_executemany(cursor, sql, *args)
+
+    with mock.patch.object(CursorWrapper, "_execute", execute), mock.patch.object(CursorWrapper, "_executemany", executemany):
+        yield counts
+
+
+MODES = (
+    # Every heartbeat and edit event written as it happens.
+    ("unbuffered", {"DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS": 0, "DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS": 0}),
+    # Heartbeat debounce and batched edit-event inserts as configured.
+    ("coalesced", {}),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive concurrent editors against one doccollab room over websockets and report "
+        "lost batches, p50/p99 broadcast latency and DB statements per batch, with presence/"
+        "edit-history writes unbuffered vs coalesced. Creates throwaway users and a room, "
+        "and deletes them afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--editors", type=int, default=20)
+        parser.add_argument("--batches", type=int, default=20, help="batches sent by each editor")
+        parser.add_argument("--max-delay-ms", type=int, default=30, help="random pause between one editor's batches")
+        parser.add_argument("--timeout", type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        editors = max(2, options["editors"])
+        batches = max(1, options["batches"])
+        host = next((item for item in settings.ALLOWED_HOSTS if item and "*" not in item), "localhost").lstrip(".")
+
+        User = get_user_model()
+        stamp = timezone.now().strftime("%Y%m%d%H%M%S")
+        users = []
+        sessions = []
+        workspace = None
+        try:
+            for index in range(editors):
+                users.append(
+                    User.objects.create_user(
+                        username=f"doccollab-bench-{stamp}-{index}",
+                        email=f"doccollab-bench-{stamp}-{index}@example.com",
+                        password="bench-password-123",
+                    )
+                )
+            workspace = DocWorkspace.objects.create(name=f"부하 테스트 {stamp}", created_by=users[0])
+            for index, user in enumerate(users):
+                DocMembership.objects.create(
+                    workspace=workspace,
+                    user=user,
+                    role=DocMembership.Role.OWNER if index == 0 else DocMembership.Role.EDITOR,
+                    status=DocMembership.Status.ACTIVE,
+                    invited_by=users[0],
+                )
+            room = DocRoom.objects.create(workspace=workspace, title="부하 테스트 문서", created_by=users[0])
+            for user in users:
+                store = SessionStore()
+                store[SESSION_KEY] = str(user.pk)
+                store[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+                store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+                store.save()
+                sessions.append(store)
+
+            cookies = [f"{settings.SESSION_COOKIE_NAME}={store.session_key}" for store in sessions]
+            for label, overrides in MODES:
+                seq_before = DocLiveState.objects.filter(room=room).values_list("last_seq", flat=True).first() or 0
+                with override_settings(**overrides), _count_statements() as statements:
+                    result = asyncio.run(
+                        self._drive(
+                            room=room,
+                            cookies=cookies,
+                            host=host,
+                            label=label,
+                            batches=batches,
+                            max_delay=max(0, options["max_delay_ms"]) / 1000,
+                            timeout=options["timeout"],
+                        )
+                    )
+                seq_after = DocLiveState.objects.filter(room=room).values_list("last_seq", flat=True).first() or 0
+                result["statements"] = statements
+                self._report(label, result, editors=editors, batches=batches, sequenced=seq_after - seq_before)
+        finally:
+            for store in sessions:
+                store.delete()
+            if workspace is not None:
+                workspace.delete()
+            for user in users:
+                user.delete()
+
+    async def _drive(self, *, room, cookies, host, label, batches, max_delay, timeout):
+        from config.asgi import application
+
+        communicators = []
+        for cookie in cookies:
+            communicator = WebsocketCommunicator(
+                application,
+                f"/ws/doccollab/rooms/{room.id}/",
+                headers=[
+                    (b"cookie", cookie.encode("utf-8")),
+                    (b"host", host.encode("utf-8")),
+                    (b"origin", f"http://{host}".encode("utf-8")),
+                ],
+            )
+            connected, detail = await communicator.connect(timeout=timeout)
+            if not connected:
+                raise CommandError(f"websocket connect failed: {detail}")
+            communicators.append(communicator)
+
+        expected = len(communicators) * batches
+        sent_at = {}
+        received = [dict() for _ in communicators]
+        latest_seq = [0 for _ in communicators]
+        errors = []
+        done = asyncio.Event()
+
+        async def listen(index, communicator):
+            while len(received[index]) < expected:
+                try:
+                    message = await communicator.receive_json_from(timeout=timeout)
+                except asyncio.TimeoutError:
+                    return
+                if message.get("type") == "room.snapshot":
+                    latest_seq[index] = int(message["payload"]["collab_state"].get("seq") or 0)
+                elif message.get("type") == "editor.command":
+                    payload = message.get("payload") or {}
+                    received[index][payload.get("batchId")] = perf_counter()
+                    latest_seq[index] = max(latest_seq[index], int(payload.get("seq") or 0))
+                elif message.get("type") == "error":
+                    errors.append((message.get("payload") or {}).get("message"))
+            if all(len(item) >= expected for item in received):
+                done.set()
+
+        async def edit(index, communicator):
+            rng = random.Random(index)
+            for batch_index in range(batches):
+                batch_id = f"bench-{label}-{index}-{batch_index}"
+                sent_at[batch_id] = perf_counter()
+                if batch_index % 5 == 0:
+                    await communicator.send_json_to({"type": "ping", "payload": {}})
+                await communicator.send_json_to(
+                    {
+                        "type": "editor.command",
+                        "payload": {
+                            "batchId": batch_id,
+                            "baseSeq": latest_seq[index],
+                            "senderSessionKey": f"bench-session-{index}",
+                            "commands": [
+                                {
+                                    "id": f"{batch_id}-cmd",
+                                    "type": "insert_text",
+                                    "position": {"sectionIndex": 0, "paragraphIndex": 0, "charOffset": rng.randint(0, 20)},
+                                    "text": "가",
+                                }
+                            ],
+                        },
+                    }
+                )
+                if max_delay:
+                    await asyncio.sleep(rng.uniform(0, max_delay))
+
+        listeners = [asyncio.create_task(listen(index, item)) for index, item in enumerate(communicators)]
+        started = perf_counter()
+        await asyncio.gather(*(edit(index, item) for index, item in enumerate(communicators)))
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(done.wait(), timeout=timeout)
+        elapsed = perf_counter() - started
+        for task in listeners:
+            task.cancel()
+        for communicator in communicators:
+            with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await communicator.disconnect()
+
+        latencies = [
+            (received_at - sent_at[batch_id]) * 1000
+            for per_editor in received
+            for batch_id, received_at in per_editor.items()
+            if batch_id in sent_at
+        ]
+        return {
+            "expected": expected,
+            "lost": sum(expected - len(per_editor) for per_editor in received),
+            "latencies": latencies,
+            "errors": errors,
+            "elapsed": elapsed,
+        }
+
+    def _report(self, label, result, *, editors, batches, sequenced):
+        latencies = result["latencies"]
+        statements = result["statements"]
+        writes = statements["INSERT"] + statements["UPDATE"] + statements["DELETE"]
+        per_batch = max(result["expected"], 1)
+        style = self.style.SUCCESS if not result["lost"] and sequenced == result["expected"] else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"[bench] {label:<10} editors={editors} batches/editor={batches} "
+                f"sequenced={sequenced}/{result['expected']} lost deliveries={result['lost']} "
+                f"errors={len(result['errors'])} | broadcast p50={_percentile(latencies, 0.5):.1f}ms "
+                f"p99={_percentile(latencies, 0.99):.1f}ms max={max(latencies or [0]):.1f}ms | "
+                f"db writes/batch={writes / per_batch:.2f} statements/batch={sum(statements.values()) / per_batch:.2f} | "
+                f"{result['expected'] / max(result['elapsed'], 1e-6):.0f} batches/s"
+            )
+        )
+        for message in sorted(set(result["errors"]))[:5]:
+            self.stdout.write(self.style.WARNING(f"[bench] error: {message}"))
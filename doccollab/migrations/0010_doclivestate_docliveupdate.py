@@ -0,0 +1,44 @@
+# Generated by Django 6.0.3 on 2026-10-17 10:12
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('doccollab', '0009_alter_docrevision_export_format'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocLiveState',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('last_seq', models.PositiveBigIntegerField(default=0)),
+                ('compacted_seq', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('base_revision', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='live_states', to='doccollab.docrevision')),
+                ('compacted_snapshot', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='doccollab.docsnapshot')),
+                ('room', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='live_state', to='doccollab.docroom')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DocLiveUpdate',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('seq', models.PositiveBigIntegerField()),
+                ('batch_id', models.CharField(blank=True, default='', max_length=120)),
+                ('sender_session_key', models.CharField(blank=True, default='', max_length=255)),
+                ('update_json', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='live_updates', to='doccollab.docroom')),
+            ],
+            options={
+                'ordering': ['seq'],
+                'indexes': [models.Index(fields=['room', 'batch_id'], name='doccollab_d_room_id_9b5982_idx')],
+                'unique_together': {('room', 'seq')},
+            },
+        ),
+    ]
@@ -494,3 +494,56 @@ class DocPresence(models.Model):
 
     def __str__(self):
         return f"{self.room_id}:{self.display_name or self.session_key}"
+
+
+class DocLiveState(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    room = models.OneToOneField(
+        DocRoom,
+        on_delete=models.CASCADE,
+        related_name="live_state",
+    )
+    base_revision = models.ForeignKey(
+        DocRevision,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="live_states",
+    )
+    last_seq = models.PositiveBigIntegerField(default=0)
+    compacted_seq = models.PositiveBigIntegerField(default=0)
+    compacted_snapshot = models.ForeignKey(
+        DocSnapshot,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.room_id}:{self.last_seq}"
+
+
+class DocLiveUpdate(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    room = models.ForeignKey(
+        DocRoom,
+        on_delete=models.CASCADE,
+        related_name="live_updates",
+    )
+    seq = models.PositiveBigIntegerField()
+    batch_id = models.CharField(max_length=120, blank=True, default="")
+    sender_session_key = models.CharField(max_length=255, blank=True, default="")
+    update_json = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["seq"]
+        unique_together = [("room", "seq")]
+        indexes = [
+            models.Index(fields=["room", "batch_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.room_id}:{self.seq}"
@@ -2,12 +2,11 @@ import logging
 import hashlib
 import json
 import os
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
-from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
@@ -18,9 +17,22 @@ from django.urls import reverse
 from django.utils import formats
 from django.utils import timezone
 
+from core.background_jobs import submit_background_job
 from version_manager.models import Document, DocumentGroup, DocumentVersion
 
-from .models import DocEditEvent, DocMembership, DocPresence, DocRevision, DocRoom, DocSnapshot, DocWorkspace, DocWorksheet
+from .collab_ot import transform_commands
+from .models import (
+    DocEditEvent,
+    DocLiveState,
+    DocLiveUpdate,
+    DocMembership,
+    DocPresence,
+    DocRevision,
+    DocRoom,
+    DocSnapshot,
+    DocWorkspace,
+    DocWorksheet,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +42,9 @@ MAX_SOURCE_FILE_BYTES = 20 * 1024 * 1024
 MAX_CONTROL_SCAN = 12
 MAX_LIVE_UPDATES = 250
 MAX_RECENT_BATCH_IDS = 400
+MIRROR_REVISION_JOB = "doccollab.services.run_mirror_revision_job"
+LIVE_UPDATES_KEPT_AFTER_COMPACTION = MAX_LIVE_UPDATES // 2
+MAX_COMPACTED_LIVE_SEGMENTS = 8
 SUPPORTED_UPLOAD_FORMATS = {
     ".hwp": DocRoom.SourceFormat.HWP,
     ".hwpx": DocRoom.SourceFormat.HWPX,
@@ -170,16 +185,15 @@ def edit_history_label(command_type):
     return "수정"
 
 
-def _edit_history_summary(family, events):
-    count = len(events)
+def _edit_history_summary(family, count, newest_summary=""):
     if family == "text_edit":
         return "본문 수정" if count == 1 else f"본문 수정 {count}건"
     if family == "table_edit":
         return "표 수정" if count == 1 else f"표 수정 {count}건"
     if family == "save_revision":
-        return events[0].summary or "저장본 저장"
+        return newest_summary or "저장본 저장"
     if family == "publish_revision":
-        return events[0].summary or "배포본 지정"
+        return newest_summary or "배포본 지정"
     return "문서 수정" if count == 1 else f"문서 수정 {count}건"
 
 
@@ -205,21 +219,83 @@ def _can_rollup_edit_history(group, event, family):
     return (oldest_at - event.created_at) <= EDIT_HISTORY_GROUP_WINDOW
 
 
-def _serialize_edit_history_group(group):
-    newest_event = group["events"][0]
-    family = group["family"]
+def _edit_history_group_payload(family, newest_event, event_count):
     return {
         "id": f"group:{newest_event.id}",
         "command_type": family,
         "command_label": edit_history_label(family),
         "display_name": newest_event.display_name,
-        "summary": _edit_history_summary(family, group["events"]),
-        "event_count": len(group["events"]),
+        "summary": _edit_history_summary(family, event_count, newest_event.summary),
+        "event_count": event_count,
         "created_at": newest_event.created_at.isoformat(),
         "created_at_display": _edit_history_timestamp(newest_event.created_at),
     }
 
 
+def _serialize_edit_history_group(group):
+    return _edit_history_group_payload(group["family"], group["events"][0], len(group["events"]))
+
+
+def _edit_history_head_state(family, newest_event, event_count):
+    # Plain JSON so it can ride along channel-layer messages to the other consumers.
+    return {
+        "family": family,
+        "actor_key": _edit_history_actor_key(newest_event),
+        "event_count": event_count,
+        "newest_at": newest_event.created_at.isoformat(),
+        "group": _edit_history_group_payload(family, newest_event, event_count),
+    }
+
+
+def edit_history_head(room):
+    """Return the newest rolled-up history group of ``room`` as head state, or ``None``."""
+    head = None
+    for event in room.edit_events.order_by("-created_at")[:80]:
+        family = edit_history_family(event.command_type)
+        if head is None:
+            head = {"family": family, "actor_key": _edit_history_actor_key(event), "events": [event], "oldest_at": event.created_at}
+            if family in {"save_revision", "publish_revision"}:
+                break
+            continue
+        if not _can_rollup_edit_history(head, event, family):
+            break
+        head["events"].append(event)
+        head["oldest_at"] = event.created_at
+    if head is None:
+        return None
+    return _edit_history_head_state(head["family"], head["events"][0], len(head["events"]))
+
+
+def advance_edit_history_head(head, events):
+    """
+    Fold freshly recorded ``events`` (oldest first) into ``head`` without a query.
+
+    Returns ``(head, delta)``. ``delta["groups"]`` lists the changed groups newest
+    first, and ``delta["replaces"]`` names the previous head group id when the first
+    event rolled into it.
+    """
+    groups = []
+    replaces = None
+    for event in events:
+        family = edit_history_family(event.command_type)
+        can_rollup = False
+        if head is not None and family == head["family"] and family not in {"save_revision", "publish_revision"}:
+            if _edit_history_actor_key(event) == head["actor_key"]:
+                newest_at = datetime.fromisoformat(head["newest_at"])
+                can_rollup = (event.created_at - newest_at) <= EDIT_HISTORY_GROUP_WINDOW
+        if can_rollup:
+            if groups:
+                groups.pop()
+            else:
+                replaces = head["group"]["id"]
+            head = _edit_history_head_state(family, event, head["event_count"] + 1)
+        else:
+            head = _edit_history_head_state(family, event, 1)
+        groups.append(head["group"])
+    groups.reverse()
+    return head, {"groups": groups, "replaces": replaces}
+
+
 def display_name_for_user(user):
     if user is None:
         return ""
@@ -315,84 +391,253 @@ def room_group_name(room):
     return f"doccollab-room-{room.id}"
 
 
-def room_collab_state_cache_key(room):
-    return f"doccollab:room:{room.id}:live"
+def _lock_live_state(room):
+    DocLiveState.objects.get_or_create(room=room)
+    return DocLiveState.objects.select_for_update(of=("self",)).select_related("compacted_snapshot").get(room=room)
+
+
+def _compacted_segment_ids(state):
+    snapshot = state.compacted_snapshot
+    if snapshot is None or not isinstance(snapshot.state_json, dict):
+        return []
+    return [*(snapshot.state_json.get("segment_ids") or []), str(snapshot.id)]
+
+
+def _compacted_live_entries(state):
+    segment_ids = _compacted_segment_ids(state)
+    if not segment_ids:
+        return []
+    segments = [state.compacted_snapshot]
+    if len(segment_ids) > 1:
+        segments.extend(DocSnapshot.objects.filter(id__in=segment_ids[:-1]))
+    entries = []
+    for snapshot in segments:
+        snapshot_state = snapshot.state_json if isinstance(snapshot.state_json, dict) else {}
+        entries.append(
+            {
+                "batchId": f"snapshot:{snapshot.id}",
+                "seq": snapshot_state.get("through_seq") or state.compacted_seq,
+                "baseRevisionId": snapshot_state.get("base_revision_id"),
+                "senderSessionKey": "",
+                "commands": list(snapshot_state.get("commands") or []),
+                "selection": {},
+                "compacted": True,
+                "receivedAt": snapshot.created_at.isoformat(),
+            }
+        )
+    entries.sort(key=lambda entry: entry["seq"])
+    return entries
+
+
+def live_checkpoint_due(state):
+    return len(_compacted_segment_ids(state)) >= MAX_COMPACTED_LIVE_SEGMENTS
 
 
 def load_room_collab_state(room):
-    cached = cache.get(room_collab_state_cache_key(room)) or {}
-    if not isinstance(cached, dict):
-        cached = {}
-    updates = cached.get("updates")
-    if not isinstance(updates, list):
-        updates = []
-    recent_batch_ids = cached.get("recent_batch_ids")
-    if not isinstance(recent_batch_ids, list):
-        recent_batch_ids = []
+    state = DocLiveState.objects.filter(room=room).select_related("compacted_snapshot").first()
+    if state is None:
+        return {
+            "base_revision_id": None,
+            "seq": 0,
+            "updates": [],
+            "recent_batch_ids": [],
+            "updated_at": None,
+        }
+    rows = list(room.live_updates.order_by("-seq")[:MAX_LIVE_UPDATES])
+    rows.reverse()
+    updates = [row.update_json for row in rows]
+    recent_batch_ids = []
+    compacted_entries = _compacted_live_entries(state)
+    if compacted_entries:
+        updates[:0] = compacted_entries
+        recent_batch_ids.extend(state.compacted_snapshot.state_json.get("batch_ids") or [])
+    recent_batch_ids.extend(row.batch_id for row in rows if row.batch_id)
     return {
-        "base_revision_id": cached.get("base_revision_id"),
-        "updates": updates[-MAX_LIVE_UPDATES:],
+        "base_revision_id": str(state.base_revision_id) if state.base_revision_id else None,
+        "seq": state.last_seq,
+        "updates": updates,
         "recent_batch_ids": recent_batch_ids[-MAX_RECENT_BATCH_IDS:],
-        "updated_at": cached.get("updated_at"),
+        "updated_at": state.updated_at.isoformat(),
     }
 
 
+@transaction.atomic
 def reset_room_collab_state(room, *, base_revision=None):
-    payload = {
-        "base_revision_id": str(base_revision.id) if getattr(base_revision, "id", None) else None,
+    state = _lock_live_state(room)
+    room.live_updates.all().delete()
+    segment_ids = _compacted_segment_ids(state)
+    state.base_revision = base_revision if getattr(base_revision, "id", None) else None
+    # Sequence numbers keep growing across resets so a client still holding a
+    # pre-reset ``baseSeq`` is told to resync instead of being rebased.
+    state.compacted_seq = state.last_seq
+    state.compacted_snapshot = None
+    state.save(update_fields=["base_revision", "compacted_seq", "compacted_snapshot", "updated_at"])
+    if segment_ids:
+        DocSnapshot.objects.filter(id__in=segment_ids).delete()
+    return {
+        "base_revision_id": str(state.base_revision_id) if state.base_revision_id else None,
+        "seq": state.last_seq,
         "updates": [],
         "recent_batch_ids": [],
-        "updated_at": timezone.now().isoformat(),
+        "updated_at": state.updated_at.isoformat(),
     }
-    cache.set(room_collab_state_cache_key(room), payload, timeout=60 * 60 * 12)
-    return payload
 
 
+def _append_live_update(room, state, entry, *, batch_id="", sender_session_key=""):
+    state.last_seq += 1
+    if isinstance(entry, dict):
+        entry["seq"] = state.last_seq
+    DocLiveUpdate.objects.create(
+        room=room,
+        seq=state.last_seq,
+        batch_id=batch_id,
+        sender_session_key=sender_session_key,
+        update_json=entry,
+    )
+    state.save(update_fields=["last_seq", "updated_at"])
+    if state.last_seq - state.compacted_seq > MAX_LIVE_UPDATES:
+        compact_room_live_updates(room, state=state)
+    return state.last_seq
+
+
+def compact_room_live_updates(room, *, state=None, keep=LIVE_UPDATES_KEPT_AFTER_COMPACTION):
+    """
+    Fold the oldest live updates into a new ``DocSnapshot`` segment so the log
+    a joining editor replays stays bounded without dropping accepted edits.
+
+    Each segment holds only the rows it folds and links the earlier segments by
+    id, so a compaction never rewrites commands that were already folded. Once
+    ``MAX_COMPACTED_LIVE_SEGMENTS`` pile up, ``live_checkpoint_due`` asks the
+    editor to save a revision, which resets the log onto real document state.
+    """
+    with transaction.atomic():
+        if state is None:
+            state = _lock_live_state(room)
+        through_seq = state.last_seq - max(0, keep)
+        rows = list(room.live_updates.filter(seq__lte=through_seq).order_by("seq"))
+        if not rows:
+            return None
+        previous = state.compacted_snapshot
+        previous_state = previous.state_json if previous is not None and isinstance(previous.state_json, dict) else {}
+        commands = []
+        batch_ids = list(previous_state.get("batch_ids") or [])
+        for row in rows:
+            entry = row.update_json
+            if not isinstance(entry, dict):
+                continue
+            commands.extend(command for command in entry.get("commands") or [] if isinstance(command, dict))
+            if row.batch_id:
+                batch_ids.append(row.batch_id)
+        snapshot = create_snapshot(
+            room=room,
+            created_by=None,
+            revision=state.base_revision,
+            state_json={
+                "source": "live_log",
+                "base_revision_id": str(state.base_revision_id) if state.base_revision_id else None,
+                "from_seq": rows[0].seq,
+                "through_seq": rows[-1].seq,
+                "commands": commands,
+                "batch_ids": batch_ids[-MAX_RECENT_BATCH_IDS:],
+                "segment_ids": _compacted_segment_ids(state),
+            },
+        )
+        room.live_updates.filter(seq__lte=rows[-1].seq).delete()
+        state.compacted_seq = rows[-1].seq
+        state.compacted_snapshot = snapshot
+        state.save(update_fields=["compacted_seq", "compacted_snapshot", "updated_at"])
+    return snapshot
+
+
+@transaction.atomic
 def append_room_collab_update(room, update):
-    payload = load_room_collab_state(room)
-    updates = payload["updates"]
-    if isinstance(update, dict):
-        updates.append(dict(update))
-    else:
-        updates.append(list(update or []))
-    payload["updates"] = updates[-MAX_LIVE_UPDATES:]
-    payload["updated_at"] = timezone.now().isoformat()
-    cache.set(room_collab_state_cache_key(room), payload, timeout=60 * 60 * 12)
-    return payload
+    state = _lock_live_state(room)
+    entry = dict(update) if isinstance(update, dict) else list(update or [])
+    _append_live_update(room, state, entry)
+    return load_room_collab_state(room)
+
+
+def _live_batch_seen(room, state, batch_id):
+    if room.live_updates.filter(batch_id=batch_id).exists():
+        return True
+    snapshot = state.compacted_snapshot
+    if snapshot is None or not isinstance(snapshot.state_json, dict):
+        return False
+    return batch_id in (snapshot.state_json.get("batch_ids") or [])
+
+
+def _parse_base_seq(raw_value):
+    if raw_value in (None, ""):
+        return None
+    try:
+        value = int(raw_value)
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
 
 
 def append_room_command_batch(room, batch):
-    payload = load_room_collab_state(room)
-    batch_id = str(batch.get("batchId") or "").strip()
-    sender_session_key = str(batch.get("senderSessionKey") or "").strip()
+    """
+    Sequence one editor batch into the room log.
+
+    Appends are serialized on the room's ``DocLiveState`` row, so concurrent
+    editors never overwrite each other. A batch carrying ``baseSeq`` older than
+    the head is rebased onto the commands other sessions appended since then
+    instead of being rejected; batches without ``baseSeq`` apply at the head.
+    """
+    batch_id = str(batch.get("batchId") or "").strip()[:120]
+    sender_session_key = str(batch.get("senderSessionKey") or "").strip()[:255]
     commands = [command for command in (batch.get("commands") or []) if isinstance(command, dict)]
     selection = batch.get("selection") if isinstance(batch.get("selection"), dict) else {}
+    payload = {"base_revision_id": None, "seq": 0, "update": None, "checkpoint_due": False}
     if not batch_id:
         return payload, False, "missing batchId"
     if not commands:
         return payload, False, "empty commands"
-    recent_batch_ids = payload["recent_batch_ids"]
-    if batch_id in recent_batch_ids:
-        return payload, False, "duplicate batchId"
-    current_base_revision_id = str(payload.get("base_revision_id") or "").strip()
-    requested_base_revision_id = str(batch.get("baseRevisionId") or "").strip()
-    if current_base_revision_id and requested_base_revision_id and current_base_revision_id != requested_base_revision_id:
-        return payload, False, "stale base revision"
-    entry = {
-        "batchId": batch_id,
-        "baseRevisionId": requested_base_revision_id or current_base_revision_id or None,
-        "senderSessionKey": sender_session_key,
-        "commands": commands,
-        "selection": selection,
-        "receivedAt": timezone.now().isoformat(),
-    }
-    updates = payload["updates"]
-    updates.append(entry)
-    payload["updates"] = updates[-MAX_LIVE_UPDATES:]
-    recent_batch_ids.append(batch_id)
-    payload["recent_batch_ids"] = recent_batch_ids[-MAX_RECENT_BATCH_IDS:]
-    payload["updated_at"] = timezone.now().isoformat()
-    cache.set(room_collab_state_cache_key(room), payload, timeout=60 * 60 * 12)
+    with transaction.atomic():
+        state = _lock_live_state(room)
+        current_base_revision_id = str(state.base_revision_id or "").strip()
+        payload["base_revision_id"] = current_base_revision_id or None
+        payload["seq"] = state.last_seq
+        if _live_batch_seen(room, state, batch_id):
+            return payload, False, "duplicate batchId"
+        requested_base_revision_id = str(batch.get("baseRevisionId") or "").strip()
+        if current_base_revision_id and requested_base_revision_id and current_base_revision_id != requested_base_revision_id:
+            return payload, False, "stale base revision"
+        base_seq = _parse_base_seq(batch.get("baseSeq"))
+        if base_seq is not None and base_seq < state.compacted_seq:
+            return payload, False, "stale base sequence"
+        if base_seq is None or base_seq > state.last_seq:
+            base_seq = state.last_seq
+        applied_commands = []
+        if base_seq < state.last_seq:
+            intervening = room.live_updates.filter(seq__gt=base_seq).order_by("seq")
+            if sender_session_key:
+                intervening = intervening.exclude(sender_session_key=sender_session_key)
+            for entry in intervening.values_list("update_json", flat=True):
+                if isinstance(entry, dict):
+                    applied_commands.extend(entry.get("commands") or [])
+        transformed = transform_commands(commands, applied_commands) if applied_commands else commands
+        entry = {
+            "batchId": batch_id,
+            "baseSeq": base_seq,
+            "baseRevisionId": requested_base_revision_id or current_base_revision_id or None,
+            "senderSessionKey": sender_session_key,
+            "commands": transformed,
+            "selection": selection,
+            "receivedAt": timezone.now().isoformat(),
+        }
+        if transformed != commands:
+            entry["transformed"] = True
+        payload["seq"] = _append_live_update(
+            room,
+            state,
+            entry,
+            batch_id=batch_id,
+            sender_session_key=sender_session_key,
+        )
+        payload["update"] = entry
+        payload["checkpoint_due"] = live_checkpoint_due(state)
     return payload, True, None
 
 
@@ -555,6 +800,19 @@ def _mirror_revision(room, revision, raw_bytes, user):
     return mirrored
 
 
+def run_mirror_revision_job(job):
+    revision = DocRevision.objects.select_related("created_by").get(pk=job.payload["revision_id"])
+    if revision.mirrored_version_id:
+        return {"mirrored_version_id": revision.mirrored_version_id}
+    with revision.file.open("rb") as handle:
+        raw_bytes = handle.read()
+    # Locking the room keeps two saves from numbering the mirrored versions at the same time.
+    with transaction.atomic():
+        room = DocRoom.objects.select_for_update().get(pk=revision.room_id)
+        mirrored = _mirror_revision(room, revision, raw_bytes, revision.created_by)
+    return {"mirrored_version_id": mirrored.pk}
+
+
 @transaction.atomic
 def create_room_from_upload(*, user, title, uploaded_file):
     file_name, raw_bytes, source_format = read_uploaded_file(uploaded_file)
@@ -640,10 +898,16 @@ def save_room_revision(*, room, user, uploaded_file, export_format, note=""):
         note=str(note or "").strip()[:200],
         created_by=user,
     )
+    # The version_manager mirror is a second upload of the same bytes; the job runner does it after the save.
     try:
-        _mirror_revision(room, revision, raw_bytes, user)
+        submit_background_job(
+            MIRROR_REVISION_JOB,
+            owner=user,
+            payload={"revision_id": str(revision.id)},
+            dedupe_key=f"doccollab.mirror_revision:{revision.id}",
+        )
     except Exception:
-        logger.exception("doccollab mirror failed during revision save for room=%s revision=%s", room.id, revision.id)
+        logger.exception("doccollab mirror job submit failed during revision save for room=%s revision=%s", room.id, revision.id)
     try:
         reset_room_collab_state(room, base_revision=revision)
     except Exception:
@@ -708,6 +972,58 @@ def record_edit_events(*, room, user, display_name, commands):
     return events
 
 
+def build_edit_events(*, room, user, display_name, commands, base_revision_id=None):
+    """
+    Return unsaved ``DocEditEvent`` rows for ``commands``. The websocket
+    consumer buffers them and writes them with ``flush_edit_events``.
+    """
+    now = timezone.now()
+    events = []
+    seen_command_ids = set()
+    for command in commands or []:
+        if not isinstance(command, dict):
+            continue
+        command_id = str(command.get("id") or "").strip()[:80]
+        if command_id:
+            if command_id in seen_command_ids:
+                continue
+            seen_command_ids.add(command_id)
+        command_type, summary = summarize_command(command)
+        events.append(
+            DocEditEvent(
+                room=room,
+                base_revision_id=base_revision_id,
+                user=user if getattr(user, "is_authenticated", False) else None,
+                command_id=command_id,
+                command_type=command_type[:40],
+                display_name=str(display_name or "")[:80],
+                summary=summary,
+                command_json=command,
+                created_at=now,
+            )
+        )
+    return events
+
+
+def flush_edit_events(events):
+    """Insert buffered edit events in one statement, skipping command ids already stored."""
+    if not events:
+        return []
+    command_ids = {event.command_id for event in events if event.command_id}
+    existing = set()
+    if command_ids:
+        existing = set(
+            DocEditEvent.objects.filter(
+                room_id__in={event.room_id for event in events},
+                command_id__in=command_ids,
+            ).values_list("command_id", flat=True)
+        )
+    fresh = [event for event in events if not event.command_id or event.command_id not in existing]
+    if fresh:
+        DocEditEvent.objects.bulk_create(fresh)
+    return fresh
+
+
 def update_presence(*, room, user, session_key, display_name, role, connected):
     presence, _created = DocPresence.objects.update_or_create(
         room=room,
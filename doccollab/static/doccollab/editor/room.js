@@ -1,10 +1,10 @@
-class b{constructor(t){this.iframe=t,this.pending=new Map,this.requestId=0,this.targetOrigin=new URL(t.src,window.location.href).origin,this.boundResponse=e=>this.handleResponse(e),window.addEventListener("message",this.boundResponse)}frameDocument(){return this.iframe.contentDocument||this.iframe.contentWindow?.document||null}handleResponse(t){if(t.source!==this.iframe.contentWindow||t.origin!==this.targetOrigin)return;const e=t.data||{};if(e.type!=="rhwp-response"||e.id==null)return;const s=this.pending.get(e.id);if(s){if(this.pending.delete(e.id),window.clearTimeout(s.timeoutId),e.error){s.reject(new Error(e.error));return}s.resolve(e.result)}}waitForFrameLoad(){return this.iframe.contentWindow&&this.iframe.dataset.loaded==="true"?Promise.resolve():new Promise((t,e)=>{const s=()=>{this.iframe.dataset.loaded="true",this.iframe.removeEventListener("error",n),t()},n=()=>{this.iframe.removeEventListener("load",s),e(new Error("편집기를 열지 못했습니다."))};this.iframe.addEventListener("load",s,{once:!0}),this.iframe.addEventListener("error",n,{once:!0})})}request(t,e={},s=3e4){return new Promise((n,o)=>{const a=++this.requestId,l=window.setTimeout(()=>{this.pending.delete(a),o(new Error(`요청 시간이 초과되었습니다: ${t}`))},s);this.pending.set(a,{resolve:n,reject:o,timeoutId:l}),this.iframe.contentWindow?.postMessage({type:"rhwp-request",id:a,method:t,params:e},this.targetOrigin)})}async waitReady(){await this.waitForFrameLoad();for(let t=0;t<40;t+=1){try{if(await this.request("ready",{},2500))return}catch{}await h(250)}throw new Error("rhwp 편집기 초기화가 지연되고 있습니다.")}async loadFile(t,e){return this.request("loadFile",{data:Array.from(t||[]),fileName:e},9e4)}async exportHwp(){const t=await this.request("exportHwp",{},9e4);return{bytes:Uint8Array.from(t?.data||[]),fileName:t?.fileName||"document.hwp",pageCount:Number(t?.pageCount||0)}}async exportHwpx(){const t=await this.request("exportHwpx",{},9e4);return{bytes:Uint8Array.from(t?.data||[]),fileName:t?.fileName||"document.hwpx",pageCount:Number(t?.pageCount||0)}}async fillWorksheetTemplate(t,e){return this.request("fillWorksheetTemplate",{content:t,layoutProfile:e},9e4)}async pageCount(){return this.request("pageCount",{},5e3)}async focus(){return this.request("focusEditor",{},5e3)}async applyCommandBatch(t,e){return this.request("applyCommandBatch",{batchId:t,commands:e},3e4)}async selectionState(){return this.request("selectionState",{},5e3)}async setCollaborationState(t){return this.request("setCollaborationState",{participantCount:t},5e3)}async waitForFrameSelector(t,e=40,s=120){for(let n=0;n<e;n+=1){const a=this.frameDocument()?.querySelector(t);if(a)return a;await h(s)}return null}async clickFrameButton(t){const e=await this.waitForFrameSelector(t,20,120);return e instanceof HTMLElement?(e.click(),!0):!1}async applyDefaultView(t="fitPage"){if(await this.waitForFrameLoad(),!await this.waitForFrameSelector("#scroll-container canvas",50,120))return!1;const s=t==="fitWidth"?"#sb-zoom-fit-width":"#sb-zoom-fit";return this.clickFrameButton(s)}destroy(){window.removeEventListener("message",this.boundResponse);for(const t of this.pending.values())window.clearTimeout(t.timeoutId),t.reject(new Error("편집기가 닫혔습니다."));this.pending.clear()}}class w{constructor(t,e){this.rootEl=t,this.payload=e,this.canEdit=!!(e.editingEnabled&&e.editingSupported),this.runtimeEditingEnabled=!!this.canEdit,this.statusBadge=document.getElementById("doccollab-status-badge"),this.snapshotBadge=document.getElementById("doccollab-snapshot-badge"),this.participantList=document.getElementById("doccollab-participant-list"),this.revisionList=document.getElementById("doccollab-revision-list"),this.editHistoryList=document.getElementById("doccollab-edit-history-list"),this.currentRevisionLabel=document.getElementById("doccollab-current-revision-label"),this.publishedRevisionLabel=document.getElementById("doccollab-published-revision-label"),this.downloadLink=document.getElementById("doccollab-download-link"),this.loadErrorEl=document.getElementById("doccollab-load-error"),this.loadErrorMessageEl=document.getElementById("doccollab-load-error-message"),this.saveButton=document.getElementById("doccollab-save-button"),this.publishButton=document.getElementById("doccollab-publish-button"),this.tableSelectionLabel=document.getElementById("doccollab-table-selection"),this.tableCommandButtons=Array.from(document.querySelectorAll("[data-doccollab-table-command]")),this.assistantForms=Array.from(document.querySelectorAll("[data-doccollab-assistant-form='true']")),this.assistantStatusEl=document.getElementById("doccollab-assistant-status"),this.assistantSummaryEl=document.getElementById("doccollab-assistant-summary"),this.assistantItemsEl=document.getElementById("doccollab-assistant-items"),this.questionForm=document.querySelector("[data-doccollab-question-form='true']"),this.questionInput=this.questionForm?.querySelector("input[name='question']"),this.questionButton=document.getElementById("doccollab-question-button"),this.assistantAnswerEl=document.getElementById("doccollab-assistant-answer"),this.assistantCitationsEl=document.getElementById("doccollab-assistant-citations"),this.renderedRevisionIds=new Set(Array.from(document.querySelectorAll("[data-revision-id]")).map(s=>s.dataset.revisionId).filter(Boolean)),this.renderedEditEventIds=new Set(Array.from(document.querySelectorAll("[data-edit-event-id]")).map(s=>s.dataset.editEventId).filter(Boolean)),this.snapshotTimer=null,this.pingTimer=null,this.reconnectTimer=null,this.reconnectAttempt=0,this.intentionalClose=!1,this.isDirty=!1,this.isSaving=!1,this.documentLoaded=!1,this.requiresCollabRefresh=!1,this.lastChangedAt=null,this.lastKnownPageCount=0,this.lastLocalRevisionId="",this.assistantBusy=!1,this.questionBusy=!1,this.baseRevisionId=e.collabState?.base_revision_id||e.currentRevision?.id||"",this.pendingReplayBatches=[],this.localBatchIds=new Set,this.participantCount=1,this.selectionState=null,this.clientSessionKey=S(),this.serverSessionKey="",this.boundFrameEvent=s=>this.handleFrameEvent(s),this.boundBeforeUnload=()=>this.handleBeforeUnload()}async start(){this.bindUI(),window.addEventListener("message",this.boundFrameEvent),window.addEventListener("beforeunload",this.boundBeforeUnload),this.connectSocket(),await this.mountEditor(),this.payload.initialFileUrl?(await this.loadDocument(this.payload.initialFileUrl),this.setStatus(this.runtimeEditingEnabled?"편집 준비 완료":"보기 모드")):this.setStatus("불러올 문서가 없습니다.",!0)}bindUI(){this.saveButton?.addEventListener("click",()=>{this.saveRevision()}),this.tableCommandButtons.forEach(t=>{t.addEventListener("click",()=>{this.applyTableCommand(t.dataset.doccollabTableCommand||"")})}),this.assistantForms.forEach(t=>{t.addEventListener("submit",e=>{e.preventDefault(),this.runAssistantAnalysis()})}),this.questionForm?.addEventListener("submit",t=>{t.preventDefault(),this.askAssistantQuestion()}),this.renderAssistantAnalysis(this.payload.assistantAnalysis||null,{keepAnswer:!0}),this.updateTablePanel()}async mountEditor(){const t=document.createElement("iframe");t.id="doccollab-editor-frame",t.className="doccollab-editor-frame",t.setAttribute("title","rhwp 문서 편집기"),t.setAttribute("allow","clipboard-read; clipboard-write");const e=new URL(this.payload.studioUrl,window.location.origin);e.searchParams.set("embed","doccollab"),this.canEdit||e.searchParams.set("readonly","1"),t.src=e.toString(),this.rootEl.innerHTML="",this.rootEl.appendChild(t),this.editor=new b(t),this.setStatus("편집기 로딩"),await this.editor.waitReady()}async loadDocument(t){try{const e=await fetch(t,{credentials:"same-origin"});if(!e.ok)throw new Error("문서를 불러오지 못했습니다.");const s=new Uint8Array(await e.arrayBuffer()),n=await this.editor.loadFile(s,this.initialFileName());this.lastKnownPageCount=Number(n?.pageCount||0),this.snapshotBadge.textContent=this.runtimeEditingEnabled?"편집 중":"보기 모드",this.documentLoaded=!0,await this.applyOpeningViewport(),await this.replayPendingBatches(),await this.syncCollaborationState(),await this.refreshSelectionState(),this.runtimeEditingEnabled&&this.editor.focus().catch(()=>{})}catch(e){throw this.showLoadError(e),e}}async applyOpeningViewport(){if(!this.editor)return;const t=["fitPage","fitWidth"],e=[120,320,640];for(const s of e){await h(s);for(const n of t)if(await this.editor.applyDefaultView(n).catch(()=>!1))return}}handleFrameEvent(t){if(!this.editor||t.source!==this.editor.iframe.contentWindow||t.origin!==this.editor.targetOrigin)return;const e=t.data||{};if(e.type==="rhwp-event")switch(e.event){case"documentChanged":this.onDocumentChanged(e.payload||{});break;case"commandExecuted":this.onCommandExecuted(e.payload||{});break;case"selectionChanged":this.onSelectionChanged(e.payload||{});break;case"saveRequested":this.runtimeEditingEnabled&&this.saveRevision();break;case"loaded":e.payload?.pageCount&&(this.lastKnownPageCount=Number(e.payload.pageCount||0),this.applyOpeningViewport().catch(()=>{}),this.replayPendingBatches().catch(()=>{}),this.syncCollaborationState().catch(()=>{}));break}}onDocumentChanged(t){this.runtimeEditingEnabled&&(this.isDirty=!0,this.lastChangedAt=t.changedAt||new Date().toISOString(),this.lastKnownPageCount=Number(t.pageCount||this.lastKnownPageCount||0),this.snapshotBadge.textContent="자동 저장 예정",this.setStatus(this.requiresCollabRefresh?"새 저장본 확인 필요":"수정 중"),this.scheduleSnapshot())}onCommandExecuted(t){if(!this.runtimeEditingEnabled)return;const e=Array.isArray(t.commands)?t.commands.filter(Boolean):[];e.length&&this.sendCommandBatch(e,t.selection||{})}onSelectionChanged(t){this.refreshSelectionState(t||{}),!(!this.runtimeEditingEnabled||!this.socket||this.socket.readyState!==WebSocket.OPEN)&&this.socket.send(JSON.stringify({type:"editor.selection",payload:{senderSessionKey:this.sessionKey(),selection:t||{}}}))}scheduleSnapshot(){!this.payload.snapshotUrl||!this.runtimeEditingEnabled||(this.snapshotTimer&&window.clearTimeout(this.snapshotTimer),this.snapshotTimer=window.setTimeout(()=>{this.postSnapshot()},4e3))}async postSnapshot(){if(!(!this.isDirty||!this.runtimeEditingEnabled))try{if(!(await fetch(this.payload.snapshotUrl,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":d(this.payload.csrfToken)},body:JSON.stringify(this.buildSnapshotPayload()),credentials:"same-origin"})).ok){this.snapshotBadge.textContent="자동 저장 실패",this.setStatus("자동 저장 실패",!0);return}this.snapshotBadge.textContent="자동 저장 완료"}catch{this.snapshotBadge.textContent="자동 저장 실패",this.setStatus("자동 저장 실패",!0)}}buildSnapshotPayload(){return{roomId:this.payload.roomId,sourceFormat:this.payload.sourceFormat,saveFormat:this.payload.saveFormat,currentRevisionId:this.payload.currentRevision?.id||null,pageCount:this.lastKnownPageCount,dirty:this.isDirty,fileName:this.initialFileName(),changedAt:this.lastChangedAt,savedAt:new Date().toISOString()}}async saveRevision(){if(!this.editor){this.setStatus("편집기를 먼저 열어 주세요.",!0);return}if(!(!this.runtimeEditingEnabled||this.isSaving)){this.isSaving=!0,this.saveButton?.setAttribute("disabled","disabled"),this.saveButton?.setAttribute("aria-busy","true"),this.setStatus("저장 중");try{const t=this.payload.saveFormat==="hwpx",e=t?await this.editor.exportHwpx():await this.editor.exportHwp();this.lastKnownPageCount=Number(e.pageCount||this.lastKnownPageCount||0);const s=E(e.fileName||this.initialFileName()||this.payload.title,this.payload.saveFormat),n=new FormData;n.append("export_file",new File([e.bytes],s,{type:t?"application/vnd.hancom.hwpx":"application/x-hwp"})),n.append("note","온라인 편집 저장"),n.append("snapshot_json",JSON.stringify(this.buildSnapshotPayload()));const o=await fetch(this.payload.saveRevisionUrl,{method:"POST",headers:{"X-CSRFToken":d(this.payload.csrfToken)},body:n,credentials:"same-origin"}),a=await c(o);if(!o.ok){const l=a.message||"저장 실패";this.setStatus(l,!0);return}a.revision&&(this.lastLocalRevisionId=a.revision.id||"",this.baseRevisionId=a.revision.id||this.baseRevisionId,this.requiresCollabRefresh=!1,this.pendingReplayBatches=[],this.upsertRevision(a.revision),this.broadcastSavedRevision(a.revision.id||"",a.edit_events||[]),this.resetAssistantForNewRevision()),Array.isArray(a.edit_history)?this.replaceEditHistory(a.edit_history):Array.isArray(a.edit_events)&&this.prependEditHistory(a.edit_events),this.isDirty=!1,this.snapshotBadge.textContent="저장 완료",this.setStatus("저장 완료")}catch{this.setStatus("저장 실패",!0)}finally{this.isSaving=!1,this.saveButton?.removeAttribute("disabled"),this.saveButton?.removeAttribute("aria-busy")}}}async runAssistantAnalysis(){if(!(!this.payload.assistantEnabled||!this.payload.assistantAnalyzeUrl||this.assistantBusy)){this.assistantBusy=!0,this.setAssistantButtonsDisabled(!0),this.setAssistantStatus("정리 중");try{const t=await fetch(this.payload.assistantAnalyzeUrl,{method:"POST",headers:{Accept:"application/json","X-Requested-With":"XMLHttpRequest","X-CSRFToken":d(this.payload.csrfToken)},credentials:"same-origin"}),e=await c(t);if(!t.ok)throw new Error(e.message||"다시 시도");this.payload.assistantAnalysis=e.analysis||null,this.renderAssistantAnalysis(this.payload.assistantAnalysis),this.setStatus("AI 정리 완료")}catch(t){const e=t?.message||"다시 시도";this.setAssistantStatus(e,!0),this.setStatus(e,!0)}finally{this.assistantBusy=!1,this.setAssistantButtonsDisabled(!1)}}}async askAssistantQuestion(){if(!this.payload.assistantEnabled||!this.payload.assistantAskUrl||this.questionBusy)return;const t=String(this.questionInput?.value||"").trim();if(!t){this.renderQuestionError("질문을 입력해 주세요."),this.questionInput?.focus();return}this.questionBusy=!0,this.questionButton&&(this.questionButton.disabled=!0,this.questionButton.setAttribute("aria-busy","true")),this.renderQuestionError("");try{const e=await fetch(this.payload.assistantAskUrl,{method:"POST",headers:{Accept:"application/json","Content-Type":"application/json","X-Requested-With":"XMLHttpRequest","X-CSRFToken":d(this.payload.csrfToken)},body:JSON.stringify({question:t}),credentials:"same-origin"}),s=await c(e);if(!e.ok)throw new Error(s.message||"다시 시도");this.renderQuestionAnswer(s)}catch(e){const s=e?.message||"다시 시도";this.renderQuestionError(s)}finally{this.questionBusy=!1,this.questionButton&&(this.questionButton.disabled=!1,this.questionButton.removeAttribute("aria-busy"))}}renderAssistantAnalysis(t,e={}){if(!this.assistantStatusEl)return;if(!t){this.setAssistantStatus("정리 전"),this.assistantSummaryEl&&(this.assistantSummaryEl.textContent="AI 정리 전"),this.renderAssistantItems([]),e.keepAnswer||this.clearAssistantAnswer();return}const s=t.status==="failed";this.setAssistantStatus(t.status_label||t.status||"정리 완료",s),this.assistantSummaryEl&&(this.assistantSummaryEl.textContent=t.summary_text||t.error_message||"정리 결과 없음"),this.renderAssistantItems(Array.isArray(t.work_items)?t.work_items:[]),e.keepAnswer||this.clearAssistantAnswer()}renderAssistantItems(t){if(this.assistantItemsEl){if(this.assistantItemsEl.innerHTML="",!t.length){const e=document.createElement("div");e.className="doccollab-empty",e.textContent="정리 후 표시됩니다.",this.assistantItemsEl.appendChild(e);return}t.slice(0,8).forEach(e=>{const s=document.createElement("div");s.className="doccollab-assistant-item";const n=document.createElement("strong");n.textContent=e.title||"확인";const o=document.createElement("span");if(o.textContent=e.action_text||e.evidence_text||"",s.append(n,o),e.due_text){const a=document.createElement("em");a.textContent=e.due_text,s.appendChild(a)}this.assistantItemsEl.appendChild(s)})}}renderQuestionAnswer(t){this.assistantAnswerEl&&(this.assistantAnswerEl.hidden=!1,this.assistantAnswerEl.textContent=t.answer||"답변 없음",this.assistantAnswerEl.classList.toggle("doccollab-assistant-answer--muted",!!t.has_insufficient_evidence),this.renderQuestionCitations(Array.isArray(t.citations)?t.citations:[]))}renderQuestionError(t){if(this.assistantAnswerEl){if(!t){this.assistantAnswerEl.hidden=!0,this.assistantAnswerEl.textContent="",this.renderQuestionCitations([]);return}this.assistantAnswerEl.hidden=!1,this.assistantAnswerEl.textContent=t,this.assistantAnswerEl.classList.add("doccollab-assistant-answer--muted"),this.renderQuestionCitations([])}}renderQuestionCitations(t){this.assistantCitationsEl&&(this.assistantCitationsEl.innerHTML="",t.slice(0,3).forEach(e=>{const s=document.createElement("div");s.className="doccollab-assistant-citation";const n=document.createElement("strong");n.textContent=e.label||"근거";const o=document.createElement("span");o.textContent=e.text||"",s.append(n,o),this.assistantCitationsEl.appendChild(s)}))}clearAssistantAnswer(){this.renderQuestionError("")}resetAssistantForNewRevision(){this.payload.assistantEnabled&&(this.payload.assistantAnalysis=null,this.renderAssistantAnalysis(null))}setAssistantStatus(t,e=!1){this.assistantStatusEl&&(this.assistantStatusEl.textContent=t,this.assistantStatusEl.style.background=e?"#fef2f2":"",this.assistantStatusEl.style.color=e?"#b91c1c":"")}setAssistantButtonsDisabled(t){this.assistantForms.forEach(e=>{e.querySelectorAll("button").forEach(s=>{s.disabled=t,t?s.setAttribute("aria-busy","true"):s.removeAttribute("aria-busy")})})}connectSocket(){this.payload.wsUrl&&(this.socket=new WebSocket(g(this.payload.wsUrl)),this.socket.addEventListener("open",()=>{this.reconnectAttempt=0,this.startPinging()}),this.socket.addEventListener("close",()=>{this.pingTimer&&window.clearInterval(this.pingTimer),this.intentionalClose||this.scheduleReconnect()}),this.socket.addEventListener("message",t=>this.handleSocketMessage(t)))}handleSocketMessage(t){const e=y(t.data||"{}");if(!e){this.setStatus("실시간 지연",!0);return}switch(e.type){case"room.snapshot":this.handleRoomSnapshot(e.payload||{});break;case"presence.join":case"presence.leave":this.updateParticipants(e.payload?.participants||[]);break;case"editor.command":this.handleBroadcastCommand(e.payload||{});break;case"editor.selection":this.handleBroadcastSelection(e.payload||{});break;case"revision.saved":this.handleRevisionSaved(e.payload||{});break;case"error":this.handleSocketError(e.payload||{});break}}handleRoomSnapshot(t){t.session_key&&(this.serverSessionKey=String(t.session_key)),this.updateParticipants(t.presence||[]),this.syncRevisionState(t||{}),this.replaceEditHistory(t.edit_history||[]),this.queueSnapshotBatches(t.collab_state||{})}handleBroadcastCommand(t){Array.isArray(t.edit_history)?this.replaceEditHistory(t.edit_history):Array.isArray(t.edit_events)&&this.prependEditHistory(t.edit_events);const e=String(t.batchId||"").trim();if(e){if(this.localBatchIds.has(e)){this.localBatchIds.delete(e);return}if(t.baseRevisionId&&this.baseRevisionId&&t.baseRevisionId!==this.baseRevisionId){this.requiresCollabRefresh=!0,this.setStatus("다른 저장본 기준의 수정이 들어왔습니다. 저장 후 다시 열어 주세요.",!0);return}this.pendingReplayBatches.push({batchId:e,commands:Array.isArray(t.commands)?t.commands:[]}),this.replayPendingBatches().catch(()=>{})}}handleBroadcastSelection(t){}handleRevisionSaved(t){if(t.revision){const e=t.revision.id||"";if(this.upsertRevision(t.revision),Array.isArray(t.edit_history)?this.replaceEditHistory(t.edit_history):Array.isArray(t.edit_events)&&this.prependEditHistory(t.edit_events),t.published&&this.syncPublishedRevision(t.revision),e===this.lastLocalRevisionId){this.baseRevisionId=e,this.requiresCollabRefresh=!1,this.updateTablePanel();return}if(this.isDirty){this.requiresCollabRefresh=!0,this.setStatus("새 저장본이 생겼습니다. 저장 후 다시 열면 최신본이 맞춰집니다."),this.updateTablePanel();return}this.baseRevisionId=e||this.baseRevisionId,this.requiresCollabRefresh=!1,this.setStatus("최신 저장본으로 맞춰졌습니다."),this.updateTablePanel()}}handleSocketError(t){const e=String(t.message||"연결 오류");if(e.includes("stale base revision")){this.requiresCollabRefresh=!0,this.setStatus("다른 저장본 기준이라 함께 수정이 잠시 멈췄습니다. 저장 후 다시 열어 주세요.",!0),this.updateTablePanel();return}this.setStatus(e,!0)}broadcastSavedRevision(t,e=[]){!t||!this.socket||this.socket.readyState!==WebSocket.OPEN||this.socket.send(JSON.stringify({type:"revision.saved",payload:{revisionId:t,editEvents:e}}))}async refreshSelectionState(t=null){const e={...t||{}};if(this.editor)try{const s=await this.editor.selectionState();Object.assign(e,s||{})}catch{}this.selectionState={...this.selectionState||{},...e},this.updateTablePanel()}updateTablePanel(){const t=!!(this.runtimeEditingEnabled&&this.documentLoaded&&this.selectionState?.inTable&&this.selectionState?.cellInfo&&this.selectionState?.cursor);if(this.tableSelectionLabel)if(t){const e=Number(this.selectionState.cellInfo.row||0)+1,s=Number(this.selectionState.cellInfo.col||0)+1;this.tableSelectionLabel.textContent=`${e}행 ${s}열`}else this.tableSelectionLabel.textContent=this.runtimeEditingEnabled?"셀 선택 필요":"보기 모드";this.tableCommandButtons.forEach(e=>{e.disabled=!t||this.requiresCollabRefresh})}buildTableCommand(t){const e=this.selectionState?.cursor?JSON.parse(JSON.stringify(this.selectionState.cursor)):null,s=this.selectionState?.cellInfo||null;if(!e||!s)return null;const n=Number(s.row||0),o=Number(s.col||0),a=`${t}-${Date.now()}-${Math.random().toString(36).slice(2,7)}`;switch(t){case"insert-row-below":return{id:a,type:"table_row_insert",position:e,row:n,below:!0};case"insert-col-right":return{id:a,type:"table_col_insert",position:e,col:o,right:!0};case"delete-row":return{id:a,type:"table_row_delete",position:e,row:n};case"delete-col":return{id:a,type:"table_col_delete",position:e,col:o};default:return null}}async applyTableCommand(t){if(!this.runtimeEditingEnabled||!this.editor)return;const e=this.buildTableCommand(t);if(!e){this.setStatus("표 셀을 먼저 선택해 주세요.",!0),await this.refreshSelectionState();return}if(this.requiresCollabRefresh){this.setStatus("새 저장본 확인 전에는 표 수정이 잠시 멈춥니다.",!0);return}const s=this.nextBatchId();if(this.localBatchIds.add(s),m(this.localBatchIds,180),!(await this.editor.applyCommandBatch(s,[e]).catch(()=>null))?.applied){this.localBatchIds.delete(s),this.setStatus("표 수정이 반영되지 않았습니다.",!0),await this.refreshSelectionState();return}this.sendExistingBatch(s,[e],this.selectionState||{}),this.setStatus("표 수정 반영 중"),await this.refreshSelectionState()}queueSnapshotBatches(t){t?.base_revision_id&&(this.baseRevisionId=t.base_revision_id);const e=Array.isArray(t?.updates)?t.updates:[];this.pendingReplayBatches=e.filter(s=>s&&s.batchId).map(s=>({batchId:String(s.batchId),commands:Array.isArray(s.commands)?s.commands:[]})),this.replayPendingBatches().catch(()=>{})}async replayPendingBatches(){if(!(!this.documentLoaded||!this.editor||!this.pendingReplayBatches.length))for(;this.pendingReplayBatches.length;){const t=this.pendingReplayBatches.shift();if(!t?.batchId)continue;if(!(await this.editor.applyCommandBatch(t.batchId,t.commands||[]))?.applied){this.setStatus("다른 탭 수정 반영 실패",!0);return}}}sendCommandBatch(t,e){if(!this.socket||this.socket.readyState!==WebSocket.OPEN||!Array.isArray(t)||!t.length)return;if(this.requiresCollabRefresh){this.setStatus("새 저장본 확인 전에는 함께 수정이 잠시 멈춥니다.",!0);return}const s=this.nextBatchId();this.localBatchIds.add(s),m(this.localBatchIds,180),this.sendExistingBatch(s,t,e)}sendExistingBatch(t,e,s){!this.socket||this.socket.readyState!==WebSocket.OPEN||!Array.isArray(e)||!e.length||this.socket.send(JSON.stringify({type:"editor.command",payload:{batchId:t,baseRevisionId:this.baseRevisionId||this.payload.currentRevision?.id||"",senderSessionKey:this.sessionKey(),commands:e,selection:s||{}}}))}nextBatchId(){return`batch-${Date.now()}-${Math.random().toString(36).slice(2,8)}`}sessionKey(){return this.serverSessionKey||this.clientSessionKey}scheduleReconnect(){if(this.reconnectTimer)return;const t=Math.min(5e3,1e3*2**this.reconnectAttempt);this.reconnectAttempt+=1,this.reconnectTimer=window.setTimeout(()=>{this.reconnectTimer=null,this.connectSocket()},t)}startPinging(){this.pingTimer&&window.clearInterval(this.pingTimer),this.pingTimer=window.setInterval(()=>{this.socket?.readyState===WebSocket.OPEN&&this.socket.send(JSON.stringify({type:"ping",payload:{}}))},2e4)}updateParticipants(t){this.participantCount=Math.max(1,t.length||0),this.participantList&&(this.participantList.innerHTML="",t.length?t.forEach(e=>{const s=document.createElement("div");s.className="doccollab-room-row",s.innerHTML=`
+const k=new Set(["delete_text","delete_selection"]);function v(i,t=0){return typeof i=="number"?Number.isFinite(i)?Math.trunc(i):t:typeof i=="boolean"?Number(i):typeof i=="string"&&/^\s*[+-]?\d+\s*$/.test(i)?Number.parseInt(i,10):t}function x(i){return String(i||"").length}function A(i){return JSON.parse(JSON.stringify(i))}function B(i){return!!i&&typeof i=="object"&&!Array.isArray(i)}function C(i,t){return JSON.stringify(i)===JSON.stringify(t)}function D(i,t){return C(i[0],t[0])&&i[1]===t[1]&&i[2]===t[2]}function F(i){if(!B(i)||i.isTextBox||(i.cellPath||[]).length>1)return null;const t=v(i.sectionIndex),e=v(i.charOffset);return i.parentParaIndex==null?[[t,null],v(i.paragraphIndex),e]:[[t,[v(i.parentParaIndex),v(i.controlIndex),v(i.cellIndex)]],v(i.cellParaIndex),e]}function I(i,t){const e=A(i),[[,s],n,o]=t;return e.charOffset=o,s===null?(e.paragraphIndex=n,e):(e.parentParaIndex=s[0],e.cellParaIndex=n,Array.isArray(e.cellPath)&&B(e.cellPath[0])&&(e.cellPath[0].cellParaIndex=n),e)}function L(i){const t=i.type;if(t==="insert_text"||t==="insert_tab"||t==="table_cell_text"&&i.action!=="delete"){const e=F(i.position),s=t==="insert_tab"?1:x(i.text);return e===null||s<=0?null:["insert",e,s]}if(t==="delete_text"||t==="delete_selection"||t==="table_cell_text"){const e=N(i);return e?["delete",...e]:null}if(t==="split_paragraph"){const e=F(i.position);return e?["split",e]:null}return t==="merge_paragraph"?M(i):null}function M(i){const t=F(i.position);if(t===null)return null;const[e,s,n]=t;return i.action==="delete"?["join",e,s,n]:s<=0?null:["join",e,s-1,null]}function N(i){if(i.type==="delete_selection"){let o=F(i.start),a=F(i.end);return o===null||a===null||!C(o[0],a[0])?null:(O(a,o)&&([o,a]=[a,o]),[o,a])}const t=F(i.position);if(t===null)return null;const[e,s,n]=t,l=Math.max(0,v(i.count,1)),r=i.direction==="backward"?Math.max(0,n-l):n;return[[e,s,r],[e,s,r+l]]}function O(i,t){return i[1]<t[1]||i[1]===t[1]&&i[2]<t[2]}function P(i,t){const[e,s]=i;if(s===null)return i;const n=R([[e,null],s[0],0],t,!1);return n[1]===s[0]?i:[e,[n[1],s[1],s[2]]]}function R(i,t,e){const[s,n,o]=i,a=t[0],l=a==="join"?t[1]:t[1][0];if(!C(s,l))return s[0]===l[0]&&l[1]===null&&s[1]!==null?[P(s,t),n,o]:i;if(a==="insert"){const[,[,c,f],h]=t;return n===c&&(o>f||o===f&&e)?[s,n,o+h]:i}if(a==="delete"){const[,c,f]=t;return O(c,i)?O(f,i)?n===f[1]?[s,c[1],c[2]+o-f[2]]:[s,n-(f[1]-c[1]),o]:c:i}if(a==="split"){const[,[,c,f]]=t;return n>c?[s,n+1,o]:n===c&&(o>f||o===f&&e)?[s,n+1,o-f]:i}const[,,r,u]=t;return n===r+1?[s,r,(u||0)+o]:n>r+1?[s,n-1,o]:i}function T(i,t,e){if(!O(t,e))return null;const s=A(i);if(i.type==="delete_selection"||t[1]!==e[1]){const o=i.start||i.position||{},a=i.end||i.position||{};return delete s.position,delete s.count,delete s.direction,delete s.deletedText,s.type="delete_selection",s.start=I(o,t),s.end=I(a,e),s}const n=e[2]-t[2];return n!==v(i.count,1)&&delete s.deletedText,s.position=I(i.position||{},t),s.count=n,s.direction="forward",s}function U(i,t,e){const[s,n]=e,o=t[0];if(o==="insert"||o==="split"){const l=t[1];if(C(l[0],s[0])&&O(s,l)&&O(l,n)){const r=o==="insert"?[l[0],l[1],l[2]+t[2]]:[l[0],l[1]+1,0],c=R(n,t,!1);return[T(i,r,c),T(i,s,l)].filter(Boolean)}}const a=T(i,R(s,t,!0),R(n,t,!1));return a?[a]:[]}function V(i,t,e=!0){const s=L(t);if(s===null)return[i];const n=L(i);if(n!==null&&n[0]==="join"){const[,l,r]=n;if(s[0]==="join"&&C(s[1],l)&&s[2]===r||s[0]==="delete"&&C(s[1][0],l)&&s[1][1]<=r&&r<s[2][1])return[]}if(k.has(i.type)||i.type==="table_cell_text"&&i.action==="delete"){const l=N(i);return l===null?[i]:U(i,s,l)}const o=F(i.position);if(o===null)return[i];n!==null&&n[0]==="join"&&n[3]!==null&&(e=!0);const a=R(o,s,e);if(D(a,o))return[i];const l=A(i);return l.position=I(i.position,a),[l]}function W(i,t){const e=[];let s=t.filter(B);for(const n of i.filter(B)){let o=[n];const a=[];for(const l of s){if(!o.length){a.push(l);continue}let r,c;o.length===1?(r=V(o[0],l,!0),c=V(l,o[0],!1)):[r,c]=W(o,[l]),o=r,a.push(...c)}s=a,e.push(...o)}return[e,s]}class b{constructor(t){this.iframe=t,this.pending=new Map,this.requestId=0,this.targetOrigin=new URL(t.src,window.location.href).origin,this.boundResponse=e=>this.handleResponse(e),window.addEventListener("message",this.boundResponse)}frameDocument(){return this.iframe.contentDocument||this.iframe.contentWindow?.document||null}handleResponse(t){if(t.source!==this.iframe.contentWindow||t.origin!==this.targetOrigin)return;const e=t.data||{};if(e.type!=="rhwp-response"||e.id==null)return;const s=this.pending.get(e.id);if(s){if(this.pending.delete(e.id),window.clearTimeout(s.timeoutId),e.error){s.reject(new Error(e.error));return}s.resolve(e.result)}}waitForFrameLoad(){return this.iframe.contentWindow&&this.iframe.dataset.loaded==="true"?Promise.resolve():new Promise((t,e)=>{const s=()=>{this.iframe.dataset.loaded="true",this.iframe.removeEventListener("error",n),t()},n=()=>{this.iframe.removeEventListener("load",s),e(new Error("편집기를 열지 못했습니다."))};this.iframe.addEventListener("load",s,{once:!0}),this.iframe.addEventListener("error",n,{once:!0})})}request(t,e={},s=3e4){return new Promise((n,o)=>{const a=++this.requestId,l=window.setTimeout(()=>{this.pending.delete(a),o(new Error(`요청 시간이 초과되었습니다: ${t}`))},s);this.pending.set(a,{resolve:n,reject:o,timeoutId:l}),this.iframe.contentWindow?.postMessage({type:"rhwp-request",id:a,method:t,params:e},this.targetOrigin)})}async waitReady(){await this.waitForFrameLoad();for(let t=0;t<40;t+=1){try{if(await this.request("ready",{},2500))return}catch{}await h(250)}throw new Error("rhwp 편집기 초기화가 지연되고 있습니다.")}async loadFile(t,e){return this.request("loadFile",{data:Array.from(t||[]),fileName:e},9e4)}async exportHwp(){const t=await this.request("exportHwp",{},9e4);return{bytes:Uint8Array.from(t?.data||[]),fileName:t?.fileName||"document.hwp",pageCount:Number(t?.pageCount||0)}}async exportHwpx(){const t=await this.request("exportHwpx",{},9e4);return{bytes:Uint8Array.from(t?.data||[]),fileName:t?.fileName||"document.hwpx",pageCount:Number(t?.pageCount||0)}}async fillWorksheetTemplate(t,e){return this.request("fillWorksheetTemplate",{content:t,layoutProfile:e},9e4)}async pageCount(){return this.request("pageCount",{},5e3)}async focus(){return this.request("focusEditor",{},5e3)}async applyCommandBatch(t,e){return this.request("applyCommandBatch",{batchId:t,commands:e},3e4)}async selectionState(){return this.request("selectionState",{},5e3)}async setCollaborationState(t){return this.request("setCollaborationState",{participantCount:t},5e3)}async waitForFrameSelector(t,e=40,s=120){for(let n=0;n<e;n+=1){const a=this.frameDocument()?.querySelector(t);if(a)return a;await h(s)}return null}async clickFrameButton(t){const e=await this.waitForFrameSelector(t,20,120);return e instanceof HTMLElement?(e.click(),!0):!1}async applyDefaultView(t="fitPage"){if(await this.waitForFrameLoad(),!await this.waitForFrameSelector("#scroll-container canvas",50,120))return!1;const s=t==="fitWidth"?"#sb-zoom-fit-width":"#sb-zoom-fit";return this.clickFrameButton(s)}destroy(){window.removeEventListener("message",this.boundResponse);for(const t of this.pending.values())window.clearTimeout(t.timeoutId),t.reject(new Error("편집기가 닫혔습니다."));this.pending.clear()}}class w{constructor(t,e){this.rootEl=t,this.payload=e,this.canEdit=!!(e.editingEnabled&&e.editingSupported),this.runtimeEditingEnabled=!!this.canEdit,this.statusBadge=document.getElementById("doccollab-status-badge"),this.snapshotBadge=document.getElementById("doccollab-snapshot-badge"),this.participantList=document.getElementById("doccollab-participant-list"),this.revisionList=document.getElementById("doccollab-revision-list"),this.editHistoryList=document.getElementById("doccollab-edit-history-list"),this.currentRevisionLabel=document.getElementById("doccollab-current-revision-label"),this.publishedRevisionLabel=document.getElementById("doccollab-published-revision-label"),this.downloadLink=document.getElementById("doccollab-download-link"),this.loadErrorEl=document.getElementById("doccollab-load-error"),this.loadErrorMessageEl=document.getElementById("doccollab-load-error-message"),this.saveButton=document.getElementById("doccollab-save-button"),this.publishButton=document.getElementById("doccollab-publish-button"),this.tableSelectionLabel=document.getElementById("doccollab-table-selection"),this.tableCommandButtons=Array.from(document.querySelectorAll("[data-doccollab-table-command]")),this.assistantForms=Array.from(document.querySelectorAll("[data-doccollab-assistant-form='true']")),this.assistantStatusEl=document.getElementById("doccollab-assistant-status"),this.assistantSummaryEl=document.getElementById("doccollab-assistant-summary"),this.assistantItemsEl=document.getElementById("doccollab-assistant-items"),this.questionForm=document.querySelector("[data-doccollab-question-form='true']"),this.questionInput=this.questionForm?.querySelector("input[name='question']"),this.questionButton=document.getElementById("doccollab-question-button"),this.assistantAnswerEl=document.getElementById("doccollab-assistant-answer"),this.assistantCitationsEl=document.getElementById("doccollab-assistant-citations"),this.renderedRevisionIds=new Set(Array.from(document.querySelectorAll("[data-revision-id]")).map(s=>s.dataset.revisionId).filter(Boolean)),this.renderedEditEventIds=new Set(Array.from(document.querySelectorAll("[data-edit-event-id]")).map(s=>s.dataset.editEventId).filter(Boolean)),this.snapshotTimer=null,this.pingTimer=null,this.reconnectTimer=null,this.reconnectAttempt=0,this.intentionalClose=!1,this.isDirty=!1,this.isSaving=!1,this.documentLoaded=!1,this.requiresCollabRefresh=!1,this.lastChangedAt=null,this.lastKnownPageCount=0,this.lastLocalRevisionId="",this.assistantBusy=!1,this.questionBusy=!1,this.baseRevisionId=e.collabState?.base_revision_id||e.currentRevision?.id||"",this.pendingReplayBatches=[],this.replayingBatches=!1,this.sequenceGapTimer=null,this.sequenceGapExpired=!1,this.skippedSeqs=new Set,this.lastSeq=null,this.unackedBatches=[],this.inflightBatchId="",this.participantCount=1,this.selectionState=null,this.clientSessionKey=S(),this.serverSessionKey="",this.boundFrameEvent=s=>this.handleFrameEvent(s),this.boundBeforeUnload=()=>this.handleBeforeUnload()}async start(){this.bindUI(),window.addEventListener("message",this.boundFrameEvent),window.addEventListener("beforeunload",this.boundBeforeUnload),this.connectSocket(),await this.mountEditor(),this.payload.initialFileUrl?(await this.loadDocument(this.payload.initialFileUrl),this.setStatus(this.runtimeEditingEnabled?"편집 준비 완료":"보기 모드")):this.setStatus("불러올 문서가 없습니다.",!0)}bindUI(){this.saveButton?.addEventListener("click",()=>{this.saveRevision()}),this.tableCommandButtons.forEach(t=>{t.addEventListener("click",()=>{this.applyTableCommand(t.dataset.doccollabTableCommand||"")})}),this.assistantForms.forEach(t=>{t.addEventListener("submit",e=>{e.preventDefault(),this.runAssistantAnalysis()})}),this.questionForm?.addEventListener("submit",t=>{t.preventDefault(),this.askAssistantQuestion()}),this.renderAssistantAnalysis(this.payload.assistantAnalysis||null,{keepAnswer:!0}),this.updateTablePanel()}async mountEditor(){const t=document.createElement("iframe");t.id="doccollab-editor-frame",t.className="doccollab-editor-frame",t.setAttribute("title","rhwp 문서 편집기"),t.setAttribute("allow","clipboard-read; clipboard-write");const e=new URL(this.payload.studioUrl,window.location.origin);e.searchParams.set("embed","doccollab"),this.canEdit||e.searchParams.set("readonly","1"),t.src=e.toString(),this.rootEl.innerHTML="",this.rootEl.appendChild(t),this.editor=new b(t),this.setStatus("편집기 로딩"),await this.editor.waitReady()}async loadDocument(t){try{const e=await fetch(t,{credentials:"same-origin"});if(!e.ok)throw new Error("문서를 불러오지 못했습니다.");const s=new Uint8Array(await e.arrayBuffer()),n=await this.editor.loadFile(s,this.initialFileName());this.lastKnownPageCount=Number(n?.pageCount||0),this.snapshotBadge.textContent=this.runtimeEditingEnabled?"편집 중":"보기 모드",this.documentLoaded=!0,await this.applyOpeningViewport(),await this.replayPendingBatches(),await this.syncCollaborationState(),await this.refreshSelectionState(),this.runtimeEditingEnabled&&this.editor.focus().catch(()=>{})}catch(e){throw this.showLoadError(e),e}}async applyOpeningViewport(){if(!this.editor)return;const t=["fitPage","fitWidth"],e=[120,320,640];for(const s of e){await h(s);for(const n of t)if(await this.editor.applyDefaultView(n).catch(()=>!1))return}}handleFrameEvent(t){if(!this.editor||t.source!==this.editor.iframe.contentWindow||t.origin!==this.editor.targetOrigin)return;const e=t.data||{};if(e.type==="rhwp-event")switch(e.event){case"documentChanged":this.onDocumentChanged(e.payload||{});break;case"commandExecuted":this.onCommandExecuted(e.payload||{});break;case"selectionChanged":this.onSelectionChanged(e.payload||{});break;case"saveRequested":this.runtimeEditingEnabled&&this.saveRevision();break;case"loaded":e.payload?.pageCount&&(this.lastKnownPageCount=Number(e.payload.pageCount||0),this.applyOpeningViewport().catch(()=>{}),this.replayPendingBatches().catch(()=>{}),this.syncCollaborationState().catch(()=>{}));break}}onDocumentChanged(t){this.runtimeEditingEnabled&&(this.isDirty=!0,this.lastChangedAt=t.changedAt||new Date().toISOString(),this.lastKnownPageCount=Number(t.pageCount||this.lastKnownPageCount||0),this.snapshotBadge.textContent="자동 저장 예정",this.setStatus(this.requiresCollabRefresh?"새 저장본 확인 필요":"수정 중"),this.scheduleSnapshot())}onCommandExecuted(t){if(!this.runtimeEditingEnabled)return;const e=Array.isArray(t.commands)?t.commands.filter(Boolean):[];e.length&&this.sendCommandBatch(e,t.selection||{})}onSelectionChanged(t){this.refreshSelectionState(t||{}),!(!this.runtimeEditingEnabled||!this.socket||this.socket.readyState!==WebSocket.OPEN)&&this.socket.send(JSON.stringify({type:"editor.selection",payload:{senderSessionKey:this.sessionKey(),selection:t||{}}}))}scheduleSnapshot(){!this.payload.snapshotUrl||!this.runtimeEditingEnabled||(this.snapshotTimer&&window.clearTimeout(this.snapshotTimer),this.snapshotTimer=window.setTimeout(()=>{this.postSnapshot()},4e3))}async postSnapshot(){if(!(!this.isDirty||!this.runtimeEditingEnabled))try{if(!(await fetch(this.payload.snapshotUrl,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":d(this.payload.csrfToken)},body:JSON.stringify(this.buildSnapshotPayload()),credentials:"same-origin"})).ok){this.snapshotBadge.textContent="자동 저장 실패",this.setStatus("자동 저장 실패",!0);return}this.snapshotBadge.textContent="자동 저장 완료"}catch{this.snapshotBadge.textContent="자동 저장 실패",this.setStatus("자동 저장 실패",!0)}}buildSnapshotPayload(){return{roomId:this.payload.roomId,sourceFormat:this.payload.sourceFormat,saveFormat:this.payload.saveFormat,currentRevisionId:this.payload.currentRevision?.id||null,pageCount:this.lastKnownPageCount,dirty:this.isDirty,fileName:this.initialFileName(),changedAt:this.lastChangedAt,savedAt:new Date().toISOString()}}async saveRevision(){if(!this.editor){this.setStatus("편집기를 먼저 열어 주세요.",!0);return}if(!(!this.runtimeEditingEnabled||this.isSaving)){this.isSaving=!0,this.saveButton?.setAttribute("disabled","disabled"),this.saveButton?.setAttribute("aria-busy","true"),this.setStatus("저장 중");try{const t=this.payload.saveFormat==="hwpx",e=t?await this.editor.exportHwpx():await this.editor.exportHwp();this.lastKnownPageCount=Number(e.pageCount||this.lastKnownPageCount||0);const s=E(e.fileName||this.initialFileName()||this.payload.title,this.payload.saveFormat),n=new FormData;n.append("export_file",new File([e.bytes],s,{type:t?"application/vnd.hancom.hwpx":"application/x-hwp"})),n.append("note","온라인 편집 저장"),n.append("snapshot_json",JSON.stringify(this.buildSnapshotPayload()));const o=await fetch(this.payload.saveRevisionUrl,{method:"POST",headers:{"X-CSRFToken":d(this.payload.csrfToken)},body:n,credentials:"same-origin"}),a=await c(o);if(!o.ok){const l=a.message||"저장 실패";this.setStatus(l,!0);return}a.revision&&(this.lastLocalRevisionId=a.revision.id||"",this.baseRevisionId=a.revision.id||this.baseRevisionId,this.requiresCollabRefresh=!1,this.pendingReplayBatches=[],this.unackedBatches=[],this.inflightBatchId="",a.collab_seq!=null&&(this.lastSeq=Number(a.collab_seq)),this.upsertRevision(a.revision),this.broadcastSavedRevision(a.revision.id||"",a.edit_events||[]),this.resetAssistantForNewRevision()),Array.isArray(a.edit_history)?this.replaceEditHistory(a.edit_history):Array.isArray(a.edit_events)&&this.prependEditHistory(a.edit_events),this.isDirty=!1,this.snapshotBadge.textContent="저장 완료",this.setStatus("저장 완료")}catch{this.setStatus("저장 실패",!0)}finally{this.isSaving=!1,this.saveButton?.removeAttribute("disabled"),this.saveButton?.removeAttribute("aria-busy")}}}async runAssistantAnalysis(){if(!(!this.payload.assistantEnabled||!this.payload.assistantAnalyzeUrl||this.assistantBusy)){this.assistantBusy=!0,this.setAssistantButtonsDisabled(!0),this.setAssistantStatus("정리 중");try{const t=await fetch(this.payload.assistantAnalyzeUrl,{method:"POST",headers:{Accept:"application/json","X-Requested-With":"XMLHttpRequest","X-CSRFToken":d(this.payload.csrfToken)},credentials:"same-origin"}),e=await c(t);if(!t.ok)throw new Error(e.message||"다시 시도");this.payload.assistantAnalysis=e.analysis||null,this.renderAssistantAnalysis(this.payload.assistantAnalysis),this.setStatus("AI 정리 완료")}catch(t){const e=t?.message||"다시 시도";this.setAssistantStatus(e,!0),this.setStatus(e,!0)}finally{this.assistantBusy=!1,this.setAssistantButtonsDisabled(!1)}}}async askAssistantQuestion(){if(!this.payload.assistantEnabled||!this.payload.assistantAskUrl||this.questionBusy)return;const t=String(this.questionInput?.value||"").trim();if(!t){this.renderQuestionError("질문을 입력해 주세요."),this.questionInput?.focus();return}this.questionBusy=!0,this.questionButton&&(this.questionButton.disabled=!0,this.questionButton.setAttribute("aria-busy","true")),this.renderQuestionError("");try{const e=await fetch(this.payload.assistantAskUrl,{method:"POST",headers:{Accept:"application/json","Content-Type":"application/json","X-Requested-With":"XMLHttpRequest","X-CSRFToken":d(this.payload.csrfToken)},body:JSON.stringify({question:t}),credentials:"same-origin"}),s=await c(e);if(!e.ok)throw new Error(s.message||"다시 시도");this.renderQuestionAnswer(s)}catch(e){const s=e?.message||"다시 시도";this.renderQuestionError(s)}finally{this.questionBusy=!1,this.questionButton&&(this.questionButton.disabled=!1,this.questionButton.removeAttribute("aria-busy"))}}renderAssistantAnalysis(t,e={}){if(!this.assistantStatusEl)return;if(!t){this.setAssistantStatus("정리 전"),this.assistantSummaryEl&&(this.assistantSummaryEl.textContent="AI 정리 전"),this.renderAssistantItems([]),e.keepAnswer||this.clearAssistantAnswer();return}const s=t.status==="failed";this.setAssistantStatus(t.status_label||t.status||"정리 완료",s),this.assistantSummaryEl&&(this.assistantSummaryEl.textContent=t.summary_text||t.error_message||"정리 결과 없음"),this.renderAssistantItems(Array.isArray(t.work_items)?t.work_items:[]),e.keepAnswer||this.clearAssistantAnswer()}renderAssistantItems(t){if(this.assistantItemsEl){if(this.assistantItemsEl.innerHTML="",!t.length){const e=document.createElement("div");e.className="doccollab-empty",e.textContent="정리 후 표시됩니다.",this.assistantItemsEl.appendChild(e);return}t.slice(0,8).forEach(e=>{const s=document.createElement("div");s.className="doccollab-assistant-item";const n=document.createElement("strong");n.textContent=e.title||"확인";const o=document.createElement("span");if(o.textContent=e.action_text||e.evidence_text||"",s.append(n,o),e.due_text){const a=document.createElement("em");a.textContent=e.due_text,s.appendChild(a)}this.assistantItemsEl.appendChild(s)})}}renderQuestionAnswer(t){this.assistantAnswerEl&&(this.assistantAnswerEl.hidden=!1,this.assistantAnswerEl.textContent=t.answer||"답변 없음",this.assistantAnswerEl.classList.toggle("doccollab-assistant-answer--muted",!!t.has_insufficient_evidence),this.renderQuestionCitations(Array.isArray(t.citations)?t.citations:[]))}renderQuestionError(t){if(this.assistantAnswerEl){if(!t){this.assistantAnswerEl.hidden=!0,this.assistantAnswerEl.textContent="",this.renderQuestionCitations([]);return}this.assistantAnswerEl.hidden=!1,this.assistantAnswerEl.textContent=t,this.assistantAnswerEl.classList.add("doccollab-assistant-answer--muted"),this.renderQuestionCitations([])}}renderQuestionCitations(t){this.assistantCitationsEl&&(this.assistantCitationsEl.innerHTML="",t.slice(0,3).forEach(e=>{const s=document.createElement("div");s.className="doccollab-assistant-citation";const n=document.createElement("strong");n.textContent=e.label||"근거";const o=document.createElement("span");o.textContent=e.text||"",s.append(n,o),this.assistantCitationsEl.appendChild(s)}))}clearAssistantAnswer(){this.renderQuestionError("")}resetAssistantForNewRevision(){this.payload.assistantEnabled&&(this.payload.assistantAnalysis=null,this.renderAssistantAnalysis(null))}setAssistantStatus(t,e=!1){this.assistantStatusEl&&(this.assistantStatusEl.textContent=t,this.assistantStatusEl.style.background=e?"#fef2f2":"",this.assistantStatusEl.style.color=e?"#b91c1c":"")}setAssistantButtonsDisabled(t){this.assistantForms.forEach(e=>{e.querySelectorAll("button").forEach(s=>{s.disabled=t,t?s.setAttribute("aria-busy","true"):s.removeAttribute("aria-busy")})})}connectSocket(){this.payload.wsUrl&&(this.socket=new WebSocket(g(this.payload.wsUrl)),this.socket.addEventListener("open",()=>{this.reconnectAttempt=0,this.startPinging()}),this.socket.addEventListener("close",()=>{this.pingTimer&&window.clearInterval(this.pingTimer),this.intentionalClose||this.scheduleReconnect()}),this.socket.addEventListener("message",t=>this.handleSocketMessage(t)))}handleSocketMessage(t){const e=y(t.data||"{}");if(!e){this.setStatus("실시간 지연",!0);return}switch(e.type){case"room.snapshot":this.handleRoomSnapshot(e.payload||{});break;case"presence.join":case"presence.leave":this.updateParticipants(e.payload?.participants||[]);break;case"editor.command":this.handleBroadcastCommand(e.payload||{});break;case"editor.selection":this.handleBroadcastSelection(e.payload||{});break;case"revision.saved":this.handleRevisionSaved(e.payload||{});break;case"error":this.handleSocketError(e.payload||{});break}}handleRoomSnapshot(t){t.session_key&&(this.serverSessionKey=String(t.session_key)),this.updateParticipants(t.presence||[]),this.syncRevisionState(t||{}),this.replaceEditHistory(t.edit_history||[]),this.queueSnapshotBatches(t.collab_state||{}),this.flushLocalBatches()}handleBroadcastCommand(t){Array.isArray(t.edit_history)?this.replaceEditHistory(t.edit_history):t.edit_history_delta?this.mergeEditHistoryDelta(t.edit_history_delta):Array.isArray(t.edit_events)&&this.prependEditHistory(t.edit_events);const e=String(t.batchId||"").trim();if(e){if(!this.unackedBatches.some(s=>s.batchId===e)&&t.baseRevisionId&&this.baseRevisionId&&t.baseRevisionId!==this.baseRevisionId){this.requiresCollabRefresh=!0,this.setStatus("다른 저장본 기준의 수정이 들어왔습니다. 저장 후 다시 열어 주세요.",!0);return}this.receiveSequencedBatch({batchId:e,seq:Number(t.seq||0),commands:Array.isArray(t.commands)?t.commands:[],checkpointDue:!!t.checkpointDue})}}handleBroadcastSelection(t){}handleRevisionSaved(t){if(t.revision){const e=t.revision.id||"";if(this.upsertRevision(t.revision),Array.isArray(t.edit_history)?this.replaceEditHistory(t.edit_history):Array.isArray(t.edit_events)&&this.prependEditHistory(t.edit_events),t.published&&this.syncPublishedRevision(t.revision),e===this.lastLocalRevisionId){this.baseRevisionId=e,this.requiresCollabRefresh=!1,this.updateTablePanel();return}if(this.isDirty){this.requiresCollabRefresh=!0,this.setStatus("새 저장본이 생겼습니다. 저장 후 다시 열면 최신본이 맞춰집니다."),this.updateTablePanel();return}this.baseRevisionId=e||this.baseRevisionId,this.requiresCollabRefresh=!1,this.setStatus("최신 저장본으로 맞춰졌습니다."),this.updateTablePanel()}}handleSocketError(t){const e=String(t.message||"연결 오류");if(e.includes("stale base revision")||e.includes("stale base sequence")){this.requiresCollabRefresh=!0,this.setStatus("다른 저장본 기준이라 함께 수정이 잠시 멈췄습니다. 저장 후 다시 열어 주세요.",!0),this.updateTablePanel();return}this.setStatus(e,!0)}broadcastSavedRevision(t,e=[]){!t||!this.socket||this.socket.readyState!==WebSocket.OPEN||this.socket.send(JSON.stringify({type:"revision.saved",payload:{revisionId:t,editEvents:e}}))}async refreshSelectionState(t=null){const e={...t||{}};if(this.editor)try{const s=await this.editor.selectionState();Object.assign(e,s||{})}catch{}this.selectionState={...this.selectionState||{},...e},this.updateTablePanel()}updateTablePanel(){const t=!!(this.runtimeEditingEnabled&&this.documentLoaded&&this.selectionState?.inTable&&this.selectionState?.cellInfo&&this.selectionState?.cursor);if(this.tableSelectionLabel)if(t){const e=Number(this.selectionState.cellInfo.row||0)+1,s=Number(this.selectionState.cellInfo.col||0)+1;this.tableSelectionLabel.textContent=`${e}행 ${s}열`}else this.tableSelectionLabel.textContent=this.runtimeEditingEnabled?"셀 선택 필요":"보기 모드";this.tableCommandButtons.forEach(e=>{e.disabled=!t||this.requiresCollabRefresh})}buildTableCommand(t){const e=this.selectionState?.cursor?JSON.parse(JSON.stringify(this.selectionState.cursor)):null,s=this.selectionState?.cellInfo||null;if(!e||!s)return null;const n=Number(s.row||0),o=Number(s.col||0),a=`${t}-${Date.now()}-${Math.random().toString(36).slice(2,7)}`;switch(t){case"insert-row-below":return{id:a,type:"table_row_insert",position:e,row:n,below:!0};case"insert-col-right":return{id:a,type:"table_col_insert",position:e,col:o,right:!0};case"delete-row":return{id:a,type:"table_row_delete",position:e,row:n};case"delete-col":return{id:a,type:"table_col_delete",position:e,col:o};default:return null}}async applyTableCommand(t){if(!this.runtimeEditingEnabled||!this.editor)return;const e=this.buildTableCommand(t);if(!e){this.setStatus("표 셀을 먼저 선택해 주세요.",!0),await this.refreshSelectionState();return}if(this.requiresCollabRefresh){this.setStatus("새 저장본 확인 전에는 표 수정이 잠시 멈춥니다.",!0);return}const s=this.nextBatchId();if(!(await this.editor.applyCommandBatch(s,[e]).catch(()=>null))?.applied){this.setStatus("표 수정이 반영되지 않았습니다.",!0),await this.refreshSelectionState();return}this.sendCommandBatch([e],this.selectionState||{},s),this.setStatus("표 수정 반영 중"),await this.refreshSelectionState()}queueSnapshotBatches(t){t?.base_revision_id&&(this.baseRevisionId=t.base_revision_id);const e=Number(t?.seq||0),s=(Array.isArray(t?.updates)?t.updates:[]).filter(o=>o&&o.batchId).map(o=>({batchId:String(o.batchId),seq:Number(o.seq||0),commands:Array.isArray(o.commands)?o.commands:[],compacted:!!o.compacted}));if(this.lastSeq===null)this.lastSeq=s.length?s[0].seq-1:e;else if(s.some(o=>o.compacted&&o.seq>this.lastSeq)){this.requiresCollabRefresh=!0,this.setStatus("연결이 끊긴 사이 수정이 많이 쌓였습니다. 저장 후 다시 열어 주세요.",!0),this.updateTablePanel();return}const n=new Set([...Array.isArray(t?.recent_batch_ids)?t.recent_batch_ids:[],...s.map(o=>o.batchId)]);this.inflightBatchId&&!n.has(this.inflightBatchId)&&(this.inflightBatchId=""),s.forEach(o=>this.receiveSequencedBatch(o))}receiveSequencedBatch(t){if(this.skippedSeqs.has(t.seq)){this.requiresCollabRefresh=!0,this.setStatus("늦게 도착한 수정이 있습니다. 저장 후 다시 열어 주세요.",!0),this.updateTablePanel();return}if(this.lastSeq!==null&&t.seq<=this.lastSeq||this.pendingReplayBatches.some(s=>s.seq===t.seq))return;const e=this.pendingReplayBatches.findIndex(s=>s.seq>t.seq);this.pendingReplayBatches.splice(e<0?this.pendingReplayBatches.length:e,0,t),this.replayPendingBatches().catch(()=>{})}async replayPendingBatches(){if(!(this.replayingBatches||!this.documentLoaded||!this.editor)){this.replayingBatches=!0;try{for(;this.pendingReplayBatches.length;){const t=this.pendingReplayBatches[0];if(!t.compacted&&t.seq>this.lastSeq+1&&!this.sequenceGapExpired){this.waitForSequenceGap();return}if(this.pendingReplayBatches.shift(),!t.compacted)for(let e=this.lastSeq+1;e<t.seq;e+=1)this.skippedSeqs.add(e);if(this.sequenceGapExpired=!1,!await this.applySequencedBatch(t)){this.setStatus("다른 탭 수정 반영 실패",!0);return}}}finally{this.replayingBatches=!1}this.flushLocalBatches()}}waitForSequenceGap(){this.sequenceGapTimer||(this.sequenceGapTimer=window.setTimeout(()=>{this.sequenceGapTimer=null,this.sequenceGapExpired=!0,this.replayPendingBatches().catch(()=>{})},1500))}async applySequencedBatch(t){if(this.unackedBatches[0]?.batchId===t.batchId)return this.unackedBatches.shift(),this.inflightBatchId="",this.lastSeq=t.seq,t.checkpointDue&&this.runtimeEditingEnabled&&!this.isSaving&&this.saveRevision(),!0;let e=t.commands||[];for(const s of this.unackedBatches){const[n,o]=W(s.commands,e);s.commands=n,e=o}return e.length&&!(await this.editor.applyCommandBatch(t.batchId,e))?.applied?!1:(this.lastSeq=t.seq,!0)}sendCommandBatch(t,e,s=this.nextBatchId()){if(!(!Array.isArray(t)||!t.length)){if(this.requiresCollabRefresh){this.setStatus("새 저장본 확인 전에는 함께 수정이 잠시 멈춥니다.",!0);return}this.unackedBatches.push({batchId:s,commands:t,selection:e||{}}),this.flushLocalBatches()}}flushLocalBatches(){if(this.inflightBatchId||this.lastSeq===null||this.requiresCollabRefresh)return;for(;this.unackedBatches.length&&!this.unackedBatches[0].commands.length;)this.unackedBatches.shift();const t=this.unackedBatches[0];!t||!this.socket||this.socket.readyState!==WebSocket.OPEN||(this.inflightBatchId=t.batchId,this.sendExistingBatch(t.batchId,t.commands,t.selection))}sendExistingBatch(t,e,s){!this.socket||this.socket.readyState!==WebSocket.OPEN||!Array.isArray(e)||!e.length||this.socket.send(JSON.stringify({type:"editor.command",payload:{batchId:t,baseRevisionId:this.baseRevisionId||this.payload.currentRevision?.id||"",baseSeq:this.lastSeq,senderSessionKey:this.sessionKey(),commands:e,selection:s||{}}}))}nextBatchId(){return`batch-${Date.now()}-${Math.random().toString(36).slice(2,8)}`}sessionKey(){return this.serverSessionKey||this.clientSessionKey}scheduleReconnect(){if(this.reconnectTimer)return;const t=Math.min(5e3,1e3*2**this.reconnectAttempt);this.reconnectAttempt+=1,this.reconnectTimer=window.setTimeout(()=>{this.reconnectTimer=null,this.connectSocket()},t)}startPinging(){this.pingTimer&&window.clearInterval(this.pingTimer),this.pingTimer=window.setInterval(()=>{this.socket?.readyState===WebSocket.OPEN&&this.socket.send(JSON.stringify({type:"ping",payload:{}}))},2e4)}updateParticipants(t){this.participantCount=Math.max(1,t.length||0),this.participantList&&(this.participantList.innerHTML="",t.length?t.forEach(e=>{const s=document.createElement("div");s.className="doccollab-room-row",s.innerHTML=`
             <span class="doccollab-room-title">${r(e.display_name||"사용자")}</span>
             <span class="doccollab-room-meta">${r(e.role||"")}</span>
           `,this.participantList.appendChild(s)}):this.participantList.innerHTML='<div class="doccollab-empty">아직 접속 중인 사람이 없습니다.</div>'),this.syncCollaborationState().catch(()=>{})}async syncCollaborationState(){this.editor&&await this.editor.setCollaborationState(this.participantCount).catch(()=>{})}syncRevisionState(t){t.current_revision&&this.syncCurrentRevision(t.current_revision,{announce:!1}),t.published_revision&&this.syncPublishedRevision(t.published_revision),t.collab_state?.base_revision_id&&(this.baseRevisionId=t.collab_state.base_revision_id)}upsertRevision(t){if(!t||!this.revisionList||(this.syncCurrentRevision(t),t.is_published&&this.syncPublishedRevision(t),this.renderedRevisionIds.has(t.id)))return;this.revisionList.querySelector(".doccollab-empty")?.remove();const s=document.createElement("a");s.className="doccollab-room-row",s.dataset.revisionId=t.id||"",s.href=t.download_url||"#",s.innerHTML=`
       <span class="doccollab-room-title">r${r(String(t.revision_number||""))} · ${r(t.export_format_label||t.export_format||"")}</span>
       <span class="doccollab-room-meta">${u(t.created_at)}</span>
-    `,this.revisionList.prepend(s),this.renderedRevisionIds.add(t.id)}syncCurrentRevision(t,e={}){if(!t)return;const s=this.payload.currentRevision?.id||"";this.payload.currentRevision=t,this.payload.currentRevisionFormat=t.file_format||this.payload.currentRevisionFormat,this.currentRevisionLabel&&(this.currentRevisionLabel.textContent=`r${t.revision_number} · ${t.export_format_label||t.export_format||""}`),this.downloadLink&&(this.downloadLink.href=t.download_url||"#",this.downloadLink.classList.remove("doccollab-secondary--disabled"),this.downloadLink.removeAttribute("aria-disabled")),this.publishButton&&this.runtimeEditingEnabled&&this.publishButton.removeAttribute("disabled"),e.announce!==!1&&s&&s!==t.id&&t.id!==this.lastLocalRevisionId&&this.setStatus("최신 저장본 정보가 갱신되었습니다.")}syncPublishedRevision(t){!t||!this.publishedRevisionLabel||(this.payload.publishedRevision=t,this.publishedRevisionLabel.textContent=`r${t.revision_number} · ${t.export_format_label||t.export_format||""}`)}replaceEditHistory(t){if(this.editHistoryList){if(this.editHistoryList.innerHTML="",this.renderedEditEventIds.clear(),!t.length){this.editHistoryList.innerHTML='<div class="doccollab-empty">아직 기록된 편집이 없습니다.</div>';return}t.forEach(e=>{e?.id&&(this.editHistoryList.appendChild(this.buildEditHistoryRow(e)),this.renderedEditEventIds.add(e.id))})}}prependEditHistory(t){!this.editHistoryList||!t.length||(this.editHistoryList.querySelector(".doccollab-empty")?.remove(),[...t].reverse().forEach(e=>{!e?.id||this.renderedEditEventIds.has(e.id)||(this.editHistoryList.prepend(this.buildEditHistoryRow(e)),this.renderedEditEventIds.add(e.id))}))}buildEditHistoryRow(t){const e=document.createElement("div");return e.className="doccollab-room-row doccollab-room-row--history",e.dataset.editEventId=t.id||"",e.innerHTML=`
+    `,this.revisionList.prepend(s),this.renderedRevisionIds.add(t.id)}syncCurrentRevision(t,e={}){if(!t)return;const s=this.payload.currentRevision?.id||"";this.payload.currentRevision=t,this.payload.currentRevisionFormat=t.file_format||this.payload.currentRevisionFormat,this.currentRevisionLabel&&(this.currentRevisionLabel.textContent=`r${t.revision_number} · ${t.export_format_label||t.export_format||""}`),this.downloadLink&&(this.downloadLink.href=t.download_url||"#",this.downloadLink.classList.remove("doccollab-secondary--disabled"),this.downloadLink.removeAttribute("aria-disabled")),this.publishButton&&this.runtimeEditingEnabled&&this.publishButton.removeAttribute("disabled"),e.announce!==!1&&s&&s!==t.id&&t.id!==this.lastLocalRevisionId&&this.setStatus("최신 저장본 정보가 갱신되었습니다.")}syncPublishedRevision(t){!t||!this.publishedRevisionLabel||(this.payload.publishedRevision=t,this.publishedRevisionLabel.textContent=`r${t.revision_number} · ${t.export_format_label||t.export_format||""}`)}replaceEditHistory(t){if(this.editHistoryList){if(this.editHistoryList.innerHTML="",this.renderedEditEventIds.clear(),!t.length){this.editHistoryList.innerHTML='<div class="doccollab-empty">아직 기록된 편집이 없습니다.</div>';return}t.forEach(e=>{e?.id&&(this.editHistoryList.appendChild(this.buildEditHistoryRow(e)),this.renderedEditEventIds.add(e.id))})}}prependEditHistory(t){!this.editHistoryList||!t.length||(this.editHistoryList.querySelector(".doccollab-empty")?.remove(),[...t].reverse().forEach(e=>{!e?.id||this.renderedEditEventIds.has(e.id)||(this.editHistoryList.prepend(this.buildEditHistoryRow(e)),this.renderedEditEventIds.add(e.id))}))}mergeEditHistoryDelta(t){if(!this.editHistoryList)return;const e=String(t?.replaces||"");e&&(this.editHistoryList.querySelectorAll("[data-edit-event-id]").forEach(n=>{n.dataset.editEventId===e&&n.remove()}),this.renderedEditEventIds.delete(e)),this.prependEditHistory(Array.isArray(t?.groups)?t.groups:[]);const s=this.editHistoryList.querySelectorAll("[data-edit-event-id]");for(let n=10;n<s.length;n+=1)this.renderedEditEventIds.delete(s[n].dataset.editEventId),s[n].remove()}buildEditHistoryRow(t){const e=document.createElement("div");return e.className="doccollab-room-row doccollab-room-row--history",e.dataset.editEventId=t.id||"",e.innerHTML=`
       <div class="doccollab-room-main">
         <div class="doccollab-room-heading">
           <span class="doccollab-room-title">${r(t.display_name||"사용자")}</span>
@@ -18,4 +18,4 @@ class b{constructor(t){this.iframe=t,this.pending=new Map,this.requestId=0,this.
           <span class="doccollab-room-meta">${r(t.created_at_display||u(t.created_at))}</span>
         </div>
       </div>
-    `,e}initialFileName(){return this.payload.currentRevision?.original_name||this.payload.sourceName||`${this.payload.title||"document"}.${this.payload.sourceFormat||"hwp"}`}showLoadError(t){const e=t?.message||"브라우저에서 열 수 없는 파일입니다.";this.rootEl.innerHTML="",this.rootEl.classList.add("doccollab-editor-surface--failed"),this.loadErrorMessageEl&&(this.loadErrorMessageEl.textContent=`${e} 원본 파일을 내려받아 확인해 주세요.`),this.loadErrorEl&&(this.loadErrorEl.hidden=!1),this.saveButton&&(this.saveButton.disabled=!0),this.publishButton&&(this.publishButton.disabled=!0),this.snapshotBadge.textContent="사용 불가",this.setStatus("열기 실패",!0)}handleBeforeUnload(){this.intentionalClose=!0,this.snapshotTimer&&window.clearTimeout(this.snapshotTimer),this.reconnectTimer&&window.clearTimeout(this.reconnectTimer),this.pingTimer&&window.clearInterval(this.pingTimer),this.socket&&this.socket.close(),this.editor?.destroy()}setStatus(t,e=!1){this.statusBadge&&(this.statusBadge.textContent=t,this.statusBadge.style.background=e?"#fef2f2":"",this.statusBadge.style.color=e?"#b91c1c":"")}}function g(i){return/^wss?:\/\//.test(i)?i:`${window.location.protocol==="https:"?"wss:":"ws:"}//${window.location.host}${i}`}function E(i,t="hwp"){const e=String(i||"document").trim()||"document",s=t==="hwpx"?".hwpx":".hwp";return e.toLowerCase().endsWith(s)?e:`${e.replace(/\.[^.]+$/u,"")}${s}`}function d(i){if(i)return i;const t=document.cookie.split(";").map(e=>e.trim()).find(e=>e.startsWith("csrftoken="));return t?t.split("=")[1]:""}async function c(i){const t=await i.text();return t?y(t)||{}:{}}function y(i){if(i&&typeof i=="object")return i;try{const t=JSON.parse(String(i||"{}"));return t&&typeof t=="object"?t:{}}catch{return null}}function r(i){return String(i||"").replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;").replaceAll('"',"&quot;")}function u(i){return i?new Date(i).toLocaleString("ko-KR"):""}function h(i){return new Promise(t=>{window.setTimeout(t,i)})}function m(i,t){for(;i.size>t;){const[e]=i;i.delete(e)}}function S(){return window.crypto?.randomUUID?window.crypto.randomUUID():`client-${Date.now()}-${Math.random().toString(36).slice(2,8)}`}const p=document.getElementById("doccollab-editor-app"),f=document.getElementById("doccollab-room-payload");if(p&&f){const i=JSON.parse(f.textContent||"{}"),t=new w(p,i);t.start().catch(e=>{console.error(e),t.showLoadError(e)})}
+    `,e}initialFileName(){return this.payload.currentRevision?.original_name||this.payload.sourceName||`${this.payload.title||"document"}.${this.payload.sourceFormat||"hwp"}`}showLoadError(t){const e=t?.message||"브라우저에서 열 수 없는 파일입니다.";this.rootEl.innerHTML="",this.rootEl.classList.add("doccollab-editor-surface--failed"),this.loadErrorMessageEl&&(this.loadErrorMessageEl.textContent=`${e} 원본 파일을 내려받아 확인해 주세요.`),this.loadErrorEl&&(this.loadErrorEl.hidden=!1),this.saveButton&&(this.saveButton.disabled=!0),this.publishButton&&(this.publishButton.disabled=!0),this.snapshotBadge.textContent="사용 불가",this.setStatus("열기 실패",!0)}handleBeforeUnload(){this.intentionalClose=!0,this.snapshotTimer&&window.clearTimeout(this.snapshotTimer),this.reconnectTimer&&window.clearTimeout(this.reconnectTimer),this.pingTimer&&window.clearInterval(this.pingTimer),this.socket&&this.socket.close(),this.editor?.destroy()}setStatus(t,e=!1){this.statusBadge&&(this.statusBadge.textContent=t,this.statusBadge.style.background=e?"#fef2f2":"",this.statusBadge.style.color=e?"#b91c1c":"")}}function g(i){return/^wss?:\/\//.test(i)?i:`${window.location.protocol==="https:"?"wss:":"ws:"}//${window.location.host}${i}`}function E(i,t="hwp"){const e=String(i||"document").trim()||"document",s=t==="hwpx"?".hwpx":".hwp";return e.toLowerCase().endsWith(s)?e:`${e.replace(/\.[^.]+$/u,"")}${s}`}function d(i){if(i)return i;const t=document.cookie.split(";").map(e=>e.trim()).find(e=>e.startsWith("csrftoken="));return t?t.split("=")[1]:""}async function c(i){const t=await i.text();return t?y(t)||{}:{}}function y(i){if(i&&typeof i=="object")return i;try{const t=JSON.parse(String(i||"{}"));return t&&typeof t=="object"?t:{}}catch{return null}}function r(i){return String(i||"").replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;").replaceAll('"',"&quot;")}function u(i){return i?new Date(i).toLocaleString("ko-KR"):""}function h(i){return new Promise(t=>{window.setTimeout(t,i)})}function S(){return window.crypto?.randomUUID?window.crypto.randomUUID():`client-${Date.now()}-${Math.random().toString(36).slice(2,8)}`}const p=document.getElementById("doccollab-editor-app"),f=document.getElementById("doccollab-room-payload");if(p&&f){const i=JSON.parse(f.textContent||"{}"),t=new w(p,i);t.start().catch(e=>{console.error(e),t.showLoadError(e)})}
@@ -0,0 +1,335 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from doccollab.collab_ot import _transform_lists, transform_commands
+from doccollab.models import DocMembership, DocRoom, DocSnapshot, DocWorkspace
+from doccollab.services import (
+    LIVE_UPDATES_KEPT_AFTER_COMPACTION,
+    MAX_COMPACTED_LIVE_SEGMENTS,
+    MAX_LIVE_UPDATES,
+    append_room_command_batch,
+    load_room_collab_state,
+    reset_room_collab_state,
+)
+
+
+User = get_user_model()
+
+
+def _position(paragraph, offset):
+    return {"sectionIndex": 0, "paragraphIndex": paragraph, "charOffset": offset}
+
+
+def _insert(paragraph, offset, text):
+    return {"type": "insert_text", "position": _position(paragraph, offset), "text": text}
+
+
+def _delete(paragraph, offset, count, direction="forward"):
+    return {"type": "delete_text", "position": _position(paragraph, offset), "count": count, "direction": direction}
+
+
+CLIENT_OT_PATH = Path(__file__).resolve().parents[1] / "frontend" / "src" / "collab-ot.js"
+NODE = shutil.which("node")
+
+
+def _client_transform_lists(cases):
+    """Run the room client's ``transformCommandLists`` on ``[(incoming, applied), ...]``."""
+    script = (
+        f"import {{ transformCommandLists }} from {json.dumps(CLIENT_OT_PATH.as_uri())};\n"
+        'import { readFileSync } from "node:fs";\n'
+        'const cases = JSON.parse(readFileSync(0, "utf8"));\n'
+        "process.stdout.write(JSON.stringify(cases.map(([incoming, applied]) => transformCommandLists(incoming, applied))));\n"
+    )
+    completed = subprocess.run(
+        [NODE, "--input-type=module", "-e", script],
+        input=json.dumps(cases),
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=30,
+    )
+    return [tuple(pair) for pair in json.loads(completed.stdout)]
+
+
+def _apply_to_text(paragraphs, commands):
+    """Apply body text commands to a list of paragraph strings, like the editor would."""
+    paragraphs = list(paragraphs)
+    for command in commands:
+        if command["type"] == "insert_text":
+            paragraph, offset = command["position"]["paragraphIndex"], command["position"]["charOffset"]
+            text = paragraphs[paragraph]
+            paragraphs[paragraph] = text[:offset] + command["text"] + text[offset:]
+        elif command["type"] == "delete_text":
+            paragraph, offset = command["position"]["paragraphIndex"], command["position"]["charOffset"]
+            start = offset - command["count"] if command["direction"] == "backward" else offset
+            text = paragraphs[paragraph]
+            paragraphs[paragraph] = text[:start] + text[start + command["count"] :]
+        elif command["type"] == "split_paragraph":
+            paragraph, offset = command["position"]["paragraphIndex"], command["position"]["charOffset"]
+            text = paragraphs[paragraph]
+            paragraphs[paragraph : paragraph + 1] = [text[:offset], text[offset:]]
+        else:
+            raise AssertionError(f"unexpected command {command['type']}")
+    return paragraphs
+
+
+class CollabTransformTests(SimpleTestCase):
+    def test_insert_after_concurrent_insert_shifts_right(self):
+        transformed = transform_commands([_insert(0, 5, "B")], [_insert(0, 2, "AAA")])
+
+        self.assertEqual(transformed[0]["position"]["charOffset"], 8)
+
+    def test_same_offset_insert_goes_after_already_sequenced_one(self):
+        transformed = transform_commands([_insert(0, 4, "B")], [_insert(0, 4, "A")])
+
+        self.assertEqual(transformed[0]["position"]["charOffset"], 5)
+
+    def test_split_moves_later_text_to_new_paragraph(self):
+        transformed = transform_commands(
+            [_insert(0, 7, "B"), _insert(2, 0, "C")],
+            [{"type": "split_paragraph", "position": _position(0, 3)}],
+        )
+
+        self.assertEqual(transformed[0]["position"], _position(1, 4))
+        self.assertEqual(transformed[1]["position"], _position(3, 0))
+
+    def test_delete_around_concurrent_insert_keeps_inserted_text(self):
+        delete = {"type": "delete_text", "position": _position(0, 2), "count": 6, "direction": "forward"}
+
+        transformed = transform_commands([delete], [_insert(0, 4, "xy")])
+
+        self.assertEqual(
+            [(item["position"]["charOffset"], item["count"]) for item in transformed],
+            [(6, 4), (2, 2)],
+        )
+
+    def test_overlapping_deletes_do_not_remove_text_twice(self):
+        first = {"type": "delete_text", "position": _position(0, 2), "count": 4, "direction": "forward"}
+        second = {"type": "delete_text", "position": _position(0, 4), "count": 4, "direction": "forward"}
+
+        transformed = transform_commands([second], [first])
+
+        self.assertEqual((transformed[0]["position"]["charOffset"], transformed[0]["count"]), (2, 2))
+
+    def test_same_paragraph_merge_is_dropped(self):
+        merge = {"type": "merge_paragraph", "action": "delete", "position": _position(0, 5)}
+
+        self.assertEqual(transform_commands([dict(merge)], [merge]), [])
+
+
+@skipUnless(NODE, "node is not installed")
+class ClientTransformParityTests(SimpleTestCase):
+    def test_client_transform_matches_server_transform(self):
+        merge = {"type": "merge_paragraph", "action": "delete", "position": _position(0, 5)}
+        cell_position = {
+            "sectionIndex": 0,
+            "parentParaIndex": 2,
+            "controlIndex": 0,
+            "cellIndex": 1,
+            "cellParaIndex": 0,
+            "charOffset": 3,
+            "cellPath": [{"cellIndex": 1, "cellParaIndex": 0}],
+        }
+        cases = [
+            ([_insert(0, 5, "B")], [_insert(0, 2, "AAA")]),
+            ([_insert(0, 4, "B")], [_insert(0, 4, "A")]),
+            ([_insert(0, 7, "B"), _insert(2, 0, "C")], [{"type": "split_paragraph", "position": _position(0, 3)}]),
+            ([_delete(0, 2, 6)], [_insert(0, 4, "xy")]),
+            ([_delete(0, 4, 4)], [_delete(0, 2, 4)]),
+            ([_delete(1, 6, 3, "backward"), _insert(1, 0, "가나")], [_delete(0, 1, 2), _insert(1, 2, "😀")]),
+            ([dict(merge)], [merge]),
+            ([_insert(3, 1, "Z")], [{"type": "merge_paragraph", "position": _position(2, 0)}]),
+            (
+                [{"type": "delete_selection", "start": _position(1, 4), "end": _position(0, 2)}],
+                [{"type": "split_paragraph", "position": _position(0, 5)}, _insert(1, 1, "q")],
+            ),
+            ([{"type": "insert_text", "position": cell_position, "text": "셀"}], [_insert(1, 0, "x"), {"type": "split_paragraph", "position": _position(1, 0)}]),
+            ([{"type": "table_row_insert", "position": cell_position, "row": 0}], [_insert(0, 0, "A")]),
+        ]
+        # Both directions, so the client's rebase of its own queue is covered as well.
+        cases += [(applied, incoming) for incoming, applied in cases]
+
+        client = _client_transform_lists(cases)
+
+        for (incoming, applied), (client_incoming, client_applied) in zip(cases, client):
+            with self.subTest(incoming=incoming, applied=applied):
+                server_incoming, server_applied = _transform_lists(incoming, applied)
+                self.assertEqual(client_incoming, server_incoming)
+                self.assertEqual(client_applied, server_applied)
+
+
+class _ClientSession:
+    """The room client's batch flow: one batch in flight, peers rebased over the unacknowledged queue."""
+
+    def __init__(self, room, session_key, paragraphs):
+        self.room = room
+        self.session_key = session_key
+        self.paragraphs = list(paragraphs)
+        self.unacked = []
+        self.inflight = None
+        self.last_seq = 0
+
+    def edit(self, batch_id, commands):
+        self.paragraphs = _apply_to_text(self.paragraphs, commands)
+        self.unacked.append({"batchId": batch_id, "commands": commands})
+
+    def flush(self):
+        if self.inflight or not self.unacked:
+            return None
+        batch = self.unacked[0]
+        self.inflight = batch["batchId"]
+        payload, accepted, reason = append_room_command_batch(
+            self.room,
+            {
+                "batchId": batch["batchId"],
+                "senderSessionKey": self.session_key,
+                "baseSeq": self.last_seq,
+                "commands": batch["commands"],
+            },
+        )
+        assert accepted, reason
+        return payload["update"]
+
+    def receive(self, update):
+        if self.unacked and self.unacked[0]["batchId"] == update["batchId"]:
+            self.unacked.pop(0)
+            self.inflight = None
+            self.last_seq = update["seq"]
+            return
+        commands = update["commands"]
+        for local in self.unacked:
+            [(local["commands"], commands)] = _client_transform_lists([(local["commands"], commands)])
+        self.paragraphs = _apply_to_text(self.paragraphs, commands)
+        self.last_seq = update["seq"]
+
+
+class LiveCommandLogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="live-owner", email="live-owner@example.com", password="pw123456")
+        workspace = DocWorkspace.objects.create(name="실시간 문서", created_by=self.user)
+        DocMembership.objects.create(
+            workspace=workspace,
+            user=self.user,
+            role=DocMembership.Role.OWNER,
+            status=DocMembership.Status.ACTIVE,
+            invited_by=self.user,
+        )
+        self.room = DocRoom.objects.create(workspace=workspace, title="실시간 문서", created_by=self.user)
+
+    def _append(self, batch_id, commands, *, sender="session-a", base_seq=None):
+        return append_room_command_batch(
+            self.room,
+            {"batchId": batch_id, "senderSessionKey": sender, "baseSeq": base_seq, "commands": commands},
+        )
+
+    def test_concurrent_batch_is_rebased_instead_of_rejected(self):
+        self._append("a-1", [_insert(0, 0, "AAA")], sender="session-a", base_seq=0)
+
+        payload, accepted, reason = self._append("b-1", [_insert(0, 5, "B")], sender="session-b", base_seq=0)
+
+        self.assertTrue(accepted, reason)
+        self.assertEqual(payload["seq"], 2)
+        self.assertTrue(payload["update"]["transformed"])
+        self.assertEqual(payload["update"]["commands"][0]["position"]["charOffset"], 8)
+
+    def test_own_earlier_batches_are_not_transformed_against(self):
+        self._append("a-1", [_insert(0, 0, "AAA")], sender="session-a", base_seq=0)
+
+        payload, accepted, _reason = self._append("a-2", [_insert(0, 5, "B")], sender="session-a", base_seq=0)
+
+        self.assertTrue(accepted)
+        self.assertEqual(payload["update"]["commands"][0]["position"]["charOffset"], 5)
+
+    @skipUnless(NODE, "node is not installed")
+    def test_two_concurrent_sessions_converge_on_the_same_document(self):
+        initial = ["abcdef"]
+        alice = _ClientSession(self.room, "session-a", initial)
+        bob = _ClientSession(self.room, "session-b", initial)
+
+        alice.edit("a-1", [_insert(0, 1, "X")])
+        first = alice.flush()
+        # Typed while a-1 is still in flight, inside the range bob is about to delete.
+        alice.edit("a-2", [_insert(0, 4, "Y")])
+        bob.edit("b-1", [_delete(0, 2, 2)])
+        second = bob.flush()
+        alice.receive(first)
+        third = alice.flush()
+        for update in (second, third):
+            alice.receive(update)
+        for update in (first, second, third):
+            bob.receive(update)
+
+        replayed = initial
+        for update in load_room_collab_state(self.room)["updates"]:
+            replayed = _apply_to_text(replayed, update["commands"])
+        self.assertEqual(alice.paragraphs, ["aXbYef"])
+        self.assertEqual(bob.paragraphs, alice.paragraphs)
+        self.assertEqual(replayed, alice.paragraphs)
+        self.assertEqual((alice.unacked, bob.unacked), ([], []))
+
+    def test_duplicate_batch_is_rejected(self):
+        self._append("dup", [_insert(0, 0, "A")])
+
+        _payload, accepted, reason = self._append("dup", [_insert(0, 0, "A")])
+
+        self.assertFalse(accepted)
+        self.assertEqual(reason, "duplicate batchId")
+
+    def test_compaction_keeps_every_batch_for_new_joiners(self):
+        total = MAX_LIVE_UPDATES + 5
+        for index in range(total):
+            self._append(f"batch-{index}", [_insert(0, 0, "가")])
+
+        state = load_room_collab_state(self.room)
+
+        self.assertEqual(state["seq"], total)
+        self.assertTrue(state["updates"][0]["compacted"])
+        replayed = sum(len(update["commands"]) for update in state["updates"])
+        self.assertEqual(replayed, total)
+        self.assertEqual(DocSnapshot.objects.filter(room=self.room).count(), 1)
+        _payload, accepted, reason = self._append("batch-0", [_insert(0, 0, "가")])
+        self.assertFalse(accepted)
+        self.assertEqual(reason, "duplicate batchId")
+
+    def test_compaction_segments_do_not_copy_earlier_commands(self):
+        total = MAX_LIVE_UPDATES + LIVE_UPDATES_KEPT_AFTER_COMPACTION + 5
+        for index in range(total):
+            self._append(f"batch-{index}", [_insert(0, 0, "가")])
+
+        segments = list(DocSnapshot.objects.filter(room=self.room))
+        state = load_room_collab_state(self.room)
+
+        self.assertEqual(len(segments), 2)
+        self.assertTrue(all(segment.command_count <= MAX_LIVE_UPDATES for segment in segments))
+        replayed = sum(len(update["commands"]) for update in state["updates"])
+        self.assertEqual(replayed, total)
+        seqs = [update["seq"] for update in state["updates"]]
+        self.assertEqual(seqs, sorted(seqs))
+
+    def test_checkpoint_is_requested_once_segments_pile_up(self):
+        payload = {}
+        index = 0
+        while not payload.get("checkpoint_due"):
+            payload, accepted, _reason = self._append(f"batch-{index}", [_insert(0, 0, "가")])
+            self.assertTrue(accepted)
+            index += 1
+
+        self.assertEqual(DocSnapshot.objects.filter(room=self.room).count(), MAX_COMPACTED_LIVE_SEGMENTS)
+        reset_room_collab_state(self.room)
+        self.assertFalse(DocSnapshot.objects.filter(room=self.room).exists())
+
+    def test_reset_clears_log_and_rejects_pre_reset_sequence(self):
+        self._append("before-reset", [_insert(0, 0, "A")])
+
+        reset_room_collab_state(self.room)
+        _payload, accepted, reason = self._append("after-reset", [_insert(0, 0, "B")], base_seq=0)
+
+        self.assertEqual(load_room_collab_state(self.room)["updates"], [])
+        self.assertFalse(accepted)
+        self.assertEqual(reason, "stale base sequence")
@@ -1,16 +1,18 @@
 import asyncio
 from contextlib import suppress
+from unittest import mock
 
+from channels.db import database_sync_to_async
 from channels.testing.websocket import WebsocketCommunicator
 from django.conf import settings
 from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
 from django.contrib.sessions.backends.db import SessionStore
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TransactionTestCase
+from django.test import TransactionTestCase, override_settings
 
 from config.asgi import application
 from doccollab.models import DocEditEvent, DocMembership
-from doccollab.services import create_room_from_upload, save_room_revision, serialize_edit_event
+from doccollab.services import create_room_from_upload, save_room_revision, serialize_edit_event, update_presence
 
 
 User = get_user_model()
@@ -120,11 +122,14 @@ class DoccollabConsumerTests(TransactionTestCase):
             echoed_to_owner = await owner.receive_json_from(timeout=1)
             self.assertEqual(echoed_to_owner["type"], "editor.command")
             self.assertEqual(echoed_to_owner["payload"]["batchId"], "batch-1")
+            self.assertEqual(echoed_to_owner["payload"]["seq"], 1)
             self.assertEqual(echoed_to_owner["payload"]["baseRevisionId"], base_revision_id)
             self.assertEqual(echoed_to_owner["payload"]["senderSessionKey"], "owner-session")
             self.assertEqual(echoed_to_owner["payload"]["commands"][0]["type"], "insert_text")
             self.assertEqual(echoed_to_owner["payload"]["edit_events"][0]["summary"], "문장 입력 · 첫 문장")
-            self.assertEqual(echoed_to_owner["payload"]["edit_history"][0]["summary"], "본문 수정")
+            first_group = echoed_to_owner["payload"]["edit_history_delta"]["groups"][0]
+            self.assertEqual(first_group["summary"], "본문 수정")
+            self.assertIsNone(echoed_to_owner["payload"]["edit_history_delta"]["replaces"])
 
             editor = await self._connect(self.editor_cookie)
             snapshot = await editor.receive_json_from(timeout=1)
@@ -148,9 +153,11 @@ class DoccollabConsumerTests(TransactionTestCase):
             echoed = await editor.receive_json_from(timeout=1)
             self.assertEqual(echoed["type"], "editor.command")
             self.assertEqual(echoed["payload"]["batchId"], "batch-2")
+            self.assertEqual(echoed["payload"]["seq"], 2)
             self.assertEqual(echoed["payload"]["commands"][0]["type"], "split_paragraph")
             self.assertEqual(echoed["payload"]["edit_events"][0]["summary"], "새 문단")
-            self.assertEqual(echoed["payload"]["edit_history"][0]["summary"], "본문 수정 2건")
+            self.assertEqual(echoed["payload"]["edit_history_delta"]["groups"][0]["summary"], "본문 수정 2건")
+            self.assertEqual(echoed["payload"]["edit_history_delta"]["replaces"], first_group["id"])
 
             await self._disconnect(owner)
             await self._disconnect(editor)
@@ -303,3 +310,36 @@ class DoccollabConsumerTests(TransactionTestCase):
             await self._disconnect(editor)
 
         asyncio.run(runner())
+
+    @override_settings(DOCCOLLAB_EDIT_EVENT_FLUSH_SECONDS=60, DOCCOLLAB_PRESENCE_HEARTBEAT_SECONDS=60)
+    def test_edit_events_and_heartbeats_are_coalesced_until_disconnect(self):
+        count_events = database_sync_to_async(lambda: DocEditEvent.objects.filter(room=self.room).count())
+
+        async def runner():
+            owner = await self._connect(self.owner_cookie)
+            snapshot = await owner.receive_json_from(timeout=1)
+            self.assertEqual(snapshot["type"], "room.snapshot")
+            await self._drain(owner)
+
+            for index in range(3):
+                await owner.send_json_to({"type": "ping", "payload": {}})
+                await owner.send_json_to(
+                    {
+                        "type": "editor.command",
+                        "payload": {
+                            "batchId": f"coalesce-{index}",
+                            "senderSessionKey": "owner-session",
+                            "commands": [{"id": f"coalesce-cmd-{index}", "type": "insert_text", "text": "가"}],
+                        },
+                    }
+                )
+            await self._drain(owner)
+
+            self.assertEqual(await count_events(), 0)
+            await self._disconnect(owner)
+
+        with mock.patch("doccollab.consumers.update_presence", wraps=update_presence) as presence_writes:
+            asyncio.run(runner())
+
+        self.assertEqual(presence_writes.call_count, 2)
+        self.assertEqual(DocEditEvent.objects.filter(room=self.room).count(), 3)
@@ -24,6 +24,19 @@ class DoccollabRuntimeContractTests(SimpleTestCase):
                 self.assertNotIn("window.alert", content)
                 self.assertNotIn("response.json()", content)
 
+    def test_room_client_merges_edit_history_delta_from_broadcasts(self):
+        root = Path(__file__).resolve().parents[2]
+        room_paths = [
+            root / "doccollab/frontend/src/room.js",
+            root / "doccollab/static/doccollab/editor/room.js",
+        ]
+
+        for path in room_paths:
+            content = path.read_text(encoding="utf-8")
+            with self.subTest(path=str(path.relative_to(root))):
+                self.assertIn("edit_history_delta", content)
+                self.assertIn("mergeEditHistoryDelta", content)
+
     def test_rhwp_bridge_reflows_justify_paragraphs_after_spacing_edits(self):
         root = Path(__file__).resolve().parents[2]
         source = (
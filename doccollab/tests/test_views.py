@@ -542,6 +542,7 @@ class DoccollabViewTests(TestCase):
         self.assertTrue(DocumentVersion.objects.filter(pk=revision.mirrored_version_id).exists())
         self.assertEqual(load_room_collab_state(room)["base_revision_id"], str(revision.id))
         self.assertEqual(load_room_collab_state(room)["updates"], [])
+        self.assertEqual(payload["collab_seq"], load_room_collab_state(room)["seq"])
         self.assertTrue(
             DocEditEvent.objects.filter(
                 room=room,
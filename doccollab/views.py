@@ -42,6 +42,7 @@ from .services import (
     create_snapshot,
     display_name_for_user,
     get_room_for_user,
+    load_room_collab_state,
     publish_revision,
     record_edit_events,
     room_payload_for_template,
@@ -778,6 +779,8 @@ def save_revision(request, room_id):
             "edit_events": serialized_edit_events,
             "edit_history": serialized_edit_history,
             "download_url": reverse("doccollab:download_revision", kwargs={"room_id": room.id, "revision_id": revision.id}),
+            # The live log restarts from this revision; the editor's next batch builds on this seq.
+            "collab_seq": load_room_collab_state(room)["seq"],
         }
     )
 
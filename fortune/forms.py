@@ -1,5 +1,7 @@
 from django import forms
 
+from core import korean_calendar
+
 
 class SajuForm(forms.Form):
     """사주 입력 폼 - 교사/일반 모드 지원"""
@@ -97,8 +99,13 @@ class SajuForm(forms.Form):
         month = cleaned_data.get('birth_month')
         day = cleaned_data.get('birth_day')
 
-        # 간단한 날짜 유효성 검사
-        if year and month and day:
+        # 간단한 날짜 유효성 검사 (음력은 달마다 29/30일이라 음력 달력으로 확인)
+        if year and month and day and cleaned_data.get('calendar_type') == 'lunar':
+            try:
+                korean_calendar.lunar_to_solar(year, month, day)
+            except ValueError:
+                raise forms.ValidationError(f'음력 {year}년 {month}월에는 {day}일이 없습니다. 음력 날짜를 다시 확인해 주세요.')
+        elif year and month and day:
             days_in_month = {
                 1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30,
                 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
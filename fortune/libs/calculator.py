@@ -1,156 +1,87 @@
+from bisect import bisect_right
+from datetime import date
+
 from fortune.models import Stem, Branch
 from fortune.libs import manse
-from datetime import datetime, timedelta
-import pytz
 
-def get_pillars(dt):
+STEMS = ['Gap', 'Eul', 'Byung', 'Jung', 'Moo', 'Gi', 'Gyung', 'Shin', 'Im', 'Gye']
+BRANCHES = ['Ja', 'Chuk', 'In', 'Myo', 'Jin', 'Sa', 'O', 'Mi', 'Shin', 'Yoo', 'Sool', 'Hae']
+
+# Jeol (major terms) opening each month of a saju year, In (Tiger) month first.
+# The last month (Chuk) starts at Sohan of the following calendar year.
+MONTH_OPENING_TERMS = [
+    'Lichun', 'Gyeongchip', 'Cheongmyeong', 'Ipha', 'Mangjong', 'Soseo',
+    'Ipchu', 'Baekro', 'Hallo', 'Ipdong', 'Daeseol',
+]
+DAY_PILLAR_REFERENCE = date(2024, 1, 1)  # 甲子 (Gap-Ja) day
+
+
+def pillar_indexes(dt):
     """
-    Calculate the Four Pillars for a given datetime (KST aware).
+    Stem/branch indexes (into STEMS/BRANCHES) of the Four Pillars; no DB access.
+
+    Solar terms come from manse's table, so this is a fixed amount of arithmetic per chart.
     """
-    # 0. Adjust to Apparent Solar Time
-    # Default longitude 135 (Standard) if not provided?
-    # Logic should accept SajuProfile or User inputs, but for core calc let's assume raw inputs
     # Use Seoul (127.0) as default for now if no geo info
     solar_time = manse.get_apparent_solar_time(dt, 127.0)
-    
+    now_minute = manse.minute_of(solar_time)
+
+    # 1. Year Pillar: the year changes at Lichun (Start of Spring).
     year = solar_time.year
-    month = solar_time.month
-    day = solar_time.day
-    hour = solar_time.hour
-    
-    # 1. Year Pillar (Year Stem/Branch)
-    # Determined by solar year (Ipchu usually starts the year in some schools? No, Lichun)
-    # Lichun (Start of Spring) determines the year change.
-    
-    # Get Lichun of the current year
-    lichun = manse.get_solar_term_date(year, 'Lichun')
-    
-    if solar_time < lichun:
+    if now_minute < manse.solar_term_minute(year, manse.TERM_INDEX['Lichun']):
         current_year = year - 1
     else:
         current_year = year
-        
-    year_ganji = get_yearly_ganji(current_year)
-    
-    # 2. Month Pillar
-    # Determined by Solar Terms (Jeolgi)
-    # Lichun -> Month 1 (Tiger)
-    # Gyeongchip -> Month 2 (Rabbit)
-    # ...
-    
-    # We need to find which Jeolgi we are in.
-    # We need the 12 major terms (Jeol)
-    major_terms = [
-        ('Lichun', 'In'), ('Gyeongchip', 'Myo'), ('Cheongmyeong', 'Jin'), 
-        ('Ipha', 'Sa'), ('Mangjong', 'O'), ('Soseo', 'Mi'), 
-        ('Ipchu', 'Shin'), ('Baekro', 'Yoo'), ('Hallo', 'Sool'), 
-        ('Ipdong', 'Hae'), ('Daeseol', 'Ja'), ('Sohan', 'Chuk')
-    ]
-    
-    # Check terms of the year (or prev year if Jan/Feb before Lichun)
-    # Be careful with year boundary.
-    # If we are in Jan 2024 before Lichun, we are technically in Chuk month of 2023.
-    
-    # Load terms for the relevant year
-    # If solar_time < lichun, we use prev year's terms?
-    # Actually, simpler: just Find the latest major term that has passed.
-    
-    # Implementation: Get all terms for current_year and current_year+1?
-    term_dates = manse.get_all_solar_terms(current_year)
-    
-    # Find active term
-    # Default to last term of previous year (Sohan -> Chuk) if before Lichun?
-    # But current_year logic handled year drop.
-    # So if we are 2024 Jan 1, current_year is 2023.
-    # Terms of 2023: Lichun... Sohan(Jan 2024).
-    # So we check 2023 terms.
-    
-    # Sort terms by date
-    sorted_terms = []
-    for t_name, t_branch_name in major_terms:
-        t_date = term_dates.get(t_name)
-        # Note: Sohan/Daeseol might be in next calendar year? 
-        # Typically manse.get_all_solar_terms(2023) should return Sohan as Jan 2024?
-        # My manse implementation might need checking on this.
-        # Assuming manse returns correct datetimes.
-        if t_date:
-            sorted_terms.append((t_date, t_branch_name))
-            
-    sorted_terms.sort(key=lambda x: x[0])
-    
-    month_branch_char = 'Chuk' # Default?
-    # Find last passed term
-    for t_date, t_branch in sorted_terms:
-        if solar_time >= t_date:
-            month_branch_char = t_branch
-            
-    # Month Stem is derived from Year Stem + Month Branch (Five Tigers)
-    year_stem = year_ganji['stem']
-    month_branch = Branch.objects.get(name=month_branch_char)
-    month_stem = get_month_stem(year_stem, month_branch)
-    
-    # 3. Day Pillar
-    # Calculated from absolute days since a reference epoch.
-    # Ref: 1900-01-01 was Jia-Xu (Gap-Sool)? No, need precise ref.
-    # Standard: epoch 1900-01-01 ?? 
-    # Better: Use korean-lunar-calendar or a known formula.
-    
-    # Using python reference:
-    ref_date = datetime(1900, 1, 1, tzinfo=pytz.utc) # UTC? Or whatever.
-    # 1900-01-01 was ... 
-    # Use a known recent date. 2024-01-01 was 甲子 (Gap-Ja). (Wait, verify!)
-    # Actually 2024-01-01 was Gap-Ja (甲子). Simple reference.
-    
-    ref_day = datetime(2024, 1, 1, tzinfo=pytz.timezone('Asia/Seoul'))
-    ref_stem_idx = 0 # 甲
-    ref_branch_idx = 0 # 子
-    
-    days_diff = (solar_time.date() - ref_day.date()).days
-    
-    day_stem_idx = (ref_stem_idx + days_diff) % 10
-    day_branch_idx = (ref_branch_idx + days_diff) % 12
-    
-    # Get objects (assuming order)
-    # Stems: 0=Gap.. 9=Gye
-    # Branches: 0=Ja.. 11=Hae
-    
-    # Optimizing: Load strict list
-    stems_list = list(Stem.objects.all()) # Assume sorted by ID creation? dangerous.
-    # Be safe:
-    STEMS = ['Gap', 'Eul', 'Byung', 'Jung', 'Moo', 'Gi', 'Gyung', 'Shin', 'Im', 'Gye']
-    BRANCHES = ['Ja', 'Chuk', 'In', 'Myo', 'Jin', 'Sa', 'O', 'Mi', 'Shin', 'Yoo', 'Sool', 'Hae']
-    
-    day_stem = Stem.objects.get(name=STEMS[day_stem_idx])
-    day_branch = Branch.objects.get(name=BRANCHES[day_branch_idx])
-    
-    # 4. Hour Pillar
-    # Derived from Day Stem + Hour Branch
-    # Determine Hour Branch from time
-    
-    # Rat (Ja): 23:30 - 01:30 (KST adjusted solar time already?)
-    # Input `solar_time` is already adjusted. 
-    # Standard Branches:
-    # Ja: 23-01, Chuk: 01-03 ...
-    # But `solar_time` is True Solar Time. So we use standard 23-01 boundaries on it.
-    
-    h = solar_time.hour
-    # Shift so that 23 maps to 0
-    # 23, 0 => Ja (0)
-    # 1, 2 => Chuk (1)
-    # ...
-    # Formula: (h + 1) // 2 % 12
-    hour_branch_idx = (h + 1) // 2 % 12
-    hour_branch = Branch.objects.get(name=BRANCHES[hour_branch_idx])
-    
-    hour_stem = get_hour_stem(day_stem, hour_branch)
-    
+    year_stem_idx = (current_year - 1984) % 10  # 1984 was 甲子 (Gap-Ja)
+    year_branch_idx = (current_year - 1984) % 12
+
+    # 2. Month Pillar: last month-opening term that has passed.
+    # Month stem follows the year stem (Five Tigers: 甲/己 year -> 丙寅 ...).
+    boundaries = [manse.solar_term_minute(current_year, manse.TERM_INDEX[name]) for name in MONTH_OPENING_TERMS]
+    boundaries.append(manse.solar_term_minute(current_year + 1, manse.TERM_INDEX['Sohan']))
+    month_offset = bisect_right(boundaries, now_minute) - 1  # 0 = In ... 11 = Chuk
+    month_branch_idx = (month_offset + 2) % 12
+    month_stem_idx = (2 + 2 * year_stem_idx + month_offset) % 10
+
+    # 3. Day Pillar: 60-day cycle counted from a known 甲子 day.
+    days_diff = (solar_time.date() - DAY_PILLAR_REFERENCE).days
+    day_stem_idx = days_diff % 10
+    day_branch_idx = days_diff % 12
+
+    # 4. Hour Pillar: 23, 0 => Ja (0); 1, 2 => Chuk (1) ...
+    # Hour stem follows the day stem (Five Rats: 甲/己 day -> 甲子 ...).
+    hour_branch_idx = (solar_time.hour + 1) // 2 % 12
+    hour_stem_idx = (2 * day_stem_idx + hour_branch_idx) % 10
+
     return {
-        'year': {'stem': year_ganji['stem'], 'branch': year_ganji['branch']},
-        'month': {'stem': month_stem, 'branch': month_branch},
-        'day': {'stem': day_stem, 'branch': day_branch},
-        'hour': {'stem': hour_stem, 'branch': hour_branch}
+        'year': (year_stem_idx, year_branch_idx),
+        'month': (month_stem_idx, month_branch_idx),
+        'day': (day_stem_idx, day_branch_idx),
+        'hour': (hour_stem_idx, hour_branch_idx),
     }
 
+
+def get_pillars_batch(dts):
+    """
+    Calculate the Four Pillars for many datetimes (KST aware) with two queries in total.
+    """
+    stems = {stem.name: stem for stem in Stem.objects.all()}
+    branches = {branch.name: branch for branch in Branch.objects.all()}
+    charts = []
+    for dt in dts:
+        charts.append({
+            pillar: {'stem': stems[STEMS[stem_idx]], 'branch': branches[BRANCHES[branch_idx]]}
+            for pillar, (stem_idx, branch_idx) in pillar_indexes(dt).items()
+        })
+    return charts
+
+
+def get_pillars(dt):
+    """
+    Calculate the Four Pillars for a given datetime (KST aware).
+    """
+    return get_pillars_batch([dt])[0]
+
 def get_yearly_ganji(year):
     # 1984 was 甲子 (Gap-Ja) - Start of cycle
     offset = year - 1984
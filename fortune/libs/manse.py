@@ -1,8 +1,18 @@
+import logging
+import mmap
+import math
+import struct
+from functools import lru_cache
+from pathlib import Path
+
 import ephem
-from korean_lunar_calendar import KoreanLunarCalendar
 from datetime import datetime, timedelta
 import pytz
 
+from core import korean_calendar
+
+logger = logging.getLogger(__name__)
+
 TERM_NAMES = [
     ('Lichun', 315), ('Usu', 330), ('Gyeongchip', 345), ('Chunbun', 0),
     ('Cheongmyeong', 15), ('Gokwoo', 30), ('Ipha', 45), ('Soman', 60),
@@ -11,98 +21,110 @@ TERM_NAMES = [
     ('Hallo', 195), ('Sanggang', 210), ('Ipdong', 225), ('Soseol', 240),
     ('Daeseol', 255), ('Dongji', 270), ('Sohan', 285), ('Daehan', 300)
 ]
+TERM_INDEX = {name: index for index, (name, _deg) in enumerate(TERM_NAMES)}
+
+# Pre-generated solar terms (manage.py build_solar_term_table): for each year
+# TABLE_FIRST_YEAR..TABLE_LAST_YEAR, 24 little-endian int32 values in TERM_NAMES
+# order, each the UTC minute (since TERM_EPOCH) in which the sun reaches the
+# term's longitude. Like the search below, a year's terms are the first
+# crossings after Jan 1 00:00 UTC, so Sohan/Daehan fall in January of that year.
+SOLAR_TERM_TABLE_PATH = Path(__file__).resolve().parent / 'data' / 'solar_terms.bin'
+TABLE_FIRST_YEAR = 1900
+TABLE_LAST_YEAR = 2100
+TERM_EPOCH = datetime(1900, 1, 1, tzinfo=pytz.utc)
+_TERM_RECORD = struct.Struct('<i')
+KST = pytz.timezone('Asia/Seoul')
+
+
+@lru_cache(maxsize=1)
+def _solar_term_table():
+    """Memory-mapped term table, or None when it has not been generated."""
+    expected_size = (TABLE_LAST_YEAR - TABLE_FIRST_YEAR + 1) * len(TERM_NAMES) * _TERM_RECORD.size
+    try:
+        with open(SOLAR_TERM_TABLE_PATH, 'rb') as handle:
+            table = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        logger.info("[manse] solar term table unavailable; computing terms with ephem")
+        return None
+    if len(table) != expected_size:
+        logger.warning("[manse] solar term table has %s bytes, expected %s; ignoring it", len(table), expected_size)
+        table.close()
+        return None
+    return table
+
+
+def _sun_longitude(sun, t):
+    sun.compute(t)
+    ecl = ephem.Ecliptic(ephem.Equatorial(sun.ra, sun.dec, epoch=t))
+    return ecl.lon
+
+
+@lru_cache(maxsize=4096)
+def compute_solar_term_minute(year, term_index):
+    """
+    Minute (since TERM_EPOCH) of a solar term, computed with ephem.
+
+    The sun's longitude is monotonic over a few days, so bracket the crossing
+    around an estimate from the mean motion and bisect down to the minute
+    instead of scanning day by day and then minute by minute.
+    """
+    target_rad = TERM_NAMES[term_index][1] * ephem.degree
+    sun = ephem.Sun()
+    minute = 1.0 / (24 * 60)
+    epoch = ephem.Date(TERM_EPOCH.replace(tzinfo=None))
+    year_start = ephem.Date(datetime(year, 1, 1))
+
+    def offset(t):
+        # Signed angle from the target, in (-pi, pi]; goes from negative to positive at the crossing.
+        return (_sun_longitude(sun, t) - target_rad + math.pi) % (2 * math.pi) - math.pi
+
+    ahead = (target_rad - _sun_longitude(sun, year_start)) % (2 * math.pi)
+    estimate = year_start + ahead / (2 * math.pi) * 365.2422
+    # Eccentricity moves the true sun up to ~2 days from the mean one.
+    low = max(year_start, estimate - 4)
+    high = estimate + 4
+    while offset(low) >= 0 and low > year_start:
+        low = max(year_start, low - 4)
+    while offset(high) < 0:
+        high += 4
+
+    low_minute = math.floor((low - epoch) / minute)
+    high_minute = math.ceil((high - epoch) / minute)
+    while high_minute - low_minute > 1:
+        middle = (low_minute + high_minute) // 2
+        if offset(epoch + middle * minute) < 0:
+            low_minute = middle
+        else:
+            high_minute = middle
+    return low_minute
+
+
+def solar_term_minute(year, term_index):
+    """Minute (since TERM_EPOCH, UTC) of a solar term; O(1) inside the pre-generated table."""
+    table = _solar_term_table()
+    if table is not None and TABLE_FIRST_YEAR <= year <= TABLE_LAST_YEAR:
+        position = ((year - TABLE_FIRST_YEAR) * len(TERM_NAMES) + term_index) * _TERM_RECORD.size
+        return _TERM_RECORD.unpack_from(table, position)[0]
+    return compute_solar_term_minute(year, term_index)
+
+
+def minute_of(dt):
+    """Minute (since TERM_EPOCH) containing an aware datetime, comparable with solar_term_minute()."""
+    return math.floor((dt - TERM_EPOCH).total_seconds() / 60)
+
+
+def minute_to_datetime(minute):
+    return (TERM_EPOCH + timedelta(minutes=minute)).astimezone(KST)
+
 
 def get_solar_term_date(year, term_name):
     """
     Get exact datetime of a specific solar term.
     """
-    target_lon = None
-    for name, deg in TERM_NAMES:
-        if name == term_name:
-            target_lon = deg
-            break
-            
-    if target_lon is None:
+    term_index = TERM_INDEX.get(term_name)
+    if term_index is None:
         return None
-        
-    # Convert to radians
-    target_rad = target_lon * ephem.degree
-    
-    sun = ephem.Sun()
-    
-    # Efficient start date estimation
-    term_index = [t[0] for t in TERM_NAMES].index(term_name)
-    days_offset = term_index * 15.2 + 34
-    if days_offset > 365: days_offset -= 365
-    
-    # Approx check implementation
-    # Lichun Feb 4, each 15 days roughly.
-    start_month = 1
-    if term_index >= 22: start_month = 12 # Dongji, Sohan, Daehan
-    elif term_index >= 20: start_month = 11
-    else: start_month = int(days_offset / 30) + 1
-    
-    # Search around estimated month
-    # To be safe, searched from Jan 1 is okay for < 1s penalty usually but 
-    # let's try to be slightly smarter or just safe.
-    search_date = datetime(year, 1, 1)
-
-    # Note: ephem dates are float (days since 1899...)
-    # We want to find DATE where sun.lon == target_rad
-    
-    def get_lon(d):
-        sun.compute(d)
-        ecl = ephem.Ecliptic(ephem.Equatorial(sun.ra, sun.dec, epoch=d))
-        return ecl.lon
-
-    t0 = ephem.Date(search_date)
-    step = 1.0
-    found_time = None
-    current_t = t0
-
-    # Quick scan 365 days
-    for _ in range(370):
-        l1 = get_lon(current_t)
-        l2 = get_lon(current_t + step)
-        
-        # Check containment handling wrap
-        # Safe way: angle distance
-        # But simple interval check works for 99%
-        is_between = False
-        
-        if l1 <= target_rad <= l2:
-            is_between = True
-        # Wrap case: target 0 (Chunbun), l1 359, l2 1
-        # target_rad is 0.0
-        elif target_rad < 0.1: # 0 degrees
-            if l1 > 6.0 and l2 < 1.0: # passed 2pi
-                is_between = True
-                
-        if is_between:
-            found_time = current_t
-            break
-        current_t += step
-        
-    if found_time:
-        # Refine (minute)
-        step = ephem.minute
-        current_t = found_time
-        for _ in range(1440 * 2):
-            l1 = get_lon(current_t)
-            l2 = get_lon(current_t + step)
-             
-            is_between = False
-            if l1 <= target_rad <= l2:
-                is_between = True
-            elif target_rad < 0.1 and l1 > 6.0 and l2 < 1.0:
-                 is_between = True
-                 
-            if is_between:
-                dt_utc = ephem.Date(current_t).datetime().replace(tzinfo=pytz.utc)
-                return dt_utc.astimezone(pytz.timezone('Asia/Seoul'))
-            current_t += step
-
-    return None
+    return minute_to_datetime(solar_term_minute(year, term_index))
 
 def get_all_solar_terms(year):
     """
@@ -132,7 +154,4 @@ def get_apparent_solar_time(dt, longitude):
 
 
 def lunar_to_solar(year, month, day, leap):
-    calendar = KoreanLunarCalendar()
-    calendar.setLunarDate(year, month, day, leap)
-    s_date = calendar.SolarIsoFormat()
-    return datetime.strptime(s_date, '%Y-%m-%d').date()
+    return korean_calendar.lunar_to_solar(year, month, day, intercalation=leap)
@@ -0,0 +1,56 @@
+import random
+from datetime import datetime, timedelta
+from time import perf_counter
+from unittest.mock import patch
+
+import pytz
+from django.core.management.base import BaseCommand
+
+from fortune.libs import calculator, manse
+from fortune.models import Stem
+
+
+class Command(BaseCommand):
+    help = "Measure saju charts per second: solar terms from ephem vs the pre-generated table, single vs batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--charts", type=int, default=200)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        tz = pytz.timezone("Asia/Seoul")
+        start = datetime(1940, 1, 1)
+        birthdates = [
+            tz.localize(start + timedelta(minutes=rng.randrange(80 * 365 * 24 * 60)))
+            for _ in range(max(1, options["charts"]))
+        ]
+        if manse._solar_term_table() is None:
+            self.stdout.write(self.style.WARNING("[bench] solar term table missing; run build_solar_term_table first"))
+
+        def indexes_from_ephem():
+            # Every chart computes its own terms, as before the table existed.
+            with patch.object(manse, "_solar_term_table", return_value=None):
+                for dt in birthdates:
+                    manse.compute_solar_term_minute.cache_clear()
+                    calculator.pillar_indexes(dt)
+
+        def indexes_from_table():
+            for dt in birthdates:
+                calculator.pillar_indexes(dt)
+
+        self._report("ephem terms", len(birthdates), indexes_from_ephem)
+        self._report("table terms", len(birthdates), indexes_from_table)
+        if not Stem.objects.exists():
+            self.stdout.write(self.style.WARNING("[bench] no Stem rows; run seed_saju_data to time get_pillars"))
+            return
+        self._report("get_pillars", len(birthdates), lambda: [calculator.get_pillars(dt) for dt in birthdates])
+        self._report("get_pillars_batch", len(birthdates), lambda: calculator.get_pillars_batch(birthdates))
+
+    def _report(self, label, count, run):
+        started = perf_counter()
+        run()
+        elapsed = perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"[bench] {label:<18} {count / elapsed:,.0f} charts/s ({elapsed * 1000:.1f}ms for {count})")
+        )
@@ -0,0 +1,34 @@
+from array import array
+import sys
+
+from django.core.management.base import BaseCommand
+
+from fortune.libs import manse
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate fortune/libs/data/solar_terms.bin, the packed solar term table "
+        f"({manse.TABLE_FIRST_YEAR}-{manse.TABLE_LAST_YEAR}) read by the saju engine."
+    )
+
+    def handle(self, *args, **options):
+        values = array('i')
+        for year in range(manse.TABLE_FIRST_YEAR, manse.TABLE_LAST_YEAR + 1):
+            for term_index in range(len(manse.TERM_NAMES)):
+                values.append(manse.compute_solar_term_minute(year, term_index))
+            manse.compute_solar_term_minute.cache_clear()
+        if sys.byteorder != 'little':
+            values.byteswap()
+
+        path = manse.SOLAR_TERM_TABLE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(values.tobytes())
+        tmp_path.replace(path)
+        manse._solar_term_table.cache_clear()
+
+        lichun = manse.get_solar_term_date(2024, 'Lichun')
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(values)} solar terms to {path} (2024 Lichun: {lichun:%Y-%m-%d %H:%M} KST)")
+        )
@@ -11,6 +11,9 @@ from django.utils import timezone
 from .models import FortunePseudonymousCache
 
 CACHE_RETENTION_DAYS = 30
+# 명식 계산이 바뀌면 올려서 예전 명식으로 만든 캐시 결과를 다시 쓰지 않게 한다.
+# 2: 음력 생일을 양력으로 바꿔 계산, 절기 표 적용
+CHART_RULES_VERSION = 2
 
 _LINE_BLOCK_PATTERNS = (
     re.compile(r'^\s*-?\s*생일\s*[:：].*$', re.IGNORECASE),
@@ -54,6 +57,7 @@ def normalize_birth_payload(data):
         'birth_day': data.get('birth_day'),
         'birth_hour': data.get('birth_hour'),
         'birth_minute': data.get('birth_minute'),
+        'chart_rules': CHART_RULES_VERSION,
     }
 
 
@@ -59,6 +59,28 @@ class LogicEngineTests(TestCase):
         # If Ipha is May 5 10:00, then it is Xin-Si (Summer month).
         # We need accurate Manse for this.
         
+    def test_month_after_sohan_is_chuk_of_previous_year(self):
+        """2024-01-20 is after Sohan but before Lichun: 癸卯 year, 乙丑 month."""
+        dt = pytz.timezone('Asia/Seoul').localize(datetime(2024, 1, 20, 12, 0))
+        pillars = calculator.get_pillars(dt)
+
+        self.assertEqual(pillars['year']['stem'].character + pillars['year']['branch'].character, '癸卯')
+        self.assertEqual(pillars['month']['stem'].character + pillars['month']['branch'].character, '乙丑')
+
+    def test_pillars_batch_matches_single_charts(self):
+        tz = pytz.timezone('Asia/Seoul')
+        dts = [
+            tz.localize(datetime(1990, 5, 5, 14, 30)),
+            tz.localize(datetime(2024, 2, 4, 18, 0)),
+            tz.localize(datetime(2000, 12, 31, 23, 40)),
+        ]
+
+        with self.assertNumQueries(2):
+            charts = calculator.get_pillars_batch(dts)
+
+        self.assertEqual(charts, [calculator.get_pillars(dt) for dt in dts])
+        self.assertEqual(charts[0]['month']['stem'].character + charts[0]['month']['branch'].character, '庚辰')
+
     def test_five_rats_hour_logic(self):
         """Test Hour Pillar derivation (Day Stem -> Hour Stem)"""
         # Day: 甲(Gap) -> Hour: Chuk(01:30) -> Should be Yi-Chuk (乙丑)
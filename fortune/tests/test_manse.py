@@ -25,6 +25,27 @@ class ManseEngineTests(TestCase):
         self.assertIn('Lichun', terms)
         self.assertIn('Dongji', terms)
 
+    def test_solar_term_table_matches_ephem_search(self):
+        """The committed table agrees with the ephem bisection to the minute."""
+        self.assertIsNotNone(manse._solar_term_table(), "run manage.py build_solar_term_table")
+        years = sorted({*range(manse.TABLE_FIRST_YEAR, manse.TABLE_LAST_YEAR + 1, 10), 2024, manse.TABLE_LAST_YEAR})
+        for year in years:
+            for term_index, (term_name, _deg) in enumerate(manse.TERM_NAMES):
+                with self.subTest(year=year, term=term_name):
+                    self.assertEqual(
+                        manse.solar_term_minute(year, term_index),
+                        manse.compute_solar_term_minute(year, term_index),
+                    )
+
+    def test_solar_term_outside_table_range(self):
+        lichun_1850 = manse.get_solar_term_date(1850, 'Lichun')
+        self.assertEqual((lichun_1850.year, lichun_1850.month), (1850, 2))
+        self.assertIn(lichun_1850.day, (3, 4, 5))
+
+    def test_sohan_belongs_to_january_of_the_same_year(self):
+        sohan = manse.get_solar_term_date(2024, 'Sohan')
+        self.assertEqual((sohan.year, sohan.month, sohan.day), (2024, 1, 6))
+
     def test_equation_of_time_correction(self):
         """
         Test true solar time calculation.
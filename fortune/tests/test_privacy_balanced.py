@@ -1,12 +1,17 @@
 import json
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from django.contrib.auth import get_user_model
 from django.test import Client, TestCase
 from django.urls import reverse
+from django.utils import timezone
 
 from core.models import UserProfile
-from fortune.models import Branch, DailyFortuneLog, FortuneResult, Stem
+from fortune.forms import SajuForm
+from fortune.models import Branch, DailyFortuneLog, FortunePseudonymousCache, FortuneResult, Stem
+from fortune.privacy import build_user_pseudonymous_fingerprint, normalize_birth_payload
+from fortune.views import _get_full_analysis_cache_entry
 
 User = get_user_model()
 
@@ -205,3 +210,39 @@ class FortunePrivacyBalancedTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(response.json()["success"])
         self.assertEqual(DailyFortuneLog.objects.count(), 0)
+
+    def test_saju_form_checks_lunar_dates_against_the_lunar_calendar(self):
+        lunar_data = dict(self.form_data, calendar_type="lunar", birth_month="1", birth_day="30")
+        form = SajuForm(lunar_data)
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.non_field_errors(), ["음력 1990년 1월에는 30일이 없습니다. 음력 날짜를 다시 확인해 주세요."])
+        # 1990년 음력 2월은 30일까지 있다.
+        self.assertTrue(SajuForm(dict(lunar_data, birth_month="2")).is_valid())
+        self.assertFalse(SajuForm(dict(self.form_data, birth_month="2", birth_day="30")).is_valid())
+
+    def test_saju_api_rejects_impossible_lunar_date(self):
+        with patch("fortune.views._check_saju_ratelimit", new=AsyncMock(return_value=False)):
+            response = self.client.post(
+                reverse("fortune:saju_api"),
+                dict(self.form_data, calendar_type="lunar", birth_month="1", birth_day="30"),
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("음력 1990년 1월에는 30일이 없습니다.", response.json()["errors"]["__all__"][0])
+
+    def test_full_analysis_cache_ignores_results_from_older_chart_rules(self):
+        data = dict(self.form_data, calendar_type="lunar", birth_year=1990, birth_month=5, birth_day=5)
+        old_payload = {key: value for key, value in normalize_birth_payload(data).items() if key != "chart_rules"}
+        FortunePseudonymousCache.objects.create(
+            user=self.user,
+            purpose="full",
+            fingerprint=build_user_pseudonymous_fingerprint(self.user.id, old_payload),
+            result_text="예전 명식으로 만든 결과",
+            expires_at=timezone.now() + timedelta(days=1),
+        )
+
+        fingerprint, cached_result = _get_full_analysis_cache_entry(self.user, data)
+
+        self.assertIsNone(cached_result)
+        self.assertNotEqual(fingerprint, build_user_pseudonymous_fingerprint(self.user.id, old_payload))
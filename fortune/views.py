@@ -9,6 +9,7 @@ from django.contrib.auth.decorators import login_required
 from django_ratelimit.decorators import ratelimit
 from django_ratelimit.core import is_ratelimited
 from asgiref.sync import sync_to_async
+from core import korean_calendar
 from core.utils import ratelimit_key_for_master_only
 from core.seo import (
     build_fortune_detail_page_seo,
@@ -138,6 +139,12 @@ def get_chart_context(data):
         hour = data['birth_hour'] if data['birth_hour'] is not None else 12 # Default noon
         minute = data['birth_minute'] if data['birth_minute'] is not None else 0
         
+        # Lunar birthdays are charted from their solar date (no leap-month input on the form).
+        # SajuForm rejects lunar dates that do not exist before we get here.
+        if data.get('calendar_type') == 'lunar':
+            solar_date = korean_calendar.lunar_to_solar(year, month, day)
+            year, month, day = solar_date.year, solar_date.month, solar_date.day
+
         # User timezone assumption: KST (Asia/Seoul)
         tz = pytz.timezone('Asia/Seoul')
         dt = datetime(year, month, day, hour, minute, tzinfo=tz)
@@ -0,0 +1,171 @@
+"""
+Mancala AI: exact play once few seeds are left, OpenSpiel MCTS before that.
+
+Positions are 14-tuples in OpenSpiel's board layout (index 0 is player 1's
+store, 1-6 player 0's pits, 7 player 0's store, 8-13 player 1's pits).
+
+Once at most ENDGAME_SEEDS seeds remain in the pits, the game is solved
+exactly. What is still to be won depends only on the pits and the player to
+move, not on the store counts, so one shared table of solved positions serves
+every game in the process. Earlier positions are searched with MCTS. The
+chosen move is kept in a transposition table keyed by position, so a class
+replaying the same openings does not search the same position again.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from open_spiel.python.algorithms import mcts
+
+BOARD_SIZE = 14
+PITS = {0: tuple(range(1, 7)), 1: tuple(range(8, 14))}
+STORES = {0: 7, 1: 0}
+
+ENDGAME_SEEDS = 10
+ENDGAME_TABLE_LIMIT = 500_000
+TRANSPOSITION_TABLE_SIZE = 20_000
+MCTS_SIMULATIONS = 48
+
+
+def sow(board, player, action):
+    """Board (list) and next player after ``player`` sows pit ``action``, following OpenSpiel's rules."""
+    board = list(board)
+    seeds = board[action]
+    board[action] = 0
+    skipped_store = STORES[1 - player]
+    index = action
+    for _ in range(seeds):
+        index = (index + 1) % BOARD_SIZE
+        if index == skipped_store:
+            index = (index + 1) % BOARD_SIZE
+        board[index] += 1
+
+    opposite = BOARD_SIZE - index
+    if index in PITS[player] and board[index] == 1 and board[opposite] > 0:
+        board[STORES[player]] += 1 + board[opposite]
+        board[index] = 0
+        board[opposite] = 0
+
+    next_player = player if index == STORES[player] else 1 - player
+    return board, next_player
+
+
+def seeds_in_pits(board):
+    return sum(board[index] for index in PITS[0]) + sum(board[index] for index in PITS[1])
+
+
+# (pits, player to move) -> seeds the mover still gains over the opponent with perfect play.
+_endgame_values = {}
+
+
+def _endgame_value(board, player):
+    key = bytes([*board[1:7], *board[8:14], player])
+    value = _endgame_values.get(key)
+    if value is not None:
+        return value
+
+    own = sum(board[index] for index in PITS[player])
+    other = sum(board[index] for index in PITS[1 - player])
+    if own == 0 or other == 0:
+        # Game over: seeds left in the pits go to their owners.
+        value = own - other
+    else:
+        value = None
+        for action in PITS[player]:
+            if board[action]:
+                score = _endgame_move_value(board, player, action)
+                if value is None or score > value:
+                    value = score
+    _endgame_values[key] = value
+    return value
+
+
+def _endgame_move_value(board, player, action):
+    after, next_player = sow(board, player, action)
+    gained = after[STORES[player]] - board[STORES[player]]
+    rest = _endgame_value(after, next_player)
+    return gained + (rest if next_player == player else -rest)
+
+
+def endgame_action(board, player):
+    """Best move by exact search; only for positions with at most ENDGAME_SEEDS seeds in the pits."""
+    if len(_endgame_values) > ENDGAME_TABLE_LIMIT:
+        _endgame_values.clear()
+    best_action, best_score = None, None
+    for action in PITS[player]:
+        if board[action]:
+            score = _endgame_move_value(board, player, action)
+            if best_score is None or score > best_score:
+                best_action, best_score = action, score
+    return best_action
+
+
+class TranspositionTable:
+    """Thread-safe LRU map from (board, player) to the move chosen there."""
+
+    def __init__(self, max_entries=TRANSPOSITION_TABLE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            action = self._entries.get(key)
+            if action is not None:
+                self._entries.move_to_end(key)
+            return action
+
+    def put(self, key, action):
+        with self._lock:
+            self._entries[key] = action
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+transposition_table = TranspositionTable()
+
+
+def _position_seed(board, player):
+    return 20260425 + player * 97 + sum((index + 1) * value for index, value in enumerate(board))
+
+
+def _mcts_action(game, state, seed):
+    rollout_rng = np.random.RandomState(seed)
+    search_rng = np.random.RandomState(seed + 31)
+    evaluator = mcts.RandomRolloutEvaluator(n_rollouts=2, random_state=rollout_rng, max_length=120)
+    bot = mcts.MCTSBot(
+        game,
+        uct_c=1.4,
+        max_simulations=MCTS_SIMULATIONS,
+        evaluator=evaluator,
+        solve=True,
+        random_state=search_rng,
+    )
+    return int(bot.step(state.clone()))
+
+
+def choose_action(game, state):
+    """Move for the player to move in an OpenSpiel mancala ``state``; ``None`` when it has no legal move."""
+    legal_actions = [int(action) for action in state.legal_actions()]
+    if not legal_actions:
+        return None
+    if len(legal_actions) == 1:
+        return legal_actions[0]
+
+    board = tuple(int(value) for value in state.observation_tensor(0))
+    player = int(state.current_player())
+    if seeds_in_pits(board) <= ENDGAME_SEEDS:
+        return endgame_action(board, player)
+
+    key = (board, player)
+    action = transposition_table.get(key)
+    if action not in legal_actions:
+        action = _mcts_action(game, state, _position_seed(board, player))
+        transposition_table.put(key, action)
+    return action
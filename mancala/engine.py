@@ -1,6 +1,9 @@
-import numpy as np
+from functools import lru_cache
+
 import pyspiel
-from open_spiel.python.algorithms import mcts
+
+from . import ai
+from .sessions import game_sessions, new_game_id, normalize_game_id
 
 
 GAME_NAME = "mancala"
@@ -18,8 +21,13 @@ def new_game():
     return pyspiel.load_game(GAME_NAME)
 
 
+@lru_cache(maxsize=1)
+def shared_game():
+    return new_game()
+
+
 def new_state():
-    return new_game().new_initial_state()
+    return shared_game().new_initial_state()
 
 
 def normalize_history(raw_history):
@@ -35,7 +43,7 @@ def normalize_action(raw_action, field_name="action"):
 
 
 def replay_history(history):
-    game = new_game()
+    game = shared_game()
     state = game.new_initial_state()
     for action in history:
         _apply_checked(state, action, source="history")
@@ -46,20 +54,25 @@ def initial_response():
     state = new_state()
     return {
         "ok": True,
+        "game_id": new_game_id(),
         "history": [],
         "state": serialize_state(state),
         "moves": [],
     }
 
 
-def play_move(history, action, *, mode="ai"):
+def play_move(history, action, *, mode="ai", game_id=None):
     history = normalize_history(history)
     action = normalize_action(action)
     mode = (mode or "ai").strip().lower()
     if mode not in {"ai", "local"}:
         mode = "ai"
+    game_id = normalize_game_id(game_id)
 
-    game, state = replay_history(history)
+    game = shared_game()
+    state = game_sessions.take(game_id, history)
+    if state is None:
+        game, state = replay_history(history)
     if mode == "ai" and state.current_player() != 0:
         raise MancalaInputError("AI 차례입니다.")
 
@@ -68,14 +81,16 @@ def play_move(history, action, *, mode="ai"):
 
     if mode == "ai":
         while not state.is_terminal() and state.current_player() == 1:
-            ai_action = _choose_ai_action(game, state, next_history)
-            moves.append(_record_and_apply(state, ai_action, actor="ai"))
+            ai_action = _choose_ai_action(game, state)
+            moves.append(_record_and_apply(state, ai_action, actor="ai", before=moves[-1]["after"]))
             next_history.append(ai_action)
 
+    game_sessions.put(game_id, next_history, state)
     return {
         "ok": True,
+        "game_id": game_id,
         "history": next_history,
-        "state": serialize_state(state),
+        "state": moves[-1]["after"],
         "moves": moves,
     }
 
@@ -108,7 +123,8 @@ def sow_path(board, action, player):
     return destinations
 
 
-def _record_and_apply(state, action, *, actor):
+def _record_and_apply(state, action, *, actor, before=None):
+    """Apply a move; ``before`` may pass the previous move's ``after`` to skip serializing the same state again."""
     action = normalize_action(action)
     if state.is_terminal():
         raise MancalaInputError("이미 끝난 판입니다.")
@@ -116,7 +132,8 @@ def _record_and_apply(state, action, *, actor):
     if action not in legal_actions:
         raise MancalaInputError("둘 수 없는 구멍입니다.")
 
-    before = serialize_state(state)
+    if before is None:
+        before = serialize_state(state)
     player = int(state.current_player())
     path = sow_path(before["board"], action, player)
     state.apply_action(action)
@@ -141,24 +158,12 @@ def _apply_checked(state, action, *, source):
     state.apply_action(action)
 
 
-def _choose_ai_action(game, state, history):
+def _choose_ai_action(game, state):
     legal_actions = [int(action) for action in state.legal_actions()]
     if not legal_actions:
         raise MancalaInputError("AI가 둘 수 있는 수가 없습니다.")
 
-    seed = 20260425 + len(history) * 97 + sum((index + 1) * action for index, action in enumerate(history))
-    rollout_rng = np.random.RandomState(seed)
-    search_rng = np.random.RandomState(seed + 31)
-    evaluator = mcts.RandomRolloutEvaluator(n_rollouts=2, random_state=rollout_rng, max_length=120)
-    bot = mcts.MCTSBot(
-        game,
-        uct_c=1.4,
-        max_simulations=48,
-        evaluator=evaluator,
-        solve=True,
-        random_state=search_rng,
-    )
-    action = int(bot.step(state.clone()))
+    action = ai.choose_action(game, state)
     if action not in legal_actions:
         raise MancalaInputError("AI가 둘 수 없는 수를 골랐습니다.")
     return action
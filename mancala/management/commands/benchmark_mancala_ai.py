@@ -0,0 +1,53 @@
+import random
+from statistics import median, quantiles
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from mancala import ai, engine
+from mancala.sessions import game_sessions
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a class playing mancala against the AI at once and time each move request: "
+        "stateless replay with a fresh search every move vs the session store and shared AI tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=30)
+        parser.add_argument("--seed", type=int, default=11)
+
+    def handle(self, *args, **options):
+        students = max(1, options["students"])
+        for label, stateful in (("stateless", False), ("session+tables", True)):
+            game_sessions.clear()
+            ai.transposition_table.clear()
+            ai._endgame_values.clear()
+            latencies = self._play_class(students, options["seed"], stateful=stateful)
+            p95 = quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[bench] {label:<15} requests={len(latencies)} total={sum(latencies):.0f}ms "
+                    f"p50={median(latencies):.1f}ms p95={p95:.1f}ms"
+                )
+            )
+
+    def _play_class(self, students, seed, *, stateful):
+        rng = random.Random(seed)
+        games = [engine.initial_response() for _ in range(students)]
+        latencies = []
+        # Round-robin over the class, one move request per student per turn.
+        while any(not game["state"]["terminal"] for game in games):
+            for index, game in enumerate(games):
+                if game["state"]["terminal"]:
+                    continue
+                action = rng.choice(game["state"]["legal_actions"])
+                if not stateful:
+                    game_sessions.clear()
+                    ai.transposition_table.clear()
+                    ai._endgame_values.clear()
+                started = perf_counter()
+                games[index] = engine.play_move(game["history"], action, mode="ai", game_id=game["game_id"])
+                latencies.append((perf_counter() - started) * 1000)
+        return latencies
@@ -0,0 +1,63 @@
+"""
+Live mancala games kept in process memory, keyed by a server-issued game id.
+
+The client's history stays the source of truth. A stored state is only used
+when its history matches the request. Otherwise the move replays the history
+as before: after a restart, on another worker, after an undo or for an
+unknown id.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+MAX_GAMES = 2048
+GAME_TTL_SECONDS = 2 * 60 * 60
+GAME_ID_MAX_LENGTH = 64
+
+
+def new_game_id():
+    return secrets.token_urlsafe(12)
+
+
+def normalize_game_id(raw_game_id):
+    if isinstance(raw_game_id, str) and 0 < len(raw_game_id) <= GAME_ID_MAX_LENGTH and raw_game_id.isprintable():
+        return raw_game_id
+    return new_game_id()
+
+
+class GameSessionStore:
+    def __init__(self, max_games=MAX_GAMES, ttl_seconds=GAME_TTL_SECONDS):
+        self.max_games = max_games
+        self.ttl_seconds = ttl_seconds
+        self._games = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, game_id, history):
+        """Remove and return the stored state for ``game_id`` if it was reached by ``history``."""
+        with self._lock:
+            entry = self._games.pop(game_id, None)
+        if entry is None:
+            return None
+        stored_history, state, stored_at = entry
+        if stored_history != tuple(history) or time.monotonic() - stored_at > self.ttl_seconds:
+            return None
+        return state
+
+    def put(self, game_id, history, state):
+        with self._lock:
+            self._games[game_id] = (tuple(history), state, time.monotonic())
+            self._games.move_to_end(game_id)
+            while len(self._games) > self.max_games:
+                self._games.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._games.clear()
+
+    def __len__(self):
+        return len(self._games)
+
+
+game_sessions = GameSessionStore()
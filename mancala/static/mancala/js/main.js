@@ -29,6 +29,7 @@ if (root) {
         legalActions: initialPayload.state.legal_actions.slice(),
         currentPlayer: initialPayload.state.current_player,
         terminal: initialPayload.state.terminal,
+        gameId: initialPayload.game_id || "",
         history: [],
         snapshots: [{ history: [], gameState: initialPayload.state }],
         aiMode: true,
@@ -254,6 +255,7 @@ if (root) {
                     "X-CSRFToken": csrfToken,
                 },
                 body: JSON.stringify({
+                    game_id: state.gameId,
                     history: state.history,
                     action,
                     mode: state.aiMode ? "ai" : "local",
@@ -268,6 +270,7 @@ if (root) {
                 await animateMove(move);
                 await showMoveResult(move);
             }
+            state.gameId = payload.game_id || state.gameId;
             applyGameState(payload.state, payload.history);
             state.snapshots.push({ history: payload.history.slice(), gameState: payload.state });
         } catch (error) {
@@ -0,0 +1,76 @@
+import random
+from unittest.mock import patch
+
+import pyspiel
+from django.test import SimpleTestCase
+
+from mancala import ai, engine
+from mancala.sessions import game_sessions
+
+
+class MancalaRulesTests(SimpleTestCase):
+    def test_pure_python_rules_match_open_spiel(self):
+        rng = random.Random(7)
+        game = pyspiel.load_game("mancala")
+        for _ in range(20):
+            state = game.new_initial_state()
+            while not state.is_terminal():
+                board = [int(value) for value in state.observation_tensor(0)]
+                player = int(state.current_player())
+                action = rng.choice([int(value) for value in state.legal_actions()])
+
+                expected_board, expected_player = ai.sow(board, player, action)
+                state.apply_action(action)
+                if state.is_terminal():
+                    break
+
+                self.assertEqual([int(value) for value in state.observation_tensor(0)], expected_board)
+                self.assertEqual(int(state.current_player()), expected_player)
+
+
+class MancalaAiTests(SimpleTestCase):
+    def setUp(self):
+        ai.transposition_table.clear()
+
+    def test_endgame_takes_the_capture(self):
+        # Player 0 to move: pit 5 lands in the empty pit 6 and captures pit 8's five seeds.
+        board = [20, 1, 0, 0, 0, 1, 0, 18, 5, 0, 0, 0, 0, 1]
+
+        self.assertEqual(ai.endgame_action(board, 0), 5)
+
+    def test_midgame_search_is_reused_for_the_same_position(self):
+        state = engine.new_state()
+        state.apply_action(1)
+
+        with patch.object(ai, "_mcts_action", wraps=ai._mcts_action) as mocked_search:
+            first = ai.choose_action(engine.shared_game(), state)
+            second = ai.choose_action(engine.shared_game(), state.clone())
+
+        self.assertEqual(first, second)
+        mocked_search.assert_called_once()
+
+
+class MancalaSessionTests(SimpleTestCase):
+    def setUp(self):
+        game_sessions.clear()
+
+    def test_next_move_continues_stored_game_without_replaying(self):
+        first = engine.play_move([], 3, mode="local", game_id="class-3-game")
+
+        with patch.object(engine, "replay_history", wraps=engine.replay_history) as mocked_replay:
+            second = engine.play_move(first["history"], 4, mode="local", game_id=first["game_id"])
+
+        mocked_replay.assert_not_called()
+        self.assertEqual(second["game_id"], "class-3-game")
+        self.assertEqual(second["history"], [3, 4])
+
+    def test_undone_history_falls_back_to_replay(self):
+        first = engine.play_move([], 3, mode="local", game_id="undo-game")
+        engine.play_move(first["history"], 4, mode="local", game_id="undo-game")
+
+        with patch.object(engine, "replay_history", wraps=engine.replay_history) as mocked_replay:
+            replayed = engine.play_move([3], 5, mode="local", game_id="undo-game")
+
+        mocked_replay.assert_called_once_with([3])
+        self.assertEqual(replayed["history"], [3, 5])
+        self.assertEqual(replayed["moves"][0]["before"]["board"], first["state"]["board"])
@@ -47,6 +47,7 @@ def api_move(request):
             payload.get("history"),
             payload.get("action"),
             mode=payload.get("mode", "ai"),
+            game_id=payload.get("game_id"),
         )
     except MancalaInputError as exc:
         return JsonResponse({"ok": False, "error": str(exc)}, status=400)
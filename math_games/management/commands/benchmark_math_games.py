@@ -0,0 +1,70 @@
+import random
+from statistics import median, quantiles
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from math_games.services import game_2048, nim
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the Nim AI and 2048 move engines for a class of students playing at once "
+        "(pure engine work, no database)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=300)
+        parser.add_argument("--moves", type=int, default=40, help="2048 moves per student.")
+        parser.add_argument("--seed", type=int, default=11)
+
+    def handle(self, *args, **options):
+        students = max(1, options["students"])
+        rng = random.Random(options["seed"])
+        self._report("nim move", self._nim_latencies(students, rng))
+        # The row tables are built on the first 2048 move of a worker; report that once on its own.
+        started = perf_counter()
+        game_2048._row_tables()
+        self.stdout.write(f"[bench] 2048 row tables built in {(perf_counter() - started) * 1000:.0f}ms")
+        self._report("2048 move", self._2048_latencies(students, options["moves"], rng))
+
+    def _report(self, label, latencies):
+        p95 = quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[bench] {label:<10} requests={len(latencies)} total={sum(latencies):.0f}ms "
+                f"p50={median(latencies) * 1000:.0f}us p95={p95 * 1000:.0f}us"
+            )
+        )
+
+    def _nim_latencies(self, students, rng):
+        latencies = []
+        for student in range(students):
+            history = []
+            difficulty = rng.choice(sorted(nim.VALID_DIFFICULTIES))
+            while True:
+                position = nim.position_from_history(history)
+                if position.is_terminal():
+                    break
+                action = rng.choice(position.legal_actions())
+                decoded = nim.decode_action(action)
+                started = perf_counter()
+                history, _move, state = nim.apply_student_move(history, decoded.pile_index, decoded.take)
+                if not state.is_terminal():
+                    ai_action = nim.select_ai_action(difficulty, state, seed=student + len(history))
+                    state.apply_action(ai_action)
+                    history = [*history, ai_action]
+                latencies.append((perf_counter() - started) * 1000)
+        return latencies
+
+    def _2048_latencies(self, students, moves, rng):
+        latencies = []
+        states = [game_2048.stored_state(game_2048.initial_state_json(rng=rng)) for _ in range(students)]
+        for _ in range(moves):
+            for index, state in enumerate(states):
+                started = perf_counter()
+                moved = game_2048.apply_move(state, rng.choice(game_2048.DIRECTIONS), rng=rng)
+                states[index] = game_2048.stored_state(moved)
+                game_2048.public_state(states[index])
+                latencies.append((perf_counter() - started) * 1000)
+        return latencies
@@ -0,0 +1,26 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+
+from math_games.services import twenty_four
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate math_games/services/data/twenty_four_catalog.bin, every solvable 24 puzzle "
+        "with its distinct solutions and difficulty tier, read by math_games.services.twenty_four."
+    )
+
+    def handle(self, *args, **options):
+        data = twenty_four.build_catalog_bytes()
+        path = twenty_four.CATALOG_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        entries = twenty_four.load_catalog(data)
+        tiers = Counter(entry.tier for entry in entries)
+        summary = ", ".join(f"{tier}={tiers[tier]}" for tier in twenty_four.TIERS)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(entries)} puzzles ({summary}, {len(data)} bytes) to {path}")
+        )
@@ -1,9 +1,18 @@
 import random
+from array import array
+from functools import lru_cache
 
 
 GRID_SIZE = 4
 WIN_TILE = 2048
 VALID_DIRECTIONS = {"up", "down", "left", "right"}
+DIRECTIONS = ("up", "down", "left", "right")
+
+# Boards are packed into one 64-bit int: 4 bits per cell holding the tile's exponent
+# (0 = empty, k = 2**k), row-major with cell (0, 0) in the lowest nibble.
+MAX_EXPONENT = 15
+WIN_EXPONENT = WIN_TILE.bit_length() - 1
+_ROW_MASK = 0xFFFF
 
 
 class InvalidDirection(ValueError):
@@ -72,6 +81,161 @@ def transpose(grid):
     return [list(row) for row in zip(*grid)]
 
 
+def tile_exponent(value):
+    value = int(value or 0)
+    if value <= 0:
+        return 0
+    exponent = value.bit_length() - 1
+    if value != 1 << exponent or not 1 <= exponent <= MAX_EXPONENT:
+        raise ValueError(f"unsupported 2048 tile: {value}")
+    return exponent
+
+
+def pack_grid(raw_grid):
+    board = 0
+    for row_index, row in enumerate(normalize_grid(raw_grid)):
+        for column_index, value in enumerate(row):
+            board |= tile_exponent(value) << (4 * (GRID_SIZE * row_index + column_index))
+    return board
+
+
+def unpack_board(board):
+    return [
+        [
+            1 << exponent if exponent else 0
+            for exponent in ((board >> (4 * (GRID_SIZE * row_index + column_index))) & 0xF for column_index in range(GRID_SIZE))
+        ]
+        for row_index in range(GRID_SIZE)
+    ]
+
+
+def board_to_hex(board):
+    return f"{board:016x}"
+
+
+def board_from_hex(raw_board):
+    return int(str(raw_board), 16) & 0xFFFF_FFFF_FFFF_FFFF
+
+
+@lru_cache(maxsize=1)
+def _row_tables():
+    """
+    Slide lookup for every packed row (65536 each): direction -> (row after the slide, score gained).
+
+    Up and down use the left and right tables on the transposed board.
+    """
+    left_rows = array("H", bytes(2 * 65536))
+    left_scores = array("I", bytes(4 * 65536))
+    right_rows = array("H", bytes(2 * 65536))
+    right_scores = array("I", bytes(4 * 65536))
+    for row in range(65536):
+        exponents = [exponent for exponent in ((row >> (4 * index)) & 0xF for index in range(GRID_SIZE)) if exponent]
+        merged = []
+        gained = 0
+        index = 0
+        while index < len(exponents):
+            exponent = exponents[index]
+            if index + 1 < len(exponents) and exponents[index + 1] == exponent and exponent < MAX_EXPONENT:
+                exponent += 1
+                gained += 1 << exponent
+                index += 2
+            else:
+                index += 1
+            merged.append(exponent)
+        left_row = sum(exponent << (4 * index) for index, exponent in enumerate(merged))
+        left_rows[row] = left_row
+        left_scores[row] = gained
+        right_rows[_reverse_row(row)] = _reverse_row(left_row)
+        right_scores[_reverse_row(row)] = gained
+    return {"left": (left_rows, left_scores), "right": (right_rows, right_scores)}
+
+
+def _reverse_row(row):
+    return ((row & 0xF) << 12) | ((row & 0xF0) << 4) | ((row >> 4) & 0xF0) | (row >> 12)
+
+
+def _transpose_board(board):
+    """Swap rows and columns of a packed board (nibble 4*row+col <-> 4*col+row)."""
+    a1 = board & 0xF0F0_0F0F_F0F0_0F0F
+    a2 = board & 0x0000_F0F0_0000_F0F0
+    a3 = board & 0x0F0F_0000_0F0F_0000
+    board = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = board & 0xFF00_FF00_00FF_00FF
+    b2 = board & 0x00FF_00FF_0000_0000
+    b3 = board & 0x0000_0000_FF00_FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def _slide_rows(board, rows, scores):
+    moved = 0
+    gained = 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & _ROW_MASK
+        moved |= rows[row] << shift
+        gained += scores[row]
+    return moved, gained
+
+
+def move_board(board, direction):
+    """Packed board and score gained after sliding ``direction``; the board is unchanged when nothing moves."""
+    if direction not in VALID_DIRECTIONS:
+        raise InvalidDirection("방향 확인")
+    tables = _row_tables()
+    if direction in {"left", "right"}:
+        return _slide_rows(board, *tables[direction])
+    moved, gained = _slide_rows(_transpose_board(board), *tables["left" if direction == "up" else "right"])
+    return _transpose_board(moved), gained
+
+
+def board_available_moves(board):
+    return [direction for direction in DIRECTIONS if move_board(board, direction)[0] != board]
+
+
+def board_empty_cells(board):
+    return [index for index in range(GRID_SIZE * GRID_SIZE) if not (board >> (4 * index)) & 0xF]
+
+
+def board_max_exponent(board):
+    return max((board >> (4 * index)) & 0xF for index in range(GRID_SIZE * GRID_SIZE))
+
+
+def spawn_tile_on_board(board, rng=None):
+    """Packed board with a 2 (or, one time in ten, a 4) in a random empty cell, and the spawned tile or ``None``."""
+    cells = board_empty_cells(board)
+    if not cells:
+        return board, None
+    random_source = rng or random.Random()
+    index = random_source.choice(cells)
+    exponent = 2 if random_source.random() < 0.1 else 1
+    tile = {"row": index // GRID_SIZE, "col": index % GRID_SIZE, "value": 1 << exponent}
+    return board | (exponent << (4 * index)), tile
+
+
+def state_board(state):
+    """Packed board of a stored state; states saved before boards were packed only have ``grid``."""
+    raw_board = (state or {}).get("board")
+    if raw_board:
+        try:
+            return board_from_hex(raw_board)
+        except ValueError:
+            pass
+    return pack_grid((state or {}).get("grid"))
+
+
+def stored_state(state):
+    """What a session keeps: the packed board and counters; the grid and available moves are derived on read."""
+    return {
+        "board": board_to_hex(state_board(state)),
+        "score": int(state.get("score") or 0),
+        "moves": int(state.get("moves") or 0),
+        "won": bool(state.get("won")),
+        "game_over": bool(state.get("game_over")),
+        "spawned": list(state.get("spawned") or []),
+        "gained": int(state.get("gained") or 0),
+        "moved": bool(state.get("moved")),
+    }
+
+
 def move_grid(raw_grid, direction):
     if direction not in VALID_DIRECTIONS:
         raise InvalidDirection("방향 확인")
@@ -120,59 +284,54 @@ def has_winning_tile(grid):
 
 
 def available_moves(grid):
-    normalized = normalize_grid(grid)
-    return [
-        direction
-        for direction in ["up", "down", "left", "right"]
-        if move_grid(normalized, direction)["moved"]
-    ]
+    return board_available_moves(pack_grid(grid))
 
 
 def is_game_over(grid):
     return not available_moves(grid)
 
 
-def public_state(state):
-    grid = normalize_grid((state or {}).get("grid"))
-    moves = available_moves(grid)
-    score = int((state or {}).get("score") or 0)
-    move_count = int((state or {}).get("moves") or 0)
-    won = bool((state or {}).get("won")) or has_winning_tile(grid)
-    game_over = bool((state or {}).get("game_over")) or not moves
+def _board_state(board, *, score=0, moves=0, won=False, game_over=False, spawned=(), gained=0, moved=False):
+    available = board_available_moves(board)
     return {
-        "grid": grid,
-        "score": score,
-        "moves": move_count,
-        "won": won,
-        "game_over": game_over,
-        "spawned": list((state or {}).get("spawned") or []),
-        "gained": int((state or {}).get("gained") or 0),
-        "moved": bool((state or {}).get("moved")),
-        "available_moves": moves,
+        "board": board_to_hex(board),
+        "grid": unpack_board(board),
+        "score": int(score),
+        "moves": int(moves),
+        "won": bool(won) or board_max_exponent(board) >= WIN_EXPONENT,
+        "game_over": bool(game_over) or not available,
+        "spawned": list(spawned),
+        "gained": int(gained),
+        "moved": bool(moved),
+        "available_moves": available,
     }
 
 
+def public_state(state):
+    state = state or {}
+    public = _board_state(
+        state_board(state),
+        score=int(state.get("score") or 0),
+        moves=int(state.get("moves") or 0),
+        won=bool(state.get("won")),
+        game_over=bool(state.get("game_over")),
+        spawned=state.get("spawned") or [],
+        gained=int(state.get("gained") or 0),
+        moved=bool(state.get("moved")),
+    )
+    del public["board"]
+    return public
+
+
 def initial_state_json(rng=None):
-    grid = empty_grid()
     random_source = rng or random.Random()
+    board = 0
     spawned = []
-    first = spawn_tile(grid, random_source)
-    if first:
-        spawned.append(first)
-    second = spawn_tile(grid, random_source)
-    if second:
-        spawned.append(second)
-    return {
-        "grid": grid,
-        "score": 0,
-        "moves": 0,
-        "won": False,
-        "game_over": False,
-        "spawned": spawned,
-        "gained": 0,
-        "moved": False,
-        "available_moves": available_moves(grid),
-    }
+    for _ in range(2):
+        board, tile = spawn_tile_on_board(board, random_source)
+        if tile:
+            spawned.append(tile)
+    return _board_state(board, spawned=spawned)
 
 
 def apply_move(state, direction, rng=None):
@@ -180,32 +339,27 @@ def apply_move(state, direction, rng=None):
     if normalized_direction not in VALID_DIRECTIONS:
         raise InvalidDirection("방향 확인")
 
-    current = public_state(state or {})
-    move = move_grid(current["grid"], normalized_direction)
-    next_grid = move["grid"]
+    state = state or {}
+    board = state_board(state)
+    next_board, gained = move_board(board, normalized_direction)
+    moved = next_board != board
     spawned = []
-    score = current["score"]
-    move_count = current["moves"]
+    score = int(state.get("score") or 0)
+    move_count = int(state.get("moves") or 0)
 
-    if move["moved"]:
-        score += move["gained"]
+    if moved:
+        score += gained
         move_count += 1
-        tile = spawn_tile(next_grid, rng or random.Random())
+        next_board, tile = spawn_tile_on_board(next_board, rng or random.Random())
         if tile:
             spawned.append(tile)
 
-    won = current["won"] or has_winning_tile(next_grid)
-    moves = available_moves(next_grid)
-    game_over = not moves
-
-    return {
-        "grid": next_grid,
-        "score": score,
-        "moves": move_count,
-        "won": won,
-        "game_over": game_over,
-        "spawned": spawned,
-        "gained": move["gained"] if move["moved"] else 0,
-        "moved": move["moved"],
-        "available_moves": moves,
-    }
+    return _board_state(
+        next_board,
+        score=score,
+        moves=move_count,
+        won=bool(state.get("won")) or board_max_exponent(board) >= WIN_EXPONENT,
+        spawned=spawned,
+        gained=gained if moved else 0,
+        moved=moved,
+    )
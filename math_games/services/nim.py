@@ -4,9 +4,6 @@ import operator
 import random
 from functools import reduce
 
-import numpy as np
-from open_spiel.python.algorithms import mcts, minimax
-
 from . import limited_nim
 from .limited_nim import DEFAULT_MAX_TAKE, DEFAULT_PILES, decode_action, encode_action
 
@@ -14,6 +11,9 @@ from .limited_nim import DEFAULT_MAX_TAKE, DEFAULT_PILES, decode_action, encode_
 VALID_DIFFICULTIES = {"random", "mcts", "minimax"}
 AI_PLAYER_ID = 1
 
+# Chance that the AI plays a random legal move instead of the bounded-XOR winning move.
+MISTAKE_RATES = {"random": 0.8, "mcts": 0.35, "minimax": 0.0}
+
 
 def make_game():
     return limited_nim.LimitedNimGame()
@@ -29,6 +29,60 @@ def initial_state_json(difficulty: str = "mcts") -> dict:
     }
 
 
+class NimPosition:
+    """
+    Limited Nim position in plain Python, with the parts of the OpenSpiel state API the views use.
+
+    Requests replay at most sum(DEFAULT_PILES) actions on it instead of building an OpenSpiel game.
+    """
+
+    def __init__(self, piles=DEFAULT_PILES, current_player: int = 0, max_take: int = DEFAULT_MAX_TAKE):
+        self._piles = [int(pile) for pile in piles]
+        self._current_player = int(current_player)
+        self._max_take = int(max_take)
+
+    @property
+    def piles(self) -> tuple[int, ...]:
+        return tuple(self._piles)
+
+    def current_player(self) -> int:
+        return self._current_player
+
+    def is_terminal(self) -> bool:
+        return sum(self._piles) == 0
+
+    def legal_actions(self) -> list[int]:
+        if self.is_terminal():
+            return []
+        pile_count = len(self._piles)
+        return sorted(
+            encode_action(pile_index, take, pile_count)
+            for pile_index, pile_size in enumerate(self._piles)
+            for take in range(1, min(self._max_take, pile_size) + 1)
+        )
+
+    def apply_action(self, action: int) -> None:
+        decoded = decode_action(action, len(self._piles))
+        if not (
+            0 <= decoded.pile_index < len(self._piles)
+            and 1 <= decoded.take <= min(self._max_take, self._piles[decoded.pile_index])
+        ):
+            raise ValueError("가져갈 수 없는 수입니다.")
+        self._piles[decoded.pile_index] -= decoded.take
+        if not self.is_terminal():
+            self._current_player = 1 - self._current_player
+
+
+def position_from_history(history: list[int]) -> NimPosition:
+    position = NimPosition()
+    for action in history:
+        try:
+            position.apply_action(int(action))
+        except ValueError as exc:
+            raise ValueError("저장된 수가 현재 규칙과 맞지 않습니다.") from exc
+    return position
+
+
 def apply_history(history: list[int]):
     game = make_game()
     state = game.new_initial_state()
@@ -125,40 +179,33 @@ def thought_for_move(before_piles: list[int] | tuple[int, ...], action: int | No
 
 
 def select_ai_action(difficulty: str, state, *, seed: int | None = None) -> int:
-    legal_actions = list(state.legal_actions())
+    """
+    AI move from the closed-form bounded-Nim solution: a pile's Grundy value is its size mod (max take + 1).
+
+    Each difficulty misses the winning move at its MISTAKE_RATES rate. Works on a NimPosition or an
+    OpenSpiel LimitedNimState.
+    """
+    legal_actions = [int(action) for action in state.legal_actions()]
     if not legal_actions:
         raise ValueError("AI가 둘 수 있는 수가 없습니다.")
 
-    if difficulty == "random":
-        rng = random.Random(seed)
-        return int(rng.choice(legal_actions))
-
-    game = state.get_game()
-    if difficulty == "minimax":
-        _value, action = minimax.alpha_beta_search(
-            game,
-            state=state,
-            maximum_depth=game.max_game_length(),
-            maximizing_player_id=AI_PLAYER_ID,
-        )
-        return int(action if action in legal_actions else legal_actions[0])
-
-    random_state = np.random.RandomState(seed)
-    bot = mcts.MCTSBot(
-        game,
-        uct_c=1.4,
-        max_simulations=96,
-        evaluator=mcts.RandomRolloutEvaluator(n_rollouts=8, random_state=random_state),
-        solve=True,
-        random_state=random_state,
-    )
-    action = int(bot.step(state))
-    return action if action in legal_actions else int(legal_actions[0])
-
-
-def apply_student_move(history: list[int], pile_index: int, take: int) -> tuple[list[int], dict, object]:
-    game, state = apply_history(history)
-    del game
+    rng = random.Random(seed)
+    piles = tuple(getattr(state, "piles", ()))
+    if rng.random() >= MISTAKE_RATES.get(difficulty, MISTAKE_RATES["mcts"]):
+        winning = find_bounded_nim_move(piles)
+        if winning:
+            return encode_action(winning[0], winning[1], len(piles))
+        if difficulty == "minimax":
+            # Losing position: take one from the largest pile to make the game last.
+            largest = max(range(len(piles)), key=lambda pile_index: piles[pile_index])
+            return encode_action(largest, 1, len(piles))
+    return int(rng.choice(legal_actions))
+
+
+def apply_student_move(history: list[int], pile_index: int, take: int) -> tuple[list[int], dict, NimPosition]:
+    state = position_from_history(history)
+    if not 0 <= int(pile_index) < len(DEFAULT_PILES):
+        raise ValueError("가져갈 수 없는 수입니다.")
     action = encode_action(pile_index, take, len(DEFAULT_PILES))
     if action not in state.legal_actions():
         raise ValueError("가져갈 수 없는 수입니다.")
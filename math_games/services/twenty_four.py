@@ -1,17 +1,41 @@
 from __future__ import annotations
 
 import ast
+import itertools
 import random
 import re
+import struct
 from collections import Counter
 from dataclasses import dataclass
 from fractions import Fraction
+from pathlib import Path
 
 
 TARGET_VALUE = Fraction(24, 1)
 DEFAULT_NUMBER_MIN = 1
 DEFAULT_NUMBER_MAX = 9
 
+TIER_EASY = "easy"
+TIER_NORMAL = "normal"
+TIER_HARD = "hard"
+TIERS = (TIER_EASY, TIER_NORMAL, TIER_HARD)
+
+# Offline catalog of every solvable 4-card multiset (manage.py build_twenty_four_catalog).
+# Header "<4sBBBH": magic, version, number min, number max, entry count. Each entry is
+# "<HHBB" (4 sorted numbers as nibbles, solution count, flags, tier) followed by its
+# solutions, 4 bytes each: 7 postfix tokens as nibbles (1-9 numbers, 10-13 + - * /).
+CATALOG_PATH = Path(__file__).resolve().parent / "data" / "twenty_four_catalog.bin"
+CATALOG_MAGIC = b"T24C"
+CATALOG_VERSION = 1
+_CATALOG_HEADER = struct.Struct("<4sBBBH")
+_CATALOG_ENTRY = struct.Struct("<HHBB")
+_SOLUTION_SIZE = 4
+FLAG_NEEDS_DIVISION = 1
+FLAG_NEEDS_FRACTION = 2
+
+_OPERATORS = "+-*/"
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+
 
 class ExpressionError(ValueError):
     pass
@@ -23,13 +47,40 @@ class ExpressionResult:
     numbers: tuple[int, ...]
 
 
+@dataclass(frozen=True)
+class CatalogEntry:
+    numbers: tuple[int, ...]
+    solutions: tuple[str, ...]
+    needs_division: bool
+    needs_fraction: bool
+    tier: str
+    hint_steps: tuple[str, ...]
+
+    @property
+    def solution_count(self) -> int:
+        return len(self.solutions)
+
+
 def solve_numbers(numbers: list[int] | tuple[int, ...]) -> str | None:
     items = [(Fraction(int(number), 1), str(int(number))) for number in numbers]
     return _search_solution(items, set())
 
 
-def generate_puzzle(*, rng: random.Random | None = None, attempts: int = 300) -> dict:
+def generate_puzzle(*, rng: random.Random | None = None, attempts: int = 300, tier: str | None = None) -> dict:
     rng = rng or random.Random()
+    if _CATALOG:
+        pool = _CATALOG_BY_TIER.get(tier) or _CATALOG
+        entry = pool[rng.randrange(len(pool))]
+        numbers = list(entry.numbers)
+        rng.shuffle(numbers)
+        return {
+            "numbers": numbers,
+            "solution": entry.solutions[0],
+            "tier": entry.tier,
+            "solution_count": entry.solution_count,
+        }
+
+    # No catalog on disk: draw and solve live.
     for _ in range(attempts):
         numbers = [rng.randint(DEFAULT_NUMBER_MIN, DEFAULT_NUMBER_MAX) for _ in range(4)]
         solution = solve_numbers(numbers)
@@ -39,6 +90,10 @@ def generate_puzzle(*, rng: random.Random | None = None, attempts: int = 300) ->
     return {"numbers": numbers, "solution": solve_numbers(numbers) or "8/(3-8/3)"}
 
 
+def catalog_entry(numbers: list[int] | tuple[int, ...]) -> CatalogEntry | None:
+    return _CATALOG_BY_NUMBERS.get(tuple(sorted(int(number) for number in numbers)))
+
+
 def validate_answer(expression: str, numbers: list[int] | tuple[int, ...]) -> dict:
     expression = (expression or "").strip()
     if not expression:
@@ -65,7 +120,9 @@ def validate_answer(expression: str, numbers: list[int] | tuple[int, ...]) -> di
 
 
 def hint_for_solution(solution: str, hint_index: int) -> str:
-    steps = _solution_steps(solution)
+    steps = _HINT_STEPS.get(solution)
+    if steps is None:
+        steps = _solution_steps(solution)
     if hint_index <= 1:
         if steps:
             return f"먼저 {steps[0]} 보기"
@@ -115,6 +172,235 @@ def _search_solution(items: list[tuple[Fraction, str]], seen: set[tuple[Fraction
     return None
 
 
+def enumerate_solutions(numbers: list[int] | tuple[int, ...]) -> list[dict]:
+    """
+    Every distinct way to make 24, for the offline catalog.
+
+    Expressions that only differ by reordering or regrouping a chain of +/- or
+    */÷ count once. Each solution keeps its friendliest form: integer steps
+    first, then fewer divisions, then no negative steps, then the shortest text.
+    """
+    best_forms: dict[str, tuple] = {}
+    leaves = [(Fraction(int(number), 1), int(number), False, 0, False) for number in numbers]
+    for value, tree, has_fraction, divisions, has_negative in _expression_trees(leaves):
+        if value != TARGET_VALUE:
+            continue
+        key = _canonical_form(tree)
+        expression = render_expression(tree)
+        rank = (has_fraction, divisions, has_negative, len(expression), expression)
+        if key not in best_forms or rank < best_forms[key][0]:
+            best_forms[key] = (rank, tree)
+    return [
+        {
+            "tree": tree,
+            "expression": rank[4],
+            "has_fraction": rank[0],
+            "divisions": rank[1],
+        }
+        for rank, tree in sorted(best_forms.values(), key=lambda item: item[0])
+    ]
+
+
+def difficulty_tier(solution_count: int, *, needs_division: bool, needs_fraction: bool) -> str:
+    if needs_fraction or (needs_division and solution_count <= 2):
+        return TIER_HARD
+    if needs_division or solution_count <= 2:
+        return TIER_NORMAL
+    return TIER_EASY
+
+
+def build_catalog_bytes(number_min: int = DEFAULT_NUMBER_MIN, number_max: int = DEFAULT_NUMBER_MAX) -> bytes:
+    if not (1 <= number_min <= number_max <= 9):
+        raise ValueError("catalog numbers must fit one nibble token (1-9)")
+    entries = []
+    for numbers in itertools.combinations_with_replacement(range(number_min, number_max + 1), 4):
+        solutions = enumerate_solutions(numbers)
+        if not solutions:
+            continue
+        needs_division = all(item["divisions"] for item in solutions)
+        needs_fraction = all(item["has_fraction"] for item in solutions)
+        flags = (FLAG_NEEDS_DIVISION if needs_division else 0) | (FLAG_NEEDS_FRACTION if needs_fraction else 0)
+        tier = difficulty_tier(len(solutions), needs_division=needs_division, needs_fraction=needs_fraction)
+        packed_numbers = 0
+        for number in numbers:
+            packed_numbers = (packed_numbers << 4) | number
+        chunk = bytearray(_CATALOG_ENTRY.pack(packed_numbers, len(solutions), flags, TIERS.index(tier)))
+        for item in solutions:
+            chunk += _pack_postfix(_postfix_tokens(item["tree"]))
+        entries.append(bytes(chunk))
+    header = _CATALOG_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, number_min, number_max, len(entries))
+    return header + b"".join(entries)
+
+
+def load_catalog(data: bytes) -> list[CatalogEntry]:
+    magic, version, _number_min, _number_max, count = _CATALOG_HEADER.unpack_from(data, 0)
+    if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+        raise ValueError("unknown 24 catalog format")
+    offset = _CATALOG_HEADER.size
+    entries = []
+    for _ in range(count):
+        packed_numbers, solution_count, flags, tier_index = _CATALOG_ENTRY.unpack_from(data, offset)
+        offset += _CATALOG_ENTRY.size
+        numbers = tuple((packed_numbers >> shift) & 0xF for shift in (12, 8, 4, 0))
+        trees = []
+        for _index in range(solution_count):
+            trees.append(_tree_from_postfix(_unpack_postfix(data[offset:offset + _SOLUTION_SIZE])))
+            offset += _SOLUTION_SIZE
+        entries.append(
+            CatalogEntry(
+                numbers=numbers,
+                solutions=tuple(render_expression(tree) for tree in trees),
+                needs_division=bool(flags & FLAG_NEEDS_DIVISION),
+                needs_fraction=bool(flags & FLAG_NEEDS_FRACTION),
+                tier=TIERS[tier_index],
+                hint_steps=_tree_steps(trees[0]),
+            )
+        )
+    return entries
+
+
+def render_expression(tree) -> str:
+    """Expression text with only the parentheses the grouping needs."""
+    if isinstance(tree, int):
+        return str(tree)
+    operator, left, right = tree
+    left_text = render_expression(left)
+    right_text = render_expression(right)
+    if not isinstance(left, int) and _PRECEDENCE[left[0]] < _PRECEDENCE[operator]:
+        left_text = f"({left_text})"
+    if not isinstance(right, int) and (
+        _PRECEDENCE[right[0]] < _PRECEDENCE[operator]
+        or (_PRECEDENCE[right[0]] == _PRECEDENCE[operator] and operator in "-/")
+    ):
+        right_text = f"({right_text})"
+    return f"{left_text}{operator}{right_text}"
+
+
+def _expression_trees(items):
+    if len(items) == 1:
+        yield items[0]
+        return
+    for first_index, second_index in itertools.combinations(range(len(items)), 2):
+        first_value, first_tree, first_fraction, first_divisions, first_negative = items[first_index]
+        second_value, second_tree, second_fraction, second_divisions, second_negative = items[second_index]
+        rest = [item for idx, item in enumerate(items) if idx not in {first_index, second_index}]
+        has_fraction = first_fraction or second_fraction
+        divisions = first_divisions + second_divisions
+        has_negative = first_negative or second_negative
+        candidates = [
+            (first_value + second_value, ("+", first_tree, second_tree), 0),
+            (first_value - second_value, ("-", first_tree, second_tree), 0),
+            (second_value - first_value, ("-", second_tree, first_tree), 0),
+            (first_value * second_value, ("*", first_tree, second_tree), 0),
+        ]
+        if second_value != 0:
+            candidates.append((first_value / second_value, ("/", first_tree, second_tree), 1))
+        if first_value != 0:
+            candidates.append((second_value / first_value, ("/", second_tree, first_tree), 1))
+        for value, tree, division in candidates:
+            combined = (value, tree, has_fraction or value.denominator != 1, divisions + division, has_negative or value < 0)
+            yield from _expression_trees([*rest, combined])
+
+
+def _canonical_form(tree) -> str:
+    if isinstance(tree, int):
+        return str(tree)
+    if tree[0] in "+-":
+        kind, inverse = "S", "-"
+    else:
+        kind, inverse = "P", "/"
+    terms: list[tuple[bool, object]] = []
+    _collect_chain(tree, kind, inverse, True, terms)
+    kept = sorted(_canonical_form(term) for positive, term in terms if positive)
+    inverted = sorted(_canonical_form(term) for positive, term in terms if not positive)
+    return f"{kind}[{','.join(kept)}|{','.join(inverted)}]"
+
+
+def _collect_chain(tree, kind, inverse, positive, terms):
+    if not isinstance(tree, int) and (tree[0] in "+-" if kind == "S" else tree[0] in "*/"):
+        operator, left, right = tree
+        _collect_chain(left, kind, inverse, positive, terms)
+        _collect_chain(right, kind, inverse, positive != (operator == inverse), terms)
+        return
+    terms.append((positive, tree))
+
+
+def _postfix_tokens(tree) -> tuple[int, ...]:
+    if isinstance(tree, int):
+        return (tree,)
+    operator, left, right = tree
+    return (*_postfix_tokens(left), *_postfix_tokens(right), 10 + _OPERATORS.index(operator))
+
+
+def _pack_postfix(tokens: tuple[int, ...]) -> bytes:
+    padded = [*tokens, 0]
+    return bytes((padded[index] << 4) | padded[index + 1] for index in range(0, 8, 2))
+
+
+def _unpack_postfix(chunk: bytes) -> list[int]:
+    tokens = []
+    for byte in chunk:
+        tokens.extend((byte >> 4, byte & 0xF))
+    return [token for token in tokens if token]
+
+
+def _tree_from_postfix(tokens):
+    stack = []
+    for token in tokens:
+        if token < 10:
+            stack.append(token)
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            stack.append((_OPERATORS[token - 10], left, right))
+    return stack[0]
+
+
+def _tree_value(tree) -> Fraction:
+    if isinstance(tree, int):
+        return Fraction(tree, 1)
+    operator, left, right = tree
+    left_value, right_value = _tree_value(left), _tree_value(right)
+    if operator == "+":
+        return left_value + right_value
+    if operator == "-":
+        return left_value - right_value
+    if operator == "*":
+        return left_value * right_value
+    return left_value / right_value
+
+
+def _tree_steps(tree) -> tuple[str, ...]:
+    """Operations in the order they are worked out; finished parts show as their value when it is whole."""
+    steps = []
+
+    def operand_text(node):
+        if isinstance(node, int):
+            return str(node)
+        value = _tree_value(node)
+        if value.denominator == 1:
+            return str(value.numerator)
+        return f"({render_expression(node)})"
+
+    def walk(node):
+        if isinstance(node, int):
+            return
+        operator, left, right = node
+        walk(left)
+        walk(right)
+        steps.append(f"{operand_text(left)}{operator}{operand_text(right)}")
+
+    walk(tree)
+    return tuple(steps)
+
+
+def _load_catalog_file() -> list[CatalogEntry]:
+    try:
+        return load_catalog(CATALOG_PATH.read_bytes())
+    except (OSError, ValueError, struct.error):
+        return []
+
+
 def _eval_node(node) -> ExpressionResult:
     if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
         if not (DEFAULT_NUMBER_MIN <= node.value <= DEFAULT_NUMBER_MAX):
@@ -142,3 +428,9 @@ def _eval_node(node) -> ExpressionResult:
         return ExpressionResult(left.value / right.value, numbers)
 
     raise ExpressionError("사칙연산만 써요!")
+
+
+_CATALOG = _load_catalog_file()
+_CATALOG_BY_NUMBERS = {entry.numbers: entry for entry in _CATALOG}
+_CATALOG_BY_TIER = {tier: [entry for entry in _CATALOG if entry.tier == tier] for tier in TIERS}
+_HINT_STEPS = {entry.solutions[0]: entry.hint_steps for entry in _CATALOG}
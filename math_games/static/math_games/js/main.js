@@ -306,6 +306,11 @@
         let sessionId = "";
         let solved = false;
 
+        function selectedTier() {
+            const checked = root.querySelector('input[name="mg-tf-tier"]:checked');
+            return checked ? checked.value : "";
+        }
+
         function setInputButtonsDisabled(disabled) {
             padNode.querySelectorAll("button").forEach((button) => {
                 button.disabled = disabled;
@@ -364,7 +369,7 @@
             removeStateClasses(root);
             input.classList.remove("is-error");
             try {
-                render(await requestJson(startUrl, {}), { popNumbers: true });
+                render(await requestJson(startUrl, { tier: selectedTier() }), { popNumbers: true });
                 input.value = "";
                 input.focus();
                 startButton.textContent = "새 카드";
@@ -1,5 +1,6 @@
 import itertools
 import json
+import random
 import re
 
 from django.test import Client, TestCase
@@ -31,6 +32,31 @@ class LimitedNimEngineTests(TestCase):
                 action = nim.select_ai_action(difficulty, state.clone(), seed=7)
                 self.assertIn(action, legal_actions)
 
+    def test_position_matches_openspiel_state(self):
+        rng = random.Random(5)
+        for _game_index in range(20):
+            _game, state = nim.apply_history([])
+            history = []
+            while not state.is_terminal():
+                position = nim.position_from_history(history)
+                self.assertEqual(position.piles, state.piles)
+                self.assertEqual(position.legal_actions(), sorted(state.legal_actions()))
+                self.assertEqual(position.current_player(), state.current_player())
+                action = rng.choice(state.legal_actions())
+                state.apply_action(action)
+                history.append(action)
+            self.assertTrue(nim.position_from_history(history).is_terminal())
+
+    def test_minimax_plays_winning_move_and_other_levels_can_slip(self):
+        position = nim.NimPosition((3, 4, 5))
+        winning = nim.find_bounded_nim_move(position.piles)
+        winning_action = nim.encode_action(winning[0], winning[1])
+
+        for seed in range(20):
+            self.assertEqual(nim.select_ai_action("minimax", position, seed=seed), winning_action)
+        random_actions = {nim.select_ai_action("random", position, seed=seed) for seed in range(40)}
+        self.assertGreater(len(random_actions), 1)
+
     def test_bounded_nim_thought_uses_remainder_xor(self):
         thought = nim.thought_for_move([3, 4, 5], nim.encode_action(0, 2))
         self.assertIn("4개씩", thought)
@@ -53,6 +79,45 @@ class TwentyFourServiceTests(TestCase):
         with self.assertRaises(twenty_four.ExpressionError):
             twenty_four.validate_answer("8/(3-3)+8", [3, 3, 8, 8])
 
+    def test_catalog_matches_live_solver(self):
+        solvable = {
+            numbers
+            for numbers in itertools.combinations_with_replacement(
+                range(twenty_four.DEFAULT_NUMBER_MIN, twenty_four.DEFAULT_NUMBER_MAX + 1), 4
+            )
+            if twenty_four.solve_numbers(list(numbers))
+        }
+        catalog = twenty_four.load_catalog(twenty_four.CATALOG_PATH.read_bytes())
+
+        self.assertEqual({entry.numbers for entry in catalog}, solvable)
+        for entry in catalog:
+            self.assertIn(entry.tier, twenty_four.TIERS)
+            self.assertTrue(entry.hint_steps)
+            for solution in entry.solutions:
+                self.assertTrue(twenty_four.validate_answer(solution, entry.numbers)["is_correct"], solution)
+
+    def test_catalog_file_is_current(self):
+        self.assertEqual(twenty_four.CATALOG_PATH.read_bytes(), twenty_four.build_catalog_bytes())
+
+    def test_catalog_difficulty_for_known_puzzles(self):
+        hard = twenty_four.catalog_entry([8, 3, 8, 3])
+
+        self.assertEqual(hard.solutions, ("8/(3-8/3)",))
+        self.assertTrue(hard.needs_fraction)
+        self.assertEqual(hard.tier, twenty_four.TIER_HARD)
+        self.assertEqual(twenty_four.catalog_entry([1, 2, 3, 4]).tier, twenty_four.TIER_EASY)
+        self.assertIsNone(twenty_four.catalog_entry([1, 1, 1, 1]))
+
+    def test_generate_puzzle_respects_tier(self):
+        rng = random.Random(7)
+        for tier in twenty_four.TIERS:
+            puzzle = twenty_four.generate_puzzle(rng=rng, tier=tier)
+
+            self.assertEqual(puzzle["tier"], tier)
+            self.assertEqual(twenty_four.catalog_entry(puzzle["numbers"]).tier, tier)
+            self.assertTrue(twenty_four.validate_answer(puzzle["solution"], puzzle["numbers"])["is_correct"])
+            self.assertTrue(twenty_four.hint_for_solution(puzzle["solution"], 1))
+
 
 class Game2048ServiceTests(TestCase):
     def test_slide_merges_once_per_pair(self):
@@ -114,6 +179,29 @@ class Game2048ServiceTests(TestCase):
         self.assertEqual(result["score"], 2048)
         self.assertEqual(result["moves"], 1)
 
+    def test_packed_board_moves_match_grid_moves(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            grid = [[rng.choice([0, 0, 2, 2, 4, 8, 1024]) for _column in range(4)] for _row in range(4)]
+            board = game_2048.pack_grid(grid)
+            self.assertEqual(game_2048.unpack_board(board), grid)
+            for direction in game_2048.DIRECTIONS:
+                expected = game_2048.move_grid(grid, direction)
+                moved, gained = game_2048.move_board(board, direction)
+                self.assertEqual(game_2048.unpack_board(moved), expected["grid"])
+                self.assertEqual(gained, expected["gained"])
+                self.assertEqual(moved != board, expected["moved"])
+
+    def test_stored_state_keeps_packed_board(self):
+        state = game_2048.apply_move(game_2048.initial_state_json(rng=random.Random(1)), "left", rng=random.Random(2))
+
+        stored = game_2048.stored_state(state)
+
+        self.assertNotIn("grid", stored)
+        self.assertEqual(len(stored["board"]), 16)
+        self.assertEqual(game_2048.public_state(stored)["grid"], state["grid"])
+        self.assertEqual(game_2048.public_state(stored)["available_moves"], state["available_moves"])
+
     def test_game_over_when_no_moves_remain(self):
         grid = [
             [2, 4, 2, 4],
@@ -286,6 +374,18 @@ class MathGamesViewTests(TestCase):
         self.assertEqual(hint_response.status_code, 200)
         self.assertTrue(hint_response.json()["hint"])
 
+    def test_twenty_four_start_with_tier(self):
+        start_response = self.client.post(
+            reverse("math_games:api_twenty_four_start"),
+            data=json.dumps({"tier": twenty_four.TIER_HARD}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(start_response.status_code, 200)
+        self.assertEqual(start_response.json()["state"]["tier"], twenty_four.TIER_HARD)
+        session = MathGameSession.objects.get(id=start_response.json()["session_id"])
+        self.assertEqual(twenty_four.catalog_entry(session.state_json["numbers"]).tier, twenty_four.TIER_HARD)
+
     def test_2048_start_status_and_move(self):
         start_response = self.client.post(reverse("math_games:api_2048_start"))
         self.assertEqual(start_response.status_code, 200)
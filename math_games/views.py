@@ -47,7 +47,7 @@ def _session_owner(request):
 
 def _nim_public_payload(session: MathGameSession, *, feedback: str = "", ai_move=None, thought: str = "") -> dict:
     history = list(session.state_json.get("history") or [])
-    _game, state = nim.apply_history(history)
+    state = nim.position_from_history(history)
     result = session.result
     return {
         "session_id": str(session.id),
@@ -64,6 +64,7 @@ def _twenty_four_state(session: MathGameSession) -> dict:
     state = dict(session.state_json or {})
     return {
         "numbers": list(state.get("numbers") or []),
+        "tier": str(state.get("tier") or ""),
         "hints_used": int(state.get("hints_used") or 0),
         "status": session.result,
     }
@@ -255,7 +256,11 @@ def api_nim_move(request, session_id):
 
 @require_POST
 def api_twenty_four_start(request):
-    puzzle = twenty_four.generate_puzzle(rng=random.Random())
+    payload = _request_payload(request)
+    tier = str(payload.get("tier") or "").strip()
+    if tier not in twenty_four.TIERS:
+        tier = None
+    puzzle = twenty_four.generate_puzzle(rng=random.Random(), tier=tier)
     session = MathGameSession.objects.create(
         user=_session_owner(request),
         session_key=_ensure_session_key(request),
@@ -264,6 +269,7 @@ def api_twenty_four_start(request):
         state_json={
             "numbers": puzzle["numbers"],
             "solution": puzzle["solution"],
+            "tier": puzzle.get("tier", ""),
             "hints_used": 0,
             "status": MathGameSession.RESULT_ACTIVE,
         },
@@ -364,7 +370,7 @@ def api_2048_start(request):
         session_key=_ensure_session_key(request),
         game_type=MathGameSession.GAME_2048,
         difficulty="",
-        state_json={**state, "status": MathGameSession.RESULT_ACTIVE},
+        state_json={**game_2048.stored_state(state), "status": MathGameSession.RESULT_ACTIVE},
     )
     MathGameMove.objects.create(
         session=session,
@@ -416,7 +422,7 @@ def api_2048_move(request, session_id):
     elif state["gained"]:
         feedback = f"+{state['gained']}"
 
-    session.state_json = {**state, "status": result}
+    session.state_json = {**game_2048.stored_state(state), "status": result}
     session.result = result
     if result != MathGameSession.RESULT_ACTIVE:
         session.ended_at = timezone.now()
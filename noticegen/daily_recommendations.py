@@ -4,15 +4,15 @@ import hashlib
 import logging
 import os
 import re
-from collections import Counter
-from datetime import date, timedelta
+from datetime import timedelta
 
 from django.db import transaction
 from django.db.models import F
 from django.utils import timezone
-from korean_lunar_calendar import KoreanLunarCalendar
 from openai import OpenAI
 
+from core import korean_calendar
+
 from .models import DailyNoticeRecommendation
 
 
@@ -160,34 +160,6 @@ SEASONAL_WEATHER_HINTS = {
     12: ("겨울 추위와 결빙", "추위와 결빙으로 미끄럼을 조심해야 하는 시기입니다."),
 }
 
-SOLAR_TERM_DATES = {
-    (1, 5): "소한",
-    (1, 20): "대한",
-    (2, 4): "입춘",
-    (2, 19): "우수",
-    (3, 5): "경칩",
-    (3, 20): "춘분",
-    (4, 4): "청명",
-    (4, 20): "곡우",
-    (5, 5): "입하",
-    (5, 21): "소만",
-    (6, 5): "망종",
-    (6, 21): "하지",
-    (7, 7): "소서",
-    (7, 22): "대서",
-    (8, 7): "입추",
-    (8, 23): "처서",
-    (9, 7): "백로",
-    (9, 23): "추분",
-    (10, 8): "한로",
-    (10, 23): "상강",
-    (11, 7): "입동",
-    (11, 22): "소설",
-    (12, 7): "대설",
-    (12, 22): "동지",
-}
-
-
 class DailyRecommendationQualityError(Exception):
     pass
 
@@ -212,159 +184,14 @@ def build_daily_safety_topic_catalog() -> list[dict]:
     return catalog
 
 
-def _safe_solar_date_from_lunar(year, month, day):
-    try:
-        calendar = KoreanLunarCalendar()
-        calendar.setLunarDate(year, month, day, False)
-        return date.fromisoformat(calendar.SolarIsoFormat())
-    except Exception:
-        return None
-
-
-def _merge_marker(markers, marker_date, name):
-    if not marker_date:
-        return
-    existing = markers.get(marker_date)
-    if existing:
-        markers[marker_date] = f"{existing} / {name}" if name not in existing else existing
-    else:
-        markers[marker_date] = name
-
-
-def _next_available_substitute_date(start_date, occupied_dates):
-    candidate = start_date + timedelta(days=1)
-    while candidate.weekday() >= 5 or candidate in occupied_dates:
-        candidate += timedelta(days=1)
-    return candidate
-
-
-def _add_substitute_holidays(markers, substitute_rules, base_holidays):
-    occupied_dates = set(markers)
-    holiday_counts = Counter(marker_date for marker_date, _name, _enabled in base_holidays if marker_date)
-    merged_rules = {}
-    for rule in substitute_rules:
-        dates = tuple(sorted(marker_date for marker_date in rule.get("dates", ()) if marker_date))
-        if not dates:
-            continue
-        merged = merged_rules.setdefault(
-            dates,
-            {
-                "names": [],
-                "weekend_days": set(),
-            },
-        )
-        name = str(rule.get("name") or "").strip()
-        if name and name not in merged["names"]:
-            merged["names"].append(name)
-        merged["weekend_days"].update(rule.get("weekend_days", set()))
-
-    for dates, rule in merged_rules.items():
-        weekend_days = rule["weekend_days"] or {6}
-        should_substitute = any(
-            marker_date.weekday() in weekend_days or holiday_counts[marker_date] > 1
-            for marker_date in dates
-        )
-        if not should_substitute:
-            continue
-        substitute_date = _next_available_substitute_date(max(dates), occupied_dates)
-        occupied_dates.add(substitute_date)
-        substitute_name = " / ".join(rule["names"]) or "공휴일"
-        _merge_marker(markers, substitute_date, f"{substitute_name} 대체공휴일")
-
-
-def _build_korean_holiday_markers(year):
-    markers = {}
-    substitute_rules = []
-    base_holidays = [
-        (date(year, 1, 1), "신정", False),
-        (date(year, 3, 1), "삼일절", True),
-        (date(year, 5, 5), "어린이날", True),
-        (date(year, 6, 6), "현충일", False),
-        (date(year, 8, 15), "광복절", True),
-        (date(year, 10, 3), "개천절", True),
-        (date(year, 10, 9), "한글날", True),
-        (date(year, 12, 25), "기독탄신일", True),
-    ]
-    for marker_date, name, _substitute_enabled in base_holidays:
-        _merge_marker(markers, marker_date, name)
-    for marker_date, name, substitute_enabled in base_holidays:
-        if substitute_enabled:
-            substitute_rules.append(
-                {
-                    "dates": (marker_date,),
-                    "name": name,
-                    "weekend_days": {5, 6},
-                }
-            )
-
-    seollal = _safe_solar_date_from_lunar(year, 1, 1)
-    if seollal:
-        seollal_dates = (
-            seollal - timedelta(days=1),
-            seollal,
-            seollal + timedelta(days=1),
-        )
-        for marker_date, name in (
-            (seollal_dates[0], "설날 연휴"),
-            (seollal_dates[1], "설날"),
-            (seollal_dates[2], "설날 연휴"),
-        ):
-            base_holidays.append((marker_date, name, True))
-            _merge_marker(markers, marker_date, name)
-        substitute_rules.append(
-            {
-                "dates": seollal_dates,
-                "name": "설날",
-                "weekend_days": {6},
-            }
-        )
-
-    buddha = _safe_solar_date_from_lunar(year, 4, 8)
-    base_holidays.append((buddha, "부처님오신날", True))
-    _merge_marker(markers, buddha, "부처님오신날")
-    substitute_rules.append(
-        {
-            "dates": (buddha,),
-            "name": "부처님오신날",
-            "weekend_days": {5, 6},
-        }
-    )
-
-    chuseok = _safe_solar_date_from_lunar(year, 8, 15)
-    if chuseok:
-        chuseok_dates = (
-            chuseok - timedelta(days=1),
-            chuseok,
-            chuseok + timedelta(days=1),
-        )
-        for marker_date, name in (
-            (chuseok_dates[0], "추석 연휴"),
-            (chuseok_dates[1], "추석"),
-            (chuseok_dates[2], "추석 연휴"),
-        ):
-            base_holidays.append((marker_date, name, True))
-            _merge_marker(markers, marker_date, name)
-        substitute_rules.append(
-            {
-                "dates": chuseok_dates,
-                "name": "추석",
-                "weekend_days": {6},
-            }
-        )
-
-    _add_substitute_holidays(markers, substitute_rules, base_holidays)
-    return markers
-
-
 def _tomorrow_holiday_name(target_date):
     tomorrow = target_date + timedelta(days=1)
-    markers = _build_korean_holiday_markers(tomorrow.year)
-    return markers.get(tomorrow, "")
+    return korean_calendar.public_holiday_name(tomorrow)
 
 
 def _tomorrow_solar_term_name(target_date):
     tomorrow = target_date + timedelta(days=1)
-    return SOLAR_TERM_DATES.get((tomorrow.month, tomorrow.day), "")
+    return korean_calendar.solar_term_name(tomorrow)
 
 
 def _season_name(month):
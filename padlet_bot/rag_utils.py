@@ -10,6 +10,8 @@ import csv
 import re
 from typing import List, Optional
 
+from core.embeddings import embed_query, get_embedding_function, sync_collection_chunks
+
 # ChromaDB 경로 설정
 BASE_DIR = "/app/data" if os.environ.get('RAILWAY_ENVIRONMENT') else "."
 CHROMA_PATH = os.path.join(BASE_DIR, "chroma_db_padlet")
@@ -214,10 +216,9 @@ class PadletRAG:
         """ChromaDB 초기화"""
         try:
             import chromadb
-            from chromadb.utils import embedding_functions
 
             self.client = chromadb.PersistentClient(path=self.persist_directory)
-            self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+            self.embedding_fn = get_embedding_function()
             self.collection = self.client.get_or_create_collection(
                 name="padlet_posts",
                 embedding_function=self.embedding_fn
@@ -230,7 +231,7 @@ class PadletRAG:
             print(f"[ERROR] ChromaDB 초기화 실패: {e}")
             raise
 
-    def add_document(self, doc_id: int, file_path: str, title: str, file_type: str, user_id: int) -> int:
+    def add_document(self, doc_id: int, file_path: str, title: str, file_type: str, user_id: int, progress=None) -> int:
         """문서를 벡터DB에 추가"""
         if not self.collection:
             raise RuntimeError("ChromaDB가 초기화되지 않았습니다.")
@@ -246,34 +247,29 @@ class PadletRAG:
         if not chunks:
             return 0
 
-        # 기존 문서 청크 삭제 (업데이트용)
-        self._delete_document_chunks(doc_id)
-
-        # 청크 추가
-        ids = []
-        documents = []
-        metadatas = []
-
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"padlet_doc_{doc_id}_chunk_{i}"
-            ids.append(chunk_id)
-            documents.append(chunk)
-            metadatas.append({
-                "doc_id": str(doc_id),
-                "user_id": int(user_id),
-                "title": title,
-                "file_type": file_type,
-                "chunk_index": i,
-            })
-
-        self.collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
+        result = self.index_chunks(
+            doc_key=str(doc_id),
+            id_prefix=f"padlet_doc_{doc_id}",
+            chunks=chunks,
+            metadata={"user_id": int(user_id), "title": title, "file_type": file_type},
+            progress=progress,
         )
 
-        print(f"[INFO] 패들릿 문서 추가 완료: {title} ({len(chunks)} 청크)")
-        return len(chunks)
+        print(f"[INFO] 패들릿 문서 추가 완료: {title} ({result['chunk_count']} 청크, 새 임베딩 {result['embedded']}개)")
+        return result["chunk_count"]
+
+    def index_chunks(self, *, doc_key: str, id_prefix: str, chunks: List[str], metadata: dict, progress=None) -> dict:
+        """청크를 배치로 임베딩해 저장 (내용이 바뀐 청크만 다시 임베딩)"""
+        if not self.collection:
+            raise RuntimeError("ChromaDB가 초기화되지 않았습니다.")
+        return sync_collection_chunks(
+            self.collection,
+            doc_key=doc_key,
+            id_prefix=id_prefix,
+            chunks=chunks,
+            metadata=metadata,
+            progress=progress,
+        )
 
     def _delete_document_chunks(self, doc_id: int):
         """특정 문서의 모든 청크 삭제"""
@@ -298,7 +294,7 @@ class PadletRAG:
 
         try:
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[embed_query(query)],
                 n_results=n_results,
                 where={"user_id": int(user_id)}
             )
@@ -12,6 +12,7 @@ urlpatterns = [
     # 관리자 문서 관리 (파일 업로드)
     path('docs/', views.manage_docs, name='manage_docs'),
     path('docs/<int:pk>/process/', views.process_document, name='process_document'),
+    path('docs/<int:pk>/process/status/', views.process_document_status, name='process_document_status'),
     path('docs/<int:pk>/delete/', views.delete_document, name='delete_document'),
 
     # 패들릿 API 연동
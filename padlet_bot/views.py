@@ -6,8 +6,10 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
+from django.urls import reverse
 from django.utils import timezone
 from django_ratelimit.decorators import ratelimit
+from core.embeddings import get_ingest_status, ingest_status_payload, submit_ingest_job
 from core.utils import ratelimit_key_for_master_only
 from google import genai
 
@@ -224,10 +226,21 @@ def manage_docs(request):
     })
 
 
+def _ingest_job_id(pk):
+    return f"padlet_bot:{pk}"
+
+
+def _ingest_response(pk, status):
+    payload, http_status = ingest_status_payload(status)
+    if payload.get("pending"):
+        payload["status_url"] = reverse("padlet_bot:process_document_status", args=[pk])
+    return JsonResponse(payload, status=http_status)
+
+
 @login_required
 @require_POST
 def process_document(request, pk):
-    """문서 벡터DB 처리 (AJAX)"""
+    """문서 벡터DB 처리 (AJAX) - 임베딩은 백그라운드 작업으로 진행"""
     doc = get_object_or_404(PadletDocument, pk=pk, uploaded_by=request.user)
 
     try:
@@ -235,36 +248,43 @@ def process_document(request, pk):
         if not rag:
             return JsonResponse({'error': 'RAG 서비스를 초기화할 수 없습니다.'}, status=500)
 
-        # 파일 경로 가져오기
         file_path = doc.file.path
-
-        # 벡터DB에 추가
-        chunk_count = rag.add_document(
-            doc_id=doc.pk,
-            file_path=file_path,
-            title=doc.title,
-            file_type=doc.file_type,
-            user_id=request.user.id
-        )
-
-        if chunk_count > 0:
-            doc.is_processed = True
-            doc.chunk_count = chunk_count
-            doc.save()
-            return JsonResponse({
-                'success': True,
-                'message': f'{chunk_count}개의 청크로 처리되었습니다.',
-                'chunk_count': chunk_count
-            })
-        else:
-            return JsonResponse({
-                'error': '텍스트를 추출할 수 없습니다. 파일 형식을 확인해주세요.'
-            }, status=400)
+        title = doc.title
+        file_type = doc.file_type
+        user_id = request.user.id
+
+        def ingest(progress):
+            chunk_count = rag.add_document(
+                doc_id=pk,
+                file_path=file_path,
+                title=title,
+                file_type=file_type,
+                user_id=user_id,
+                progress=progress,
+            )
+            if chunk_count <= 0:
+                raise ValueError('텍스트를 추출할 수 없습니다. 파일 형식을 확인해주세요.')
+            processed = PadletDocument.objects.filter(pk=pk).first()
+            if processed is not None:
+                processed.is_processed = True
+                processed.chunk_count = chunk_count
+                processed.save()
+            return {'chunk_count': chunk_count}
+
+        status = submit_ingest_job(_ingest_job_id(pk), ingest)
+        return _ingest_response(pk, status)
 
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@login_required
+def process_document_status(request, pk):
+    """문서 벡터DB 처리 진행 상황 (AJAX)"""
+    get_object_or_404(PadletDocument, pk=pk, uploaded_by=request.user)
+    return _ingest_response(pk, get_ingest_status(_ingest_job_id(pk)))
+
+
 @login_required
 @require_POST
 def delete_document(request, pk):
@@ -396,41 +416,20 @@ def sync_padlet(request, pk):
         if not rag:
             return JsonResponse({'error': 'RAG 서비스를 초기화할 수 없습니다.'}, status=500)
 
-        # 기존 청크 삭제 (linked_ 접두사로 구분)
-        try:
-            results = rag.collection.get(
-                where={"doc_id": f"linked_{board.pk}"}
-            )
-            if results['ids']:
-                rag.collection.delete(ids=results['ids'])
-        except Exception:
-            pass
-
-        # 청크 분할 및 추가
+        # 청크 분할 후 바뀐 청크만 다시 임베딩 (linked_ 접두사로 구분)
         chunks = chunk_text(text)
         if not chunks:
             return JsonResponse({'error': '텍스트를 청크로 분할할 수 없습니다.'}, status=400)
 
-        ids = []
-        documents = []
-        metadatas = []
-
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"linked_{board.pk}_chunk_{i}"
-            ids.append(chunk_id)
-            documents.append(chunk)
-            metadatas.append({
-                "doc_id": f"linked_{board.pk}",
+        rag.index_chunks(
+            doc_key=f"linked_{board.pk}",
+            id_prefix=f"linked_{board.pk}",
+            chunks=chunks,
+            metadata={
                 "user_id": int(request.user.id),
                 "title": padlet_board.title,
                 "source": "api",
-                "chunk_index": i,
-            })
-
-        rag.collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
+            },
         )
 
         # DB 업데이트
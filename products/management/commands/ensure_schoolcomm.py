@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 
+from schoolcomm.search_index import backfill_search_index
 from schoolcomm.services import ensure_service_product
 
 
@@ -8,4 +9,6 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         product = ensure_service_product()
-        self.stdout.write(self.style.SUCCESS(f"ensure_schoolcomm completed: {product.title}"))
+        # Messages written before the search index existed are indexed once here.
+        indexed = backfill_search_index()
+        self.stdout.write(self.style.SUCCESS(f"ensure_schoolcomm completed: {product.title} (search index +{indexed})"))
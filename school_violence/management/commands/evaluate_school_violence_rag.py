@@ -0,0 +1,83 @@
+import json
+from statistics import median
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from school_violence.rag_utils import SEARCH_MODES, get_rag_service
+
+
+class Command(BaseCommand):
+    help = (
+        "Evaluate school_violence retrieval against labeled queries: recall@k and uncached latency for the "
+        "vector, lexical (BM25) and hybrid (RRF) modes, plus the size of the LLM context. The labels file is "
+        'a JSON list of {"query": ..., "relevant_doc_ids": [...], "category": optional}; doc ids are '
+        "SchoolViolenceDocument primary keys."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("labels", help="Path to the labeled queries JSON file.")
+        parser.add_argument("--k", type=int, nargs="+", default=[1, 3, 5])
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["labels"], encoding="utf-8") as handle:
+                labels = json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read labels: {exc}")
+        labels = [item for item in labels if item.get("query") and item.get("relevant_doc_ids")]
+        if not labels:
+            raise CommandError("No labeled queries with relevant_doc_ids.")
+
+        rag = get_rag_service()
+        if not rag:
+            raise CommandError("RAG service is not available.")
+
+        ks = sorted({max(1, k) for k in options["k"]})
+        repeat = max(1, options["repeat"])
+        self.stdout.write(f"[eval] queries={len(labels)} k={ks} repeat={repeat}")
+        for mode in SEARCH_MODES:
+            self._report(mode, self._evaluate(rag, labels, mode=mode, ks=ks, repeat=repeat))
+        self._report_context(rag, labels)
+
+    def _evaluate(self, rag, labels, *, mode, ks, repeat):
+        hits = {k: 0.0 for k in ks}
+        latencies = []
+        for item in labels:
+            relevant = {str(doc_id) for doc_id in item["relevant_doc_ids"]}
+            for _ in range(repeat):
+                started = perf_counter()
+                results = rag.search(
+                    item["query"], n_results=max(ks), category=item.get("category"), mode=mode, use_cache=False
+                )
+                latencies.append((perf_counter() - started) * 1000)
+            found = [str(result["metadata"].get("doc_id")) for result in results]
+            for k in ks:
+                hits[k] += len(relevant.intersection(found[:k])) / len(relevant)
+        latencies.sort()
+        return {
+            "recall": {k: hits[k] / len(labels) for k in ks},
+            "p50_ms": median(latencies),
+            "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        }
+
+    def _report(self, mode, result):
+        recall = " ".join(f"recall@{k}={value:.2f}" for k, value in result["recall"].items())
+        self.stdout.write(
+            self.style.SUCCESS(f"[eval] {mode:<8} {recall} p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms")
+        )
+
+    def _report_context(self, rag, labels):
+        legacy = []
+        current = []
+        for item in labels:
+            results = rag.search(item["query"], n_results=3, mode="vector", use_cache=False)
+            legacy.append(sum(len(result["content"]) for result in results))
+            current.append(len(rag.get_context_for_query(item["query"], n_results=3)))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[eval] context chars/query: vector top-3 full chunks={median(legacy):.0f} "
+                f"hybrid trimmed={median(current):.0f}"
+            )
+        )
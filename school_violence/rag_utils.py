@@ -2,13 +2,22 @@
 학교폭력 상담 RAG 유틸리티
 
 PDF/HWP/TXT 파일에서 텍스트를 추출하고 ChromaDB에 임베딩하여 저장합니다.
+검색은 벡터 유사도와 같은 청크 위의 BM25 결과를 reciprocal-rank fusion으로
+합칩니다. 조문 번호나 서식 이름처럼 정확히 일치해야 하는 질의는 BM25가,
+표현이 다른 질의는 벡터 검색이 잡아 줍니다.
 """
 
+import hashlib
 import os
 import re
-import uuid
+import threading
 from typing import List, Optional
 
+from django.core.cache import cache
+
+from core.bm25 import BM25Index, tokenize
+from core.embeddings import embed_query, get_embedding_function, normalize_embedding_text, sync_collection_chunks
+
 # ChromaDB 경로 설정
 BASE_DIR = "/app/data" if os.environ.get('RAILWAY_ENVIRONMENT') else "."
 CHROMA_PATH = os.path.join(BASE_DIR, "chroma_db_school_violence")
@@ -114,6 +123,115 @@ def extract_text(file_path: str) -> str:
         return ""
 
 
+SEARCH_MODE_HYBRID = "hybrid"
+SEARCH_MODE_VECTOR = "vector"
+SEARCH_MODE_LEXICAL = "lexical"
+SEARCH_MODES = (SEARCH_MODE_HYBRID, SEARCH_MODE_VECTOR, SEARCH_MODE_LEXICAL)
+
+HYBRID_CANDIDATES = 20
+RRF_K = 60
+MAX_CHUNKS_PER_DOC = 2
+SEARCH_CACHE_SECONDS = 10 * 60
+INDEX_VERSION_CACHE_KEY = "school_violence_rag:index_version"
+SEARCH_CACHE_KEY_TEMPLATE = "school_violence_rag:search:{version}:{digest}"
+CONTEXT_CHUNK_CHARS = 600
+# RRF 점수는 순위만 반영해 1위와 20위의 차이도 두 배 남짓이라, 잘라내기는 각 검색기의 원래 점수로 함
+CONTEXT_MIN_RELATIVE_BM25 = 0.5
+CONTEXT_MAX_SIMILARITY_GAP = 0.2
+
+
+def reciprocal_rank_fusion(rankings, k: int = RRF_K) -> List[tuple]:
+    """여러 순위 목록(청크 ID 리스트)을 RRF 점수로 합쳐 ``(chunk_id, score)`` 내림차순으로 반환"""
+    scores = {}
+    first_seen = {}
+    for ranking in rankings:
+        for rank, chunk_id in enumerate(ranking, 1):
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (k + rank)
+            first_seen.setdefault(chunk_id, len(first_seen))
+    return sorted(scores.items(), key=lambda item: (-item[1], first_seen[item[0]]))
+
+
+def dedupe_results(results: List[dict], max_per_doc: int = MAX_CHUNKS_PER_DOC) -> List[dict]:
+    """같은 문서의 청크는 ``max_per_doc``개까지만, 이미 고른 청크에 포함되는 청크는 제외"""
+    kept = []
+    per_doc = {}
+    for result in results:
+        doc_id = result['metadata'].get('doc_id')
+        if per_doc.get(doc_id, 0) >= max_per_doc:
+            continue
+        content = normalize_embedding_text(result['content'])
+        if any(
+            kept_result['metadata'].get('doc_id') == doc_id and content in normalize_embedding_text(kept_result['content'])
+            for kept_result in kept
+        ):
+            continue
+        per_doc[doc_id] = per_doc.get(doc_id, 0) + 1
+        kept.append(result)
+    return kept
+
+
+def _vector_similarity(result: dict) -> Optional[float]:
+    distance = result.get('distance')
+    if distance is None:
+        return None
+    # 정규화된 임베딩의 제곱 L2 거리(Chroma 기본값)를 코사인 유사도로 환산
+    return 1.0 - float(distance) / 2.0
+
+
+def select_context_results(results: List[dict]) -> List[dict]:
+    """1위 결과와 비교해 BM25 점수나 벡터 유사도 중 하나라도 크게 떨어지지 않은 결과만 남김"""
+    if not results:
+        return []
+    bm25_scores = [result['bm25'] for result in results if result.get('bm25') is not None]
+    similarities = [value for value in map(_vector_similarity, results) if value is not None]
+    bm25_cutoff = max(bm25_scores) * CONTEXT_MIN_RELATIVE_BM25 if bm25_scores else None
+    similarity_cutoff = max(similarities) - CONTEXT_MAX_SIMILARITY_GAP if similarities else None
+    selected = [results[0]]
+    for result in results[1:]:
+        bm25 = result.get('bm25')
+        similarity = _vector_similarity(result)
+        if bm25 is not None and bm25_cutoff is not None and bm25 >= bm25_cutoff:
+            selected.append(result)
+        elif similarity is not None and similarity_cutoff is not None and similarity >= similarity_cutoff:
+            selected.append(result)
+    return selected
+
+
+def trim_to_query(content: str, query: str, limit: int = CONTEXT_CHUNK_CHARS) -> str:
+    """청크가 ``limit``자보다 길면 질의어가 가장 많이 모인 구간만 남김"""
+    if len(content) <= limit:
+        return content
+    lowered = content.lower()
+    hits = sorted(
+        position
+        for term in set(tokenize(query))
+        for position in (match.start() for match in re.finditer(re.escape(term), lowered))
+    )
+    start = 0
+    if hits:
+        lead = limit // 4
+        best = -1
+        for hit in hits:
+            candidate = max(0, min(hit - lead, len(content) - limit))
+            covered = sum(1 for position in hits if candidate <= position < candidate + limit)
+            if covered > best:
+                best, start = covered, candidate
+    snippet = content[start : start + limit].strip()
+    return ("…" if start > 0 else "") + snippet + ("…" if start + limit < len(content) else "")
+
+
+def _index_version() -> int:
+    return cache.get(INDEX_VERSION_CACHE_KEY) or 0
+
+
+def _bump_index_version():
+    """문서가 바뀌면 버전을 올려 BM25 색인과 검색 결과 캐시를 모든 워커에서 무효화"""
+    try:
+        cache.incr(INDEX_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(INDEX_VERSION_CACHE_KEY, 1, None)
+
+
 def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
     """텍스트를 청크로 분할"""
     if not text:
@@ -178,6 +296,10 @@ class SchoolViolenceRAG:
         self.client = None
         self.collection = None
         self.embedding_fn = None
+        self._lexical_lock = threading.Lock()
+        self._lexical_index = None
+        self._lexical_rows = {}
+        self._lexical_version = None
         self._initialized = True
 
         self._init_chromadb()
@@ -186,10 +308,9 @@ class SchoolViolenceRAG:
         """ChromaDB 초기화"""
         try:
             import chromadb
-            from chromadb.utils import embedding_functions
 
             self.client = chromadb.PersistentClient(path=self.persist_directory)
-            self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+            self.embedding_fn = get_embedding_function()
             self.collection = self.client.get_or_create_collection(
                 name="school_violence_guidelines",
                 embedding_function=self.embedding_fn
@@ -202,7 +323,7 @@ class SchoolViolenceRAG:
             print(f"[ERROR] ChromaDB 초기화 실패: {e}")
             raise
 
-    def add_document(self, doc_id: int, file_path: str, title: str, category: str) -> int:
+    def add_document(self, doc_id: int, file_path: str, title: str, category: str, progress=None) -> int:
         """문서를 벡터DB에 추가"""
         if not self.collection:
             raise RuntimeError("ChromaDB가 초기화되지 않았습니다.")
@@ -218,34 +339,31 @@ class SchoolViolenceRAG:
         if not chunks:
             return 0
 
-        # 기존 문서 청크 삭제 (업데이트용)
-        self._delete_document_chunks(doc_id)
+        result = self.index_chunks(
+            doc_key=str(doc_id),
+            id_prefix=f"doc_{doc_id}",
+            chunks=chunks,
+            metadata={"title": title, "category": category},
+            progress=progress,
+        )
+        _bump_index_version()
 
-        # 청크 추가
-        ids = []
-        documents = []
-        metadatas = []
-
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"doc_{doc_id}_chunk_{i}"
-            ids.append(chunk_id)
-            documents.append(chunk)
-            metadatas.append({
-                "doc_id": str(doc_id),
-                "title": title,
-                "category": category,
-                "chunk_index": i,
-            })
+        print(f"[INFO] 문서 추가 완료: {title} ({result['chunk_count']} 청크, 새 임베딩 {result['embedded']}개)")
+        return result["chunk_count"]
 
-        self.collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
+    def index_chunks(self, *, doc_key: str, id_prefix: str, chunks: List[str], metadata: dict, progress=None) -> dict:
+        """청크를 배치로 임베딩해 저장 (내용이 바뀐 청크만 다시 임베딩)"""
+        if not self.collection:
+            raise RuntimeError("ChromaDB가 초기화되지 않았습니다.")
+        return sync_collection_chunks(
+            self.collection,
+            doc_key=doc_key,
+            id_prefix=id_prefix,
+            chunks=chunks,
+            metadata=metadata,
+            progress=progress,
         )
 
-        print(f"[INFO] 문서 추가 완료: {title} ({len(chunks)} 청크)")
-        return len(chunks)
-
     def _delete_document_chunks(self, doc_id: int):
         """특정 문서의 모든 청크 삭제"""
         try:
@@ -262,46 +380,127 @@ class SchoolViolenceRAG:
     def delete_document(self, doc_id: int):
         """문서 삭제"""
         self._delete_document_chunks(doc_id)
-
-    def search(self, query: str, n_results: int = 5, category: Optional[str] = None) -> List[dict]:
-        """관련 문서 검색"""
-        if not self.collection:
+        _bump_index_version()
+
+    def _lexical_search_index(self):
+        """컬렉션 전체 청크로 만든 BM25 색인 (색인 버전이 바뀔 때만 다시 생성)"""
+        version = _index_version()
+        with self._lexical_lock:
+            if self._lexical_index is None or self._lexical_version != version:
+                stored = self.collection.get(include=["documents", "metadatas"])
+                rows = {
+                    chunk_id: (content or "", metadata or {})
+                    for chunk_id, content, metadata in zip(
+                        stored.get('ids') or [], stored.get('documents') or [], stored.get('metadatas') or []
+                    )
+                }
+                self._lexical_index = BM25Index.build(
+                    (chunk_id, f"{metadata.get('title', '')} {content}") for chunk_id, (content, metadata) in rows.items()
+                )
+                self._lexical_rows = rows
+                self._lexical_version = version
+            return self._lexical_index, self._lexical_rows
+
+    def _vector_candidates(self, query: str, limit: int, category: Optional[str]) -> List[dict]:
+        results = self.collection.query(
+            query_embeddings=[embed_query(query)],
+            n_results=limit,
+            where={"category": category} if category else None,
+        )
+        candidates = []
+        if results['documents'] and results['documents'][0]:
+            for i in range(len(results['documents'][0])):
+                candidates.append({
+                    'id': results['ids'][0][i],
+                    'content': results['documents'][0][i],
+                    'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
+                    'distance': results['distances'][0][i] if results.get('distances') else 0,
+                })
+        return candidates
+
+    def _lexical_candidates(self, query: str, limit: int, category: Optional[str]) -> List[dict]:
+        index, rows = self._lexical_search_index()
+        # 분류 필터는 색인 밖에서 걸러내므로 넉넉히 뽑아 둠
+        hits = index.search(query, limit=limit * 4 if category else limit)
+        candidates = []
+        for chunk_id, score in hits:
+            content, metadata = rows[chunk_id]
+            if category and metadata.get('category') != category:
+                continue
+            candidates.append({'id': chunk_id, 'content': content, 'metadata': metadata, 'bm25': score})
+            if len(candidates) >= limit:
+                break
+        return candidates
+
+    def _ranked_search(self, query: str, n_results: int, category: Optional[str], mode: str) -> List[dict]:
+        limit = max(n_results, HYBRID_CANDIDATES)
+        rankings = []
+        by_id = {}
+        if mode in (SEARCH_MODE_HYBRID, SEARCH_MODE_VECTOR):
+            candidates = self._vector_candidates(query, limit, category)
+            rankings.append([item['id'] for item in candidates])
+            by_id.update((item['id'], item) for item in candidates)
+        if mode in (SEARCH_MODE_HYBRID, SEARCH_MODE_LEXICAL):
+            candidates = self._lexical_candidates(query, limit, category)
+            rankings.append([item['id'] for item in candidates])
+            for item in candidates:
+                by_id.setdefault(item['id'], {}).update(item)
+
+        fused = []
+        for chunk_id, score in reciprocal_rank_fusion(rankings):
+            item = by_id[chunk_id]
+            fused.append({
+                'content': item['content'],
+                'metadata': item['metadata'],
+                'distance': item.get('distance'),
+                'bm25': item.get('bm25'),
+                'score': score,
+            })
+        return dedupe_results(fused)[:n_results]
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 5,
+        category: Optional[str] = None,
+        *,
+        mode: str = SEARCH_MODE_HYBRID,
+        use_cache: bool = True,
+    ) -> List[dict]:
+        """관련 문서 검색 (기본은 벡터 + BM25 하이브리드, 결과는 질의·분류별로 캐시)"""
+        if not self.collection or mode not in SEARCH_MODES:
             return []
 
-        try:
-            where_filter = {"category": category} if category else None
-
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results,
-                where=where_filter
-            )
+        normalized = normalize_embedding_text(query)
+        cache_key = None
+        if use_cache:
+            digest = hashlib.sha1(f"{mode}|{category or ''}|{n_results}|{normalized}".encode("utf-8")).hexdigest()
+            cache_key = SEARCH_CACHE_KEY_TEMPLATE.format(version=_index_version(), digest=digest)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            search_results = []
-            if results['documents'] and results['documents'][0]:
-                for i in range(len(results['documents'][0])):
-                    search_results.append({
-                        'content': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
-                        'distance': results['distances'][0][i] if results.get('distances') else 0
-                    })
-
-            return search_results
+        try:
+            search_results = self._ranked_search(normalized, n_results, category, mode)
         except Exception as e:
             print(f"[ERROR] 검색 실패: {e}")
             return []
 
+        if cache_key:
+            cache.set(cache_key, search_results, SEARCH_CACHE_SECONDS)
+        return search_results
+
     def get_context_for_query(self, query: str, n_results: int = 3) -> str:
-        """쿼리에 대한 컨텍스트 문자열 생성"""
+        """쿼리에 대한 컨텍스트 문자열 생성 (점수가 크게 떨어지는 청크는 빼고, 긴 청크는 질의 주변만)"""
         results = self.search(query, n_results=n_results)
 
         if not results:
             return ""
 
         context_parts = []
-        for i, result in enumerate(results, 1):
+        for i, result in enumerate(select_context_results(results), 1):
             title = result['metadata'].get('title', '알 수 없음')
-            content = result['content']
+            content = trim_to_query(result['content'], query)
             context_parts.append(f"[참고자료 {i}: {title}]\n{content}")
 
         return "\n\n---\n\n".join(context_parts)
@@ -1,6 +1,7 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from .models import ChatSession
+from .rag_utils import dedupe_results, reciprocal_rank_fusion, select_context_results, trim_to_query
 
 class ChatSessionModelTest(TestCase):
     def test_create_chat_session(self):
@@ -13,3 +14,49 @@ class ChatSessionModelTest(TestCase):
         # )
         # self.assertEqual(ChatSession.objects.count(), 1)
         # self.assertEqual(session.mode, "homeroom")
+
+
+class HybridRetrievalTest(SimpleTestCase):
+    def test_rrf_prefers_chunks_found_by_both_rankers(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+        self.assertEqual([chunk_id for chunk_id, _score in fused], ["c", "a", "b", "d"])
+
+    def test_dedupe_limits_chunks_per_document_and_drops_contained_chunks(self):
+        results = [
+            {'content': '학교장 자체해결 요건', 'metadata': {'doc_id': '1'}},
+            {'content': '자체해결 요건', 'metadata': {'doc_id': '1'}},
+            {'content': '심의위원회 개최', 'metadata': {'doc_id': '1'}},
+            {'content': '피해학생 보호조치', 'metadata': {'doc_id': '1'}},
+            {'content': '자체해결 요건', 'metadata': {'doc_id': '2'}},
+        ]
+
+        kept = dedupe_results(results, max_per_doc=2)
+
+        self.assertEqual(
+            [(item['metadata']['doc_id'], item['content']) for item in kept],
+            [('1', '학교장 자체해결 요건'), ('1', '심의위원회 개최'), ('2', '자체해결 요건')],
+        )
+
+    def test_trim_keeps_window_around_query_terms(self):
+        content = "가" * 500 + " 제17조 긴급조치 " + "나" * 500
+
+        trimmed = trim_to_query(content, "제17조 긴급조치", limit=100)
+
+        self.assertIn("제17조 긴급조치", trimmed)
+        self.assertTrue(trimmed.startswith("…") and trimmed.endswith("…"))
+        self.assertLessEqual(len(trimmed), 102)
+
+    def test_context_cut_uses_raw_scores_not_fused_rank_scores(self):
+        results = [
+            {'content': '1위', 'bm25': 9.0, 'distance': 0.4, 'score': 2 / 61},
+            # 한쪽 검색기에서만 1위라 RRF 점수는 절반이지만 BM25 점수가 높음
+            {'content': '키워드 일치', 'bm25': 8.0, 'distance': None, 'score': 1 / 61},
+            {'content': '의미 유사', 'bm25': None, 'distance': 0.5, 'score': 1 / 62},
+            {'content': '약한 키워드', 'bm25': 1.0, 'distance': None, 'score': 1 / 63},
+            {'content': '먼 벡터', 'bm25': None, 'distance': 1.4, 'score': 1 / 64},
+        ]
+
+        kept = select_context_results(results)
+
+        self.assertEqual([item['content'] for item in kept], ['1위', '키워드 일치', '의미 유사'])
@@ -8,7 +8,9 @@ from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.conf import settings
+from django.urls import reverse
 from django_ratelimit.decorators import ratelimit
+from core.embeddings import get_ingest_status, ingest_status_payload, submit_ingest_job
 from core.utils import ratelimit_key_for_master_only
 from google import genai
 
@@ -284,10 +286,21 @@ def manage_docs(request):
     })
 
 
+def _ingest_job_id(pk):
+    return f"school_violence:{pk}"
+
+
+def _ingest_response(pk, status):
+    payload, http_status = ingest_status_payload(status)
+    if payload.get("pending"):
+        payload["status_url"] = reverse("school_violence:process_document_status", args=[pk])
+    return JsonResponse(payload, status=http_status)
+
+
 @staff_member_required
 @require_POST
 def process_document(request, pk):
-    """문서 벡터DB 처리 (AJAX)"""
+    """문서 벡터DB 처리 (AJAX) - 임베딩은 백그라운드 작업으로 진행"""
     doc = get_object_or_404(GuidelineDocument, pk=pk)
 
     try:
@@ -295,35 +308,41 @@ def process_document(request, pk):
         if not rag:
             return JsonResponse({'error': 'RAG 서비스를 초기화할 수 없습니다.'}, status=500)
 
-        # 파일 경로 가져오기
         file_path = doc.file.path
-
-        # 벡터DB에 추가
-        chunk_count = rag.add_document(
-            doc_id=doc.pk,
-            file_path=file_path,
-            title=doc.title,
-            category=doc.category
-        )
-
-        if chunk_count > 0:
-            doc.is_processed = True
-            doc.chunk_count = chunk_count
-            doc.save()
-            return JsonResponse({
-                'success': True,
-                'message': f'{chunk_count}개의 청크로 처리되었습니다.',
-                'chunk_count': chunk_count
-            })
-        else:
-            return JsonResponse({
-                'error': '텍스트를 추출할 수 없습니다. 파일 형식을 확인해주세요.'
-            }, status=400)
+        title = doc.title
+        category = doc.category
+
+        def ingest(progress):
+            chunk_count = rag.add_document(
+                doc_id=pk,
+                file_path=file_path,
+                title=title,
+                category=category,
+                progress=progress,
+            )
+            if chunk_count <= 0:
+                raise ValueError('텍스트를 추출할 수 없습니다. 파일 형식을 확인해주세요.')
+            processed = GuidelineDocument.objects.filter(pk=pk).first()
+            if processed is not None:
+                processed.is_processed = True
+                processed.chunk_count = chunk_count
+                processed.save(update_fields=['is_processed', 'chunk_count', 'updated_at'])
+            return {'chunk_count': chunk_count}
+
+        status = submit_ingest_job(_ingest_job_id(pk), ingest)
+        return _ingest_response(pk, status)
 
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@staff_member_required
+def process_document_status(request, pk):
+    """문서 벡터DB 처리 진행 상황 (AJAX)"""
+    get_object_or_404(GuidelineDocument, pk=pk)
+    return _ingest_response(pk, get_ingest_status(_ingest_job_id(pk)))
+
+
 @staff_member_required
 @require_POST
 def delete_document(request, pk):
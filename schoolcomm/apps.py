@@ -5,3 +5,6 @@ class SchoolcommConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "schoolcomm"
     verbose_name = "끼리끼리 채팅방"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from schoolcomm.search_index import REBUILD_BATCH_SIZE, backfill_search_index, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the schoolcomm message/asset search index (or only index rows that are missing)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--missing-only", action="store_true", help="keep existing entries and index only new rows")
+        parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        if options["missing_only"]:
+            indexed = backfill_search_index(batch_size=batch_size)
+        else:
+            indexed = rebuild_search_index(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"rebuild_schoolcomm_search_index completed: {indexed} entries"))
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.3 on 2026-10-17 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schoolcomm', '0002_sharedcalendarevent_sharedcalendareventcopy_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('message', '메시지'), ('asset', '자료')], max_length=10)),
+                ('is_reply', models.BooleanField(default=False)),
+                ('search_text', models.TextField(blank=True, default='')),
+                ('source_created_at', models.DateTimeField()),
+                ('asset', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='schoolcomm.sharedasset')),
+                ('message', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='schoolcomm.roommessage')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='schoolcomm.communityroom')),
+            ],
+            options={
+                'verbose_name': '검색 색인 항목',
+                'verbose_name_plural': '검색 색인 항목',
+                'indexes': [models.Index(fields=['room', 'kind', 'source_created_at'], name='schoolcomm__room_id_10813d_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('kind', 'message')), fields=('message',), name='schoolcomm_search_entry_message_unique'), models.UniqueConstraint(condition=models.Q(('kind', 'asset')), fields=('message', 'asset'), name='schoolcomm_search_entry_asset_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('message', '메시지'), ('asset', '자료')], max_length=10)),
+                ('gram', models.CharField(max_length=8)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='schoolcomm.searchentry')),
+                ('room', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='schoolcomm.communityroom')),
+            ],
+            options={
+                'verbose_name': '검색 색인 단어',
+                'verbose_name_plural': '검색 색인 단어',
+                'indexes': [models.Index(fields=['gram', 'room', 'kind'], name='schoolcomm__gram_f667fa_idx')],
+                'unique_together': {('entry', 'gram')},
+            },
+        ),
+    ]
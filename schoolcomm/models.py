@@ -580,3 +580,80 @@ class SharedCalendarEventCopy(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.shared_event.title}"
+
+
+class SearchEntry(models.Model):
+    class Kind(models.TextChoices):
+        MESSAGE = "message", "메시지"
+        ASSET = "asset", "자료"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    room = models.ForeignKey(
+        CommunityRoom,
+        on_delete=models.CASCADE,
+        related_name="search_entries",
+    )
+    message = models.ForeignKey(
+        RoomMessage,
+        on_delete=models.CASCADE,
+        related_name="search_entries",
+    )
+    asset = models.ForeignKey(
+        SharedAsset,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="search_entries",
+    )
+    is_reply = models.BooleanField(default=False)
+    search_text = models.TextField(blank=True, default="")
+    source_created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["message"],
+                condition=models.Q(kind="message"),
+                name="schoolcomm_search_entry_message_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["message", "asset"],
+                condition=models.Q(kind="asset"),
+                name="schoolcomm_search_entry_asset_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["room", "kind", "source_created_at"]),
+        ]
+        verbose_name = "검색 색인 항목"
+        verbose_name_plural = "검색 색인 항목"
+
+    def __str__(self):
+        return f"{self.kind} - {self.message_id}"
+
+
+class SearchTerm(models.Model):
+    entry = models.ForeignKey(
+        SearchEntry,
+        on_delete=models.CASCADE,
+        related_name="terms",
+    )
+    room = models.ForeignKey(
+        CommunityRoom,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,
+    )
+    kind = models.CharField(max_length=10, choices=SearchEntry.Kind.choices)
+    gram = models.CharField(max_length=8)
+
+    class Meta:
+        unique_together = [("entry", "gram")]
+        indexes = [
+            models.Index(fields=["gram", "room", "kind"]),
+        ]
+        verbose_name = "검색 색인 단어"
+        verbose_name_plural = "검색 색인 단어"
+
+    def __str__(self):
+        return self.gram
@@ -0,0 +1,232 @@
+"""
+Workspace search index for schoolcomm.
+
+Korean chat text has no stemmer-friendly word boundaries ("회의록은", "회의에서"),
+so every word is indexed as overlapping character bigrams. A message or an
+asset linked to a message gets one ``SearchEntry`` (normalized text plus its
+room) and one ``SearchTerm`` row per distinct bigram. A query is answered by
+intersecting posting lists on the ``(gram, room, kind)`` index, then every
+candidate is streamed in batches, verified against the normalized phrase and
+scored in Python; a bounded heap keeps the best ones. It needs no database extension, so tests on SQLite exercise the same
+path as PostgreSQL in production.
+
+Entries are kept current by the post_save handlers in ``schoolcomm.signals``
+and disappear with their message or asset through ``CASCADE``.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef
+from django.utils import timezone
+
+from .models import MessageAssetLink, RoomMessage, SearchEntry, SearchTerm
+
+SEARCH_RESULT_LIMIT = 400
+SEARCH_SCAN_BATCH_SIZE = 500
+SEARCH_RECENCY_DAYS = 30
+HIGHLIGHT_RADIUS = 40
+REBUILD_BATCH_SIZE = 500
+MAX_GRAM_LENGTH = 2
+
+_WORD_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_search_text(value):
+    text = unicodedata.normalize("NFKC", str(value or "")).lower()
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def search_grams(value):
+    """Return the distinct bigrams (single characters for one-letter words) in ``value``."""
+    grams = set()
+    for word in _WORD_RE.findall(normalize_search_text(value)):
+        if len(word) < MAX_GRAM_LENGTH:
+            grams.add(word)
+            continue
+        for index in range(len(word) - MAX_GRAM_LENGTH + 1):
+            grams.add(word[index : index + MAX_GRAM_LENGTH])
+    return grams
+
+
+def _query_grams(phrase):
+    # A one-letter query word can sit inside a longer indexed word, where only
+    # bigrams exist, so it is left to phrase verification.
+    return {gram for gram in search_grams(phrase) if len(gram) == MAX_GRAM_LENGTH}
+
+
+def _asset_text(asset):
+    return " ".join(
+        part for part in (asset.original_name, asset.file_extension, asset.uploader_name_snapshot) if part
+    )
+
+
+def _write_entry(entry, text):
+    normalized = normalize_search_text(text)
+    if entry.pk and entry.search_text == normalized:
+        return entry
+    entry.search_text = normalized
+    entry.save()
+    entry.terms.all().delete()
+    SearchTerm.objects.bulk_create(
+        [SearchTerm(entry=entry, room_id=entry.room_id, kind=entry.kind, gram=gram) for gram in sorted(search_grams(normalized))]
+    )
+    return entry
+
+
+@transaction.atomic
+def index_message(message):
+    entry = SearchEntry.objects.filter(kind=SearchEntry.Kind.MESSAGE, message=message).first() or SearchEntry(
+        kind=SearchEntry.Kind.MESSAGE,
+        message=message,
+        room_id=message.room_id,
+        is_reply=bool(message.parent_message_id),
+        source_created_at=message.created_at,
+    )
+    return _write_entry(entry, message.body)
+
+
+@transaction.atomic
+def index_asset_link(link):
+    asset = link.asset
+    message = link.message
+    entry = SearchEntry.objects.filter(kind=SearchEntry.Kind.ASSET, message_id=link.message_id, asset=asset).first() or SearchEntry(
+        kind=SearchEntry.Kind.ASSET,
+        message_id=link.message_id,
+        asset=asset,
+        room_id=message.room_id,
+        is_reply=bool(message.parent_message_id),
+        source_created_at=asset.created_at,
+    )
+    return _write_entry(entry, _asset_text(asset))
+
+
+def reindex_asset(asset):
+    for link in MessageAssetLink.objects.select_related("message", "asset").filter(asset=asset):
+        index_asset_link(link)
+
+
+def backfill_search_index(*, batch_size=REBUILD_BATCH_SIZE):
+    """Index messages and asset links that have no entry yet, oldest first. Returns the number indexed."""
+    indexed = 0
+    messages = RoomMessage.objects.filter(
+        ~Exists(SearchEntry.objects.filter(kind=SearchEntry.Kind.MESSAGE, message_id=OuterRef("id")))
+    ).order_by("created_at", "id")
+    for message in messages.iterator(chunk_size=batch_size):
+        index_message(message)
+        indexed += 1
+    links = (
+        MessageAssetLink.objects.select_related("message", "asset")
+        .filter(
+            ~Exists(
+                SearchEntry.objects.filter(
+                    kind=SearchEntry.Kind.ASSET,
+                    message_id=OuterRef("message_id"),
+                    asset_id=OuterRef("asset_id"),
+                )
+            )
+        )
+        .order_by("created_at", "id")
+    )
+    for link in links.iterator(chunk_size=batch_size):
+        index_asset_link(link)
+        indexed += 1
+    return indexed
+
+
+def rebuild_search_index(*, batch_size=REBUILD_BATCH_SIZE):
+    SearchEntry.objects.all().delete()
+    return backfill_search_index(batch_size=batch_size)
+
+
+def _candidate_entries(room_ids, kind, phrase):
+    """Every entry holding all query bigrams, streamed in batches; nothing is cut before ranking."""
+    grams = _query_grams(phrase)
+    if grams:
+        entry_ids = (
+            SearchTerm.objects.filter(room_id__in=room_ids, kind=kind, gram__in=grams)
+            .values("entry_id")
+            .annotate(matched=Count("id"))
+            .filter(matched=len(grams))
+            .values("entry_id")
+        )
+        queryset = SearchEntry.objects.filter(id__in=entry_ids)
+    else:
+        queryset = SearchEntry.objects.filter(room_id__in=room_ids, kind=kind, search_text__contains=phrase)
+    fields = ("id", "kind", "message_id", "asset_id", "is_reply", "search_text", "source_created_at")
+    return queryset.only(*fields).order_by().iterator(chunk_size=SEARCH_SCAN_BATCH_SIZE)
+
+
+def _score(entry, phrase, now):
+    text = entry.search_text
+    score = 1 + math.log1p(text.count(phrase))
+    if text.startswith(phrase) or f" {phrase}" in text:
+        score += 0.5
+    if text == phrase:
+        score += 1
+    age_days = max(0.0, (now - entry.source_created_at).total_seconds() / 86400)
+    return score / (1 + age_days / SEARCH_RECENCY_DAYS)
+
+
+def _rank_key(entry):
+    return (entry.search_score, entry.source_created_at, entry.id)
+
+
+def search_index(room_ids, kind, query, *, include_replies=True, limit=SEARCH_RESULT_LIMIT):
+    """
+    Return the ``limit`` best ``SearchEntry`` objects of ``kind`` in ``room_ids``
+    whose text contains ``query``, best first, each with ``search_score`` set.
+    Every match is scored, however old; asset entries are de-duplicated per asset.
+    """
+    phrase = normalize_search_text(query)
+    room_ids = list(room_ids)
+    if not phrase or not room_ids:
+        return []
+    now = timezone.now()
+
+    def scored():
+        for entry in _candidate_entries(room_ids, kind, phrase):
+            if phrase not in entry.search_text or (entry.is_reply and not include_replies):
+                continue
+            entry.search_score = _score(entry, phrase, now)
+            yield entry
+
+    entries = scored()
+    if kind == SearchEntry.Kind.ASSET:
+        best_by_asset = {}
+        for entry in entries:
+            current = best_by_asset.get(entry.asset_id)
+            if current is None or _rank_key(entry) > _rank_key(current):
+                best_by_asset[entry.asset_id] = entry
+        entries = best_by_asset.values()
+    return heapq.nlargest(limit, entries, key=_rank_key)
+
+
+def build_search_highlight(text, query, *, radius=HIGHLIGHT_RADIUS):
+    """
+    Return ``{"snippet", "matches"}`` for ``text`` around the first hit of
+    ``query``; ``matches`` are ``[start, end]`` offsets inside the snippet so
+    templates and clients can mark them without trusting any HTML.
+    """
+    text = str(text or "")
+    needle = normalize_search_text(query)
+    haystack = text.lower()
+    first = haystack.find(needle) if needle else -1
+    if first < 0:
+        snippet = text[: radius * 2]
+        return {"snippet": snippet + ("…" if len(text) > len(snippet) else ""), "matches": []}
+    start = max(0, first - radius)
+    end = min(len(text), first + len(needle) + radius)
+    prefix = "…" if start > 0 else ""
+    snippet = prefix + text[start:end] + ("…" if end < len(text) else "")
+    matches = []
+    cursor = haystack.find(needle, start)
+    while 0 <= cursor and cursor + len(needle) <= end:
+        offset = cursor - start + len(prefix)
+        matches.append([offset, offset + len(needle)])
+        cursor = haystack.find(needle, cursor + len(needle))
+    return {"snippet": snippet, "matches": matches}
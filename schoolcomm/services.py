@@ -12,7 +12,7 @@ from channels.layers import get_channel_layer
 from django.core.files.base import ContentFile
 from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import F, Q
+from django.db.models import F
 from django.template.defaultfilters import slugify
 from django.urls import reverse
 from django.utils import timezone
@@ -29,6 +29,7 @@ from .models import (
     RoomMessage,
     RoomParticipant,
     SchoolMembership,
+    SearchEntry,
     SchoolWorkspace,
     SharedCalendarEvent,
     SharedCalendarEventCopy,
@@ -38,6 +39,7 @@ from .models import (
     UserRoomState,
     WorkspaceInvite,
 )
+from .search_index import build_search_highlight, search_index
 
 SERVICE_ROUTE = "schoolcomm:main"
 SERVICE_TITLE = "끼리끼리 채팅방"
@@ -1301,6 +1303,48 @@ def build_workspace_dashboard(workspace, user):
     }
 
 
+def _accessible_room_ids(membership):
+    return list(RoomParticipant.objects.filter(membership=membership).values_list("room_id", flat=True))
+
+
+def _sort_search_entries(entries):
+    return sorted(entries, key=lambda entry: (entry.search_score, entry.source_created_at, entry.id), reverse=True)
+
+
+def _merge_linked_asset_entries(asset_entries, message_entries):
+    """Add assets attached to matching messages (replies included) to the asset hits."""
+    by_asset = {entry.asset_id: entry for entry in asset_entries}
+    message_hits = {entry.message_id: entry for entry in message_entries}
+    if message_hits:
+        linked_entries = SearchEntry.objects.filter(
+            kind=SearchEntry.Kind.ASSET,
+            message_id__in=list(message_hits),
+        ).only("id", "message_id", "asset_id", "source_created_at")
+        for entry in linked_entries:
+            if entry.asset_id in by_asset:
+                continue
+            entry.search_score = message_hits[entry.message_id].search_score
+            by_asset[entry.asset_id] = entry
+    return _sort_search_entries(by_asset.values())
+
+
+def _load_search_hits(entries, queryset, key, query_text, text_of):
+    objects = queryset.in_bulk([getattr(entry, key) for entry in entries])
+    hits = []
+    for entry in entries:
+        obj = objects.get(getattr(entry, key))
+        if obj is None:
+            continue
+        obj.search_score = entry.search_score
+        obj.search_highlight = build_search_highlight(text_of(obj), query_text)
+        hits.append(obj)
+    return hits
+
+
+def _search_asset_queryset():
+    return SharedAsset.objects.select_related("blob").prefetch_related("message_links__message__room")
+
+
 def search_workspace(workspace, user, query, *, page_number=1, per_page=12):
     membership = get_membership(workspace, user)
     if membership is None:
@@ -1309,32 +1353,35 @@ def search_workspace(workspace, user, query, *, page_number=1, per_page=12):
     if not query_text:
         return {"query": "", "messages_page": None, "assets_page": None, "room_matches": []}
 
-    accessible_room_ids = RoomParticipant.objects.filter(membership=membership).values_list("room_id", flat=True)
+    accessible_room_ids = _accessible_room_ids(membership)
     room_matches = list(
         CommunityRoom.objects.filter(id__in=accessible_room_ids, name__icontains=query_text).order_by("name")[:8]
     )
-    message_queryset = (
-        RoomMessage.objects.select_related("room")
-        .filter(room_id__in=accessible_room_ids, parent_message__isnull=True, body__icontains=query_text)
-        .order_by("-created_at")
+    message_entries = search_index(accessible_room_ids, SearchEntry.Kind.MESSAGE, query_text)
+    asset_entries = _merge_linked_asset_entries(
+        search_index(accessible_room_ids, SearchEntry.Kind.ASSET, query_text),
+        message_entries,
     )
-    asset_queryset = (
-        SharedAsset.objects.select_related("blob")
-        .filter(message_links__message__room_id__in=accessible_room_ids)
-        .prefetch_related("message_links__message__room")
-        .filter(
-            Q(original_name__icontains=query_text)
-            | Q(file_extension__icontains=query_text)
-            | Q(uploader_name_snapshot__icontains=query_text)
-            | Q(message_links__message__body__icontains=query_text)
-        )
-        .distinct()
-        .order_by("-created_at")
+    messages_page = Paginator([entry for entry in message_entries if not entry.is_reply], per_page).get_page(page_number)
+    messages_page.object_list = _load_search_hits(
+        messages_page.object_list,
+        RoomMessage.objects.select_related("room"),
+        "message_id",
+        query_text,
+        lambda message: message.body,
+    )
+    assets_page = Paginator(asset_entries, per_page).get_page(page_number)
+    assets_page.object_list = _load_search_hits(
+        assets_page.object_list,
+        _search_asset_queryset(),
+        "asset_id",
+        query_text,
+        lambda asset: asset.original_name,
     )
     return {
         "query": query_text,
-        "messages_page": Paginator(message_queryset, per_page).get_page(page_number),
-        "assets_page": Paginator(asset_queryset, per_page).get_page(page_number),
+        "messages_page": messages_page,
+        "assets_page": assets_page,
         "room_matches": room_matches,
     }
 
@@ -1344,20 +1391,27 @@ def search_workspace_assets(workspace, user, query, *, page_number=1, per_page=1
     if membership is None:
         raise MembershipRequiredError("워크스페이스 멤버만 검색할 수 있습니다.")
     query_text = str(query or "").strip()
-    accessible_room_ids = RoomParticipant.objects.filter(membership=membership).values_list("room_id", flat=True)
-    queryset = (
-        SharedAsset.objects.select_related("blob")
-        .filter(message_links__message__room_id__in=accessible_room_ids)
-        .distinct()
-        .order_by("-created_at")
-    )
-    if query_text:
-        queryset = queryset.filter(
-            Q(original_name__icontains=query_text)
-            | Q(file_extension__icontains=query_text)
-            | Q(uploader_name_snapshot__icontains=query_text)
+    accessible_room_ids = _accessible_room_ids(membership)
+    if not query_text:
+        queryset = (
+            SharedAsset.objects.select_related("blob")
+            .filter(message_links__message__room_id__in=accessible_room_ids)
+            .distinct()
+            .order_by("-created_at")
         )
-    return Paginator(queryset, per_page).get_page(page_number)
+        return Paginator(queryset, per_page).get_page(page_number)
+    page_obj = Paginator(
+        search_index(accessible_room_ids, SearchEntry.Kind.ASSET, query_text),
+        per_page,
+    ).get_page(page_number)
+    page_obj.object_list = _load_search_hits(
+        page_obj.object_list,
+        _search_asset_queryset(),
+        "asset_id",
+        query_text,
+        lambda asset: asset.original_name,
+    )
+    return page_obj
 
 
 def build_home_card(user):
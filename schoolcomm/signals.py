@@ -0,0 +1,27 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import MessageAssetLink, RoomMessage, SharedAsset
+from .search_index import index_asset_link, index_message, reindex_asset
+
+
+@receiver(post_save, sender=RoomMessage)
+def index_saved_message(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and "body" not in update_fields):
+        return
+    index_message(instance)
+
+
+@receiver(post_save, sender=MessageAssetLink)
+def index_saved_asset_link(sender, instance, created, raw=False, **kwargs):
+    if raw or not created:
+        return
+    index_asset_link(instance)
+
+
+@receiver(post_save, sender=SharedAsset)
+def reindex_saved_asset(sender, instance, created, raw=False, **kwargs):
+    # A new asset has no message link yet; the link handler indexes it.
+    if raw or created:
+        return
+    reindex_asset(instance)
@@ -1,12 +1,13 @@
 import re
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import DatabaseError
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from unittest.mock import patch
@@ -19,12 +20,14 @@ from schoolcomm.models import (
     CommunityRoom,
     RoomMessage,
     SchoolMembership,
+    SearchEntry,
     SharedCalendarEvent,
     SharedCalendarEventCopy,
     StoredAssetBlob,
     UserAssetCategory,
     WorkspaceInvite,
 )
+from schoolcomm.search_index import SEARCH_RESULT_LIMIT, backfill_search_index
 from schoolcomm.services import (
     create_room_message,
     create_shared_calendar_event,
@@ -32,6 +35,8 @@ from schoolcomm.services import (
     ensure_user_asset_category,
     get_default_room,
     get_or_create_dm_room,
+    search_workspace,
+    search_workspace_assets,
     update_user_asset_category,
 )
 
@@ -158,6 +163,67 @@ class SchoolcommServiceTests(SchoolcommTestCase):
 
         self.assertEqual(category.category, "social")
 
+    def test_search_ranks_korean_substring_matches_with_highlights(self):
+        create_room_message(self.shared_room, self.owner_membership, text="내일 급식 메뉴 안내")
+        create_room_message(self.shared_room, self.owner_membership, text="3월 학부모 총회 회의록 공유합니다")
+        parent = create_room_message(self.notice_room, self.owner_membership, text="회의록 회의록 정리본")
+        upload = SimpleUploadedFile("총회_자료.hwp", b"meeting-bytes", content_type="application/octet-stream")
+        create_room_message(self.notice_room, self.owner_membership, text="첨부한 회의록 확인", parent_message=parent, uploads=[upload])
+
+        results = search_workspace(self.workspace, self.member, "회의록")
+
+        bodies = [message.body for message in results["messages_page"].object_list]
+        self.assertEqual(bodies, ["회의록 회의록 정리본", "3월 학부모 총회 회의록 공유합니다"])
+        highlight = results["messages_page"].object_list[1].search_highlight
+        start, end = highlight["matches"][0]
+        self.assertEqual(highlight["snippet"][start:end], "회의록")
+        self.assertEqual([asset.original_name for asset in results["assets_page"].object_list], ["총회_자료.hwp"])
+        self.assertEqual([message.body for message in search_workspace(self.workspace, self.member, "총회")["messages_page"]], ["3월 학부모 총회 회의록 공유합니다"])
+
+    def test_search_index_follows_asset_rename_and_message_delete(self):
+        upload = SimpleUploadedFile("초안.hwp", b"draft-bytes", content_type="application/octet-stream")
+        message = create_room_message(self.shared_room, self.owner_membership, text="운동회 계획 초안", uploads=[upload])
+        asset = message.asset_links.first().asset
+        asset.original_name = "운동회_최종안.hwp"
+        asset.save()
+
+        page = search_workspace_assets(self.workspace, self.member, "최종안")
+        self.assertEqual([item.id for item in page.object_list], [asset.id])
+
+        message.delete()
+        self.assertEqual(list(search_workspace(self.workspace, self.member, "운동회")["messages_page"]), [])
+        self.assertFalse(SearchEntry.objects.exists())
+
+    def test_search_ranks_every_match_not_only_the_newest(self):
+        best = create_room_message(self.shared_room, self.owner_membership, text="회의록")
+        SearchEntry.objects.filter(message=best).update(source_created_at=timezone.now() - timedelta(days=3))
+        RoomMessage.objects.bulk_create(
+            [
+                RoomMessage(room=self.shared_room, sender=self.owner, body=f"공지 회의록 안내 {index}")
+                for index in range(SEARCH_RESULT_LIMIT + 20)
+            ]
+        )
+        backfill_search_index()
+
+        results = search_workspace(self.workspace, self.member, "회의록")
+
+        self.assertEqual(results["messages_page"].paginator.count, SEARCH_RESULT_LIMIT)
+        self.assertEqual(results["messages_page"].object_list[0].body, "회의록")
+
+    def test_search_uses_the_index_instead_of_scanning_message_bodies(self):
+        for index in range(5):
+            create_room_message(self.shared_room, self.owner_membership, text=f"{index}교시 수업 자료")
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = search_workspace(self.workspace, self.member, "수업 자료")
+            list(results["messages_page"])
+
+        self.assertEqual(len(results["messages_page"].object_list), 5)
+        for query in ctx.captured_queries:
+            sql = query["sql"]
+            self.assertFalse("schoolcomm_roommessage" in sql and "LIKE" in sql.upper(), sql)
+            self.assertNotIn("DISTINCT", sql.upper())
+
 
 class SchoolcommViewTests(SchoolcommTestCase):
     def setUp(self):
@@ -379,13 +379,14 @@ def _build_search_display(search_results, user):
             {
                 "room_name": message.room.name,
                 "body": message.body,
+                "highlight": message.search_highlight,
                 "url": f"{reverse('schoolcomm:room_detail', kwargs={'room_id': message.room.id})}#message-{message.id}",
             }
         )
 
     asset_cards = []
     for asset in search_results["assets_page"].object_list if search_results["assets_page"] else []:
-        asset_cards.append(serialize_asset(asset, user=user))
+        asset_cards.append(dict(serialize_asset(asset, user=user), highlight=asset.search_highlight))
 
     messages_page = search_results["messages_page"]
     assets_page = search_results["assets_page"]
@@ -934,8 +935,14 @@ def api_search(request):
                 "status": "success",
                 "query": results["query"],
                 "rooms": [build_room_summary(room, user=request.user) for room in results["room_matches"]],
-                "messages": [serialize_message(message, user=request.user) for message in (results["messages_page"].object_list if results["messages_page"] else [])],
-                "assets": [serialize_asset(asset, user=request.user) for asset in (results["assets_page"].object_list if results["assets_page"] else [])],
+                "messages": [
+                    dict(serialize_message(message, user=request.user), highlight=message.search_highlight)
+                    for message in (results["messages_page"].object_list if results["messages_page"] else [])
+                ],
+                "assets": [
+                    dict(serialize_asset(asset, user=request.user), highlight=asset.search_highlight)
+                    for asset in (results["assets_page"].object_list if results["assets_page"] else [])
+                ],
             }
         )
     except DatabaseError:
@@ -1,11 +1,11 @@
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
-from core.models import UserPolicyConsent, UserProfile
+from core.models import BackgroundJob, UserPolicyConsent, UserProfile
 from handoff.models import HandoffRosterGroup, HandoffRosterMember
 from core.policy_meta import PRIVACY_VERSION, TERMS_VERSION
 from signatures.models import TrainingSession
@@ -182,3 +182,34 @@ class SignatureProxySessionCreationTests(TestCase):
             TrainingSession.objects.filter(title="대행 생성 요청", created_by=self.teacher).exists()
         )
         self.assertEqual(session.expected_participants.count(), 0)
+
+    @override_settings(BACKGROUND_JOBS_ENABLED=True, BACKGROUND_JOBS_EMBEDDED_RUNNER=False)
+    def test_owner_and_proxy_manager_each_get_their_own_register_pdf_job(self):
+        UserPolicyConsent.objects.create(
+            user=self.teacher,
+            provider="direct",
+            terms_version=TERMS_VERSION,
+            privacy_version=PRIVACY_VERSION,
+            agreed_at=timezone.now(),
+            agreement_source="required_gate",
+        )
+        self.client.force_login(self.kakio)
+        self.client.post(
+            reverse("signatures:create"),
+            data=self._session_payload(
+                acting_for_user=str(self.teacher.id),
+                proxy_participants_text="김교사, 1-1",
+                shared_roster_group="",
+            ),
+        )
+        session = TrainingSession.objects.get(title="대행 생성 요청", created_by=self.teacher)
+        url = reverse("signatures:print_pdf", kwargs={"uuid": session.uuid})
+
+        self.assertEqual(self.client.get(url).status_code, 202)
+        self.client.force_login(self.teacher)
+        self.assertEqual(self.client.get(url).status_code, 202)
+
+        jobs = BackgroundJob.objects.filter(payload__session_id=session.pk)
+        self.assertEqual(sorted(jobs.values_list("owner__username", flat=True)), ["kakio", "teacher_alpha"])
+        proxy_job = jobs.get(owner=self.kakio)
+        self.assertEqual(self.client.get(f"{url}?job={proxy_job.pk}").status_code, 404)
@@ -15,6 +15,7 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.files.base import ContentFile
 from django.db import transaction
 from django.db.models import Q
 from django.http import FileResponse, Http404, JsonResponse, HttpResponse
@@ -24,7 +25,9 @@ from django.utils.text import get_valid_filename
 from django.utils import timezone
 from django_ratelimit.decorators import ratelimit
 from handoff.models import HandoffRosterGroup
+from core.background_jobs import background_job_wait_response, get_requested_background_job, submit_background_job
 from core.document_signing import get_file_field_bytes
+from core.models import BackgroundJob
 from core.teacher_activity import ACTIVITY_CATEGORY_REQUEST_SENT, award_teacher_activity
 from .models import (
     SIGNATURE_ATTACHMENT_MAX_FILES,
@@ -2291,19 +2294,43 @@ def print_view(request, uuid):
     return _apply_sensitive_cache_headers(response)
 
 
+REGISTER_PDF_JOB = "signatures.views.run_register_pdf_job"
+
+
+def run_register_pdf_job(job):
+    session = TrainingSession.objects.get(pk=job.payload["session_id"])
+    pdf_bytes = _build_signature_register_pdf_bytes(_build_signature_print_context(session))
+    job.artifact.save(f"signatures-register-{session.pk}.pdf", ContentFile(pdf_bytes), save=False)
+    return {"size": len(pdf_bytes)}
+
+
 @login_required
 def print_pdf_download(request, uuid):
     session = _get_signature_session_or_404(request.user, uuid)
-
-    try:
-        pdf_bytes = _build_signature_register_pdf_bytes(_build_signature_print_context(session))
-    except Exception:
-        logger.exception("failed to build signatures PDF download session=%s", session.pk)
+    # 공동 관리자마다 따로: get_requested_background_job은 본인 소유 작업만 찾는다.
+    job_key = f"signatures.register_pdf:{session.pk}:{request.user.pk}"
+    job = get_requested_background_job(request, dedupe_key=job_key)
+    if job is None:
+        job = submit_background_job(
+            REGISTER_PDF_JOB,
+            owner=request.user,
+            payload={"session_id": session.pk},
+            dedupe_key=job_key,
+        )
+    if not job.is_finished:
+        return background_job_wait_response(
+            request,
+            job,
+            title="출석부 PDF",
+            back_url=reverse("signatures:detail", kwargs={"uuid": session.uuid}),
+        )
+    if job.status == BackgroundJob.STATUS_FAILED or not job.artifact:
+        logger.error("failed to build signatures PDF download session=%s job=%s err=%s", session.pk, job.pk, job.error_message)
         messages.error(request, "PDF 파일을 바로 만들지 못했습니다. 잠시 후 다시 시도해 주세요.")
         return redirect("signatures:detail", uuid=session.uuid)
 
     response = FileResponse(
-        io.BytesIO(pdf_bytes),
+        job.artifact.open("rb"),
         as_attachment=True,
         filename=_build_signature_print_download_name(session),
         content_type="application/pdf",
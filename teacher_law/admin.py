@@ -1,6 +1,14 @@
 from django.contrib import admin
 
-from .models import LegalChatMessage, LegalChatSession, LegalCitation, LegalQueryAudit
+from .models import (
+    LawCorpusCase,
+    LawCorpusLaw,
+    LawCorpusQuery,
+    LegalChatMessage,
+    LegalChatSession,
+    LegalCitation,
+    LegalQueryAudit,
+)
 
 
 @admin.register(LegalChatSession)
@@ -39,3 +47,23 @@ class LegalQueryAuditAdmin(admin.ModelAdmin):
     )
     search_fields = ("original_question", "normalized_question", "failure_reason", "error_message")
     list_filter = ("scope_supported", "cache_hit", "topic")
+
+
+@admin.register(LawCorpusLaw)
+class LawCorpusLawAdmin(admin.ModelAdmin):
+    list_display = ("id", "provider", "law_name", "law_id", "mst", "enforcement_date", "fetched_at")
+    search_fields = ("law_name", "law_id", "mst")
+    list_filter = ("provider",)
+
+
+@admin.register(LawCorpusCase)
+class LawCorpusCaseAdmin(admin.ModelAdmin):
+    list_display = ("id", "provider", "case_number", "law_id", "fetched_at")
+    search_fields = ("case_key", "case_number", "law_id")
+    list_filter = ("provider",)
+
+
+@admin.register(LawCorpusQuery)
+class LawCorpusQueryAdmin(admin.ModelAdmin):
+    list_display = ("id", "provider", "kind", "law", "fetched_at", "last_used_at")
+    list_filter = ("provider", "kind")
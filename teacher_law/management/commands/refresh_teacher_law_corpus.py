@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from teacher_law.services import corpus
+from teacher_law.services.chat import warm_quick_question_sources
+from teacher_law.services.law_api import LawApiError, get_law_provider, refresh_corpus_query
+
+
+class Command(BaseCommand):
+    help = "교사용 법률 가이드의 법령·조문·판례 코퍼스를 갱신합니다. cron/Railway Scheduled Task로 주기 실행하세요."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=300, help="한 번에 갱신할 오래된 조회 수 (최근 사용 순)")
+        parser.add_argument("--warm", action="store_true", help="빠른 질문 프리셋의 법령을 미리 불러옵니다.")
+        parser.add_argument("--prune", action="store_true", help="보존 기간 동안 쓰이지 않은 조회 기록을 지웁니다.")
+
+    def handle(self, *args, **options):
+        if not corpus.is_enabled():
+            self.stdout.write(self.style.WARNING("TEACHER_LAW_CORPUS_ENABLED가 꺼져 있어 건너뜁니다."))
+            return
+
+        provider = get_law_provider()
+        refreshed = 0
+        failed = 0
+        for entry in corpus.stale_queries(provider, limit=max(0, options["limit"])):
+            try:
+                refresh_corpus_query(entry)
+            except LawApiError as exc:
+                failed += 1
+                self.stderr.write(f"갱신 실패 {entry.kind} {entry.params_json}: {exc}")
+                continue
+            refreshed += 1
+        self.stdout.write(f"오래된 조회 갱신: {refreshed}건 (실패 {failed}건)")
+
+        if options["warm"]:
+            self.stdout.write(f"빠른 질문 법령 미리 불러오기: {warm_quick_question_sources()}건")
+        if options["prune"]:
+            self.stdout.write(f"사용되지 않은 조회 삭제: {corpus.prune_unused()}건")
+        self.stdout.write(self.style.SUCCESS("법령 코퍼스 갱신 완료"))
@@ -0,0 +1,84 @@
+# Generated by Django 6.0.3 on 2026-10-17 13:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teacher_law', '0003_legalcitation_source_type_case_number'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LawCorpusCase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=16)),
+                ('case_key', models.CharField(max_length=140)),
+                ('case_number', models.CharField(blank=True, default='', max_length=120)),
+                ('law_id', models.CharField(blank=True, default='', max_length=32)),
+                ('data_json', models.JSONField(blank=True, default=dict)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ('id',),
+                'constraints': [models.UniqueConstraint(fields=('provider', 'case_key'), name='teacher_law_corpus_case_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LawCorpusLaw',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=16)),
+                ('law_id', models.CharField(max_length=32)),
+                ('mst', models.CharField(blank=True, default='', max_length=32)),
+                ('law_name', models.CharField(max_length=255)),
+                ('law_type', models.CharField(blank=True, default='', max_length=60)),
+                ('ministry', models.CharField(blank=True, default='', max_length=120)),
+                ('promulgation_date', models.CharField(blank=True, default='', max_length=16)),
+                ('enforcement_date', models.CharField(blank=True, default='', max_length=16)),
+                ('detail_link', models.CharField(blank=True, default='', max_length=500)),
+                ('raw_json', models.JSONField(blank=True, default=dict)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ('law_name', 'id'),
+                'constraints': [models.UniqueConstraint(fields=('provider', 'law_id'), name='teacher_law_corpus_law_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LawCorpusArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('article_key', models.CharField(max_length=140)),
+                ('article_label', models.CharField(blank=True, default='', max_length=120)),
+                ('article_text', models.TextField()),
+                ('fetched_at', models.DateTimeField()),
+                ('law', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='articles', to='teacher_law.lawcorpuslaw')),
+            ],
+            options={
+                'ordering': ('law_id', 'id'),
+                'constraints': [models.UniqueConstraint(fields=('law', 'article_key'), name='teacher_law_corpus_article_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LawCorpusQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=16)),
+                ('kind', models.CharField(choices=[('law_search', '법령 검색'), ('law_detail', '법령 상세'), ('case_search', '판례 검색')], max_length=16)),
+                ('query_key', models.CharField(max_length=40)),
+                ('params_json', models.JSONField(blank=True, default=dict)),
+                ('result_ids_json', models.JSONField(blank=True, default=dict)),
+                ('fetched_at', models.DateTimeField(db_index=True)),
+                ('last_used_at', models.DateTimeField()),
+                ('law', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='queries', to='teacher_law.lawcorpuslaw')),
+            ],
+            options={
+                'ordering': ('-last_used_at', '-id'),
+                'constraints': [models.UniqueConstraint(fields=('provider', 'kind', 'query_key'), name='teacher_law_corpus_query_unique')],
+            },
+        ),
+    ]
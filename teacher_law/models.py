@@ -137,3 +137,96 @@ class LegalQueryAudit(models.Model):
 
     def __str__(self):
         return f"{self.topic or 'unknown'}:{self.created_at:%Y-%m-%d %H:%M:%S}"
+
+
+class LawCorpusLaw(models.Model):
+    provider = models.CharField(max_length=16)
+    law_id = models.CharField(max_length=32)
+    mst = models.CharField(max_length=32, blank=True, default="")
+    law_name = models.CharField(max_length=255)
+    law_type = models.CharField(max_length=60, blank=True, default="")
+    ministry = models.CharField(max_length=120, blank=True, default="")
+    promulgation_date = models.CharField(max_length=16, blank=True, default="")
+    enforcement_date = models.CharField(max_length=16, blank=True, default="")
+    detail_link = models.CharField(max_length=500, blank=True, default="")
+    raw_json = models.JSONField(default=dict, blank=True)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("law_name", "id")
+        constraints = [
+            models.UniqueConstraint(fields=["provider", "law_id"], name="teacher_law_corpus_law_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.law_name} ({self.revision or '-'})"
+
+    @property
+    def revision(self):
+        return self.enforcement_date or self.promulgation_date
+
+
+class LawCorpusArticle(models.Model):
+    law = models.ForeignKey(LawCorpusLaw, on_delete=models.CASCADE, related_name="articles")
+    article_key = models.CharField(max_length=140)
+    article_label = models.CharField(max_length=120, blank=True, default="")
+    article_text = models.TextField()
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("law_id", "id")
+        constraints = [
+            models.UniqueConstraint(fields=["law", "article_key"], name="teacher_law_corpus_article_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.law_id}:{self.article_label or self.article_key}"
+
+
+class LawCorpusCase(models.Model):
+    provider = models.CharField(max_length=16)
+    case_key = models.CharField(max_length=140)
+    case_number = models.CharField(max_length=120, blank=True, default="")
+    law_id = models.CharField(max_length=32, blank=True, default="")
+    data_json = models.JSONField(default=dict, blank=True)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(fields=["provider", "case_key"], name="teacher_law_corpus_case_unique"),
+        ]
+
+    def __str__(self):
+        return self.case_number or self.case_key
+
+
+class LawCorpusQuery(models.Model):
+    class Kind(models.TextChoices):
+        LAW_SEARCH = "law_search", "법령 검색"
+        LAW_DETAIL = "law_detail", "법령 상세"
+        CASE_SEARCH = "case_search", "판례 검색"
+
+    provider = models.CharField(max_length=16)
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    query_key = models.CharField(max_length=40)
+    params_json = models.JSONField(default=dict, blank=True)
+    law = models.ForeignKey(
+        LawCorpusLaw,
+        on_delete=models.CASCADE,
+        related_name="queries",
+        null=True,
+        blank=True,
+    )
+    result_ids_json = models.JSONField(default=dict, blank=True)
+    fetched_at = models.DateTimeField(db_index=True)
+    last_used_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("-last_used_at", "-id")
+        constraints = [
+            models.UniqueConstraint(fields=["provider", "kind", "query_key"], name="teacher_law_corpus_query_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.provider}:{self.kind}:{self.query_key}"
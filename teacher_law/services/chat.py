@@ -3,10 +3,12 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from time import perf_counter
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connections
 from django.utils import timezone
 
 from teacher_law.models import LegalChatSession
@@ -19,6 +21,7 @@ from .law_api import (
     get_law_details,
     get_law_provider,
     is_configured as is_law_api_configured,
+    law_request_deadline,
     rank_case_matches,
     rank_search_results,
     resolve_law_by_name,
@@ -367,27 +370,44 @@ def answer_legal_question(
     law_query_hint = profile.get("law_query_hint") or _build_law_query_hint(profile)
     resolved_laws = []
 
-    for law_name in profile.get("law_allowlist") or []:
-        _ensure_total_timeout(started, total_timeout_seconds)
-        search_attempt_count += 1
-        resolved = resolve_law_by_name(law_name)
+    law_names = list(profile.get("law_allowlist") or [])
+    search_attempt_count += len(law_names)
+    for resolved in _raise_first_error(
+        _fetch_concurrently(
+            [(resolve_law_by_name, (law_name,), {}) for law_name in law_names],
+            started=started,
+            total_timeout_seconds=total_timeout_seconds,
+        )
+    ):
         if not resolved:
             continue
         search_result_count += 1
         resolved_laws.append(resolved)
 
-    ranked_laws = rank_search_results(_dedupe_search_results(resolved_laws), profile)
-
-    for ranked in ranked_laws[:detail_limit]:
-        _ensure_total_timeout(started, total_timeout_seconds)
-        detail_fetch_count += 1
-        detail = get_law_details(
-            law_id=ranked.get("law_id") or "",
-            mst=ranked.get("mst") or "",
-            detail_link=ranked.get("detail_link") or "",
-            query_hint=law_query_hint,
-            law_name=ranked.get("law_name") or "",
+    ranked_laws = rank_search_results(_dedupe_search_results(resolved_laws), profile)[:detail_limit]
+    detail_fetch_count += len(ranked_laws)
+    details = _raise_first_error(
+        _fetch_concurrently(
+            [
+                (
+                    get_law_details,
+                    (),
+                    {
+                        "law_id": ranked.get("law_id") or "",
+                        "mst": ranked.get("mst") or "",
+                        "detail_link": ranked.get("detail_link") or "",
+                        "query_hint": law_query_hint,
+                        "law_name": ranked.get("law_name") or "",
+                    },
+                )
+                for ranked in ranked_laws
+            ],
+            started=started,
+            total_timeout_seconds=total_timeout_seconds,
         )
+    )
+
+    for ranked, detail in zip(ranked_laws, details):
         if not _is_allowed_law_detail(detail, profile):
             logger.warning(
                 "[TeacherLaw] skipped unexpected law detail law_name=%s allowlist=%s",
@@ -429,15 +449,22 @@ def answer_legal_question(
             article_ref=first_article_ref,
         )
         has_visible_case_match = any(match.get("confidence") in {"high", "medium"} for match in ranked_case_matches)
-        if not has_visible_case_match:
-            for query in case_queries:
-                _ensure_total_timeout(started, total_timeout_seconds)
-                search_attempt_count += 1
-                try:
-                    case_results = search_cases(query, law_id=first_law_id, article=first_article_ref, display=2)
-                except (LawApiError, LawApiTimeoutError) as exc:
-                    logger.warning("[TeacherLaw] case search skipped: %s", exc)
+        if not has_visible_case_match and case_queries:
+            search_attempt_count += len(case_queries)
+            case_fetches = _fetch_concurrently(
+                [
+                    (search_cases, (query,), {"law_id": first_law_id, "article": first_article_ref, "display": 2})
+                    for query in case_queries
+                ],
+                started=started,
+                total_timeout_seconds=total_timeout_seconds,
+            )
+            for case_results in case_fetches:
+                if isinstance(case_results, (LawApiError, LawApiTimeoutError)):
+                    logger.warning("[TeacherLaw] case search skipped: %s", case_results)
                     continue
+                if isinstance(case_results, Exception):
+                    raise case_results
                 search_result_count += len(case_results)
                 if not case_results:
                     continue
@@ -575,6 +602,32 @@ def answer_legal_question(
     return {"status": "ok", "profile": profile, "payload": payload, "audit": audit}
 
 
+def warm_quick_question_sources() -> int:
+    """빠른 질문 프리셋이 쓰는 법령 검색·상세 조회를 미리 불러와 코퍼스를 채우고, 조회한 법령 수를 돌려줍니다."""
+    detail_limit = int(getattr(settings, "TEACHER_LAW_DETAIL_FETCH_LIMIT", 3))
+    warmed = 0
+    for preset in get_quick_question_presets():
+        profile = build_query_profile(
+            preset["question"],
+            incident_type=preset.get("incident_type") or "",
+            legal_goal=preset.get("legal_goal") or "",
+            scene=preset.get("scene") or "",
+            counterpart=preset.get("counterpart") or "",
+        )
+        law_query_hint = profile.get("law_query_hint") or _build_law_query_hint(profile)
+        resolved_laws = [resolved for resolved in (resolve_law_by_name(name) for name in profile.get("law_allowlist") or []) if resolved]
+        for ranked in rank_search_results(_dedupe_search_results(resolved_laws), profile)[:detail_limit]:
+            get_law_details(
+                law_id=ranked.get("law_id") or "",
+                mst=ranked.get("mst") or "",
+                detail_link=ranked.get("detail_link") or "",
+                query_hint=law_query_hint,
+                law_name=ranked.get("law_name") or "",
+            )
+            warmed += 1
+    return warmed
+
+
 def _elapsed_ms(started: float) -> int:
     return int((perf_counter() - started) * 1000)
 
@@ -584,6 +637,60 @@ def _ensure_total_timeout(started: float, limit_seconds: int) -> None:
         raise TeacherLawTimeoutError("법령 확인 시간이 길어져 잠시 후 다시 시도해 주세요.")
 
 
+def _run_fetch(func, args, kwargs, deadline):
+    try:
+        # 제한 시간이 지나면 HTTP 요청도 끝나도록 작업 스레드에 마감 시각을 넘깁니다.
+        with law_request_deadline(deadline):
+            return func(*args, **kwargs)
+    finally:
+        # 캐시 백엔드가 DB일 수 있으므로 작업 스레드의 연결은 바로 정리합니다.
+        connections.close_all()
+
+
+def _fetch_concurrently(calls: list[tuple], *, started: float, total_timeout_seconds: int) -> list:
+    """
+    ``(func, args, kwargs)`` 호출을 동시에 실행하고 결과를 호출 순서대로 돌려줍니다.
+
+    실패한 호출 자리에는 예외 객체가 들어가며, 호출별 제한 시간
+    (TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS)을 넘기면 ``LawApiTimeoutError``가 들어갑니다.
+    전체 제한 시간이 끝나면 남은 호출을 취소하고 ``TeacherLawTimeoutError``를 올립니다.
+
+    실행 중인 스레드는 취소할 수 없으므로 요청마다 따로 만든 풀을 쓰고, 법령 API 요청의
+    HTTP 제한 시간을 마감 시각까지로 줄여 늦은 호출도 곧 끝나게 합니다.
+    """
+    _ensure_total_timeout(started, total_timeout_seconds)
+    if not calls:
+        return []
+    call_timeout_seconds = float(getattr(settings, "TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS", 8))
+    submitted_at = perf_counter()
+    total_deadline = started + total_timeout_seconds
+    call_deadline = min(submitted_at + call_timeout_seconds, total_deadline)
+    max_workers = max(1, int(getattr(settings, "TEACHER_LAW_FETCH_WORKERS", 6)))
+    executor = ThreadPoolExecutor(max_workers=min(len(calls), max_workers), thread_name_prefix="teacher-law-fetch")
+    try:
+        futures = [executor.submit(_run_fetch, func, args, kwargs, call_deadline) for func, args, kwargs in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=max(0.0, call_deadline - perf_counter())))
+            except FutureTimeoutError:
+                if perf_counter() >= total_deadline:
+                    raise TeacherLawTimeoutError("법령 확인 시간이 길어져 잠시 후 다시 시도해 주세요.")
+                results.append(LawApiTimeoutError("법령 데이터 응답이 지연되고 있습니다."))
+            except Exception as exc:
+                results.append(exc)
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _raise_first_error(results: list) -> list:
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
 def _build_law_query_hint(profile: dict) -> str:
     hint_queries = [compact_text(item) for item in profile.get("hint_queries") or [] if compact_text(item)]
     if hint_queries:
@@ -0,0 +1,291 @@
+"""
+Durable local corpus behind the law API lookups.
+
+``search_laws``, ``get_law_details`` and ``search_cases`` read through this
+module. Law metadata (keyed by provider + law ID, with MST and revision dates),
+article text and case summaries are stored once in their own tables, and each
+upstream request is remembered as a ``LawCorpusQuery`` that points at the rows
+it returned. A repeated question about the usual school-related laws is then
+answered from the database without an upstream call.
+
+- Rows younger than ``TEACHER_LAW_CORPUS_REFRESH_SECONDS`` are served as is.
+- Older rows are still served, and the same lookup is re-fetched on a
+  background thread. The ``refresh_teacher_law_corpus`` command does the same
+  on a schedule.
+- Past ``TEACHER_LAW_CORPUS_MAX_AGE_SECONDS`` a lookup goes upstream first. If
+  that fails, the old rows are used as a fallback.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.utils import timezone
+
+from teacher_law.models import LawCorpusArticle, LawCorpusCase, LawCorpusLaw, LawCorpusQuery
+
+
+logger = logging.getLogger(__name__)
+
+KIND_LAW_SEARCH = LawCorpusQuery.Kind.LAW_SEARCH
+KIND_LAW_DETAIL = LawCorpusQuery.Kind.LAW_DETAIL
+KIND_CASE_SEARCH = LawCorpusQuery.Kind.CASE_SEARCH
+LAST_USED_TOUCH_SECONDS = 60 * 60
+LAW_FIELDS = (
+    "law_name",
+    "law_id",
+    "mst",
+    "law_type",
+    "ministry",
+    "promulgation_date",
+    "enforcement_date",
+    "detail_link",
+)
+
+_refresh_lock = threading.Lock()
+_refresh_pending = set()
+_refresh_executor = None
+
+
+def is_enabled() -> bool:
+    return bool(getattr(settings, "TEACHER_LAW_CORPUS_ENABLED", False))
+
+
+def _refresh_age() -> timedelta:
+    return timedelta(seconds=int(getattr(settings, "TEACHER_LAW_CORPUS_REFRESH_SECONDS", 86400)))
+
+
+def _max_age() -> timedelta:
+    return timedelta(seconds=int(getattr(settings, "TEACHER_LAW_CORPUS_MAX_AGE_SECONDS", 30 * 86400)))
+
+
+def build_query_key(params: dict) -> str:
+    encoded = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _text_key(value: str) -> str:
+    return "#" + hashlib.sha1(str(value or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _law_values(item: dict) -> dict:
+    return {field: str(item.get(field) or "")[: LawCorpusLaw._meta.get_field(field).max_length] for field in LAW_FIELDS}
+
+
+def _law_result(law: LawCorpusLaw) -> dict:
+    result = {field: getattr(law, field) for field in LAW_FIELDS}
+    result["provider"] = law.provider
+    return result
+
+
+def _upsert_laws(provider: str, items: list[dict], now) -> dict[str, LawCorpusLaw]:
+    """Store law metadata and return the rows keyed by law ID."""
+    by_law_id = {}
+    for item in items:
+        values = _law_values(item)
+        if values["law_id"]:
+            by_law_id[values["law_id"]] = (values, item.get("raw") if isinstance(item.get("raw"), dict) else None)
+    if not by_law_id:
+        return {}
+    existing = {law.law_id: law for law in LawCorpusLaw.objects.filter(provider=provider, law_id__in=list(by_law_id))}
+    for law_id, (values, raw) in by_law_id.items():
+        law = existing.get(law_id) or LawCorpusLaw(provider=provider, law_id=law_id)
+        for field, value in values.items():
+            # A detail payload can lack fields a search hit had (and vice versa).
+            if value or not getattr(law, field, ""):
+                setattr(law, field, value)
+        if raw is not None:
+            law.raw_json = raw
+        law.fetched_at = now
+        law.save()
+        existing[law_id] = law
+    return existing
+
+
+def _upsert_cases(provider: str, cases: list[dict], now) -> list[int]:
+    ids = []
+    for case in cases:
+        case_key = str(case.get("case_id") or case.get("case_number") or _text_key(case.get("quote")))[:140]
+        row, _created = LawCorpusCase.objects.update_or_create(
+            provider=provider,
+            case_key=case_key,
+            defaults={
+                "case_number": str(case.get("case_number") or "")[:120],
+                "law_id": str(case.get("law_id") or "")[:32],
+                "data_json": case,
+                "fetched_at": now,
+            },
+        )
+        ids.append(row.id)
+    return ids
+
+
+def _upsert_articles(law: LawCorpusLaw, articles: list[dict], now) -> list[int]:
+    ids = []
+    for article in articles:
+        label = str(article.get("article_label") or "")
+        text = str(article.get("article_text") or "")
+        row, _created = LawCorpusArticle.objects.update_or_create(
+            law=law,
+            article_key=(label or _text_key(text))[:140],
+            defaults={"article_label": label[:120], "article_text": text, "fetched_at": now},
+        )
+        ids.append(row.id)
+    return ids
+
+
+@transaction.atomic
+def _store(kind: str, provider: str, key: str, params: dict, result, now) -> None:
+    law = None
+    if kind == KIND_LAW_SEARCH:
+        laws = _upsert_laws(provider, result, now)
+        if len(laws) != len({_law_values(item)["law_id"] for item in result}):
+            return
+        result_ids = {"laws": [laws[_law_values(item)["law_id"]].id for item in result]}
+    elif kind == KIND_LAW_DETAIL:
+        law = _upsert_laws(provider, [result], now).get(_law_values(result)["law_id"])
+        if law is None:
+            return
+        result_ids = {
+            "articles": _upsert_articles(law, result.get("articles") or [], now),
+            "cases": _upsert_cases(provider, result.get("related_cases") or [], now),
+        }
+    else:
+        result_ids = {"cases": _upsert_cases(provider, result, now)}
+    LawCorpusQuery.objects.update_or_create(
+        provider=provider,
+        kind=kind,
+        query_key=key,
+        defaults={
+            "params_json": params,
+            "law": law,
+            "result_ids_json": result_ids,
+            "fetched_at": now,
+            "last_used_at": now,
+        },
+    )
+
+
+def _save(kind: str, provider: str, key: str, params: dict, result, now) -> None:
+    try:
+        _store(kind, provider, key, params, result, now)
+    except IntegrityError:
+        # Another worker stored the same lookup first; its rows are just as good.
+        logger.info("[TeacherLaw] corpus store raced kind=%s key=%s", kind, key)
+
+
+def _ordered(model, ids: list[int]):
+    rows = model.objects.in_bulk(ids)
+    if len(rows) != len(set(ids)):
+        return None
+    return [rows[row_id] for row_id in ids]
+
+
+def _load(entry: LawCorpusQuery):
+    """Rebuild the API-shaped result for ``entry``; ``None`` if any row it points at is gone."""
+    result_ids = entry.result_ids_json or {}
+    if entry.kind == KIND_LAW_SEARCH:
+        laws = _ordered(LawCorpusLaw, result_ids.get("laws") or [])
+        if laws is None:
+            return None
+        return [dict(_law_result(law), raw=law.raw_json) for law in laws]
+    if entry.kind == KIND_LAW_DETAIL:
+        articles = _ordered(LawCorpusArticle, result_ids.get("articles") or [])
+        cases = _ordered(LawCorpusCase, result_ids.get("cases") or [])
+        if entry.law is None or articles is None or cases is None:
+            return None
+        return dict(
+            _law_result(entry.law),
+            articles=[{"article_label": item.article_label, "article_text": item.article_text} for item in articles],
+            related_cases=[case.data_json for case in cases],
+        )
+    cases = _ordered(LawCorpusCase, result_ids.get("cases") or [])
+    return None if cases is None else [case.data_json for case in cases]
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="teacher-law-corpus")
+    return _refresh_executor
+
+
+def _refresh_in_background(kind: str, provider: str, key: str, params: dict, fetch) -> None:
+    if not getattr(settings, "TEACHER_LAW_CORPUS_BACKGROUND_REFRESH", True):
+        return
+    token = (provider, kind, key)
+    with _refresh_lock:
+        if token in _refresh_pending:
+            return
+        _refresh_pending.add(token)
+        executor = _get_refresh_executor()
+
+    def run():
+        try:
+            refresh(kind, provider, params, fetch)
+        except Exception:
+            logger.warning("[TeacherLaw] corpus background refresh failed kind=%s key=%s", kind, key, exc_info=True)
+        finally:
+            connections.close_all()
+            with _refresh_lock:
+                _refresh_pending.discard(token)
+
+    executor.submit(run)
+
+
+def refresh(kind: str, provider: str, params: dict, fetch):
+    """Fetch upstream now and store the result; returns the fresh result."""
+    result = fetch()
+    _save(kind, provider, build_query_key(params), params, result, timezone.now())
+    return result
+
+
+def read_through(kind: str, provider: str, params: dict, fetch):
+    """
+    Return the stored result for ``params`` or call ``fetch()`` and store it.
+
+    ``params`` must hold every argument ``fetch`` depends on; it is the corpus
+    key and is kept so scheduled refreshes can repeat the lookup.
+    """
+    if not is_enabled():
+        return fetch()
+
+    key = build_query_key(params)
+    now = timezone.now()
+    entry = LawCorpusQuery.objects.select_related("law").filter(provider=provider, kind=kind, query_key=key).first()
+    stored = _load(entry) if entry else None
+    if stored is not None and entry.fetched_at >= now - _max_age():
+        if entry.fetched_at < now - _refresh_age():
+            _refresh_in_background(kind, provider, key, params, fetch)
+        if entry.last_used_at < now - timedelta(seconds=LAST_USED_TOUCH_SECONDS):
+            LawCorpusQuery.objects.filter(id=entry.id).update(last_used_at=now)
+        return stored
+
+    try:
+        result = fetch()
+    except Exception:
+        if stored is None:
+            raise
+        logger.warning("[TeacherLaw] upstream failed, serving expired corpus entry kind=%s key=%s", kind, key, exc_info=True)
+        return stored
+    _save(kind, provider, key, params, result, now)
+    return result
+
+
+def stale_queries(provider: str, *, limit: int):
+    cutoff = timezone.now() - _refresh_age()
+    return list(LawCorpusQuery.objects.filter(provider=provider, fetched_at__lt=cutoff).order_by("-last_used_at", "id")[:limit])
+
+
+def prune_unused(*, now=None) -> int:
+    """Drop lookups nobody has used within the max age; stored laws stay for other lookups."""
+    cutoff = (now or timezone.now()) - _max_age()
+    deleted, _detail = LawCorpusQuery.objects.filter(last_used_at__lt=cutoff).delete()
+    return deleted
@@ -3,13 +3,18 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+from contextlib import contextmanager
 from datetime import timedelta
+from time import perf_counter
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 
+from . import corpus
 from .query_normalizer import (
     ACTOR_KEYWORDS,
     CONSENT_KEYWORDS,
@@ -55,6 +60,11 @@ CASE_STAGE_LABELS = {
 }
 
 
+_session_lock = threading.Lock()
+_session = None
+_request_deadline = threading.local()
+
+
 class LawApiError(Exception):
     pass
 
@@ -138,6 +148,42 @@ def _candidate_base_urls() -> list[str]:
     return candidates
 
 
+def get_http_session() -> requests.Session:
+    """Process-wide session so parallel law lookups reuse pooled keep-alive connections."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = max(1, int(getattr(settings, "TEACHER_LAW_FETCH_WORKERS", 6)))
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+@contextmanager
+def law_request_deadline(deadline: float | None):
+    """Clamp law API HTTP timeouts in this thread so no request outlives ``deadline`` (a ``perf_counter`` value)."""
+    previous = getattr(_request_deadline, "value", None)
+    _request_deadline.value = deadline
+    try:
+        yield
+    finally:
+        _request_deadline.value = previous
+
+
+def _bounded_timeout(timeout_seconds: float) -> float:
+    deadline = getattr(_request_deadline, "value", None)
+    if deadline is None:
+        return timeout_seconds
+    remaining = deadline - perf_counter()
+    if remaining <= 0:
+        raise LawApiTimeoutError("법령 데이터 응답이 지연되고 있습니다.")
+    return min(timeout_seconds, remaining)
+
+
 def _request_headers() -> dict[str, str]:
     return {
         "Accept": "application/json, text/plain, */*",
@@ -176,11 +222,11 @@ def _request_open_law(endpoint: str, *, params: dict, timeout_seconds: int):
         url = f"{base_url}/{endpoint}"
         attempted_urls.append(url)
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 url,
                 params=request_params,
                 headers=_request_headers(),
-                timeout=timeout_seconds,
+                timeout=_bounded_timeout(timeout_seconds),
             )
         except requests.Timeout as exc:
             last_error = exc
@@ -216,11 +262,11 @@ def _request_open_law(endpoint: str, *, params: dict, timeout_seconds: int):
 def _request_beopmang(path: str, *, params: dict, timeout_seconds: int) -> dict:
     url = f"{get_beopmang_base_url()}/{path.lstrip('/')}"
     try:
-        response = requests.get(
+        response = get_http_session().get(
             url,
             params=params,
             headers=_request_headers(),
-            timeout=timeout_seconds,
+            timeout=_bounded_timeout(timeout_seconds),
         )
     except requests.Timeout as exc:
         raise LawApiTimeoutError("법령 데이터 응답이 지연되고 있습니다.") from exc
@@ -385,14 +431,24 @@ def _search_beopmang(query: str, *, display: int | None = None) -> list[dict]:
     return results[:limit]
 
 
-def search_laws(query: str, *, search: int = 1, display: int | None = None) -> list[dict]:
-    provider = get_law_provider()
+def _fetch_laws(provider: str, *, query: str, search: int = 1, display: int | None = None) -> list[dict]:
     logger.info("[TeacherLaw] law search provider=%s query=%s", provider, query)
     if provider == "open_law":
         return _search_open_law(query, search=search, display=display)
     return _search_beopmang(query, display=display)
 
 
+def search_laws(query: str, *, search: int = 1, display: int | None = None) -> list[dict]:
+    provider = get_law_provider()
+    params = {"query": query, "search": search, "display": display}
+    return corpus.read_through(
+        corpus.KIND_LAW_SEARCH,
+        provider,
+        params,
+        lambda: _fetch_laws(provider, **params),
+    )
+
+
 def _rank_exact_law_matches(results: list[dict], *, target_name: str) -> list[dict]:
     target_compact = compact_text(target_name)
     target_key = _normalize_law_name_key(target_name)
@@ -612,6 +668,33 @@ def get_law_details(
     law_name: str = "",
 ) -> dict:
     provider = get_law_provider()
+    if provider == "open_law":
+        # 국가법령정보 상세는 검색어와 무관하게 법령 전체를 돌려주므로 식별자만으로 저장합니다.
+        query_hint = ""
+    params = {
+        "law_id": law_id,
+        "mst": mst,
+        "detail_link": detail_link,
+        "query_hint": compact_text(query_hint),
+        "law_name": law_name,
+    }
+    return corpus.read_through(
+        corpus.KIND_LAW_DETAIL,
+        provider,
+        params,
+        lambda: _fetch_law_details(provider, **params),
+    )
+
+
+def _fetch_law_details(
+    provider: str,
+    *,
+    law_id: str = "",
+    mst: str = "",
+    detail_link: str = "",
+    query_hint: str = "",
+    law_name: str = "",
+) -> dict:
     logger.info(
         "[TeacherLaw] law detail provider=%s law_id=%s mst=%s",
         provider,
@@ -666,12 +749,36 @@ def _search_beopmang_cases(query: str, *, law_id: str = "", article: str = "", d
     return []
 
 
+def _fetch_cases(provider: str, *, query: str, law_id: str = "", article: str = "", display: int | None = None) -> list[dict]:
+    logger.info("[TeacherLaw] case search provider=%s query=%s", provider, query)
+    return _search_beopmang_cases(query, law_id=law_id, article=article, display=display)
+
+
 def search_cases(query: str, *, law_id: str = "", article: str = "", display: int | None = None) -> list[dict]:
     provider = get_law_provider()
-    logger.info("[TeacherLaw] case search provider=%s query=%s", provider, query)
     if provider == "open_law":
         return []
-    return _search_beopmang_cases(query, law_id=law_id, article=article, display=display)
+    params = {"query": query, "law_id": law_id, "article": article, "display": display}
+    return corpus.read_through(
+        corpus.KIND_CASE_SEARCH,
+        provider,
+        params,
+        lambda: _fetch_cases(provider, **params),
+    )
+
+
+CORPUS_FETCHERS = {
+    corpus.KIND_LAW_SEARCH: _fetch_laws,
+    corpus.KIND_LAW_DETAIL: _fetch_law_details,
+    corpus.KIND_CASE_SEARCH: _fetch_cases,
+}
+
+
+def refresh_corpus_query(entry) -> None:
+    """Repeat the upstream lookup recorded in a ``LawCorpusQuery`` and store the fresh result."""
+    fetcher = CORPUS_FETCHERS[entry.kind]
+    params = dict(entry.params_json or {})
+    corpus.refresh(entry.kind, entry.provider, params, lambda: fetcher(entry.provider, **params))
 
 
 def rank_search_results(results: list[dict], profile: dict) -> list[dict]:
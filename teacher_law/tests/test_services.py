@@ -1,10 +1,16 @@
+import threading
+from time import perf_counter, sleep
 from unittest.mock import Mock, patch
 
+from datetime import timedelta
+
 from django.core.cache import cache
 from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
 
+from teacher_law.models import LawCorpusArticle, LawCorpusLaw, LawCorpusQuery
 from teacher_law.services import law_api
-from teacher_law.services.chat import answer_legal_question
+from teacher_law.services.chat import TeacherLawTimeoutError, _fetch_concurrently, answer_legal_question
 from teacher_law.services.llm_client import _extract_json_payload, _truncate_prompt_quote
 from teacher_law.services.law_api import LawApiError, LawApiTimeoutError, LawApiVerificationError
 from teacher_law.services.query_normalizer import (
@@ -138,7 +144,7 @@ class OpenLawRequestTests(SimpleTestCase):
                 raise law_api.requests.ConnectionError("connection reset by peer")
             return success_response
 
-        with patch("teacher_law.services.law_api.requests.get", side_effect=fake_get) as request_mock:
+        with patch("teacher_law.services.law_api.requests.Session.get", side_effect=fake_get) as request_mock:
             payload = law_api._request("lawSearch.do", params={"target": "law"}, timeout_seconds=4)
 
         self.assertEqual(payload["result"], "success")
@@ -155,7 +161,7 @@ class OpenLawRequestTests(SimpleTestCase):
             "msg": "OPEN API 호출 시 사용자 검증을 위하여 정확한 서버장비의 IP주소 및 도메인주소를 등록해 주세요.",
         }
 
-        with patch("teacher_law.services.law_api.requests.get", return_value=verification_response):
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=verification_response):
             with self.assertRaises(LawApiVerificationError) as caught:
                 law_api._request("lawSearch.do", params={"target": "law"}, timeout_seconds=4)
 
@@ -186,7 +192,7 @@ class BeopmangLawApiTests(SimpleTestCase):
             },
         }
 
-        with patch("teacher_law.services.law_api.requests.get", return_value=response) as request_mock:
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response) as request_mock:
             results = law_api.search_laws("민법")
 
         self.assertEqual(len(results), 1)
@@ -215,7 +221,7 @@ class BeopmangLawApiTests(SimpleTestCase):
             },
         }
 
-        with patch("teacher_law.services.law_api.requests.get", return_value=response) as request_mock:
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response) as request_mock:
             details = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
 
         self.assertEqual(details["law_name"], "민법")
@@ -253,7 +259,7 @@ class BeopmangLawApiTests(SimpleTestCase):
         }
 
         with patch(
-            "teacher_law.services.law_api.requests.get",
+            "teacher_law.services.law_api.requests.Session.get",
             side_effect=[grep_response, overview_response],
         ) as request_mock:
             details = law_api.get_law_details(law_id="001706", query_hint="손해배상")
@@ -289,16 +295,31 @@ class BeopmangLawApiTests(SimpleTestCase):
         response = Mock(status_code=429)
         response.json.return_value = {"detail": "rate limited"}
 
-        with patch("teacher_law.services.law_api.requests.get", return_value=response):
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response):
             with self.assertRaises(LawApiError):
                 law_api.search_laws("민법")
 
     @override_settings(TEACHER_LAW_PROVIDER="beopmang")
     def test_beopmang_timeout_maps_to_timeout_error(self):
-        with patch("teacher_law.services.law_api.requests.get", side_effect=law_api.requests.Timeout("timeout")):
+        with patch("teacher_law.services.law_api.requests.Session.get", side_effect=law_api.requests.Timeout("timeout")):
             with self.assertRaises(LawApiTimeoutError):
                 law_api.search_laws("민법")
 
+    @override_settings(TEACHER_LAW_PROVIDER="beopmang", TEACHER_LAW_SEARCH_TIMEOUT_SECONDS=4)
+    def test_request_deadline_clamps_http_timeout(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"success": True, "data": {"results": []}}
+
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response) as request_mock:
+            with law_api.law_request_deadline(perf_counter() + 0.5):
+                law_api.search_laws("민법")
+            with law_api.law_request_deadline(perf_counter() - 1):
+                with self.assertRaises(LawApiTimeoutError):
+                    law_api.search_laws("형법")
+
+        self.assertEqual(request_mock.call_count, 1)
+        self.assertLessEqual(request_mock.call_args.kwargs["timeout"], 0.5)
+
     @override_settings(TEACHER_LAW_PROVIDER="beopmang")
     def test_search_cases_maps_beopmang_results(self):
         response = Mock(status_code=200)
@@ -317,7 +338,7 @@ class BeopmangLawApiTests(SimpleTestCase):
             },
         }
 
-        with patch("teacher_law.services.law_api.requests.get", return_value=response) as request_mock:
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response) as request_mock:
             results = law_api.search_cases("학교안전사고 손해배상", law_id="009620", article="750")
 
         self.assertEqual(len(results), 1)
@@ -976,3 +997,233 @@ class TeacherLawCachingTests(TestCase):
         self.assertEqual(result["status"], "ok")
         self.assertIsNone(result["payload"]["representative_case"])
         self.assertIn("관련 판례는 더 확인 필요", result["payload"]["precedent_note"])
+
+
+class FakeLawApi:
+    """Local stand-in for the law API that answers every lookup after a fixed latency."""
+
+    def __init__(self, *, latency, hang_law_names=()):
+        self.latency = latency
+        self.hang_law_names = set(hang_law_names)
+        self.release = threading.Event()
+
+    def _wait(self, law_name):
+        if law_name in self.hang_law_names:
+            self.release.wait(5)
+        else:
+            sleep(self.latency)
+
+    def resolve_law_by_name(self, law_name):
+        self._wait(law_name)
+        return {"law_name": law_name, "law_id": f"id-{law_name}", "mst": "", "detail_link": "", "provider": "beopmang"}
+
+    def get_law_details(self, *, law_id="", mst="", detail_link="", query_hint="", law_name=""):
+        self._wait(law_name)
+        return {"law_name": law_name, "law_id": law_id, "mst": "", "detail_link": "", "provider": "beopmang", "articles": [], "related_cases": []}
+
+
+@override_settings(
+    TEACHER_LAW_ENABLED=True,
+    TEACHER_LAW_PROVIDER="beopmang",
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "teacher-law-fetch-tests"}},
+)
+class TeacherLawParallelFetchTests(TestCase):
+    question = {
+        "question": "학생 사진을 올리려면 동의가 필요한가요?",
+        "incident_type": "privacy_photo",
+        "legal_goal": "posting_allowed",
+        "counterpart": "student",
+    }
+    llm_answer = {
+        "summary": "개인정보 보호법상 동의 기준을 먼저 확인해야 합니다.",
+        "action_items": ["사실관계를 기록합니다."],
+        "citations": ["law-1"],
+        "risk_level": "medium",
+        "needs_human_help": False,
+        "disclaimer": "일반적 법령 정보 안내이며 개별 사건의 법률 자문은 아닙니다.",
+        "scope_supported": True,
+    }
+
+    def tearDown(self):
+        cache.clear()
+
+    def _citation(self, detail, profile, limit=2):
+        return [
+            {
+                "citation_id": "law-1",
+                "source_type": "law",
+                "title": detail["law_name"],
+                "law_name": detail["law_name"],
+                "law_id": detail["law_id"],
+                "mst": "",
+                "reference_label": "제1조",
+                "article_label": "제1조",
+                "case_number": "",
+                "quote": "법령 내용",
+                "source_url": "",
+                "provider": "beopmang",
+                "fetched_at": "2026-04-05T00:00:00+09:00",
+            }
+        ]
+
+    def _answer(self, fake):
+        with (
+            patch("teacher_law.services.chat.is_llm_configured", return_value=True),
+            patch("teacher_law.services.chat.resolve_law_by_name", side_effect=fake.resolve_law_by_name),
+            patch("teacher_law.services.chat.get_law_details", side_effect=fake.get_law_details),
+            patch("teacher_law.services.chat.select_relevant_citations", side_effect=self._citation),
+            patch("teacher_law.services.chat.search_cases", return_value=[]),
+            patch("teacher_law.services.chat.generate_legal_answer", return_value=self.llm_answer),
+        ):
+            return answer_legal_question(**self.question)
+
+    def test_fetch_concurrently_keeps_call_order_and_isolates_failures(self):
+        def lookup(value, delay):
+            sleep(delay)
+            if value == "broken":
+                raise LawApiError("upstream failed")
+            return value
+
+        results = _fetch_concurrently(
+            [(lookup, ("slow", 0.2), {}), (lookup, ("broken", 0.0), {}), (lookup, ("fast", 0.0), {})],
+            started=perf_counter(),
+            total_timeout_seconds=5,
+        )
+
+        self.assertEqual(results[0], "slow")
+        self.assertIsInstance(results[1], LawApiError)
+        self.assertEqual(results[2], "fast")
+
+    def test_law_lookups_run_in_parallel(self):
+        profile = build_query_profile(self.question["question"], incident_type="privacy_photo", legal_goal="posting_allowed", counterpart="student")
+        law_names = profile["law_allowlist"]
+        case_queries = list(profile.get("case_queries") or [])[:2]
+        fake = FakeLawApi(latency=0.3)
+
+        started = perf_counter()
+        result = self._answer(fake)
+        elapsed = perf_counter() - started
+
+        sequential = 0.3 * (len(law_names) + min(3, len(law_names)))
+        self.assertEqual(result["status"], "ok")
+        # Case-law lookups run once citations exist and count as search attempts too.
+        self.assertEqual(result["audit"]["search_attempt_count"], len(law_names) + len(case_queries))
+        self.assertLess(elapsed, sequential * 0.75)
+
+    @override_settings(TEACHER_LAW_TOTAL_TIMEOUT_SECONDS=1, TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS=5)
+    def test_total_budget_cancels_slow_lookups(self):
+        law_names = build_query_profile(self.question["question"], incident_type="privacy_photo", legal_goal="posting_allowed", counterpart="student")["law_allowlist"]
+        fake = FakeLawApi(latency=0.0, hang_law_names=law_names[:1])
+        self.addCleanup(fake.release.set)
+
+        started = perf_counter()
+        with self.assertRaises(TeacherLawTimeoutError):
+            self._answer(fake)
+
+        self.assertLess(perf_counter() - started, 3)
+
+    @override_settings(TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS=1)
+    def test_slow_single_lookup_hits_its_own_deadline(self):
+        def hang():
+            sleep(3)
+
+        started = perf_counter()
+        results = _fetch_concurrently([(hang, (), {}), (lambda: "ok", (), {})], started=started, total_timeout_seconds=20)
+
+        self.assertIsInstance(results[0], LawApiTimeoutError)
+        self.assertEqual(results[1], "ok")
+        self.assertLess(perf_counter() - started, 2.5)
+
+
+    @override_settings(TEACHER_LAW_FETCH_WORKERS=1, TEACHER_LAW_FETCH_CALL_TIMEOUT_SECONDS=1)
+    def test_stuck_lookup_does_not_hold_a_worker_for_the_next_request(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        first = _fetch_concurrently([(release.wait, (5,), {})], started=perf_counter(), total_timeout_seconds=20)
+        started = perf_counter()
+        second = _fetch_concurrently([(lambda: "ok", (), {})], started=started, total_timeout_seconds=20)
+
+        self.assertIsInstance(first[0], LawApiTimeoutError)
+        self.assertEqual(second, ["ok"])
+        self.assertLess(perf_counter() - started, 0.5)
+
+@override_settings(
+    TEACHER_LAW_PROVIDER="beopmang",
+    TEACHER_LAW_CORPUS_ENABLED=True,
+    TEACHER_LAW_CORPUS_BACKGROUND_REFRESH=False,
+    TEACHER_LAW_CORPUS_REFRESH_SECONDS=3600,
+    TEACHER_LAW_CORPUS_MAX_AGE_SECONDS=86400,
+)
+class LawCorpusTests(TestCase):
+    def _detail_response(self, text="제750조(불법행위의 내용) 고의 또는 과실로 인한 손해배상 책임이 있다."):
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            "success": True,
+            "data": {
+                "law_id": "001706",
+                "law_name": "민법",
+                "law_type": "법률",
+                "enforcement_date": "2025-01-01",
+                "articles": [{"label": "제750조", "full_text": text}],
+            },
+        }
+        return response
+
+    def test_law_details_are_served_from_corpus_after_first_fetch(self):
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=self._detail_response()) as request_mock:
+            first = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+            second = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+
+        self.assertEqual(request_mock.call_count, 1)
+        self.assertEqual(second, first)
+        law = LawCorpusLaw.objects.get(provider="beopmang", law_id="001706")
+        self.assertEqual(law.revision, "2025-01-01")
+        self.assertEqual(LawCorpusArticle.objects.get(law=law).article_label, "제750조")
+
+    def test_search_laws_reads_through_corpus(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            "success": True,
+            "data": {"results": [{"law_id": "001706", "law_name": "민법", "law_type": "법률"}]},
+        }
+
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=response) as request_mock:
+            first = law_api.search_laws("민법")
+            second = law_api.search_laws("민법")
+
+        self.assertEqual(request_mock.call_count, 1)
+        self.assertEqual([item["law_id"] for item in second], ["001706"])
+        self.assertEqual(second[0]["raw"], first[0]["raw"])
+
+    def test_expired_entry_is_used_when_upstream_fails(self):
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=self._detail_response()):
+            law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+        LawCorpusQuery.objects.update(fetched_at=timezone.now() - timedelta(days=2))
+
+        with patch("teacher_law.services.law_api.requests.Session.get", side_effect=law_api.requests.Timeout("timeout")) as request_mock:
+            details = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+
+        self.assertEqual(request_mock.call_count, 1)
+        self.assertEqual(details["articles"][0]["article_label"], "제750조")
+
+    def test_refresh_updates_stale_lookups(self):
+        with patch("teacher_law.services.law_api.requests.Session.get", return_value=self._detail_response()):
+            law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+        LawCorpusQuery.objects.update(fetched_at=timezone.now() - timedelta(hours=2))
+
+        with patch("teacher_law.services.law_api.requests.Session.get") as request_mock:
+            stale = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+        request_mock.assert_not_called()
+        self.assertIn("고의 또는 과실", stale["articles"][0]["article_text"])
+
+        with patch(
+            "teacher_law.services.law_api.requests.Session.get",
+            return_value=self._detail_response("제750조(불법행위의 내용) 개정된 조문입니다."),
+        ):
+            for entry in law_api.corpus.stale_queries("beopmang", limit=10):
+                law_api.refresh_corpus_query(entry)
+            refreshed = law_api.get_law_details(law_id="001706", query_hint="손해배상", law_name="민법")
+
+        self.assertIn("개정된 조문", refreshed["articles"][0]["article_text"])
+        self.assertEqual(law_api.corpus.stale_queries("beopmang", limit=10), [])
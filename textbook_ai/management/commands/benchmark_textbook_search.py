@@ -0,0 +1,147 @@
+import random
+from statistics import median
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+
+from textbook_ai.models import TextbookChunk, TextbookDocument, TextbookParseArtifact
+from textbook_ai.services import (
+    build_source_label,
+    load_document_search_index,
+    search_document_chunks,
+    store_document_search_index,
+    tokenize_search_query,
+)
+
+VOCABULARY = (
+    "광합성 엽록체 기공 이산화탄소 산소 포도당 증산작용 뿌리 줄기 잎맥 세포 현미경 지층 화석 퇴적암 화산 지진 "
+    "날씨 구름 태양계 행성 달의 위상 전기회로 전구 자석 용해 용액 혼합물 거름 증발 생태계 먹이사슬 분해자 "
+    "에너지 온도 열의 이동 물의 순환 실험 관찰 가설 변인 통제 결과 정리 탐구 문제"
+).split()
+QUERIES = ("광합성", "이산화탄소 산소", "먹이사슬 분해자", "전기회로", "물의 순환 실험", "지층 화석 퇴적암")
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _legacy_search(document, query):
+    """The pre-index path: OR of icontains filters, 120 candidates, substring scoring."""
+    tokens = tokenize_search_query(query)
+    filters = Q()
+    for token in tokens[:6]:
+        filters |= Q(search_text__icontains=token)
+    candidates = list(TextbookChunk.objects.filter(document=document).filter(filters).order_by("page_from", "sort_order")[:120])
+    lowered_query = query.lower()
+    scored = []
+    for chunk in candidates:
+        haystack = str(chunk.search_text or chunk.text or "").lower()
+        score = sum(1 for token in tokens if token in haystack) + (2 if lowered_query in haystack else 0)
+        if score:
+            scored.append({"chunk": chunk, "score": score, "source_label": build_source_label(chunk)})
+    return sorted(scored, key=lambda item: (-item["score"], item["chunk"].page_from, item["chunk"].sort_order))[:12]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare textbook_ai chunk search on a synthetic textbook: legacy icontains scan vs the stored BM25 index "
+        "(build cost, cold load, warm query latency and SQL per query). Runs inside a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=300)
+        parser.add_argument("--chunks-per-page", type=int, default=6)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        pages = max(1, options["pages"])
+        per_page = max(1, options["chunks_per_page"])
+        repeat = max(1, options["repeat"])
+        index_file = None
+        try:
+            with transaction.atomic():
+                document, artifact = self._create_textbook(pages=pages, per_page=per_page)
+
+                started = perf_counter()
+                index = store_document_search_index(document, artifact)
+                build_ms = (perf_counter() - started) * 1000
+                index_file = artifact.search_index_file
+                self.stdout.write(
+                    f"[bench] textbook pages={pages} chunks={len(index)} terms={len(index.terms)} "
+                    f"index={artifact.search_index_file.size / 1024:.0f}KB build={build_ms:.0f}ms"
+                )
+
+                started = perf_counter()
+                load_document_search_index(document)
+                self.stdout.write(f"[bench] cold index load={(perf_counter() - started) * 1000:.1f}ms")
+
+                for label, search in (("icontains", _legacy_search), ("bm25", search_document_chunks)):
+                    self._report(label, self._measure(search, document, repeat=repeat))
+                raise _Rollback
+        except _Rollback:
+            pass
+        finally:
+            if index_file:
+                index_file.storage.delete(index_file.name)
+
+    def _create_textbook(self, *, pages, per_page):
+        rng = random.Random(7)
+        user = get_user_model().objects.create_user(
+            username="textbook-search-bench",
+            email="textbook-search-bench@example.com",
+            password="bench-password-123",
+        )
+        document = TextbookDocument.objects.create(
+            owner=user,
+            title="벤치마크 과학 교과서",
+            subject=TextbookDocument.Subject.SCIENCE,
+            source_pdf="textbook_ai/bench/bench.pdf",
+            file_sha256="0" * 64,
+            page_count=pages,
+            license_confirmed=True,
+            parse_status=TextbookDocument.ParseStatus.READY,
+        )
+        artifact = TextbookParseArtifact.objects.create(document=document, page_count=pages)
+        chunks = []
+        for page in range(1, pages + 1):
+            heading = f"{(page - 1) // 20 + 1}. {rng.choice(VOCABULARY)}"
+            for index in range(per_page):
+                text = " ".join(rng.choice(VOCABULARY) + rng.choice(("은", "는", "을", "를", "의", "에서", "")) for _ in range(60))
+                chunks.append(
+                    TextbookChunk(
+                        document=document,
+                        heading_path=heading,
+                        text=text,
+                        search_text=f"{heading} {text} {page} {page}",
+                        page_from=page,
+                        page_to=page,
+                        sort_order=len(chunks) + 1,
+                    )
+                )
+        TextbookChunk.objects.bulk_create(chunks, batch_size=500)
+        return document, artifact
+
+    def _measure(self, search, document, *, repeat):
+        search(document, QUERIES[0])
+        latencies = []
+        queries = []
+        for _ in range(repeat):
+            for query in QUERIES:
+                with CaptureQueriesContext(connection) as ctx:
+                    started = perf_counter()
+                    search(document, query)
+                    latencies.append((perf_counter() - started) * 1000)
+                queries.append(len(ctx))
+        return {"p50_ms": median(latencies), "max_ms": max(latencies), "queries": median(queries)}
+
+    def _report(self, label, result):
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[bench] {label:<9} p50={result['p50_ms']:.1f}ms max={result['max_ms']:.1f}ms "
+                f"queries/search={result['queries']:.0f}"
+            )
+        )
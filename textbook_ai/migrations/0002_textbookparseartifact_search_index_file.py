@@ -0,0 +1,19 @@
+# Generated by Django 6.0.3 on 2026-10-17 12:20
+
+import textbook_ai.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('textbook_ai', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='textbookparseartifact',
+            name='search_index_file',
+            field=models.FileField(blank=True, upload_to=textbook_ai.models.search_index_upload_to),
+        ),
+    ]
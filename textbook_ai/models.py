@@ -25,6 +25,11 @@ def parsed_markdown_upload_to(instance, filename):
     return f"textbook_ai/parsed/{instance.document.owner_id}/{instance.document_id}/{safe_name}"
 
 
+def search_index_upload_to(instance, filename):
+    safe_name = _safe_filename(filename).rsplit(".", 1)[0] + ".bm25"
+    return f"textbook_ai/parsed/{instance.document.owner_id}/{instance.document_id}/{safe_name}"
+
+
 class TextbookDocument(models.Model):
     class Subject(models.TextChoices):
         KOREAN = "KOREAN", "국어"
@@ -103,6 +108,7 @@ class TextbookParseArtifact(models.Model):
     )
     parsed_json_file = models.FileField(upload_to=parsed_json_upload_to, blank=True)
     parsed_markdown_file = models.FileField(upload_to=parsed_markdown_upload_to, blank=True)
+    search_index_file = models.FileField(upload_to=search_index_upload_to, blank=True)
     parser_version = models.CharField(max_length=50, blank=True, default="")
     raw_metadata = models.JSONField(default=dict, blank=True)
     summary_json = models.JSONField(default=dict, blank=True)
@@ -7,16 +7,18 @@ import re
 import shutil
 import subprocess
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.db import transaction
-from django.db.models import Q
 from django.utils import timezone
 from pypdf import PdfReader
 
+from core.bm25 import BM25Index
+from core.file_cleanup import schedule_storage_delete
 from products.models import Product
 
 from .models import TextbookChunk, TextbookDocument, TextbookParseArtifact
@@ -30,6 +32,8 @@ DEFAULT_PARSER_VERSION = "opendataloader-local-v1"
 MIN_SCAN_REVIEW_TOTAL_CHARS = 120
 MIN_SCAN_REVIEW_CHARS_PER_PAGE = 40
 TEXTUAL_NODE_TYPES = {"paragraph", "heading", "caption", "list item"}
+SEARCH_RESULT_LIMIT = 12
+SEARCH_INDEX_CACHE_SIZE = 16
 WINDOWS_JAVA_BIN_GLOBS = (
     r"C:\Program Files\Microsoft\jdk-*\bin",
     r"C:\Program Files\Java\jdk-*\bin",
@@ -335,6 +339,7 @@ def parse_document(document, *, force=False, parser_fn=None):
         ]
         if chunk_objects:
             TextbookChunk.objects.bulk_create(chunk_objects)
+        store_document_search_index(document, artifact)
 
         document.page_count = normalized["page_count"] or document.page_count
         document.parse_status = status
@@ -398,6 +403,7 @@ def rebuild_document_from_saved_artifact(document):
         ]
         if chunk_objects:
             TextbookChunk.objects.bulk_create(chunk_objects)
+        store_document_search_index(document, artifact)
 
         artifact.page_count = normalized["page_count"]
         artifact.heading_count = normalized["heading_count"]
@@ -736,38 +742,78 @@ def tokenize_search_query(query):
     return [token.lower() for token in re.findall(r"[0-9A-Za-z가-힣]+", str(query or "")) if token.strip()]
 
 
+_search_index_cache = OrderedDict()
+
+
+def build_document_search_index(document):
+    rows = document.chunks.order_by("sort_order", "id").values_list("id", "search_text", "text")
+    return BM25Index.build((chunk_id, search_text or text) for chunk_id, search_text, text in rows)
+
+
+def store_document_search_index(document, artifact):
+    """Build the chunk BM25 index once and keep it next to the parser artifact."""
+    index = build_document_search_index(document)
+    previous_name = artifact.search_index_file.name if artifact.search_index_file else ""
+    artifact.search_index_file.save(f"{document.id}.bm25", ContentFile(index.to_bytes()), save=False)
+    artifact.save(update_fields=["search_index_file", "updated_at"])
+    if previous_name and previous_name != artifact.search_index_file.name:
+        schedule_storage_delete(
+            artifact.search_index_file.storage,
+            previous_name,
+            reason="textbook_ai.search_index.replace",
+        )
+    return index
+
+
+def load_document_search_index(document):
+    artifact = TextbookParseArtifact.objects.filter(document=document).first()
+    if artifact is None:
+        # Chunks written without an artifact (fixtures, admin edits) are indexed on the fly.
+        return build_document_search_index(document)
+    if not artifact.search_index_file:
+        return store_document_search_index(document, artifact)
+
+    cache_key = (artifact.search_index_file.name, artifact.updated_at)
+    index = _search_index_cache.get(cache_key)
+    if index is not None:
+        _search_index_cache.move_to_end(cache_key)
+        return index
+    try:
+        artifact.search_index_file.open("rb")
+        try:
+            index = BM25Index.from_bytes(artifact.search_index_file.read())
+        finally:
+            artifact.search_index_file.close()
+    except (OSError, ValueError):
+        logger.warning("textbook_ai search index unreadable document=%s; rebuilding", document.id)
+        return store_document_search_index(document, artifact)
+    _search_index_cache[cache_key] = index
+    while len(_search_index_cache) > SEARCH_INDEX_CACHE_SIZE:
+        _search_index_cache.popitem(last=False)
+    return index
+
+
 def search_document_chunks(document, query):
     tokens = tokenize_search_query(query)
     if not tokens:
         return []
 
-    chunk_queryset = TextbookChunk.objects.filter(document=document)
-    filters = Q()
-    for token in tokens[:6]:
-        filters |= Q(search_text__icontains=token)
-    candidates = list(chunk_queryset.filter(filters).order_by("page_from", "sort_order")[:120])
-    scored = []
-    lowered_query = str(query or "").strip().lower()
-
-    for chunk in candidates:
-        haystack = str(chunk.search_text or chunk.text or "").lower()
-        token_score = sum(1 for token in tokens if token in haystack)
-        exact_bonus = 2 if lowered_query and lowered_query in haystack else 0
-        if token_score <= 0 and exact_bonus <= 0:
+    hits = load_document_search_index(document).search(query, limit=SEARCH_RESULT_LIMIT)
+    chunks = TextbookChunk.objects.in_bulk([chunk_id for chunk_id, _score in hits])
+    results = []
+    for chunk_id, score in hits:
+        chunk = chunks.get(chunk_id)
+        if chunk is None:
             continue
-        scored.append(
+        results.append(
             {
                 "chunk": chunk,
-                "score": token_score + exact_bonus,
+                "score": round(score, 4),
                 "snippet": build_snippet(chunk.text, tokens),
                 "source_label": build_source_label(chunk),
             }
         )
-
-    return sorted(
-        scored,
-        key=lambda item: (-item["score"], item["chunk"].page_from, item["chunk"].sort_order),
-    )[:12]
+    return results
 
 
 def build_snippet(text, tokens):
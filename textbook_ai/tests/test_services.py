@@ -10,7 +10,7 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from reportlab.pdfgen import canvas
 
-from textbook_ai.models import TextbookDocument
+from textbook_ai.models import TextbookDocument, TextbookParseArtifact
 from textbook_ai.services import (
     _ensure_java_runtime_on_path,
     build_scan_review_reason,
@@ -18,6 +18,7 @@ from textbook_ai.services import (
     get_parser_readiness,
     normalize_opendataloader_payload,
     search_document_chunks,
+    store_document_search_index,
 )
 
 
@@ -141,6 +142,32 @@ class TextbookAiServiceTests(TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["source_label"], "2쪽")
 
+    def test_search_reads_stored_bm25_index_and_ranks_by_relevance(self):
+        document = TextbookDocument.objects.create(
+            owner=self.user,
+            title="과학 PDF",
+            subject=TextbookDocument.Subject.SCIENCE,
+            source_pdf=SimpleUploadedFile("science-bm25.pdf", build_pdf_bytes(["광합성"]), content_type="application/pdf"),
+            original_filename="science-bm25.pdf",
+            file_sha256="b" * 64,
+            file_size_bytes=100,
+            page_count=3,
+            license_confirmed=True,
+            parse_status=TextbookDocument.ParseStatus.READY,
+        )
+        artifact = TextbookParseArtifact.objects.create(document=document)
+        for sort_order, text in enumerate(["기공과 엽록체, 광합성에 필요한 빛", "광합성 광합성 과정 정리", "지층과 화석"], start=1):
+            document.chunks.create(chunk_type="text", text=text, search_text=text, page_from=sort_order, page_to=sort_order, sort_order=sort_order)
+
+        store_document_search_index(document, artifact)
+        artifact.refresh_from_db()
+        with mock.patch("textbook_ai.services.BM25Index.build") as mocked_build:
+            results = search_document_chunks(document, "광합성")
+
+        self.assertTrue(artifact.search_index_file.name.endswith(".bm25"))
+        mocked_build.assert_not_called()
+        self.assertEqual([result["chunk"].sort_order for result in results], [2, 1])
+
     def test_discover_java_bin_dir_uses_java_home_bin(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             bin_dir = Path(temp_dir) / "bin"
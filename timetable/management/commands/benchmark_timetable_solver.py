@@ -0,0 +1,131 @@
+import math
+import random
+from io import BytesIO
+from statistics import median
+from time import perf_counter
+
+import openpyxl
+from django.core.management.base import BaseCommand
+
+from timetable.services.legacy_import import (
+    OPTIONAL_SHEETS,
+    REQUIRED_SHEETS,
+    SOLVER_BACKTRACKING,
+    SOLVER_BITSET,
+    SOLVER_PORTFOLIO,
+    generate_timetable_schedule,
+)
+
+DAYS = ["월", "화", "수", "목", "금"]
+SLOTS = ["1", "2", "3", "4", "5", "6"]
+GRADES = (3, 4, 5, 6)
+# (subject, weekly hours per grade, special room prefix)
+SUBJECTS = (
+    ("영어", {3: 2, 4: 2, 5: 3, 6: 3}, ""),
+    ("체육", {3: 2, 4: 2, 5: 3, 6: 3}, ""),
+    ("과학", {3: 3, 4: 3, 5: 3, 6: 3}, "과학실"),
+    ("음악", {5: 2, 6: 2}, ""),
+)
+TARGET_LOAD = 0.8
+
+
+def build_benchmark_workbook(classes_per_grade, *, seed=1, rotation=True):
+    """
+    A synthetic specialist-teacher workbook sized by ``classes_per_grade``.
+
+    Teachers and science rooms are added until each runs at about 80% of its
+    weekly capacity. It also has grade slot limits, a few unavailable slots per
+    teacher, a soft avoid day for PE and a 2+1 split for science.
+    """
+    rng = random.Random(seed)
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    sheets = {name: wb.create_sheet(name) for name in (*REQUIRED_SHEETS, "배치불가시간", "배치조건")}
+    for name, ws in sheets.items():
+        ws.append(REQUIRED_SHEETS.get(name) or OPTIONAL_SHEETS[name])
+
+    sheets["기본설정"].append(["운영요일", ",".join(DAYS)])
+    sheets["기본설정"].append(["기본교시수", len(SLOTS)])
+    sheets["기본설정"].append(["시간칸형식", "교시"])
+    sheets["기본설정"].append(["학년별사용시간칸", "3=1,2,3,4,5;4=1,2,3,4,5"])
+    for grade in GRADES:
+        for class_no in range(1, classes_per_grade + 1):
+            sheets["학급목록"].append([grade, class_no, "Y"])
+
+    max_daily = 5
+    teacher_ids = []
+    assignment_no = 0
+    for subject, hours, room_prefix in SUBJECTS:
+        classes = [(grade, class_no) for grade in GRADES if grade in hours for class_no in range(1, classes_per_grade + 1)]
+        total = sum(hours[grade] for grade, _ in classes)
+        teacher_count = math.ceil(total / (len(DAYS) * max_daily * TARGET_LOAD))
+        room_count = math.ceil(total / (len(DAYS) * len(SLOTS) * TARGET_LOAD))
+        for number in range(1, teacher_count + 1):
+            teacher_id = f"{subject}{number}"
+            teacher_ids.append(teacher_id)
+            sheets["전담선생님목록"].append([teacher_id, f"{subject}전담{number}", subject, max_daily])
+        for index, (grade, class_no) in enumerate(classes):
+            assignment_no += 1
+            room_name = f"{room_prefix}{index * room_count // len(classes) + 1}" if room_prefix else ""
+            sheets["전담배정표"].append(
+                [
+                    f"A{assignment_no:03d}",
+                    f"{subject}{index * teacher_count // len(classes) + 1}",
+                    subject,
+                    grade,
+                    class_no,
+                    hours[grade],
+                    "자동배치" if room_name else "해당없음",
+                    room_name,
+                ]
+            )
+
+    for teacher_id in teacher_ids:
+        for _ in range(2):
+            sheets["배치불가시간"].append([teacher_id, rng.choice(DAYS), rng.choice(SLOTS), "회의"])
+    sheets["배치조건"].append(["체육 금요일", "교과", "체육", "피하기", "금", "권장"])
+    sheets["배치조건"].append(["과학 블록", "교과", "과학", "나눠배치", "2+1", "권장"])
+    if not rotation:
+        for subject, _hours, _room in SUBJECTS:
+            sheets["배치조건"].append([f"{subject} 순환", "교과", subject, "순환배치", "OFF", "반드시"])
+
+    output = BytesIO()
+    wb.save(output)
+    return output
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the timetable solvers on generated workbooks: the step-capped backtracking search, the "
+        "bitset forward-checking search and the multi-process portfolio (time and share of lesson hours placed "
+        "per workbook size). The portfolio uses TIMETABLE_SOLVER_WORKERS processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="2,4,6,8", help="Comma-separated classes per grade.")
+        parser.add_argument("--seeds", type=int, default=3, help="Workbooks generated per size.")
+        parser.add_argument("--solvers", default=f"{SOLVER_BACKTRACKING},{SOLVER_BITSET},{SOLVER_PORTFOLIO}")
+        parser.add_argument("--time-budget", type=float, default=5.0, help="Bitset search budget in seconds.")
+        parser.add_argument("--no-rotation", action="store_true", help="Turn round-robin (순환배치) off.")
+
+    def handle(self, *args, **options):
+        sizes = [int(item) for item in options["sizes"].split(",") if item.strip()]
+        solvers = [item.strip() for item in options["solvers"].split(",") if item.strip()]
+        for size in sizes:
+            for solver in solvers:
+                elapsed = []
+                placed = needed = solved = 0
+                for seed in range(1, options["seeds"] + 1):
+                    workbook = build_benchmark_workbook(size, seed=seed, rotation=not options["no_rotation"])
+                    started = perf_counter()
+                    result = generate_timetable_schedule(workbook, solver=solver, time_budget_seconds=options["time_budget"])
+                    elapsed.append((perf_counter() - started) * 1000)
+                    placed += result["summary"]["placed_count"]
+                    needed += result["summary"]["total_needed"]
+                    solved += 1 if result["is_success"] else 0
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[bench] classes/grade={size} {solver:<12} p50={median(elapsed):.0f}ms max={max(elapsed):.0f}ms "
+                        f"placed={placed / max(1, needed):.1%} solved={solved}/{options['seeds']}"
+                    )
+                )
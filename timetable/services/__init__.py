@@ -17,6 +17,7 @@ from .events import (
     build_event_slot_map,
     get_effective_shared_events,
 )
+from .incremental import ConflictIndex, ConflictIndexEvicted, load_conflict_index, store_conflict_index
 from .legacy_import import (
     OPTIONAL_SHEETS,
     REQUIRED_SHEETS,
@@ -31,13 +32,17 @@ from .normalizer import (
     assignments_to_sheet_data,
     build_default_period_labels,
     build_workspace_sheet_data,
+    normalize_cell,
     normalize_sheet_data,
     parse_display_text,
 )
+from .portfolio import get_solver_progress
 from .publishers import build_publication_payload, publish_to_reservations
 from .stats import build_teacher_stat_rows
 
 __all__ = [
+    "ConflictIndex",
+    "ConflictIndexEvicted",
     "OPTIONAL_SHEETS",
     "REQUIRED_SHEETS",
     "apply_meeting_selections",
@@ -65,13 +70,17 @@ __all__ = [
     "generate_timetable_schedule",
     "get_workspace_date_overrides",
     "get_effective_shared_events",
+    "get_solver_progress",
     "legacy_generated_result_to_sheet_data",
+    "load_conflict_index",
+    "normalize_cell",
     "normalize_sheet_data",
     "parse_display_text",
     "publish_to_reservations",
     "resolve_actor_name",
     "serialize_validation_result",
     "serialize_recent_activity",
+    "store_conflict_index",
     "validate_timetable_workbook",
     "validate_workspace_assignments",
 ]
@@ -1,14 +1,35 @@
 from timetable.services.events import build_event_conflict_message, build_event_slot_map
 
 
+EMPTY_SUBJECT_MESSAGE = "과목이 비어 있습니다."
+UNMATCHED_TEACHER_MESSAGE = "교사 이름을 찾지 못했습니다."
+WARNING_ISSUE_KINDS = {"sheet", "format"}
+
+
 def _assignment_key(item):
     return f"{item.classroom_id}:{item.day_key}:{item.period_no}"
 
 
+def teacher_conflict_message(teacher_name, day_key, period_no):
+    return f"{teacher_name} 교사가 {day_key} {period_no}교시에 여러 반에 배정되었습니다."
+
+
+def room_conflict_message(room_name, day_key, period_no, capacity):
+    return f"{room_name}은 {day_key} {period_no}교시에 {capacity}개 반까지만 배정할 수 있습니다."
+
+
+def event_conflict_message(day_key, period_no, slot_events):
+    return f"{day_key} {period_no}교시는 {build_event_conflict_message(slot_events)} 시간입니다."
+
+
+def build_room_capacity_map(room_policies):
+    return {policy.special_room_id: max(1, int(policy.capacity_per_slot or 1)) for policy in room_policies}
+
+
 def validate_workspace_assignments(workspace, assignments, room_policies, issues=None, effective_events=None):
     issues = list(issues or [])
     event_slot_map = build_event_slot_map(effective_events or [])
-    policy_map = {policy.special_room_id: max(1, int(policy.capacity_per_slot or 1)) for policy in room_policies}
+    policy_map = build_room_capacity_map(room_policies)
     cell_map = {}
     cell_messages = {}
     teacher_slots = {}
@@ -20,9 +41,9 @@ def validate_workspace_assignments(workspace, assignments, room_policies, issues
         cell_messages.setdefault(key, [])
 
         if not item.subject_name:
-            cell_messages[key].append("과목이 비어 있습니다.")
+            cell_messages[key].append(EMPTY_SUBJECT_MESSAGE)
         if item.display_text and "(" in item.display_text and not item.teacher_id:
-            cell_messages[key].append("교사 이름을 찾지 못했습니다.")
+            cell_messages[key].append(UNMATCHED_TEACHER_MESSAGE)
 
         if item.teacher_id:
             teacher_key = (item.teacher_id, item.day_key, item.period_no)
@@ -32,15 +53,14 @@ def validate_workspace_assignments(workspace, assignments, room_policies, issues
             room_slots.setdefault(room_key, []).append(item)
         slot_events = event_slot_map.get(f"{item.day_key}:{item.period_no}") or []
         if slot_events:
-            message = f"{item.day_key} {item.period_no}교시는 {build_event_conflict_message(slot_events)} 시간입니다."
-            cell_messages[key].append(message)
+            cell_messages[key].append(event_conflict_message(item.day_key, item.period_no, slot_events))
 
     conflicts = []
     warnings = []
     seen_event_conflicts = set()
 
     for issue in issues:
-        target = warnings if issue.get("kind") in {"sheet", "format"} else conflicts
+        target = warnings if issue.get("kind") in WARNING_ISSUE_KINDS else conflicts
         target.append(issue["message"])
         cell_key = issue.get("cell_key")
         if cell_key:
@@ -49,7 +69,7 @@ def validate_workspace_assignments(workspace, assignments, room_policies, issues
     for (_teacher_id, day_key, period_no), items in teacher_slots.items():
         if len(items) < 2:
             continue
-        message = f"{items[0].teacher.name} 교사가 {day_key} {period_no}교시에 여러 반에 배정되었습니다."
+        message = teacher_conflict_message(items[0].teacher.name, day_key, period_no)
         conflicts.append(message)
         for item in items:
             cell_messages.setdefault(_assignment_key(item), []).append(message)
@@ -58,7 +78,7 @@ def validate_workspace_assignments(workspace, assignments, room_policies, issues
         slot_events = event_slot_map.get(f"{item.day_key}:{item.period_no}") or []
         if not slot_events:
             continue
-        message = f"{item.day_key} {item.period_no}교시는 {build_event_conflict_message(slot_events)} 시간입니다."
+        message = event_conflict_message(item.day_key, item.period_no, slot_events)
         slot_key = (item.day_key, item.period_no, message)
         if slot_key in seen_event_conflicts:
             continue
@@ -69,8 +89,7 @@ def validate_workspace_assignments(workspace, assignments, room_policies, issues
         capacity = policy_map.get(room_id, 1)
         if len(items) <= capacity:
             continue
-        room_name = items[0].special_room.name
-        message = f"{room_name}은 {day_key} {period_no}교시에 {capacity}개 반까지만 배정할 수 있습니다."
+        message = room_conflict_message(items[0].special_room.name, day_key, period_no, capacity)
         conflicts.append(message)
         for item in items:
             cell_messages.setdefault(_assignment_key(item), []).append(message)
@@ -0,0 +1,515 @@
+"""
+Incremental conflict checks for the grid editor.
+
+``validate_workspace_assignments`` walks every assignment on each call.
+``ConflictIndex`` holds the same teacher, room and event slot indexes for one
+editing session. It applies single-cell edits as deltas. An edit only touches
+the cells that share its teacher or room slot, so ``apply_cell`` returns just
+the cell messages and conflicts that changed. The full validator remains the
+fallback and is the test oracle.
+
+The index holds plain values, not model instances. It is kept in the cache as
+one small meta entry plus one entry per cell, teacher slot, room slot and event
+slot, so an edit reads and writes only the entries its neighbourhood touches.
+A missing or stale revision, or an entry the cache has evicted, tells the
+editor to resync with a full validation.
+"""
+
+import time
+import uuid
+from collections import Counter
+
+from django.core.cache import cache
+
+from timetable.services.conflicts import (
+    EMPTY_SUBJECT_MESSAGE,
+    UNMATCHED_TEACHER_MESSAGE,
+    WARNING_ISSUE_KINDS,
+    build_room_capacity_map,
+    event_conflict_message,
+    room_conflict_message,
+    teacher_conflict_message,
+)
+from timetable.services.events import build_event_slot_map
+
+INDEX_TTL_SECONDS = 2 * 60 * 60
+INDEX_KEY_TEMPLATE = "timetable_conflict_index:{workspace_id}:{generation}:{part}"
+# Issues an edit re-derives from the cell text; others (e.g. duplicate sheets) stay.
+CELL_ISSUE_KINDS = {"teacher", "room", "format"}
+
+
+class ConflictIndexEvicted(Exception):
+    """An entry of a stored index is gone (culled or expired early); the index can no longer be trusted."""
+
+
+def _cell_key(item):
+    return f"{item.classroom_id}:{item.day_key}:{item.period_no}"
+
+
+def _cell_entry(item):
+    return {
+        "day_key": item.day_key,
+        "period_no": item.period_no,
+        "has_subject": bool(item.subject_name),
+        "teacher_unmatched": bool(item.display_text and "(" in item.display_text and not item.teacher_id),
+        "teacher_id": item.teacher_id,
+        "teacher_name": item.teacher.name if item.teacher_id else "",
+        "room_id": item.special_room_id,
+        "room_name": item.special_room.name if item.special_room_id else "",
+    }
+
+
+class ConflictIndex:
+    def __init__(self, room_policies, effective_events=None):
+        self.room_capacity = build_room_capacity_map(room_policies)
+        self.event_slot_map = build_event_slot_map(effective_events or [])
+        self.cells = {}
+        self.cell_issues = {}
+        self.sheet_issues = []
+        # Slot key -> cell keys in insertion order (dicts used as ordered sets).
+        self.teacher_slots = {}
+        self.room_slots = {}
+        self.event_slot_counts = Counter()
+        self.conflicts = Counter()
+        self.warnings = Counter()
+        self.flagged = set()
+        self.assignment_count = 0
+        self.incomplete_count = 0
+        self.revision = ""
+        # Set for an index loaded from the cache; only the entries an edit needs are read.
+        self.storage = None
+
+    @classmethod
+    def build(cls, assignments, room_policies, issues=None, effective_events=None):
+        """Index the same inputs ``validate_workspace_assignments`` takes."""
+        index = cls(room_policies, effective_events)
+        for item in assignments:
+            index._add_cell(_cell_key(item), _cell_entry(item))
+        for issue in issues or []:
+            if issue.get("cell_key"):
+                index.cell_issues.setdefault(issue["cell_key"], []).append(issue)
+            else:
+                index.sheet_issues.append(issue)
+        for issue in index.sheet_issues:
+            index._source_counter(issue).update([issue["message"]])
+        for cell_key in set(index.cells) | set(index.cell_issues):
+            conflicts, warnings = index._cell_sources(cell_key)
+            index.conflicts.update(conflicts)
+            index.warnings.update(warnings)
+            index._set_flagged(cell_key, bool(index.cell_messages(cell_key)))
+        for slot_key in index.teacher_slots:
+            index.conflicts.update(index._teacher_conflicts(slot_key))
+        for slot_key in index.room_slots:
+            index.conflicts.update(index._room_conflicts(slot_key))
+        for slot_key in index.event_slot_counts:
+            index.conflicts.update(index._event_conflicts(slot_key))
+        return index
+
+    def _source_counter(self, issue):
+        return self.warnings if issue.get("kind") in WARNING_ISSUE_KINDS else self.conflicts
+
+    def _set_flagged(self, cell_key, flagged):
+        if flagged and cell_key not in self.flagged:
+            self.flagged.add(cell_key)
+            self.incomplete_count += 1
+        elif not flagged and cell_key in self.flagged:
+            self.flagged.discard(cell_key)
+            self.incomplete_count -= 1
+
+    def _add_cell(self, cell_key, entry):
+        self.cells[cell_key] = entry
+        self.assignment_count += 1
+        if entry["teacher_id"]:
+            self.teacher_slots.setdefault((entry["teacher_id"], entry["day_key"], entry["period_no"]), {})[cell_key] = None
+        if entry["room_id"]:
+            self.room_slots.setdefault((entry["room_id"], entry["day_key"], entry["period_no"]), {})[cell_key] = None
+        event_key = f"{entry['day_key']}:{entry['period_no']}"
+        if event_key in self.event_slot_map:
+            self.event_slot_counts[event_key] += 1
+
+    def _remove_cell(self, cell_key):
+        entry = self.cells.pop(cell_key, None)
+        if entry is None:
+            return
+        self.assignment_count -= 1
+        for slots, id_field in ((self.teacher_slots, "teacher_id"), (self.room_slots, "room_id")):
+            if not entry[id_field]:
+                continue
+            slot_key = (entry[id_field], entry["day_key"], entry["period_no"])
+            members = slots.get(slot_key, {})
+            members.pop(cell_key, None)
+            if not members:
+                slots.pop(slot_key, None)
+        event_key = f"{entry['day_key']}:{entry['period_no']}"
+        if self.event_slot_counts.get(event_key):
+            self.event_slot_counts[event_key] -= 1
+            if not self.event_slot_counts[event_key]:
+                del self.event_slot_counts[event_key]
+
+    def _slot_keys(self, entry):
+        teacher_key = (entry["teacher_id"], entry["day_key"], entry["period_no"]) if entry["teacher_id"] else None
+        room_key = (entry["room_id"], entry["day_key"], entry["period_no"]) if entry["room_id"] else None
+        return teacher_key, room_key, f"{entry['day_key']}:{entry['period_no']}"
+
+    def _teacher_conflicts(self, slot_key):
+        members = self.teacher_slots.get(slot_key) or {}
+        if len(members) < 2:
+            return []
+        teacher_name = self.cells[next(iter(members))]["teacher_name"]
+        return [teacher_conflict_message(teacher_name, slot_key[1], slot_key[2])]
+
+    def _room_conflicts(self, slot_key):
+        members = self.room_slots.get(slot_key) or {}
+        capacity = self.room_capacity.get(slot_key[0], 1)
+        if len(members) <= capacity:
+            return []
+        room_name = self.cells[next(iter(members))]["room_name"]
+        return [room_conflict_message(room_name, slot_key[1], slot_key[2], capacity)]
+
+    def _event_conflicts(self, event_key):
+        if not self.event_slot_counts.get(event_key):
+            return []
+        day_key, period_no = event_key.split(":", 1)
+        return [event_conflict_message(day_key, period_no, self.event_slot_map[event_key])]
+
+    def _cell_sources(self, cell_key):
+        conflicts, warnings = [], []
+        for issue in self.cell_issues.get(cell_key) or []:
+            (warnings if issue.get("kind") in WARNING_ISSUE_KINDS else conflicts).append(issue["message"])
+        return conflicts, warnings
+
+    def cell_messages(self, cell_key):
+        """Messages for one cell, in the order the full validator produces them."""
+        messages = []
+        entry = self.cells.get(cell_key)
+        if entry:
+            if not entry["has_subject"]:
+                messages.append(EMPTY_SUBJECT_MESSAGE)
+            if entry["teacher_unmatched"]:
+                messages.append(UNMATCHED_TEACHER_MESSAGE)
+            teacher_key, room_key, event_key = self._slot_keys(entry)
+            if event_key in self.event_slot_map:
+                messages.append(event_conflict_message(entry["day_key"], entry["period_no"], self.event_slot_map[event_key]))
+        messages.extend(issue["message"] for issue in self.cell_issues.get(cell_key) or [])
+        if entry:
+            if teacher_key:
+                messages.extend(self._teacher_conflicts(teacher_key))
+            if room_key:
+                messages.extend(self._room_conflicts(room_key))
+        return messages
+
+    def _neighbourhood(self, cell_key, entries):
+        """Cells and conflict sources an edit of ``cell_key`` between ``entries`` can change."""
+        cell_keys = {cell_key}
+        teacher_keys, room_keys, event_keys = set(), set(), set()
+        for entry in entries:
+            if not entry:
+                continue
+            teacher_key, room_key, event_key = self._slot_keys(entry)
+            if teacher_key:
+                teacher_keys.add(teacher_key)
+                cell_keys.update(self.teacher_slots.get(teacher_key) or {})
+            if room_key:
+                room_keys.add(room_key)
+                cell_keys.update(self.room_slots.get(room_key) or {})
+            event_keys.add(event_key)
+        return cell_keys, teacher_keys, room_keys, event_keys
+
+    def _local_state(self, cell_key, cell_keys, teacher_keys, room_keys, event_keys):
+        conflicts, warnings = self._cell_sources(cell_key)
+        conflicts = Counter(conflicts)
+        for slot_key in teacher_keys:
+            conflicts.update(self._teacher_conflicts(slot_key))
+        for slot_key in room_keys:
+            conflicts.update(self._room_conflicts(slot_key))
+        for event_key in event_keys:
+            conflicts.update(self._event_conflicts(event_key))
+        messages = {key: self.cell_messages(key) for key in cell_keys}
+        return messages, conflicts, Counter(warnings)
+
+    def apply_cell(self, cell_key, item=None, issues=()):
+        """
+        Replace one cell with ``item`` (``None`` clears it) and its parse ``issues``.
+
+        Returns the changed ``cell_messages`` (an empty list clears a cell), the
+        conflicts and warnings added and removed, and the new ``summary``.
+        """
+        new_entry = _cell_entry(item) if item is not None else None
+        if self.storage is not None:
+            self.storage.fetch(self, cell_key, new_entry)
+        scope = self._neighbourhood(cell_key, (self.cells.get(cell_key), new_entry))
+        before_messages, before_conflicts, before_warnings = self._local_state(cell_key, *scope)
+
+        self._remove_cell(cell_key)
+        kept = [issue for issue in self.cell_issues.pop(cell_key, []) if issue.get("kind") not in CELL_ISSUE_KINDS]
+        if kept or issues:
+            self.cell_issues[cell_key] = kept + list(issues)
+        if new_entry is not None:
+            self._add_cell(cell_key, new_entry)
+
+        after_messages, after_conflicts, after_warnings = self._local_state(cell_key, *scope)
+        self.conflicts.update(after_conflicts)
+        self.conflicts.subtract(before_conflicts)
+        self.warnings.update(after_warnings)
+        self.warnings.subtract(before_warnings)
+        self.conflicts += Counter()
+        self.warnings += Counter()
+
+        changed = {}
+        for key, messages in after_messages.items():
+            self._set_flagged(key, bool(messages))
+            if messages != before_messages[key]:
+                changed[key] = messages
+        return {
+            "cell_messages": changed,
+            "conflicts_added": list((after_conflicts - before_conflicts).elements()),
+            "conflicts_removed": list((before_conflicts - after_conflicts).elements()),
+            "warnings_added": list((after_warnings - before_warnings).elements()),
+            "warnings_removed": list((before_warnings - after_warnings).elements()),
+            "summary": self.summary(),
+        }
+
+    def apply_cells(self, changes):
+        """``apply_cell`` over ``(cell_key, item, issues)`` triples, merged into one delta."""
+        cell_messages = {}
+        conflicts = Counter()
+        warnings = Counter()
+        for cell_key, item, issues in changes:
+            delta = self.apply_cell(cell_key, item, issues)
+            cell_messages.update(delta["cell_messages"])
+            conflicts.update(delta["conflicts_added"])
+            conflicts.subtract(delta["conflicts_removed"])
+            warnings.update(delta["warnings_added"])
+            warnings.subtract(delta["warnings_removed"])
+        return {
+            "cell_messages": cell_messages,
+            "conflicts_added": list((+conflicts).elements()),
+            "conflicts_removed": list((-conflicts).elements()),
+            "warnings_added": list((+warnings).elements()),
+            "warnings_removed": list((-warnings).elements()),
+            "summary": self.summary(),
+        }
+
+    def summary(self):
+        return {
+            "conflict_count": sum(self.conflicts.values()),
+            "warning_count": sum(self.warnings.values()),
+            "incomplete_count": self.incomplete_count,
+            "assignment_count": self.assignment_count,
+        }
+
+    def to_result(self):
+        """The whole in-memory index in ``validate_workspace_assignments`` shape (conflict order may differ)."""
+        cell_messages = {key: self.cell_messages(key) for key in set(self.cells) | set(self.cell_issues)}
+        return {
+            "conflicts": list(self.conflicts.elements()),
+            "warnings": list(self.warnings.elements()),
+            "cell_messages": cell_messages,
+            "summary": self.summary(),
+        }
+
+
+def _index_key(workspace_id, generation, part):
+    return INDEX_KEY_TEMPLATE.format(workspace_id=workspace_id, generation=generation, part=part)
+
+
+class _IndexStorage:
+    """Cache entries of one stored index; ``fetch`` pulls in what an edit reads and ``save`` writes it back."""
+
+    def __init__(self, workspace_id, generation, expires_at, stored_parts=()):
+        self.workspace_id = workspace_id
+        self.generation = generation
+        self.expires_at = expires_at
+        # Parts written by ``save``; one of them missing from the cache was evicted, not cleared.
+        self.stored_parts = set(stored_parts)
+        self.loaded_cells = set()
+        self.loaded_teacher_slots = set()
+        self.loaded_room_slots = set()
+        self.loaded_event_keys = set()
+
+    def key(self, part):
+        return _index_key(self.workspace_id, self.generation, part)
+
+    def timeout(self):
+        # Every entry of one build expires together; culling can still drop single
+        # entries, which the loads below detect and raise ConflictIndexEvicted for.
+        return max(1, int(self.expires_at - time.time()))
+
+    def _get_parts(self, parts):
+        """``{part: value}`` for the stored ``parts``; raises ``ConflictIndexEvicted`` if one was dropped."""
+        values = cache.get_many([self.key(part) for part in parts])
+        found = {}
+        for part in parts:
+            if self.key(part) in values:
+                found[part] = values[self.key(part)]
+            elif part in self.stored_parts:
+                raise ConflictIndexEvicted(part)
+        return found
+
+    def _load_cells(self, index, cell_keys):
+        missing = [key for key in cell_keys if key not in self.loaded_cells]
+        if not missing:
+            return
+        records = self._get_parts([f"cell:{key}" for key in missing])
+        for cell_key in missing:
+            self.loaded_cells.add(cell_key)
+            record = records.get(f"cell:{cell_key}")
+            if not record:
+                continue
+            if record["entry"] is not None:
+                index.cells[cell_key] = record["entry"]
+            if record["issues"]:
+                index.cell_issues[cell_key] = record["issues"]
+            if record["flagged"]:
+                index.flagged.add(cell_key)
+
+    def _load_slots(self, index, teacher_keys, room_keys, event_keys):
+        parts = {}
+        for slot_key in teacher_keys - self.loaded_teacher_slots:
+            parts[_slot_part("teacher", slot_key)] = (index.teacher_slots, slot_key)
+        for slot_key in room_keys - self.loaded_room_slots:
+            parts[_slot_part("room", slot_key)] = (index.room_slots, slot_key)
+        self.loaded_teacher_slots |= teacher_keys
+        self.loaded_room_slots |= room_keys
+        for part, value in self._get_parts(list(parts)).items():
+            slots, slot_key = parts[part]
+            slots[slot_key] = dict.fromkeys(value)
+        event_keys = event_keys - self.loaded_event_keys
+        self.loaded_event_keys |= event_keys
+        events = self._get_parts([f"event:{event_key}" for event_key in event_keys])
+        for event_key in event_keys:
+            if f"event:{event_key}" in events:
+                index.event_slot_counts[event_key] = events[f"event:{event_key}"]
+
+    def _load_slots_of(self, index, entries, *, with_events):
+        """Load the slots ``entries`` sit in and the cells sharing them; returns those cell keys."""
+        teacher_keys, room_keys, event_keys = set(), set(), set()
+        for entry in entries:
+            if not entry:
+                continue
+            teacher_key, room_key, event_key = index._slot_keys(entry)
+            if teacher_key:
+                teacher_keys.add(teacher_key)
+            if room_key:
+                room_keys.add(room_key)
+            if with_events:
+                event_keys.add(event_key)
+        self._load_slots(index, teacher_keys, room_keys, event_keys)
+        members = set()
+        for slot_key in teacher_keys:
+            members.update(index.teacher_slots.get(slot_key) or {})
+        for slot_key in room_keys:
+            members.update(index.room_slots.get(slot_key) or {})
+        self._load_cells(index, members)
+        return members
+
+    def fetch(self, index, cell_key, new_entry):
+        """
+        Load ``cell_key``, the slots its old and ``new_entry`` sit in and the cells
+        sharing them. Those cells' messages also name their other slots, so those
+        slots and their cells are loaded one hop further.
+        """
+        self._load_cells(index, [cell_key])
+        members = self._load_slots_of(index, (index.cells.get(cell_key), new_entry), with_events=True)
+        self._load_slots_of(index, [index.cells.get(key) for key in members], with_events=False)
+
+    def save(self, index):
+        parts = {}
+        for cell_key in self.loaded_cells:
+            has_record = cell_key in index.cells or cell_key in index.cell_issues
+            parts[f"cell:{cell_key}"] = _cell_record(index, cell_key) if has_record else None
+        for prefix, slots, slot_keys in (
+            ("teacher", index.teacher_slots, self.loaded_teacher_slots),
+            ("room", index.room_slots, self.loaded_room_slots),
+        ):
+            for slot_key in slot_keys:
+                parts[_slot_part(prefix, slot_key)] = list(slots[slot_key]) if slots.get(slot_key) else None
+        for event_key in self.loaded_event_keys:
+            parts[f"event:{event_key}"] = index.event_slot_counts.get(event_key) or None
+        entries = {}
+        stale = []
+        for part, value in parts.items():
+            if value is None:
+                stale.append(self.key(part))
+                self.stored_parts.discard(part)
+            else:
+                entries[self.key(part)] = value
+                self.stored_parts.add(part)
+        entries[self.key("meta")] = _meta_record(index, self.expires_at, self.stored_parts)
+        cache.set_many(entries, self.timeout())
+        if stale:
+            cache.delete_many(stale)
+
+
+def _slot_part(prefix, slot_key):
+    return "{}:{}:{}:{}".format(prefix, *slot_key)
+
+
+def _cell_record(index, cell_key):
+    return {
+        "entry": index.cells.get(cell_key),
+        "issues": index.cell_issues.get(cell_key) or [],
+        "flagged": cell_key in index.flagged,
+    }
+
+
+def _meta_record(index, expires_at, stored_parts):
+    return {
+        "revision": index.revision,
+        "expires_at": expires_at,
+        "stored_parts": sorted(stored_parts),
+        "room_capacity": index.room_capacity,
+        "event_slot_map": index.event_slot_map,
+        "conflicts": dict(index.conflicts),
+        "warnings": dict(index.warnings),
+        "assignment_count": index.assignment_count,
+        "incomplete_count": index.incomplete_count,
+    }
+
+
+def store_conflict_index(workspace_id, index):
+    """
+    Save ``index`` and return its new revision.
+
+    A freshly built index is written entry by entry under a new generation. An
+    index from ``load_conflict_index`` only writes back the entries its edits
+    loaded, plus the meta entry.
+    """
+    storage = index.storage
+    if storage is None:
+        storage = _IndexStorage(workspace_id, uuid.uuid4().hex, time.time() + INDEX_TTL_SECONDS)
+        storage.loaded_cells = set(index.cells) | set(index.cell_issues)
+        storage.loaded_teacher_slots = set(index.teacher_slots)
+        storage.loaded_room_slots = set(index.room_slots)
+        storage.loaded_event_keys = set(index.event_slot_counts)
+        index.storage = storage
+        index.revision = f"{storage.generation}.0"
+    else:
+        edit_no = int(index.revision.rsplit(".", 1)[-1]) + 1
+        index.revision = f"{storage.generation}.{edit_no}"
+    storage.save(index)
+    return index.revision
+
+
+def load_conflict_index(workspace_id, revision):
+    """
+    The index saved as ``revision`` with only its meta loaded, or ``None`` once it
+    is stale or gone. Its edits raise ``ConflictIndexEvicted`` if they need an
+    entry the cache has since dropped.
+    """
+    generation = str(revision or "").split(".", 1)[0]
+    if not generation:
+        return None
+    meta = cache.get(_index_key(workspace_id, generation, "meta"))
+    if not meta or meta["revision"] != revision:
+        return None
+    index = ConflictIndex([])
+    index.room_capacity = meta["room_capacity"]
+    index.event_slot_map = meta["event_slot_map"]
+    index.conflicts = Counter(meta["conflicts"])
+    index.warnings = Counter(meta["warnings"])
+    index.assignment_count = meta["assignment_count"]
+    index.incomplete_count = meta["incomplete_count"]
+    index.revision = revision
+    index.storage = _IndexStorage(workspace_id, generation, meta["expires_at"], meta["stored_parts"])
+    return index
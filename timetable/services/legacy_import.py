@@ -2,8 +2,12 @@ from io import BytesIO
 from collections import defaultdict
 
 import openpyxl
+from django.conf import settings as django_settings
 from openpyxl.styles import Alignment, Font, PatternFill
 
+from .portfolio import publish_solver_progress, solve_portfolio
+from .solver import DEFAULT_TIME_BUDGET_SECONDS, solve_tasks_bitset
+
 
 REQUIRED_SHEETS = {
     "기본설정": ["항목", "값"],
@@ -21,6 +25,12 @@ OPTIONAL_SHEETS = {
 
 ALL_TEMPLATE_SHEETS = {**REQUIRED_SHEETS, **OPTIONAL_SHEETS}
 
+SOLVER_BITSET = "bitset"
+# Several bitset configurations raced across worker processes.
+SOLVER_PORTFOLIO = "portfolio"
+# The original step-capped backtracking, kept for comparison benchmarks.
+SOLVER_BACKTRACKING = "backtracking"
+
 REQUIRED_SETTING_KEYS = {"운영요일", "기본교시수", "시간칸형식"}
 
 TEMPLATE_GUIDE_ROWS = {
@@ -286,7 +296,13 @@ def _validate_sheet_choices(ws, sheet_name, headers, result):
                 )
 
 
-def generate_timetable_schedule(file_obj):
+def generate_timetable_schedule(
+    file_obj,
+    *,
+    solver=None,
+    time_budget_seconds=None,
+    job_id=None,
+):
     result = {
         "is_success": False,
         "errors": [],
@@ -331,12 +347,23 @@ def generate_timetable_schedule(file_obj):
         tasks.extend(_build_assignment_tasks(assignment, remaining, result))
 
     if tasks:
-        solved, _ = _solve_tasks_backtracking(tasks, parsed, state)
+        solved, remaining_tasks = _solve_tasks(
+            tasks,
+            parsed,
+            state,
+            solver=solver or getattr(django_settings, "TIMETABLE_SOLVER", SOLVER_BITSET),
+            time_budget_seconds=(
+                time_budget_seconds
+                if time_budget_seconds is not None
+                else getattr(django_settings, "TIMETABLE_SOLVER_TIME_BUDGET_SECONDS", DEFAULT_TIME_BUDGET_SECONDS)
+            ),
+            job_id=job_id,
+        )
         if not solved:
             result["warnings"].append(
                 "모든 수업칸을 한 번에 배치하지 못해, 가능한 범위까지 먼저 배치했습니다."
             )
-            unplaced_tasks = _solve_tasks_greedy(tasks, parsed, state)
+            unplaced_tasks = _solve_tasks_greedy(remaining_tasks, parsed, state)
             if unplaced_tasks:
                 by_assignment = defaultdict(int)
                 for task in unplaced_tasks:
@@ -707,6 +734,56 @@ def _build_assignment_tasks(assignment, remaining_count, result):
     return tasks
 
 
+def _solve_tasks(tasks, parsed, state, *, solver, time_budget_seconds, job_id):
+    """
+    Run the chosen solver and return ``(solved, tasks_left_for_greedy)``.
+
+    Only the portfolio keeps a partial timetable in ``state``; the other solvers
+    leave ``state`` as it was when they fail.
+    """
+    if solver == SOLVER_PORTFOLIO:
+        outcome = solve_portfolio(
+            tasks,
+            parsed,
+            state,
+            workers=int(getattr(django_settings, "TIMETABLE_SOLVER_WORKERS", 4)),
+            time_budget_seconds=time_budget_seconds,
+            job_id=job_id,
+        )
+        _apply_placements(outcome["placements"], parsed, state)
+        return not outcome["unplaced_hours"], _tasks_left_after(tasks, outcome["placements"])
+
+    publish_solver_progress(job_id, "running", total=1)
+    if solver == SOLVER_BACKTRACKING:
+        solved, _ = _solve_tasks_backtracking(tasks, parsed, state)
+    else:
+        placements, _ = solve_tasks_bitset(tasks, parsed, state, time_budget_seconds=time_budget_seconds)
+        solved = placements is not None
+        if solved:
+            _apply_placements(placements, parsed, state)
+    publish_solver_progress(job_id, "done", done=1, total=1)
+    return solved, [] if solved else tasks
+
+
+def _apply_placements(placements, parsed, state):
+    for assignment_id, day, block_slots in placements:
+        _apply_block(parsed["assignment_map"][assignment_id], day, block_slots, state)
+
+
+def _tasks_left_after(tasks, placements):
+    placed = defaultdict(int)
+    for assignment_id, _day, block_slots in placements:
+        placed[(assignment_id, len(block_slots))] += 1
+    left = []
+    for task in tasks:
+        key = (task["assignment_id"], task["length"])
+        if placed[key]:
+            placed[key] -= 1
+            continue
+        left.append(task)
+    return left
+
+
 def _solve_tasks_backtracking(tasks, parsed, state):
     max_steps = 50000
     step_count = {"value": 0}
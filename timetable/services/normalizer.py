@@ -154,6 +154,55 @@ def _extract_cell_text(cell):
     return str(cell).strip()
 
 
+def normalize_cell(workspace, classroom, day_key, period_no, raw_text, teacher_by_name, room_by_name):
+    """One grid cell as an assignment dict (``None`` when blank) plus its issues."""
+    cell_key = f"{classroom.id}:{day_key}:{period_no}"
+    parsed = parse_display_text(raw_text)
+    if not raw_text and not parsed["subject_name"] and not parsed["teacher_name"] and not parsed["room_name"]:
+        return None, []
+
+    issues = []
+    teacher = teacher_by_name.get(parsed["teacher_name"]) if parsed["teacher_name"] else None
+    special_room = room_by_name.get(parsed["room_name"]) if parsed["room_name"] else None
+    if parsed["teacher_name"] and not teacher:
+        issues.append(
+            {
+                "kind": "teacher",
+                "message": f"{classroom.label} {day_key} {period_no}교시에 입력한 교사 '{parsed['teacher_name']}'를 찾지 못했습니다.",
+                "cell_key": cell_key,
+            }
+        )
+    if parsed["room_name"] and not special_room:
+        issues.append(
+            {
+                "kind": "room",
+                "message": f"{classroom.label} {day_key} {period_no}교시에 입력한 특별실 '{parsed['room_name']}'를 찾지 못했습니다.",
+                "cell_key": cell_key,
+            }
+        )
+    for message in parsed["issues"]:
+        issues.append(
+            {
+                "kind": "format",
+                "message": f"{classroom.label} {day_key} {period_no}교시: {message}",
+                "cell_key": cell_key,
+            }
+        )
+
+    assignment = {
+        "workspace": workspace,
+        "classroom": classroom,
+        "day_key": day_key,
+        "period_no": period_no,
+        "subject_name": parsed["subject_name"],
+        "teacher": teacher,
+        "special_room": special_room,
+        "display_text": parsed["display_text"] or raw_text,
+        "note": "",
+    }
+    return assignment, issues
+
+
 def normalize_sheet_data(workspace, sheet_data, classrooms, teachers, special_rooms):
     classroom_by_sheet = {classroom_sheet_name(classroom): classroom for classroom in classrooms}
     teacher_by_name = {teacher.name: teacher for teacher in teachers if teacher.is_active}
@@ -191,49 +240,11 @@ def normalize_sheet_data(workspace, sheet_data, classrooms, teachers, special_ro
                     continue
                 seen.add(slot_key)
 
-                parsed = parse_display_text(raw_text)
-                if not raw_text and not parsed["subject_name"] and not parsed["teacher_name"] and not parsed["room_name"]:
-                    continue
-
-                teacher = teacher_by_name.get(parsed["teacher_name"]) if parsed["teacher_name"] else None
-                special_room = room_by_name.get(parsed["room_name"]) if parsed["room_name"] else None
-                if parsed["teacher_name"] and not teacher:
-                    issues.append(
-                        {
-                            "kind": "teacher",
-                            "message": f"{classroom.label} {day_key} {period_no}교시에 입력한 교사 '{parsed['teacher_name']}'를 찾지 못했습니다.",
-                            "cell_key": f"{classroom.id}:{day_key}:{period_no}",
-                        }
-                    )
-                if parsed["room_name"] and not special_room:
-                    issues.append(
-                        {
-                            "kind": "room",
-                            "message": f"{classroom.label} {day_key} {period_no}교시에 입력한 특별실 '{parsed['room_name']}'를 찾지 못했습니다.",
-                            "cell_key": f"{classroom.id}:{day_key}:{period_no}",
-                        }
-                    )
-                for message in parsed["issues"]:
-                    issues.append(
-                        {
-                            "kind": "format",
-                            "message": f"{classroom.label} {day_key} {period_no}교시: {message}",
-                            "cell_key": f"{classroom.id}:{day_key}:{period_no}",
-                        }
-                    )
-
-                assignments.append(
-                    {
-                        "workspace": workspace,
-                        "classroom": classroom,
-                        "day_key": day_key,
-                        "period_no": period_no,
-                        "subject_name": parsed["subject_name"],
-                        "teacher": teacher,
-                        "special_room": special_room,
-                        "display_text": parsed["display_text"] or raw_text,
-                        "note": "",
-                    }
+                assignment, cell_issues = normalize_cell(
+                    workspace, classroom, day_key, period_no, raw_text, teacher_by_name, room_by_name
                 )
+                issues.extend(cell_issues)
+                if assignment:
+                    assignments.append(assignment)
 
     return assignments, issues
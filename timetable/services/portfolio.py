@@ -0,0 +1,255 @@
+"""
+Portfolio solving for ``generate_timetable_schedule``.
+
+Several configurations of the bitset engine (``PORTFOLIO``) race in a process
+pool against one deadline. They differ in tie-break seed, value ordering, and
+greedy versus backtracking search. The first complete timetable wins.
+Otherwise the best partial one wins, ranked by unplaced hours and then by
+blocks on soft-avoid days. When a job ID is given, progress goes to the cache
+so the import page can poll it while the upload request is still running.
+
+The web process runs threads, so workers are never forked from it. One pool
+is started from a ``forkserver`` (or ``spawn``) context on first use and kept
+for the life of the process. Its workers run ``django.setup`` once and get the
+picklable ``_portable_inputs`` with each race. A race asks losing members to
+stop through a manager event. With a single worker, or when the pool cannot
+start, the first configuration runs in process.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.core.cache import cache
+
+from .solver import (
+    DEFAULT_TIME_BUDGET_SECONDS,
+    VALUE_ORDER_EARLIEST,
+    VALUE_ORDER_LCV,
+    VALUE_ORDER_MIXED,
+    BitsetScheduler,
+)
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_TTL_SECONDS = 60 * 60
+PROGRESS_KEY_TEMPLATE = "timetable_solver:{job_id}"
+# Time allowed on top of the search budget for returning results.
+RESULT_GRACE_SECONDS = 2.0
+# Extra time for the first race, whose workers still start and load Django.
+POOL_STARTUP_SECONDS = 15.0
+# How often a member asks the manager whether its race is over.
+STOP_POLL_SECONDS = 0.1
+
+MODE_SEARCH = "search"
+MODE_GREEDY = "greedy"
+PORTFOLIO = (
+    {"label": "mixed", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_MIXED, "seed": 0},
+    {"label": "earliest", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_EARLIEST, "seed": 0},
+    {"label": "greedy", "mode": MODE_GREEDY, "value_order": VALUE_ORDER_MIXED, "seed": 0},
+    {"label": "lcv", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_LCV, "seed": 0},
+    {"label": "mixed-shuffled", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_MIXED, "seed": 101},
+    {"label": "earliest-shuffled", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_EARLIEST, "seed": 202},
+    {"label": "lcv-shuffled", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_LCV, "seed": 303},
+    {"label": "mixed-shuffled-2", "mode": MODE_SEARCH, "value_order": VALUE_ORDER_MIXED, "seed": 404},
+)
+
+_pool_lock = threading.Lock()
+_pool = None
+_pool_manager = None
+
+
+def _progress_key(job_id):
+    return PROGRESS_KEY_TEMPLATE.format(job_id=job_id)
+
+
+def publish_solver_progress(job_id, status, **fields):
+    if not job_id:
+        return None
+    payload = {"job_id": job_id, "status": status, "done": 0, "total": 0, "best_unplaced": None}
+    payload.update(fields)
+    cache.set(_progress_key(job_id), payload, PROGRESS_TTL_SECONDS)
+    return payload
+
+
+def get_solver_progress(job_id):
+    return cache.get(_progress_key(job_id))
+
+
+def _pool_context():
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _get_pool(workers):
+    """The shared pool and its manager, started on first use; ``started`` is true for a new pool."""
+    global _pool, _pool_manager
+    with _pool_lock:
+        if _pool is not None:
+            return _pool, _pool_manager, False
+        context = _pool_context()
+        _pool_manager = context.Manager()
+        # Referenced by name so unpickling it does not import this app before setup.
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=django.setup)
+        return _pool, _pool_manager, True
+
+
+def _discard_pool(pool):
+    global _pool, _pool_manager
+    with _pool_lock:
+        if _pool is not pool:
+            return
+        manager = _pool_manager
+        _pool, _pool_manager = None, None
+    pool.shutdown(wait=False, cancel_futures=True)
+    manager.shutdown()
+
+
+def _stop_poller(stop_event):
+    """A ``should_stop`` that asks the manager at most every ``STOP_POLL_SECONDS``."""
+    if stop_event is None:
+        return None
+    next_poll = time.monotonic()
+    stopped = False
+
+    def should_stop():
+        nonlocal next_poll, stopped
+        if not stopped and time.monotonic() >= next_poll:
+            next_poll = time.monotonic() + STOP_POLL_SECONDS
+            stopped = stop_event.is_set()
+        return stopped
+
+    return should_stop
+
+
+def _portable_inputs(parsed, state):
+    """Plain-dict copies of what the engine reads; ``parsed`` holds unpicklable lambdas."""
+    portable_parsed = {
+        key: parsed[key]
+        for key in ("days", "day_index", "slot_labels", "teachers", "assignment_map", "teacher_unavailable")
+    }
+    portable_parsed["grade_slot_map"] = dict(parsed["grade_slot_map"])
+    portable_parsed["rotation_groups"] = dict(parsed.get("rotation_groups", {}))
+    portable_state = {
+        key: dict(state[key])
+        for key in ("teacher_busy", "class_busy", "room_busy", "assignment_slots", "assignment_block_count", "assignment_block_starts")
+    }
+    return portable_parsed, portable_state
+
+
+def run_portfolio_member(config, tasks, parsed, state, time_budget_seconds, stop_event=None):
+    started = time.monotonic()
+    scheduler = BitsetScheduler(tasks, parsed, state, value_order=config["value_order"])
+    if config["mode"] == MODE_GREEDY:
+        placements = scheduler.greedy()
+    else:
+        placements = scheduler.solve(
+            time_budget_seconds=time_budget_seconds,
+            seed=config["seed"],
+            shuffle_first=bool(config["seed"]),
+            should_stop=_stop_poller(stop_event),
+        )
+        if placements is None:
+            placements = scheduler.best_rows()
+    placed_hours = sum(len(block_slots) for _assignment_id, _day, block_slots in placements)
+    soft_penalty = sum(
+        1
+        for assignment_id, day, _block_slots in placements
+        if day in parsed["assignment_map"][assignment_id]["soft_avoid_days"]
+    )
+    return dict(
+        scheduler.stats(),
+        label=config["label"],
+        placements=placements,
+        unplaced_hours=scheduler.total_hours - placed_hours,
+        soft_penalty=soft_penalty,
+        elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+    )
+
+
+def _rank(outcome):
+    return (outcome["unplaced_hours"], outcome["soft_penalty"])
+
+
+def _race(configs, tasks, parsed, state, *, time_budget_seconds, job_id):
+    executor, manager, started = _get_pool(len(configs))
+    stop_event = manager.Event()
+    deadline = time.monotonic() + time_budget_seconds + RESULT_GRACE_SECONDS
+    if started:
+        deadline += POOL_STARTUP_SECONDS
+    best = None
+    done = 0
+    pending = set()
+    try:
+        pending = {
+            executor.submit(run_portfolio_member, config, tasks, parsed, state, time_budget_seconds, stop_event)
+            for config in configs
+        }
+        while pending:
+            finished, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not finished:
+                logger.warning("[Timetable] portfolio deadline passed with %s members running", len(pending))
+                break
+            for future in finished:
+                done += 1
+                try:
+                    outcome = future.result()
+                except BrokenProcessPool:
+                    _discard_pool(executor)
+                    raise
+                except Exception:
+                    logger.exception("[Timetable] portfolio member failed")
+                    continue
+                if best is None or _rank(outcome) < _rank(best):
+                    best = outcome
+            publish_solver_progress(
+                job_id,
+                "running",
+                done=done,
+                total=len(configs),
+                best_unplaced=best["unplaced_hours"] if best else None,
+            )
+            if best and not best["unplaced_hours"]:
+                break
+    finally:
+        # The pool stays up for the next race; members still running see the event and stop.
+        stop_event.set()
+        for future in pending:
+            future.cancel()
+    return best
+
+
+def solve_portfolio(tasks, parsed, state, *, workers, time_budget_seconds=DEFAULT_TIME_BUDGET_SECONDS, job_id=None):
+    """
+    Race ``PORTFOLIO[:workers]`` on ``tasks`` and return the winning outcome.
+
+    The outcome holds ``placements`` (as from ``solve_tasks_bitset``; possibly
+    partial), ``unplaced_hours``, ``soft_penalty``, ``label`` and search stats.
+    ``state`` is not modified.
+    """
+    configs = PORTFOLIO[: max(1, min(workers, len(PORTFOLIO)))]
+    portable_parsed, portable_state = _portable_inputs(parsed, state)
+    publish_solver_progress(job_id, "running", total=len(configs))
+
+    best = None
+    if len(configs) > 1:
+        try:
+            best = _race(configs, tasks, portable_parsed, portable_state, time_budget_seconds=time_budget_seconds, job_id=job_id)
+        except (OSError, BrokenProcessPool):
+            logger.exception("[Timetable] could not run portfolio workers; solving in process")
+    if best is None:
+        best = run_portfolio_member(configs[0], tasks, portable_parsed, portable_state, time_budget_seconds)
+
+    publish_solver_progress(
+        job_id,
+        "done",
+        done=len(configs),
+        total=len(configs),
+        best_unplaced=best["unplaced_hours"],
+        label=best["label"],
+    )
+    return best
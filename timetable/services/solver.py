@@ -0,0 +1,457 @@
+"""
+Bitset search engine behind ``generate_timetable_schedule``.
+
+Each teacher, class and special room keeps one int for the week. Bit
+``day * slot_count + slot`` marks a busy slot, so a clash test is one AND and a
+day's load is a popcount over that day's bit range.
+
+The tasks of one assignment that share a block length form a unit. Each unit
+keeps the start bits it could still take. Placing a block re-filters only the
+units that share its teacher, class or room, and only on the placed day. A unit
+left without enough starts fails the branch at once (forward checking).
+
+Units are chosen most-constrained first (MRV: fewest starts per block still
+owed). Their starts are tried in the legacy preference order (soft avoid days,
+then days the assignment already uses). After that, round-robin units go
+earliest first, and the rest go least-constraining first (LCV), then by
+teacher load. The search restarts with shuffled ties on a Luby schedule of
+failure limits until it finishes or ``time_budget_seconds`` runs out. The first
+run is deterministic, so an easy workbook always gets the same timetable.
+
+``greedy`` makes one pass without backtracking. ``best_rows`` returns the
+deepest partial timetable any search reached. ``portfolio.py`` races both
+across worker processes.
+
+Round-robin (``순환배치``) rules depend on the order of placement, not only on
+what is placed. They are checked when a unit is chosen rather than propagated,
+with the same meaning as ``_is_rotation_unlocked`` and
+``_is_rotation_position_valid``.
+"""
+
+import random
+import time
+from bisect import insort
+from collections import defaultdict
+
+DEFAULT_TIME_BUDGET_SECONDS = 5.0
+VALUE_ORDER_MIXED = "mixed"
+VALUE_ORDER_EARLIEST = "earliest"
+VALUE_ORDER_LCV = "lcv"
+RESTART_BASE_FAILURES = 64
+_TIME_CHECK_INTERVAL = 128
+
+
+def _luby(index):
+    """Return the ``index``-th (0-based) term of 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+    size, power = 1, 0
+    while size < index + 1:
+        power += 1
+        size = 2 * size + 1
+    while size - 1 != index:
+        size = (size - 1) >> 1
+        power -= 1
+        index %= size
+    return 1 << power
+
+
+class _Assignment:
+    __slots__ = (
+        "assignment_id",
+        "teacher",
+        "klass",
+        "room",
+        "max_daily",
+        "daily_limit",
+        "soft_days",
+        "allowed",
+        "mask",
+        "block_count",
+        "starts",
+        "group",
+    )
+
+
+class _Unit:
+    __slots__ = ("assignment", "length", "block", "count", "domain", "union", "neighbors")
+
+
+class BitsetScheduler:
+    def __init__(self, tasks, parsed, state, *, value_order=VALUE_ORDER_MIXED):
+        self.value_order = value_order
+        self.days = list(parsed["days"])
+        self.slot_labels = list(parsed["slot_labels"])
+        self.slot_count = len(self.slot_labels)
+        day_bits = (1 << self.slot_count) - 1
+        self.day_masks = [day_bits << (day_idx * self.slot_count) for day_idx in range(len(self.days))]
+
+        self.teacher_ids = {}
+        self.class_ids = {}
+        self.room_ids = {}
+        self.teacher_busy = []
+        self.class_busy = []
+        self.room_busy = []
+        self.assignments = {}
+        for assignment_id, assignment in parsed["assignment_map"].items():
+            self.assignments[assignment_id] = self._compile_assignment(assignment, parsed, state)
+        for assignment_id, raw in parsed["assignment_map"].items():
+            group_ids = parsed.get("rotation_groups", {}).get(raw.get("rotation_group_key"), [])
+            if len(group_ids) > 1:
+                self.assignments[assignment_id].group = [self.assignments[aid] for aid in group_ids]
+
+        for key in state["teacher_busy"]:
+            self._mark(self.teacher_busy, self._index(self.teacher_ids, self.teacher_busy, key[0]), key[1], key[2])
+        for key in state["class_busy"]:
+            self._mark(self.class_busy, self._index(self.class_ids, self.class_busy, key[0]), key[1], key[2])
+        for key in state["room_busy"]:
+            self._mark(self.room_busy, self._index(self.room_ids, self.room_busy, key[0]), key[1], key[2])
+
+        lengths = defaultdict(int)
+        for task in tasks:
+            lengths[(task["assignment_id"], task["length"])] += 1
+        self.units = []
+        for (assignment_id, length), count in lengths.items():
+            unit = _Unit()
+            unit.assignment = self.assignments[assignment_id]
+            unit.length = length
+            unit.block = (1 << length) - 1
+            unit.count = count
+            unit.domain = [
+                position
+                for day_idx in range(len(self.days))
+                for position in range(day_idx * self.slot_count, (day_idx + 1) * self.slot_count - length + 1)
+                if not (unit.block << position) & ~unit.assignment.allowed and self._fits(unit, position)
+            ]
+            unit.union = self._union(unit, unit.domain)
+            self.units.append(unit)
+
+        by_resource = defaultdict(list)
+        for unit in self.units:
+            assignment = unit.assignment
+            by_resource[("teacher", assignment.teacher)].append(unit)
+            by_resource[("class", assignment.klass)].append(unit)
+            if assignment.room is not None:
+                by_resource[("room", assignment.room)].append(unit)
+        for unit in self.units:
+            assignment = unit.assignment
+            keys = [("teacher", assignment.teacher), ("class", assignment.klass)]
+            if assignment.room is not None:
+                keys.append(("room", assignment.room))
+            unit.neighbors = list({id(other): other for key in keys for other in by_resource[key]}.values())
+
+        self.remaining = len(tasks)
+        self.total_hours = sum(task["length"] for task in tasks)
+        self.placed_hours = 0
+        self.trail = []
+        self.placements = []
+        # Deepest partial timetable seen, kept for callers that can use one.
+        self.best_placements = []
+        self.best_hours = 0
+        self.nodes = 0
+        self.failures = 0
+        self.restarts = 0
+
+    @staticmethod
+    def _index(ids, masks, key):
+        if key not in ids:
+            ids[key] = len(masks)
+            masks.append(0)
+        return ids[key]
+
+    def _position(self, day, slot):
+        return self.days.index(day) * self.slot_count + self.slot_labels.index(slot)
+
+    def _mark(self, masks, index, day, slot):
+        masks[index] |= 1 << self._position(day, slot)
+
+    def _compile_assignment(self, assignment, parsed, state):
+        compiled = _Assignment()
+        compiled.assignment_id = assignment["배정번호"]
+        teacher_id = assignment["선생님코드"]
+        compiled.teacher = self._index(self.teacher_ids, self.teacher_busy, teacher_id)
+        compiled.klass = self._index(self.class_ids, self.class_busy, assignment["학급ID"])
+        compiled.room = None
+        if assignment["특별실처리"] != "해당없음" and assignment["특별실명"]:
+            compiled.room = self._index(self.room_ids, self.room_busy, assignment["특별실명"])
+        compiled.max_daily = parsed["teachers"][teacher_id]["max_daily"]
+        compiled.daily_limit = assignment.get("daily_subject_limit", 1)
+        compiled.soft_days = {parsed["day_index"][day] for day in assignment["soft_avoid_days"]}
+
+        allowed_slots = parsed["grade_slot_map"].get(assignment["학년"], set(self.slot_labels))
+        compiled.allowed = 0
+        for day_idx, day in enumerate(self.days):
+            if day in assignment["hard_avoid_days"]:
+                continue
+            for slot_idx, slot in enumerate(self.slot_labels):
+                if slot not in allowed_slots or (day, slot) in assignment["배치금지"]:
+                    continue
+                if (teacher_id, day, slot) in parsed["teacher_unavailable"]:
+                    continue
+                compiled.allowed |= 1 << (day_idx * self.slot_count + slot_idx)
+
+        assignment_id = compiled.assignment_id
+        compiled.mask = 0
+        for day, slot in state["assignment_slots"].get(assignment_id, []):
+            compiled.mask |= 1 << self._position(day, slot)
+        compiled.block_count = state["assignment_block_count"].get(assignment_id, 0)
+        compiled.starts = sorted(self._position(day, slot) for day, slot in state["assignment_block_starts"].get(assignment_id, []))
+        compiled.group = None
+        return compiled
+
+    def _busy(self, assignment):
+        busy = self.teacher_busy[assignment.teacher] | self.class_busy[assignment.klass]
+        if assignment.room is not None:
+            busy |= self.room_busy[assignment.room]
+        return busy
+
+    def _fits(self, unit, position):
+        assignment = unit.assignment
+        if (unit.block << position) & self._busy(assignment):
+            return False
+        day_mask = self.day_masks[position // self.slot_count]
+        if (self.teacher_busy[assignment.teacher] & day_mask).bit_count() + unit.length > assignment.max_daily:
+            return False
+        return (assignment.mask & day_mask).bit_count() + unit.length <= assignment.daily_limit
+
+    @staticmethod
+    def _union(unit, domain):
+        union = 0
+        for position in domain:
+            union |= unit.block << position
+        return union
+
+    def _has_room_for(self, unit):
+        if not unit.domain:
+            return False
+        if unit.count == 1:
+            return True
+        # An assignment takes at most ``daily_limit`` hours a day.
+        per_day = max(1, unit.assignment.daily_limit // unit.length)
+        return len({position // self.slot_count for position in unit.domain}) * per_day >= unit.count
+
+    def _unlocked(self, assignment):
+        if assignment.group is None:
+            return True
+        return assignment.block_count <= min(member.block_count for member in assignment.group)
+
+    def _rotation_floor(self, assignment):
+        """Earliest start the assignment's next block may take, or ``None`` if none can."""
+        prereq_round = assignment.block_count
+        if assignment.group is None or prereq_round == 0:
+            return -1
+        floor = -1
+        for member in assignment.group:
+            if member is assignment:
+                continue
+            if len(member.starts) < prereq_round:
+                return None
+            floor = max(floor, member.starts[prereq_round - 1])
+        return floor
+
+    def _select(self, skip=()):
+        best_unit = None
+        best_candidates = None
+        best_key = None
+        for unit in self.units:
+            if not unit.count or unit in skip or not self._unlocked(unit.assignment):
+                continue
+            floor = self._rotation_floor(unit.assignment)
+            candidates = [] if floor is None else [position for position in unit.domain if position >= floor]
+            if not candidates:
+                return unit, []
+            # Starts per block still to place, so a unit owing three lessons counts as tighter.
+            key = (len(candidates) / unit.count, -unit.length, -len(unit.neighbors))
+            if best_key is None or key < best_key:
+                best_unit, best_candidates, best_key = unit, candidates, key
+        return best_unit, best_candidates or []
+
+    def _order(self, unit, candidates, rng):
+        assignment = unit.assignment
+        teacher_busy = self.teacher_busy[assignment.teacher]
+        if self.value_order == VALUE_ORDER_MIXED:
+            earliest = assignment.group is not None
+        else:
+            earliest = self.value_order == VALUE_ORDER_EARLIEST
+        scored = []
+        for position in candidates:
+            day_idx = position // self.slot_count
+            day_mask = self.day_masks[day_idx]
+            preference = (2 if day_idx in assignment.soft_days else 0, 1 if assignment.mask & day_mask else 0)
+            jitter = rng.random() if rng else 0.0
+            if earliest:
+                # Each round must start after the previous round of the whole group,
+                # so earliest-first keeps later rounds placeable.
+                scored.append(preference + (jitter, position))
+                continue
+            block = unit.block << position
+            lcv = 0.0
+            for other in unit.neighbors:
+                if other is not unit and other.count and other.union & block:
+                    lcv += other.count / len(other.domain)
+            scored.append(preference + (round(lcv, 6), (teacher_busy & day_mask).bit_count(), jitter, position))
+        scored.sort()
+        return [item[-1] for item in scored]
+
+    def _place(self, unit, position):
+        assignment = unit.assignment
+        block = unit.block << position
+        self.teacher_busy[assignment.teacher] |= block
+        self.class_busy[assignment.klass] |= block
+        if assignment.room is not None:
+            self.room_busy[assignment.room] |= block
+        assignment.mask |= block
+        assignment.block_count += 1
+        insort(assignment.starts, position)
+        unit.count -= 1
+        self.remaining -= 1
+        self.placed_hours += unit.length
+        self.placements.append((unit, position))
+        self.trail.append((unit, position, None))
+        if self.placed_hours > self.best_hours:
+            self.best_hours = self.placed_hours
+            self.best_placements = list(self.placements)
+
+        day_start = position - position % self.slot_count
+        day_end = day_start + self.slot_count
+        feasible = True
+        for other in unit.neighbors:
+            if not other.count:
+                continue
+            domain = [
+                start
+                for start in other.domain
+                if start < day_start or start >= day_end or self._fits(other, start)
+            ]
+            if len(domain) != len(other.domain):
+                self.trail.append((other, other.domain, other.union))
+                other.domain = domain
+                other.union = self._union(other, domain)
+            if not self._has_room_for(other):
+                feasible = False
+        return feasible
+
+    def _undo(self, mark):
+        while len(self.trail) > mark:
+            unit, value, union = self.trail.pop()
+            if union is not None:
+                unit.domain, unit.union = value, union
+                continue
+            assignment = unit.assignment
+            block = unit.block << value
+            self.teacher_busy[assignment.teacher] &= ~block
+            self.class_busy[assignment.klass] &= ~block
+            if assignment.room is not None:
+                self.room_busy[assignment.room] &= ~block
+            assignment.mask &= ~block
+            assignment.block_count -= 1
+            assignment.starts.remove(value)
+            unit.count += 1
+            self.remaining += 1
+            self.placed_hours -= unit.length
+            self.placements.pop()
+
+    def _search(self, failure_limit, rng, deadline, should_stop):
+        """Depth-first search; ``True`` when solved, ``False`` when exhausted, ``None`` to restart."""
+        frames = []
+        failure_cap = self.failures + failure_limit
+        while True:
+            if not self.remaining:
+                return True
+            self.nodes += 1
+            if self.nodes % _TIME_CHECK_INTERVAL == 0 and self._out_of_time(deadline, should_stop):
+                return None
+            unit, candidates = self._select()
+            if candidates:
+                frames.append([unit, self._order(unit, candidates, rng), 0, len(self.trail)])
+            else:
+                self.failures += 1
+            while frames:
+                frame = frames[-1]
+                self._undo(frame[3])
+                if frame[2] >= len(frame[1]):
+                    frames.pop()
+                    continue
+                position = frame[1][frame[2]]
+                frame[2] += 1
+                if self._place(frame[0], position):
+                    break
+                self.failures += 1
+            else:
+                return False
+            if self.failures > failure_cap:
+                return None
+
+    @staticmethod
+    def _out_of_time(deadline, should_stop):
+        return time.monotonic() >= deadline or bool(should_stop and should_stop())
+
+    def _rows(self, placements):
+        return [
+            (
+                unit.assignment.assignment_id,
+                self.days[position // self.slot_count],
+                self.slot_labels[position % self.slot_count : position % self.slot_count + unit.length],
+            )
+            for unit, position in placements
+        ]
+
+    def best_rows(self):
+        """The deepest partial timetable any run reached, as ``solve`` placements."""
+        return self._rows(self.best_placements)
+
+    def solve(self, *, time_budget_seconds=DEFAULT_TIME_BUDGET_SECONDS, seed=0, shuffle_first=False, should_stop=None):
+        """
+        Return ``(assignment_id, day, block_slots)`` placements in search order, or ``None``.
+
+        ``shuffle_first`` shuffles ties from the first run on. ``should_stop()``
+        is polled with the clock and ends the search early when it returns true.
+        """
+        deadline = time.monotonic() + max(0.0, time_budget_seconds)
+        if any(unit.count and not self._has_room_for(unit) for unit in self.units):
+            return None
+        run = 0
+        while True:
+            rng = random.Random(seed + run) if run or shuffle_first else None
+            outcome = self._search(RESTART_BASE_FAILURES * _luby(run), rng, deadline, should_stop)
+            placements = self._rows(self.placements)
+            self._undo(0)
+            if outcome:
+                return placements
+            if outcome is False or self._out_of_time(deadline, should_stop):
+                return None
+            run += 1
+            self.restarts = run
+
+    def greedy(self):
+        """One pass without backtracking: most-constrained unit first, best start, skip units with none."""
+        skipped = set()
+        while self.remaining:
+            unit, candidates = self._select(skipped)
+            if unit is None:
+                break
+            if not candidates:
+                skipped.add(unit)
+                continue
+            self._place(unit, self._order(unit, candidates, None)[0])
+        placements = self._rows(self.placements)
+        self._undo(0)
+        return placements
+
+    def stats(self):
+        return {"nodes": self.nodes, "failures": self.failures, "restarts": self.restarts}
+
+
+def solve_tasks_bitset(tasks, parsed, state, *, time_budget_seconds=DEFAULT_TIME_BUDGET_SECONDS, seed=0):
+    """
+    Place ``tasks`` around the fixed blocks already in ``state``.
+
+    Returns ``(placements, stats)``. ``placements`` lists
+    ``(assignment_id, day, block_slots)`` in an order ``_apply_block`` can
+    replay, or is ``None`` when no full timetable was found in the budget.
+    ``state`` is not modified.
+    """
+    started = time.monotonic()
+    scheduler = BitsetScheduler(tasks, parsed, state)
+    placements = scheduler.solve(time_budget_seconds=time_budget_seconds, seed=seed)
+    stats = scheduler.stats()
+    stats["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+    return placements, stats
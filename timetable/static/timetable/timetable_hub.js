@@ -35,7 +35,10 @@
     changeVersion: 0,
     editingEventId: null,
     eventSlotMap: {},
+    validationRevision: "",
+    cellValidationQueue: Promise.resolve(),
   };
+  const MAX_INCREMENTAL_CELLS = 40;
   state.lastSavedSignature = JSON.stringify(state.sheetData || []);
 
   const classroomMap = {};
@@ -682,6 +685,104 @@
     return { cell_messages: cellMessages };
   };
 
+  const collectChangedCells = (previousSheets, nextSheets) => {
+    const previousByName = {};
+    (previousSheets || []).forEach((sheet) => {
+      previousByName[sheet.name] = sheet;
+    });
+    const changed = [];
+    (nextSheets || []).forEach((sheet) => {
+      const previous = previousByName[sheet.name];
+      (bootstrap.period_labels || []).forEach((_periodLabel, periodOffset) => {
+        const periodNo = periodOffset + 1;
+        (bootstrap.days || []).forEach((dayKey, dayOffset) => {
+          const text = extractCellText((sheet.data?.[periodNo] || [])[dayOffset + 1]);
+          const previousText = extractCellText((previous?.data?.[periodNo] || [])[dayOffset + 1]);
+          if (text !== previousText) {
+            changed.push({ sheet_name: sheet.name, day_key: dayKey, period_no: periodNo, text });
+          }
+        });
+      });
+    });
+    return changed;
+  };
+
+  const removeMessages = (items, removed) => {
+    const next = [...(items || [])];
+    (removed || []).forEach((message) => {
+      const index = next.indexOf(message);
+      if (index >= 0) {
+        next.splice(index, 1);
+      }
+    });
+    return next;
+  };
+
+  const applyValidationDelta = (delta) => {
+    const cellMessages = { ...(state.validation.cell_messages || {}) };
+    Object.keys(delta.cell_messages || {}).forEach((cellKey) => {
+      if ((delta.cell_messages[cellKey] || []).length) {
+        cellMessages[cellKey] = delta.cell_messages[cellKey];
+      } else {
+        delete cellMessages[cellKey];
+      }
+    });
+    renderValidation({
+      conflicts: [...removeMessages(state.validation.conflicts, delta.conflicts_removed), ...(delta.conflicts_added || [])],
+      warnings: [...removeMessages(state.validation.warnings, delta.warnings_removed), ...(delta.warnings_added || [])],
+      cell_messages: cellMessages,
+      summary: delta.summary || {},
+    });
+    applyConflictHighlights();
+  };
+
+  const runFullValidation = async () => {
+    const payload = await postJson(bootstrap.validate_url, { sheet_data: state.sheetData });
+    state.validationRevision = payload.validation_revision || "";
+    renderValidation(payload.validation);
+    renderTeacherStats(payload.teacher_stats);
+    applyConflictHighlights();
+  };
+
+  const validateChangedCells = async (cells) => {
+    if (state.validationRevision && cells.length <= MAX_INCREMENTAL_CELLS) {
+      try {
+        const delta = await postJson(bootstrap.validate_cells_url, {
+          validation_revision: state.validationRevision,
+          cells,
+        });
+        state.validationRevision = delta.validation_revision || "";
+        applyValidationDelta(delta);
+        return;
+      } catch (error) {
+        // 409: the server no longer holds this revision; rebuild it from the full sheet.
+        if (error.status !== 409) {
+          throw error;
+        }
+      }
+    }
+    await runFullValidation();
+  };
+
+  const queueCellValidation = (cells) => {
+    if (!cells.length) {
+      return;
+    }
+    state.cellValidationQueue = state.cellValidationQueue
+      .then(() => validateChangedCells(cells))
+      .catch(() => {
+        state.validationRevision = "";
+        const localValidation = buildLocalValidation();
+        renderValidation({
+          conflicts: state.validation.conflicts || [],
+          warnings: state.validation.warnings || [],
+          cell_messages: localValidation.cell_messages,
+          summary: state.validation.summary || {},
+        });
+        applyConflictHighlights();
+      });
+  };
+
   const runAutosave = async () => {
     window.clearTimeout(state.autosaveTimer);
     if (state.saveInFlight) {
@@ -925,6 +1026,7 @@
       onChange(data) {
         const nextSheetData = data || [];
         const nextSignature = JSON.stringify(nextSheetData);
+        const previousSheetData = state.sheetData;
         state.sheetData = nextSheetData;
         if (!state.workbookReady || nextSignature === state.lastSavedSignature) {
           return;
@@ -934,14 +1036,7 @@
           setSaveStatus("변경 없음", "idle");
           return;
         }
-        const localValidation = buildLocalValidation();
-        renderValidation({
-          conflicts: state.validation.conflicts || [],
-          warnings: state.validation.warnings || [],
-          cell_messages: localValidation.cell_messages,
-          summary: state.validation.summary || {},
-        });
-        applyConflictHighlights();
+        queueCellValidation(collectChangedCells(previousSheetData, nextSheetData));
         scheduleAutosave();
       },
       ref,
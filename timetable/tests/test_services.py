@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from reservations.models import RecurringSchedule, School, SpecialRoom
@@ -15,14 +16,19 @@ from timetable.models import (
     TimetableWorkspace,
 )
 from timetable.services import (
+    ConflictIndex,
+    ConflictIndexEvicted,
     build_classroom_date_rows,
     build_effective_date_assignments,
     build_effective_event_payloads,
     build_meeting_matrix,
     build_progress_summary,
     build_publish_readiness,
+    load_conflict_index,
+    normalize_cell,
     parse_display_text,
     publish_to_reservations,
+    store_conflict_index,
     validate_workspace_assignments,
 )
 
@@ -308,3 +314,158 @@ class TimetableServiceTests(TestCase):
         readiness = build_publish_readiness(self.workspace, {"conflicts": [], "warnings": []}, summary)
         self.assertFalse(readiness["can_publish"])
         self.assertEqual(readiness["workflow_stage"], "review_required")
+
+    def test_conflict_index_cell_edits_match_full_validation(self):
+        event = TimetableSharedEvent.objects.create(
+            school=self.school,
+            school_year=2026,
+            term="1학기",
+            scope_type=TimetableSharedEvent.ScopeType.SCHOOL,
+            title="체육대회",
+            day_key="화",
+            period_start=1,
+            period_end=1,
+        )
+        room_policies = list(self.workspace.room_policies.all())
+        effective_events = build_effective_event_payloads(self.workspace, [event])
+        teacher_by_name = {self.teacher.name: self.teacher}
+        room_by_name = {self.room.name: self.room}
+        grid = {}
+
+        def set_cell(classroom, day_key, text):
+            assignment, issues = normalize_cell(self.workspace, classroom, day_key, 1, text, teacher_by_name, room_by_name)
+            item = TimetableSlotAssignment(**assignment) if assignment else None
+            grid[f"{classroom.id}:{day_key}:1"] = (item, issues)
+            return f"{classroom.id}:{day_key}:1", item, issues
+
+        def full_validation():
+            return validate_workspace_assignments(
+                self.workspace,
+                [item for item, _issues in grid.values() if item],
+                room_policies,
+                issues=[issue for _item, issues in grid.values() for issue in issues],
+                effective_events=effective_events,
+            )
+
+        set_cell(self.classroom1, "월", "영어(홍길동)")
+        index = ConflictIndex.build(
+            [item for item, _issues in grid.values()],
+            room_policies,
+            effective_events=effective_events,
+        )
+        validation = full_validation()
+        edits = [
+            (self.classroom2, "월", "음악(홍길동) @ 과학실"),
+            (self.classroom1, "월", "과학(홍길동) @ 과학실"),
+            (self.classroom2, "화", "체육(없는교사)"),
+            (self.classroom2, "월", ""),
+            (self.classroom1, "월", "(홍길동)"),
+        ]
+        for classroom, day_key, text in edits:
+            delta = index.apply_cell(*set_cell(classroom, day_key, text))
+            expected = full_validation()
+            result = index.to_result()
+            self.assertCountEqual(result["conflicts"], expected["conflicts"])
+            self.assertEqual(
+                {key: messages for key, messages in result["cell_messages"].items() if messages},
+                {key: messages for key, messages in expected["cell_messages"].items() if messages},
+            )
+            self.assertEqual(delta["summary"], expected["summary"])
+            patched = dict(validation["cell_messages"], **delta["cell_messages"])
+            self.assertEqual(
+                {key: messages for key, messages in patched.items() if messages},
+                {key: messages for key, messages in expected["cell_messages"].items() if messages},
+            )
+            conflicts = list(validation["conflicts"]) + delta["conflicts_added"]
+            for message in delta["conflicts_removed"]:
+                conflicts.remove(message)
+            self.assertCountEqual(conflicts, expected["conflicts"])
+            validation = expected
+
+    def test_stored_conflict_index_edits_match_full_validation(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        room_policies = list(self.workspace.room_policies.all())
+        teacher_by_name = {self.teacher.name: self.teacher}
+        room_by_name = {self.room.name: self.room}
+        grid = {}
+
+        def set_cell(classroom, day_key, text):
+            assignment, issues = normalize_cell(self.workspace, classroom, day_key, 1, text, teacher_by_name, room_by_name)
+            item = TimetableSlotAssignment(**assignment) if assignment else None
+            grid[f"{classroom.id}:{day_key}:1"] = (item, issues)
+            return f"{classroom.id}:{day_key}:1", item, issues
+
+        set_cell(self.classroom1, "월", "영어(홍길동)")
+        set_cell(self.classroom2, "화", "수학(홍길동) @ 과학실")
+        revision = store_conflict_index(
+            self.workspace.id,
+            ConflictIndex.build([item for item, _issues in grid.values()], room_policies),
+        )
+        edits = [
+            (self.classroom2, "월", "음악(홍길동) @ 과학실"),
+            (self.classroom1, "월", "과학(홍길동) @ 과학실"),
+            (self.classroom2, "월", ""),
+            (self.classroom1, "화", "(홍길동)"),
+        ]
+        for classroom, day_key, text in edits:
+            index = load_conflict_index(self.workspace.id, revision)
+            self.assertIsNotNone(index)
+            delta = index.apply_cell(*set_cell(classroom, day_key, text))
+            previous_revision, revision = revision, store_conflict_index(self.workspace.id, index)
+            expected = validate_workspace_assignments(
+                self.workspace,
+                [item for item, _issues in grid.values() if item],
+                room_policies,
+                issues=[issue for _item, issues in grid.values() for issue in issues],
+            )
+            self.assertEqual(delta["summary"], expected["summary"])
+            for cell_key, messages in delta["cell_messages"].items():
+                self.assertEqual(messages, expected["cell_messages"].get(cell_key, []))
+            self.assertIsNone(load_conflict_index(self.workspace.id, previous_revision))
+
+        rebuilt = ConflictIndex.build(
+            [item for item, _issues in grid.values() if item],
+            room_policies,
+            issues=[issue for _item, issues in grid.values() for issue in issues],
+        )
+        self.assertEqual(load_conflict_index(self.workspace.id, revision).summary(), rebuilt.summary())
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "culled"}})
+    def test_culled_conflict_index_entries_force_a_resync(self):
+        # 400 cells overflow the default 300-entry cache, so some entries of the build are culled.
+        cache.clear()
+        self.addCleanup(cache.clear)
+        teacher_by_name = {self.teacher.name: self.teacher}
+        assignments = []
+        for day_key in ("월", "화", "수", "목", "금"):
+            for period_no in range(1, 81):
+                assignment, _issues = normalize_cell(
+                    self.workspace, self.classroom1, day_key, period_no, "영어(홍길동)", teacher_by_name, {}
+                )
+                assignments.append(TimetableSlotAssignment(**assignment))
+        revision = store_conflict_index(self.workspace.id, ConflictIndex.build(assignments, []))
+
+        evicted = 0
+        for assignment in assignments:
+            index = load_conflict_index(self.workspace.id, revision)
+            self.assertIsNotNone(index)
+            assignment_data, issues = normalize_cell(
+                self.workspace,
+                self.classroom2,
+                assignment.day_key,
+                assignment.period_no,
+                "수학(홍길동)",
+                teacher_by_name,
+                {},
+            )
+            cell_key = f"{self.classroom2.id}:{assignment.day_key}:{assignment.period_no}"
+            try:
+                delta = index.apply_cell(cell_key, TimetableSlotAssignment(**assignment_data), issues)
+            except ConflictIndexEvicted:
+                evicted += 1
+                continue
+            # Whatever survived must still see the clash with the stored cell.
+            self.assertTrue(delta["cell_messages"][cell_key])
+            self.assertEqual(delta["summary"]["assignment_count"], 401)
+        self.assertGreater(evicted, 0)
@@ -0,0 +1,141 @@
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from timetable.management.commands.benchmark_timetable_solver import build_benchmark_workbook
+from timetable.services.legacy_import import (
+    SOLVER_BACKTRACKING,
+    SOLVER_BITSET,
+    SOLVER_PORTFOLIO,
+    _build_assignment_tasks,
+    _empty_schedule_state,
+    _tasks_left_after,
+    generate_timetable_schedule,
+)
+from timetable.services.portfolio import PORTFOLIO, get_solver_progress, run_portfolio_member, solve_portfolio
+from timetable.services.solver import _luby, solve_tasks_bitset
+
+
+def _parsed(assignments, *, days=("월", "화"), slot_labels=("1", "2"), max_daily=4):
+    slot_labels = list(slot_labels)
+    rotation_groups = defaultdict(list)
+    for assignment in assignments:
+        if assignment.get("rotation_group_key"):
+            rotation_groups[assignment["rotation_group_key"]].append(assignment["배정번호"])
+    return {
+        "days": list(days),
+        "day_index": {day: idx for idx, day in enumerate(days)},
+        "slot_labels": slot_labels,
+        "slot_index": {slot: idx for idx, slot in enumerate(slot_labels)},
+        "grade_slot_map": defaultdict(lambda: set(slot_labels)),
+        "teachers": {"T1": {"teacher_id": "T1", "max_daily": max_daily}},
+        "assignments": assignments,
+        "assignment_map": {assignment["배정번호"]: assignment for assignment in assignments},
+        "teacher_unavailable": set(),
+        "rotation_groups": dict(rotation_groups),
+    }
+
+
+def _assignment(assignment_id, class_no, weekly_hours, *, rotation=True):
+    return {
+        "배정번호": assignment_id,
+        "선생님코드": "T1",
+        "교과": "영어",
+        "학년": 3,
+        "반": class_no,
+        "학급ID": f"3-{class_no}",
+        "주당시수": weekly_hours,
+        "특별실명": "",
+        "특별실처리": "해당없음",
+        "배치금지": set(),
+        "hard_avoid_days": set(),
+        "soft_avoid_days": set(),
+        "split_pattern": None,
+        "daily_subject_limit": 1,
+        "rotation_group_key": (3, "영어") if rotation else None,
+    }
+
+
+class BitsetTimetableSolverTests(SimpleTestCase):
+    def test_luby_sequence(self):
+        self.assertEqual([_luby(index) for index in range(8)], [1, 1, 2, 1, 1, 2, 4, 1])
+
+    def test_solution_respects_teacher_day_limit_and_round_robin(self):
+        assignments = [_assignment(f"A{no}", no, 2) for no in range(1, 4)]
+        parsed = _parsed(assignments, days=("월", "화", "수"), max_daily=2)
+        state = _empty_schedule_state()
+        tasks = [task for assignment in assignments for task in _build_assignment_tasks(assignment, 2, {})]
+
+        placements, _stats = solve_tasks_bitset(tasks, parsed, state)
+
+        self.assertIsNotNone(placements)
+        self.assertEqual(len(placements), 6)
+        self.assertEqual(state["assignment_block_count"], {})
+        per_day = defaultdict(int)
+        rounds = defaultdict(list)
+        for assignment_id, day, slots in placements:
+            per_day[day] += len(slots)
+            rounds[assignment_id].append((parsed["day_index"][day], parsed["slot_index"][slots[0]]))
+        self.assertLessEqual(max(per_day.values()), 2)
+        first_turns = [min(positions) for positions in rounds.values()]
+        second_turns = [max(positions) for positions in rounds.values()]
+        self.assertGreater(min(second_turns), max(first_turns))
+
+    def test_returns_none_when_hours_do_not_fit(self):
+        assignments = [_assignment("A1", 1, 3, rotation=False)]
+        parsed = _parsed(assignments)
+        tasks = _build_assignment_tasks(assignments[0], 3, {})
+
+        placements, _stats = solve_tasks_bitset(tasks, parsed, _empty_schedule_state())
+
+        self.assertIsNone(placements)
+
+    def test_generated_workbook_is_fully_placed(self):
+        result = generate_timetable_schedule(build_benchmark_workbook(3), solver=SOLVER_BITSET)
+
+        self.assertTrue(result["is_success"], result["errors"])
+        self.assertEqual(result["summary"]["placed_count"], result["summary"]["total_needed"])
+        self.assertEqual(result["warnings"], [])
+
+    def test_backtracking_solver_still_selectable(self):
+        result = generate_timetable_schedule(build_benchmark_workbook(1), solver=SOLVER_BACKTRACKING)
+
+        self.assertTrue(result["is_success"], result["errors"])
+
+
+class PortfolioTimetableSolverTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_greedy_member_reports_partial_outcome(self):
+        assignments = [_assignment("A1", 1, 3, rotation=False), _assignment("A2", 2, 1, rotation=False)]
+        parsed = _parsed(assignments)
+        tasks = _build_assignment_tasks(assignments[0], 3, {}) + _build_assignment_tasks(assignments[1], 1, {})
+        greedy = next(config for config in PORTFOLIO if config["mode"] == "greedy")
+
+        outcome = run_portfolio_member(greedy, tasks, parsed, _empty_schedule_state(), 1.0)
+
+        self.assertEqual(outcome["unplaced_hours"], 1)
+        self.assertEqual(len(_tasks_left_after(tasks, outcome["placements"])), 1)
+        self.assertEqual(_tasks_left_after(tasks, outcome["placements"])[0]["assignment_id"], "A1")
+
+    def test_in_process_portfolio_publishes_progress(self):
+        assignments = [_assignment(f"A{no}", no, 2) for no in range(1, 3)]
+        parsed = _parsed(assignments)
+        tasks = [task for assignment in assignments for task in _build_assignment_tasks(assignment, 2, {})]
+
+        outcome = solve_portfolio(tasks, parsed, _empty_schedule_state(), workers=1, job_id="1:job")
+
+        self.assertEqual(outcome["unplaced_hours"], 0)
+        self.assertEqual(outcome["label"], PORTFOLIO[0]["label"])
+        self.assertEqual(get_solver_progress("1:job")["status"], "done")
+
+    @override_settings(TIMETABLE_SOLVER_WORKERS=2)
+    def test_generated_workbook_solved_by_process_pool(self):
+        for job_id in ("1:pool", "2:pool"):
+            result = generate_timetable_schedule(build_benchmark_workbook(3), solver=SOLVER_PORTFOLIO, job_id=job_id)
+
+            self.assertTrue(result["is_success"], result["errors"])
+            self.assertEqual(get_solver_progress(job_id)["best_unplaced"], 0)
+            self.assertEqual(get_solver_progress(job_id)["total"], 2)
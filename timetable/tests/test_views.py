@@ -184,6 +184,50 @@ class TimetableViewTests(TestCase):
         self.assertIn("영어", str(self.workspace.sheet_data))
         self.assertEqual(self.workspace.assignments.count(), 1)
 
+    def test_validate_cells_applies_edits_to_seeded_index(self):
+        self.client.force_login(self.user)
+        TimetableTeacher.objects.create(
+            school=self.school,
+            name="홍길동",
+            teacher_type=TimetableTeacher.TeacherType.INSTRUCTOR,
+        )
+        classroom2 = TimetableClassroom.objects.create(school=self.school, school_year=2026, grade=3, class_no=2)
+        sheet_data = [self._build_sheet("3-1반", "영어(홍길동)"), self._build_sheet("3-2반")]
+        seeded = self.client.post(
+            reverse("timetable:api_validate", args=[self.workspace.id]),
+            data={"sheet_data": sheet_data},
+            content_type="application/json",
+        ).json()
+        self.assertEqual(seeded["validation"]["summary"]["conflict_count"], 0)
+
+        response = self.client.post(
+            reverse("timetable:api_validate_cells", args=[self.workspace.id]),
+            data={
+                "validation_revision": seeded["validation_revision"],
+                "cells": [{"sheet_name": "3-2반", "day_key": "월", "period_no": 1, "text": "음악(홍길동)"}],
+            },
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(len(payload["conflicts_added"]), 1)
+        self.assertIn("홍길동", payload["conflicts_added"][0])
+        self.assertEqual(
+            set(payload["cell_messages"]),
+            {f"{self.classroom.id}:월:1", f"{classroom2.id}:월:1"},
+        )
+        self.assertEqual(payload["summary"]["conflict_count"], 1)
+
+        stale = self.client.post(
+            reverse("timetable:api_validate_cells", args=[self.workspace.id]),
+            data={
+                "validation_revision": seeded["validation_revision"],
+                "cells": [{"sheet_name": "3-2반", "day_key": "월", "period_no": 1, "text": ""}],
+            },
+            content_type="application/json",
+        )
+        self.assertEqual(stale.status_code, 409)
+
     def test_share_view_renders_class_snapshot(self):
         TimetableTeacher.objects.create(
             school=self.school,
@@ -7,6 +7,7 @@ app_name = "timetable"
 urlpatterns = [
     path("", views.main, name="main"),
     path("import/legacy/", views.legacy_import, name="legacy_import"),
+    path("import/legacy/progress/<str:job_id>/", views.legacy_import_progress, name="legacy_import_progress"),
     path("template/", legacy_views.download_template, name="download_template"),
     path("sync-logs.csv", legacy_views.download_sync_logs_csv, name="download_sync_logs_csv"),
     path("edit/<str:token>/", views.class_edit_view, name="class_edit"),
@@ -15,6 +16,7 @@ urlpatterns = [
     path("api/setup/batch-create", views.api_setup_batch_create, name="api_setup_batch_create"),
     path("api/workspaces/<int:workspace_id>/autosave", views.api_autosave, name="api_autosave"),
     path("api/workspaces/<int:workspace_id>/validate", views.api_validate, name="api_validate"),
+    path("api/workspaces/<int:workspace_id>/validate/cells", views.api_validate_cells, name="api_validate_cells"),
     path("api/workspaces/<int:workspace_id>/class-links/issue", views.api_issue_class_link, name="api_issue_class_link"),
     path(
         "api/workspaces/<int:workspace_id>/class-links/<int:link_id>/revoke",
@@ -1,5 +1,6 @@
 import json
 import re
+import uuid
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
@@ -36,6 +37,8 @@ from .models import (
     TimetableWorkspace,
 )
 from .services import (
+    ConflictIndex,
+    ConflictIndexEvicted,
     assignments_to_sheet_data,
     apply_meeting_selections,
     build_classroom_date_rows,
@@ -55,18 +58,22 @@ from .services import (
     generate_timetable_schedule,
     get_workspace_date_overrides,
     get_effective_shared_events,
+    get_solver_progress,
     legacy_generated_result_to_sheet_data,
+    load_conflict_index,
     log_timetable_event,
+    normalize_cell,
     normalize_sheet_data,
     parse_display_text,
     publish_to_reservations,
     resolve_actor_name,
     serialize_validation_result,
     serialize_recent_activity,
+    store_conflict_index,
     validate_timetable_workbook,
     validate_workspace_assignments,
 )
-from .services.normalizer import build_display_text
+from .services.normalizer import build_display_text, classroom_sheet_name
 
 
 SERVICE_TITLE = "우리학교 시간표"
@@ -1898,6 +1905,7 @@ def workspace_detail(request, workspace_id):
                 "period_labels": list(workspace.period_labels),
                 "autosave_url": reverse("timetable:api_autosave", args=[workspace.id]),
                 "validate_url": reverse("timetable:api_validate", args=[workspace.id]),
+                "validate_cells_url": reverse("timetable:api_validate_cells", args=[workspace.id]),
                 "snapshots_url": reverse("timetable:api_snapshots", args=[workspace.id]),
                 "publish_url": reverse("timetable:api_publish", args=[workspace.id]),
                 "events_url": reverse("timetable:api_events", args=[workspace.id]),
@@ -1953,17 +1961,24 @@ def api_validate(request, workspace_id):
         return _json_error("JSON 형식이 올바르지 않습니다.")
     sheet_data = payload.get("sheet_data")
 
+    validation_revision = ""
     if isinstance(sheet_data, list):
         _classrooms, teachers, _rooms, runtime_assignments, issues = _build_runtime_assignments(workspace, sheet_data)
         room_policies = _ensure_room_policies(workspace)
+        effective_events = _build_effective_events(workspace)
         validation = validate_workspace_assignments(
             workspace,
             runtime_assignments,
             room_policies,
             issues=issues,
-            effective_events=_build_effective_events(workspace),
+            effective_events=effective_events,
         )
         teacher_stats = build_teacher_stat_rows(teachers, runtime_assignments)
+        # Seed the index the editor's single-cell checks (api_validate_cells) build on.
+        validation_revision = store_conflict_index(
+            workspace.id,
+            ConflictIndex.build(runtime_assignments, room_policies, issues=issues, effective_events=effective_events),
+        )
     else:
         state = _build_workspace_state(workspace)
         validation = state["validation"]
@@ -1975,10 +1990,72 @@ def api_validate(request, workspace_id):
         validation=validation,
         teacher_stats=teacher_stats,
     )
-    response_payload["ok"] = True
+    response_payload.update({"ok": True, "validation_revision": validation_revision})
     return JsonResponse(response_payload)
 
 
+@login_required
+@require_POST
+def api_validate_cells(request, workspace_id):
+    workspace = _get_editable_workspace_or_404(request, workspace_id)
+    payload = _parse_json_request(request)
+    if payload is None:
+        return _json_error("JSON 형식이 올바르지 않습니다.")
+    cells = payload.get("cells")
+    if not isinstance(cells, list) or not cells:
+        return _json_error("cells가 필요합니다.")
+
+    index = load_conflict_index(workspace.id, str(payload.get("validation_revision") or ""))
+    if index is None:
+        return _json_error("전체 검사를 다시 실행해 주세요.", status=409)
+
+    if not all(isinstance(cell, dict) for cell in cells):
+        return _json_error("cells 형식이 올바르지 않습니다.")
+    # Only the teachers and rooms the edited cells name are looked up, not the whole school.
+    parsed_cells = [parse_display_text(str(cell.get("text") or "").strip()) for cell in cells]
+    teacher_names = {parsed["teacher_name"] for parsed in parsed_cells if parsed["teacher_name"]}
+    room_names = {parsed["room_name"] for parsed in parsed_cells if parsed["room_name"]}
+    classroom_by_sheet = {classroom_sheet_name(classroom): classroom for classroom in _workspace_classrooms(workspace)}
+    teacher_by_name = {
+        teacher.name: teacher
+        for teacher in TimetableTeacher.objects.filter(school=workspace.school, is_active=True, name__in=teacher_names)
+        .order_by("teacher_type", "name", "id")
+    } if teacher_names else {}
+    room_by_name = {
+        room.name: room
+        for room in SpecialRoom.objects.filter(school=workspace.school, name__in=room_names).order_by("name", "id")
+    } if room_names else {}
+    period_count = len(workspace.period_labels)
+    changes = []
+    for cell in cells:
+        classroom = classroom_by_sheet.get(cell.get("sheet_name"))
+        day_key = cell.get("day_key")
+        try:
+            period_no = int(cell.get("period_no"))
+        except (TypeError, ValueError):
+            period_no = 0
+        if not classroom or day_key not in workspace.day_keys or not 1 <= period_no <= period_count:
+            return _json_error("알 수 없는 칸이 포함되어 있습니다.")
+        assignment, issues = normalize_cell(
+            workspace,
+            classroom,
+            day_key,
+            period_no,
+            str(cell.get("text") or "").strip(),
+            teacher_by_name,
+            room_by_name,
+        )
+        item = TimetableSlotAssignment(**assignment, source=TimetableSlotAssignment.Source.MANUAL) if assignment else None
+        changes.append((f"{classroom.id}:{day_key}:{period_no}", item, issues))
+
+    try:
+        delta = index.apply_cells(changes)
+    except ConflictIndexEvicted:
+        return _json_error("전체 검사를 다시 실행해 주세요.", status=409)
+    delta.update({"ok": True, "validation_revision": store_conflict_index(workspace.id, index)})
+    return JsonResponse(delta)
+
+
 @login_required
 @require_POST
 def api_setup_batch_create(request):
@@ -2715,6 +2792,14 @@ def share_view(request, token):
     return _apply_sensitive_cache_headers(response)
 
 
+def _solver_job_key(request, token):
+    """Scope a client-generated solver job token to the signed-in user."""
+    token = str(token or "")
+    if not re.fullmatch(r"[0-9a-f]{32}", token):
+        return None
+    return f"{request.user.pk}:{token}"
+
+
 @login_required
 def legacy_import(request):
     workspace = None
@@ -2734,7 +2819,10 @@ def legacy_import(request):
         else:
             check_result = validate_timetable_workbook(file_obj)
             if check_result["is_valid"]:
-                generated_result = generate_timetable_schedule(file_obj)
+                generated_result = generate_timetable_schedule(
+                    file_obj,
+                    job_id=_solver_job_key(request, request.POST.get("solver_job_id")),
+                )
                 if generated_result["is_success"] and workspace:
                     classrooms = _workspace_classrooms(workspace)
                     workspace.days_json = list(generated_result.get("days") or workspace.day_keys)
@@ -2769,6 +2857,25 @@ def legacy_import(request):
             "check_result": check_result,
             "generated_result": generated_result,
             "school_choices": school_choices,
+            "solver_job_id": uuid.uuid4().hex,
         },
     )
     return _apply_workspace_cache_headers(response)
+
+
+@login_required
+@require_GET
+def legacy_import_progress(request, job_id):
+    job_key = _solver_job_key(request, job_id)
+    progress = get_solver_progress(job_key) if job_key else None
+    if not progress:
+        return _json_error("배치 작업을 찾을 수 없습니다.", status=404)
+    return JsonResponse(
+        {
+            "ok": True,
+            "status": progress["status"],
+            "done": progress.get("done", 0),
+            "total": progress.get("total", 0),
+            "best_unplaced": progress.get("best_unplaced"),
+        }
+    )